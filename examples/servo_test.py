@@ -18,10 +18,10 @@ import sys
 import time
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add firmware root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from drivers.servo.pca9685 import PCA9685Driver, ServoController
+from src.drivers.servo.pca9685 import PCA9685Driver, ServoController
 
 
 def test_single_servo():
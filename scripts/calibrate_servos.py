@@ -17,11 +17,11 @@ import time
 import argparse
 from pathlib import Path
 
-# Add parent src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add firmware root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
-    from drivers.servo.pca9685 import PCA9685Driver
+    from src.drivers.servo.pca9685 import PCA9685Driver
 except ImportError:
     print("ERROR: Cannot import PCA9685Driver. Ensure firmware/src/drivers/servo/pca9685.py exists")
     sys.exit(1)
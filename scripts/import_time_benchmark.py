@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark - Cold Import Cost of Firmware Packages
+
+Imports each package in fresh interpreters and reports wall time, the
+number of modules pulled in, and the slowest modules by self time
+(``python -X importtime``). Covers src.voice, src.animation, src.core and
+src.led by default.
+
+Usage:
+    python scripts/import_time_benchmark.py
+    python scripts/import_time_benchmark.py --repeat 10 --top 5
+    python scripts/import_time_benchmark.py --module src.voice --budget-ms 50
+    python scripts/import_time_benchmark.py --export results_import_time.json
+
+Exit status is 1 when a --budget-ms is given and any package's median
+exceeds it.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add firmware root to path for src.* imports
+firmware_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(firmware_dir))
+
+from src.utils.import_profiler import (  # noqa: E402
+    DEFAULT_PACKAGES,
+    DEFAULT_TOP_MODULES,
+    format_import_report,
+    profile_import,
+)
+
+
+def main() -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Firmware package import-time benchmark")
+    parser.add_argument("--module", "-m", action="append", dest="modules",
+                        help="Package to import (repeatable, default: voice/animation/core/led)")
+    parser.add_argument("--repeat", "-r", type=int, default=5,
+                        help="Fresh interpreters per package (default: 5)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_MODULES,
+                        help=f"Slowest modules listed per package (default: {DEFAULT_TOP_MODULES})")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Fail if any package's median import time exceeds this")
+    parser.add_argument("--export", "-e", type=str, default=None,
+                        help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    modules = args.modules or list(DEFAULT_PACKAGES)
+    profiles = []
+    for module in modules:
+        try:
+            profiles.append(profile_import(module, repeat=args.repeat, top=args.top))
+        except RuntimeError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+
+    print(format_import_report(profiles))
+
+    if args.export:
+        with open(args.export, "w") as f:
+            json.dump({"import_time": [p.to_dict() for p in profiles]}, f, indent=2)
+        print(f"\nResults written to {args.export}")
+
+    if args.budget_ms is not None:
+        over = [p for p in profiles if p.median_ms > args.budget_ms]
+        for p in over:
+            print(f"OVER BUDGET: {p.module} {p.median_ms:.1f}ms > {args.budget_ms:.1f}ms")
+        if over:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Startup Report - Cold-Start Timeline and Time to First Expression
+
+Runs the staged bring-up (src/core/bringup.py) and prints every traced
+import and initialization phase per subsystem and thread, stage status,
+and time from process start to the LED booting frame against the 1s
+target. Optionally adds fresh-interpreter import times per package.
+
+Usage:
+    python scripts/startup_report.py              # real hardware
+    python scripts/startup_report.py --sim        # simulated servos/GPIO
+    python scripts/startup_report.py --sim --no-voice --imports
+    python scripts/startup_report.py --sim --export results_startup.json
+
+Exit status is 1 if the safety stage fails or the first expression misses
+its target.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Taken first so the report covers this script's own imports
+_PROCESS_T0 = time.monotonic()
+
+# Add firmware root to path for src.* imports
+firmware_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(firmware_dir))
+
+from src.utils.startup_profiler import StartupTracer  # noqa: E402
+
+_tracer = StartupTracer(origin=_PROCESS_T0)
+
+with _tracer.phase("src.core.bringup", kind="import"):
+    from src.core.bringup import BringupConfig, StagedBringup  # noqa: E402
+
+
+class _SimServoDriver:
+    """Stand-in PCA9685 for --sim (accepts every command)."""
+
+    def disable_all(self) -> None:
+        pass
+
+    def set_servo_angle(self, channel: int, angle: float) -> None:
+        pass
+
+    def get_channel_state(self, channel: int) -> dict:
+        return {'angle': 90.0}
+
+
+class _SimGPIO:
+    """Stand-in RPi.GPIO for --sim (E-stop button never pressed)."""
+
+    BCM, IN, PUD_UP, FALLING = 11, 1, 22, 32
+
+    def setmode(self, mode: int) -> None:
+        pass
+
+    def setup(self, pin: int, direction: int, pull_up_down: int = 0) -> None:
+        pass
+
+    def input(self, pin: int) -> int:
+        return 1
+
+    def add_event_detect(self, pin: int, edge: int, callback=None, bouncetime: int = 0) -> None:
+        pass
+
+    def remove_event_detect(self, pin: int) -> None:
+        pass
+
+    def cleanup(self, pin: int = None) -> None:
+        pass
+
+
+def main() -> int:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Firmware cold-start report")
+    parser.add_argument("--sim", action="store_true",
+                        help="Simulated servo driver and GPIO (no hardware)")
+    parser.add_argument("--no-voice", action="store_true",
+                        help="Skip the background voice stage")
+    parser.add_argument("--no-patterns", action="store_true",
+                        help="Skip the background compound pattern stage")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Seconds to wait for background stages (default: 30)")
+    parser.add_argument("--imports", action="store_true",
+                        help="Also report fresh-interpreter import times per package")
+    parser.add_argument("--export", "-e", type=str, default=None,
+                        help="Write the report to a JSON file")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Show subsystem log output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    robot_factory = None
+    if args.sim:
+        def robot_factory():
+            robot_module = _tracer.import_module("src.core.robot")
+            return robot_module.Robot(
+                servo_driver=_SimServoDriver(),
+                gpio_provider=_SimGPIO(),
+                enable_hardware=False,
+            )
+
+    config = BringupConfig(
+        enable_voice=not args.no_voice,
+        enable_compound_patterns=not args.no_patterns,
+    )
+    bringup = StagedBringup(robot_factory=robot_factory, config=config, tracer=_tracer)
+
+    ok = bringup.run()
+    finished = bringup.wait(timeout=args.timeout)
+    report = bringup.get_report()
+    bringup.shutdown()
+
+    print("=" * 70)
+    print("  STARTUP TIMELINE (t=0 at script start)")
+    print("=" * 70)
+    print(_tracer.format_report())
+
+    print("\nStages:")
+    for stage, status in report['stages'].items():
+        error = report['errors'].get(stage)
+        print(f"  {stage:<18} {status}" + (f"  ({error})" if error else ""))
+    if not finished:
+        print(f"  (background stages still running after {args.timeout:.0f}s)")
+
+    first_ms = report['first_expression_ms']
+    target_ms = report['first_expression_target_ms']
+    if first_ms is None:
+        print(f"\nTime to first expression: not reached (target {target_ms:.0f}ms)")
+    else:
+        verdict = "PASS" if report['first_expression_met'] else "FAIL"
+        print(f"\nTime to first expression: {first_ms:.1f}ms "
+              f"(target {target_ms:.0f}ms) {verdict}")
+
+    if args.imports:
+        from src.utils.import_profiler import (
+            DEFAULT_PACKAGES,
+            format_import_report,
+            profile_import,
+        )
+        profiles = []
+        for package in DEFAULT_PACKAGES:
+            try:
+                profiles.append(profile_import(package, repeat=3, top=5))
+            except RuntimeError as e:
+                print(f"  {package}: {e}")
+        print("\n" + format_import_report(profiles))
+        report['imports'] = [p.to_dict() for p in profiles]
+
+    if args.export:
+        with open(args.export, "w") as f:
+            json.dump({"startup": report}, f, indent=2)
+        print(f"\nResults written to {args.export}")
+
+    return 0 if ok and report['first_expression_met'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,8 +21,8 @@ import time
 import argparse
 from pathlib import Path
 
-# Add parent src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add firmware root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 def test_i2c_bus():
     """Test I2C bus availability"""
@@ -66,7 +66,7 @@ def test_bno085():
     print("=" * 60)
 
     try:
-        from drivers.sensor.imu.bno085 import BNO085Driver
+        from src.drivers.sensor.imu.bno085 import BNO085Driver
         print("✓ BNO085 driver imported")
 
         # Initialize sensor
@@ -192,7 +192,7 @@ def test_pca9685():
     print("=" * 60)
 
     try:
-        from drivers.servo.pca9685 import PCA9685Driver
+        from src.drivers.servo.pca9685 import PCA9685Driver
         print("✓ PCA9685 driver imported")
 
         # Initialize driver
@@ -242,7 +242,7 @@ def continuous_monitoring():
     print("Press Ctrl+C to stop\n")
 
     try:
-        from drivers.sensor.imu.bno085 import BNO085Driver
+        from src.drivers.sensor.imu.bno085 import BNO085Driver
 
         imu = BNO085Driver()
 
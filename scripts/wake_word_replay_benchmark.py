@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Wake Word Replay Benchmark - Offline Throughput, Latency and FPR
+
+Streams WAV recordings or a synthetic corpus through the full wake word
+pipeline (preprocessor → VAD → detector → MultiFrameConfirmer) faster than
+real time. No microphone needed; OpenWakeWord is used when installed,
+otherwise a template-matching stub detector.
+
+Reported:
+    - Chunks/sec and real-time factor
+    - Per-stage latency (mean/median/p99/max) against targets
+    - Detection latency after each wake word ends
+    - Recall and false positives per hour
+
+Ground truth for a WAV file is read from ``<name>.events.json``
+(``[[start_s, end_s], ...]``); files without one are negative corpora.
+
+Usage:
+    python scripts/wake_word_replay_benchmark.py
+    python scripts/wake_word_replay_benchmark.py --minutes 60 --events 100
+    python scripts/wake_word_replay_benchmark.py --wav kitchen_noise.wav --detector stub
+    python scripts/wake_word_replay_benchmark.py --export results_wake_word.json
+
+Output JSON uses the results_day13.json layout.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add firmware root to path for src.* imports
+firmware_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(firmware_dir))
+
+from src.voice.replay import (  # noqa: E402
+    DEFAULT_FPR_TARGET_PER_HOUR,
+    ReplayCorpus,
+    TemplateWakeWordDetector,
+    print_report,
+    run_replay,
+    synthesize_corpus,
+)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Offline wake word replay benchmark"
+    )
+    parser.add_argument(
+        "--wav", "-w",
+        action="append",
+        default=[],
+        help="WAV corpus to replay (repeatable). Default: synthetic corpus"
+    )
+    parser.add_argument(
+        "--minutes", "-m",
+        type=float,
+        default=10.0,
+        help="Synthetic corpus length in minutes (default: 10)"
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=20,
+        help="Wake word events in the synthetic corpus (default: 20)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic corpus seed (default: 0)"
+    )
+    parser.add_argument(
+        "--detector", "-d",
+        choices=["auto", "stub", "openwakeword"],
+        default="auto",
+        help="Wake word model (default: OpenWakeWord if installed, else stub)"
+    )
+    parser.add_argument(
+        "--fpr-target",
+        type=float,
+        default=DEFAULT_FPR_TARGET_PER_HOUR,
+        help=f"False positives per hour target (default: {DEFAULT_FPR_TARGET_PER_HOUR})"
+    )
+    parser.add_argument(
+        "--export", "-e",
+        type=str,
+        help="Export results to JSON file"
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable pipeline logging"
+    )
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    if args.wav:
+        corpora = [ReplayCorpus.from_wav(path) for path in args.wav]
+    else:
+        corpora = [synthesize_corpus(
+            duration_s=args.minutes * 60.0,
+            n_events=args.events,
+            seed=args.seed,
+        )]
+
+    if args.detector == "stub":
+        factory = TemplateWakeWordDetector
+    elif args.detector == "openwakeword":
+        factory = None
+        try:
+            import openwakeword  # noqa: F401
+        except ImportError:
+            print("OpenWakeWord not installed. Install with: pip install openwakeword")
+            return 1
+    else:
+        factory = None
+
+    report = run_replay(
+        corpora,
+        detector_factory=factory,
+        fpr_target_per_hour=args.fpr_target,
+    )
+    print_report(report)
+
+    if args.export:
+        with open(args.export, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"\nResults exported to: {args.export}")
+
+    return 0 if report.verdict == "PASS" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,63 +30,58 @@ Exports:
 Author: Boston Dynamics Animation Systems Engineer
 Created: 18 January 2026
 Updated: 18 January 2026 (Day 12 - Idle behaviors + Animation Coordinator + Emotion Bridge)
-"""
-
-from .easing import (
-    ease,
-    ease_linear,
-    ease_in,
-    ease_out,
-    ease_in_out,
-    EASING_FUNCTIONS,
-    EASING_LUTS,
-)
-
-from .timing import (
-    Keyframe,
-    AnimationSequence,
-    AnimationPlayer,
-)
 
-from .emotion_axes import (
-    EmotionAxes,
-    EMOTION_PRESETS,
-)
-
-from .micro_expressions import (
-    MicroExpressionType,
-    MicroExpression,
-    MicroExpressionEngine,
-    MICRO_EXPRESSION_PRESETS,
-    get_preset_names,
-    get_preset,
-)
+Lazy loading:
+    Exports are resolved on first access (PEP 562 module ``__getattr__``).
+    Importing one submodule, e.g. ``animation.timing`` for the LED
+    manager, no longer imports every behavior, coordinator and bridge.
+"""
 
-from .behaviors import (
-    IdleBehavior,
-    BlinkBehavior,
-    create_idle_behavior,
-    create_blink_behavior,
-)
+from typing import TYPE_CHECKING, Dict
 
-from .coordinator import (
-    AnimationCoordinator,
-    AnimationPriority,
-    AnimationLayer,
-    AnimationState,
-)
+try:
+    from src.utils.lazy_exports import make_lazy
+except ImportError:
+    from utils.lazy_exports import make_lazy
 
-from .emotion_bridge import (
-    EmotionState,
-    EmotionPose,
-    EmotionExpression,
-    EmotionBridge,
-    EMOTION_POSES,
-    IDLE_PARAMETERS,
-    get_available_emotions,
-    get_emotion_pose,
-    emotion_state_to_axes,
-)
+# Exported name -> defining submodule (imported on first access)
+_LAZY_EXPORTS: Dict[str, str] = {
+    'ease': '.easing',
+    'ease_linear': '.easing',
+    'ease_in': '.easing',
+    'ease_out': '.easing',
+    'ease_in_out': '.easing',
+    'EASING_FUNCTIONS': '.easing',
+    'EASING_LUTS': '.easing',
+    'Keyframe': '.timing',
+    'AnimationSequence': '.timing',
+    'AnimationPlayer': '.timing',
+    'EmotionAxes': '.emotion_axes',
+    'EMOTION_PRESETS': '.emotion_axes',
+    'MicroExpressionType': '.micro_expressions',
+    'MicroExpression': '.micro_expressions',
+    'MicroExpressionEngine': '.micro_expressions',
+    'MICRO_EXPRESSION_PRESETS': '.micro_expressions',
+    'get_preset_names': '.micro_expressions',
+    'get_preset': '.micro_expressions',
+    'IdleBehavior': '.behaviors',
+    'BlinkBehavior': '.behaviors',
+    'create_idle_behavior': '.behaviors',
+    'create_blink_behavior': '.behaviors',
+    'AnimationCoordinator': '.coordinator',
+    'AnimationPriority': '.coordinator',
+    'AnimationLayer': '.coordinator',
+    'AnimationState': '.coordinator',
+    'EmotionState': '.emotion_bridge',
+    'EmotionPose': '.emotion_bridge',
+    'EmotionExpression': '.emotion_bridge',
+    'EmotionBridge': '.emotion_bridge',
+    'EMOTION_POSES': '.emotion_bridge',
+    'IDLE_PARAMETERS': '.emotion_bridge',
+    'get_available_emotions': '.emotion_bridge',
+    'get_emotion_pose': '.emotion_bridge',
+    'emotion_state_to_axes': '.emotion_bridge',
+}
 
 __all__ = [
     # Easing
@@ -132,3 +127,58 @@ __all__ = [
     'get_emotion_pose',
     'emotion_state_to_axes',
 ]
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY_EXPORTS, __all__)
+
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .easing import (
+        ease,
+        ease_linear,
+        ease_in,
+        ease_out,
+        ease_in_out,
+        EASING_FUNCTIONS,
+        EASING_LUTS,
+    )
+    from .timing import (
+        Keyframe,
+        AnimationSequence,
+        AnimationPlayer,
+    )
+    from .emotion_axes import (
+        EmotionAxes,
+        EMOTION_PRESETS,
+    )
+    from .micro_expressions import (
+        MicroExpressionType,
+        MicroExpression,
+        MicroExpressionEngine,
+        MICRO_EXPRESSION_PRESETS,
+        get_preset_names,
+        get_preset,
+    )
+    from .behaviors import (
+        IdleBehavior,
+        BlinkBehavior,
+        create_idle_behavior,
+        create_blink_behavior,
+    )
+    from .coordinator import (
+        AnimationCoordinator,
+        AnimationPriority,
+        AnimationLayer,
+        AnimationState,
+    )
+    from .emotion_bridge import (
+        EmotionState,
+        EmotionPose,
+        EmotionExpression,
+        EmotionBridge,
+        EMOTION_POSES,
+        IDLE_PARAMETERS,
+        get_available_emotions,
+        get_emotion_pose,
+        emotion_state_to_axes,
+    )
@@ -26,11 +26,20 @@ Thread Safety:
     All public methods are thread-safe using internal RLock.
     Safe for concurrent emotion changes from multiple threads.
 
+Expression Cache:
+    get_expression_for_emotion() is a pure function of the axes when the
+    bridge uses a stock AxisToLEDMapper, so its results are memoized:
+    EMOTION_PRESETS are compiled once at construction (a dictionary
+    lookup afterwards) and other axes go through a bounded LRU keyed on
+    axes rounded to EXPRESSION_AXES_DECIMALS. Custom or mock mappers are
+    never cached.
+
 Author: Agent 4 - DeepMind RL Engineer (Emotion-Motion Bridge)
 Created: 18 January 2026 (Day 12)
 Quality Standard: Boston Dynamics / Pixar / DeepMind Grade
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Dict, Callable, Tuple, Any
 from enum import Enum
@@ -63,6 +72,14 @@ DEFAULT_TRANSITION_MS = 500
 MIN_TRANSITION_MS = 50
 MAX_TRANSITION_MS = 5000
 
+# Expression cache: axes are rounded to this many decimals before lookup
+# (0.001 of an axis moves the head by at most 0.015 degrees)
+EXPRESSION_AXES_DECIMALS = 3
+EXPRESSION_CACHE_SIZE = 256
+
+# Quantized (arousal, valence, focus, blink_speed)
+AxesKey = Tuple[float, float, float, float]
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -183,13 +200,14 @@ IDLE_PARAMETERS: Dict[EmotionState, Dict[str, float]] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmotionExpression:
     """
     Complete expression configuration for an emotion.
 
     Bundles all output parameters derived from EmotionAxes for
     coordinated expression across head, LED, and timing systems.
+    Immutable, so cached instances can be shared between callers.
 
     Attributes:
         target_pan: Head pan angle in degrees
@@ -251,7 +269,8 @@ class EmotionBridge:
         micro_engine=None,
         led_controller=None,
         axis_to_led_mapper: Optional[AxisToLEDMapper] = None,
-        led_mapper: Optional[AxisToLEDMapper] = None
+        led_mapper: Optional[AxisToLEDMapper] = None,
+        expression_cache_size: int = EXPRESSION_CACHE_SIZE
     ):
         """
         Initialize EmotionBridge.
@@ -264,10 +283,18 @@ class EmotionBridge:
             led_controller: Optional LED controller for direct LED control.
             axis_to_led_mapper: Optional AxisToLEDMapper instance. Creates default if None.
             led_mapper: Alias for axis_to_led_mapper (for backward compatibility).
+            expression_cache_size: Maximum non-preset expressions kept in the
+                LRU cache (0 disables the LRU; presets are still precompiled).
 
         Raises:
             TypeError: If mapper is provided but not an AxisToLEDMapper instance.
+            ValueError: If expression_cache_size is negative.
         """
+        if expression_cache_size < 0:
+            raise ValueError(
+                f"expression_cache_size must be >= 0, got {expression_cache_size}"
+            )
+
         # Use axis_to_led_mapper if provided, otherwise fall back to led_mapper
         mapper = axis_to_led_mapper if axis_to_led_mapper is not None else led_mapper
 
@@ -291,6 +318,21 @@ class EmotionBridge:
             Callable[[EmotionAxes, EmotionExpression], None]
         ] = None
 
+        # Expression cache (only for the stock, stateless mapper)
+        self._cache_enabled = type(self._mapper) is AxisToLEDMapper
+        self._cache_size = expression_cache_size
+        self._cache_lock = threading.Lock()
+        self._expression_cache: "OrderedDict[AxesKey, EmotionExpression]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._preset_expressions: Dict[AxesKey, EmotionExpression] = {}
+        if self._cache_enabled:
+            for axes in EMOTION_PRESETS.values():
+                key = self._axes_key(axes)
+                expression = self._compile_expression(EmotionAxes(*key))
+                self._preset_expressions[key] = expression
+
         _logger.debug("EmotionBridge initialized")
 
     # =========================================================================
@@ -560,6 +602,11 @@ class EmotionBridge:
         Maps EmotionAxes to all output parameters without triggering
         any actual hardware commands. Useful for preview/planning.
 
+        With the stock mapper the result is memoized: axes are rounded to
+        EXPRESSION_AXES_DECIMALS, presets come from the precompiled table
+        and other axes from the LRU cache. The returned expression is
+        shared and immutable.
+
         Args:
             axes: EmotionAxes to map
 
@@ -574,6 +621,77 @@ class EmotionBridge:
                 f"axes must be EmotionAxes, got {type(axes).__name__}"
             )
 
+        if not self._cache_enabled:
+            return self._compile_expression(axes)
+
+        key = self._axes_key(axes)
+        expression = self._preset_expressions.get(key)
+        if expression is not None:
+            with self._cache_lock:
+                self._cache_hits += 1
+            return expression
+
+        with self._cache_lock:
+            expression = self._expression_cache.get(key)
+            if expression is not None:
+                self._expression_cache.move_to_end(key)
+                self._cache_hits += 1
+                return expression
+            self._cache_misses += 1
+
+        # Compile outside the lock (pure); a racing thread may compile the
+        # same key, which only costs the duplicate work
+        expression = self._compile_expression(EmotionAxes(*key))
+        if self._cache_size:
+            with self._cache_lock:
+                self._expression_cache[key] = expression
+                self._expression_cache.move_to_end(key)
+                if len(self._expression_cache) > self._cache_size:
+                    self._expression_cache.popitem(last=False)
+                    self._cache_evictions += 1
+        return expression
+
+    def get_expression_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get expression cache statistics.
+
+        Returns:
+            Dictionary with enabled, hits, misses, hit_rate, evictions,
+            size, capacity and presets (precompiled preset count)
+        """
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "enabled": self._cache_enabled,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+                "evictions": self._cache_evictions,
+                "size": len(self._expression_cache),
+                "capacity": self._cache_size,
+                "presets": len(self._preset_expressions),
+            }
+
+    def clear_expression_cache(self) -> None:
+        """Drop cached (non-preset) expressions and reset statistics."""
+        with self._cache_lock:
+            self._expression_cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._cache_evictions = 0
+
+    @staticmethod
+    def _axes_key(axes: EmotionAxes) -> AxesKey:
+        """Quantize axes to the cache key."""
+        return (
+            round(axes.arousal, EXPRESSION_AXES_DECIMALS),
+            round(axes.valence, EXPRESSION_AXES_DECIMALS),
+            round(axes.focus, EXPRESSION_AXES_DECIMALS),
+            round(axes.blink_speed, EXPRESSION_AXES_DECIMALS),
+        )
+
+    def _compile_expression(self, axes: EmotionAxes) -> EmotionExpression:
+        """Map axes to an EmotionExpression (uncached)."""
         # Map to head pose
         pan, tilt = self._map_emotion_to_head_pose(axes)
 
@@ -849,27 +967,18 @@ class EmotionBridge:
             _logger.warning(f"No axes preset for {preset_name}")
             return
 
-        # Get LED configuration from mapper
-        try:
-            led_config = self._mapper.axes_to_led_config(axes)
-            pattern_name = led_config.get('pattern_name', 'breathing')
-            hsv = led_config.get('hsv', (200.0, 0.5, 0.8))
-            speed = led_config.get('speed', 1.0)
-        except (TypeError, AttributeError):
-            # Fallback for Mock objects or invalid mappers
-            pattern_name = 'breathing'
-            hsv = (200.0, 0.5, 0.8)
-            speed = 1.0
+        # LED configuration from the (precompiled) preset expression
+        expression = self.get_expression_for_emotion(axes)
 
         _logger.debug(
             f"LED config for {emotion.value}: "
-            f"pattern={pattern_name}, "
-            f"hsv={hsv}, "
-            f"speed={speed:.2f}"
+            f"pattern={expression.pattern_name}, "
+            f"hsv={expression.led_hsv}, "
+            f"speed={expression.pattern_speed:.2f}"
         )
 
         # Apply to LED controller if available
-        self._apply_led_config_values(pattern_name, hsv, speed)
+        self._apply_led_config(expression)
 
     def _apply_led_config(self, expression: EmotionExpression) -> None:
         """
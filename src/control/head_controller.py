@@ -31,8 +31,8 @@ Created: 18 January 2026
 Quality Standard: Pixar Character TD / Disney Animation Grade
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Tuple, Callable, List, Dict, Any
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Optional, Tuple, Callable, List, Dict, Any
 from enum import Enum
 import logging
 import threading
@@ -48,6 +48,9 @@ try:
 except ImportError:
     from src.animation.easing import ease, EASING_LUTS
 
+if TYPE_CHECKING:
+    from src.utils.config import RobotConfig
+
 # Logger for this module
 _logger = logging.getLogger(__name__)
 
@@ -317,6 +320,47 @@ class HeadController:
         # Initialize servos to center position
         self._move_servos_to(self._current_pan, self._current_tilt)
 
+    @classmethod
+    def from_config(
+        cls,
+        config: "RobotConfig",
+        servo_driver: 'PCA9685Driver',
+        pan_channel: int = 12,
+        tilt_channel: int = 13,
+    ) -> 'HeadController':
+        """Create a head controller using the configured animation timings.
+
+        Args:
+            config: RobotConfig from src.utils.config
+            servo_driver: Configured PCA9685Driver instance
+            pan_channel: PCA9685 channel for pan servo
+            tilt_channel: PCA9685 channel for tilt servo
+
+        Returns:
+            HeadController instance
+        """
+        return cls(servo_driver, config.head_config(pan_channel, tilt_channel))
+
+    def apply_config(self, config: "RobotConfig") -> None:
+        """Apply hot-reloaded animation timings.
+
+        Only the default duration and easing change; channels and limits
+        keep their values. Movements already running finish with the
+        timings they started with.
+
+        Args:
+            config: RobotConfig from src.utils.config
+
+        Raises:
+            ValueError: If the configured easing is unknown
+        """
+        with self._lock:
+            self._config = replace(
+                self._config,
+                default_speed_ms=config.animation.head_default_speed_ms,
+                easing=config.animation.head_easing,
+            )
+
     # =========================================================================
     # PUBLIC METHODS - Movement Commands
     # =========================================================================
@@ -1410,10 +1454,17 @@ class HeadController:
         pan_servo_angle = max(0.0, min(180.0, pan_servo_angle))
         tilt_servo_angle = max(0.0, min(180.0, tilt_servo_angle))
 
-        # Command servos
+        # Command servos - one coalesced I2C burst when the driver supports it
         try:
-            self._driver.set_servo_angle(self._config.pan_channel, pan_servo_angle)
-            self._driver.set_servo_angle(self._config.tilt_channel, tilt_servo_angle)
+            set_servo_angles = getattr(self._driver, 'set_servo_angles', None)
+            if set_servo_angles is not None:
+                set_servo_angles({
+                    self._config.pan_channel: pan_servo_angle,
+                    self._config.tilt_channel: tilt_servo_angle,
+                })
+            else:
+                self._driver.set_servo_angle(self._config.pan_channel, pan_servo_angle)
+                self._driver.set_servo_angle(self._config.tilt_channel, tilt_servo_angle)
         except Exception as e:
             # FIX H-005: Log error for debugging instead of silent swallow
             _logger.error(f"Servo command failed: {e}", exc_info=True)
@@ -4,25 +4,33 @@ This package provides the high-level robot orchestration layer:
 - RobotState: State machine for robot lifecycle
 - SafetyCoordinator: Unified safety system interface
 - Robot: Main orchestrator class (to be implemented)
+
+Exports are resolved on first access (PEP 562 module ``__getattr__``), so
+importing one submodule (e.g. src.core.bringup) does not pull in the robot,
+kinematics and NumPy before bring-up asks for them.
 """
 
-from .robot_state import (
-    RobotState,
-    VALID_TRANSITIONS,
-    validate_transition,
-    get_allowed_transitions,
-    RobotError,
-    RobotStateError,
-    SafetyViolationError,
-    HardwareError,
-)
+from typing import TYPE_CHECKING, Dict
 
-from .safety_coordinator import (
-    SafetyCoordinator,
-    SafetyStatus,
-)
+try:
+    from src.utils.lazy_exports import make_lazy
+except ImportError:
+    from utils.lazy_exports import make_lazy
 
-from .robot import Robot
+# Exported name -> defining submodule (imported on first access)
+_LAZY_EXPORTS: Dict[str, str] = {
+    'RobotState': '.robot_state',
+    'VALID_TRANSITIONS': '.robot_state',
+    'validate_transition': '.robot_state',
+    'get_allowed_transitions': '.robot_state',
+    'RobotError': '.robot_state',
+    'RobotStateError': '.robot_state',
+    'SafetyViolationError': '.robot_state',
+    'HardwareError': '.robot_state',
+    'SafetyCoordinator': '.safety_coordinator',
+    'SafetyStatus': '.safety_coordinator',
+    'Robot': '.robot',
+}
 
 __all__ = [
     # State machine
@@ -41,3 +49,26 @@ __all__ = [
     # Robot orchestrator
     "Robot",
 ]
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY_EXPORTS, __all__)
+
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .robot_state import (
+        RobotState,
+        VALID_TRANSITIONS,
+        validate_transition,
+        get_allowed_transitions,
+        RobotError,
+        RobotStateError,
+        SafetyViolationError,
+        HardwareError,
+    )
+    from .safety_coordinator import (
+        SafetyCoordinator,
+        SafetyStatus,
+    )
+    from .robot import (
+        Robot,
+    )
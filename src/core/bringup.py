@@ -0,0 +1,477 @@
+"""Staged Robot Bring-Up for OpenDuck Mini V3.
+
+Brings the robot up in priority order instead of importing and
+initializing every subsystem serially, so the first LED expression
+appears as soon as the safety stack is live.
+
+Stages:
+    1. Safety (foreground): configuration load (src/utils/config.py),
+       Robot construction (PCA9685, SafetyCoordinator, ArmKinematics) and
+       start(). Failure aborts bring-up.
+    2. Boot frame (foreground): LED controller created and shown a dim
+       "booting" frame. Marks ``first_expression``.
+    3. Head (foreground, optional): pan/tilt head controller on the
+       robot's servo driver. Failure is logged and non-fatal.
+    4. Background: voice stack and compound emotion patterns initialize on
+       daemon threads. Failures are logged and non-fatal (like the IMU).
+
+Once the foreground stages are done, hot reloads of the configuration
+(LED brightness and refresh rate, head animation timings) are applied to
+the LED and head controllers that were brought up.
+
+Every import and initialization step is recorded by a StartupTracer
+(src/utils/startup_profiler.py); get_report() returns the timeline and
+time-to-first-expression against the target.
+
+Design Philosophy:
+    - Safety first: nothing visible or audible starts before E-stop and
+      the watchdog are running
+    - Testable: every subsystem comes from an injectable factory
+
+Example:
+    >>> from src.core.bringup import StagedBringup
+    >>> bringup = StagedBringup()
+    >>> if bringup.run():
+    ...     bringup.wait(timeout=30.0)
+    >>> print(bringup.tracer.format_report())
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.config import DEFAULT_POLL_INTERVAL_S, ConfigLoader, RobotConfig
+from src.utils.startup_profiler import StartupTracer, get_startup_tracer
+
+_logger = logging.getLogger(__name__)
+
+RGB = Tuple[int, int, int]
+
+# Milestone recorded when the boot frame is shown
+FIRST_EXPRESSION_MARK = "first_expression"
+
+# Milestone recorded when every background stage has finished
+BACKGROUND_DONE_MARK = "background_done"
+
+# Compound emotion name -> pattern class name in src.animation.emotion_patterns
+COMPOUND_PATTERN_CLASSES: Dict[str, str] = {
+    "confused": "ConfusedPattern",
+    "surprised": "SurprisedPattern",
+    "anxious": "AnxiousPattern",
+    "frustrated": "FrustratedPattern",
+    "proud": "ProudPattern",
+}
+
+
+class StageStatus(Enum):
+    """Bring-up stage status."""
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class BringupConfig:
+    """Configuration for staged bring-up.
+
+    Attributes:
+        boot_color: RGB color of the booting frame (dim amber)
+        boot_brightness: Brightness of the booting frame (0-255)
+        boot_pattern: LED pattern used for the booting frame
+        enable_voice: Initialize the voice stack in the background
+        enable_compound_patterns: Initialize compound emotion patterns in
+            the background
+        enable_head: Bring up the pan/tilt head controller
+        first_expression_target_s: Target time to the booting frame
+        config_watch_interval_s: Seconds between config file polls for
+            hot reload (None = no hot reload)
+    """
+    boot_color: RGB = (255, 120, 0)
+    boot_brightness: int = 40
+    boot_pattern: str = "breathing"
+    enable_voice: bool = True
+    enable_compound_patterns: bool = True
+    enable_head: bool = False
+    first_expression_target_s: float = 1.0
+    config_watch_interval_s: Optional[float] = DEFAULT_POLL_INTERVAL_S
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if len(self.boot_color) != 3 or not all(0 <= c <= 255 for c in self.boot_color):
+            raise ValueError(f"boot_color must be an RGB tuple 0-255, got {self.boot_color}")
+        if not 0 <= self.boot_brightness <= 255:
+            raise ValueError(f"boot_brightness must be 0-255, got {self.boot_brightness}")
+        if self.first_expression_target_s <= 0:
+            raise ValueError(
+                f"first_expression_target_s must be positive, got {self.first_expression_target_s}"
+            )
+        if self.config_watch_interval_s is not None and self.config_watch_interval_s <= 0:
+            raise ValueError(
+                f"config_watch_interval_s must be positive, got {self.config_watch_interval_s}"
+            )
+
+
+class StagedBringup:
+    """Brings up safety, LEDs, head, voice and compound patterns in stages.
+
+    Thread Safety:
+        run() is called once from the main thread. Background stages run
+        on daemon threads; status and results are safe to read from any
+        thread (results are published once, when a stage finishes).
+        Config reloads are applied on the ConfigLoader watcher thread.
+
+    Attributes:
+        config: Bring-up configuration
+        tracer: StartupTracer recording every phase
+    """
+
+    def __init__(
+        self,
+        robot_factory: Optional[Callable[[], Any]] = None,
+        led_factory: Optional[Callable[[], Any]] = None,
+        voice_factory: Optional[Callable[[], Any]] = None,
+        patterns_factory: Optional[Callable[[], Any]] = None,
+        config: Optional[BringupConfig] = None,
+        tracer: Optional[StartupTracer] = None,
+        head_factory: Optional[Callable[[Any], Any]] = None,
+        config_loader: Optional[ConfigLoader] = None,
+    ) -> None:
+        """Initialize bring-up.
+
+        Args:
+            robot_factory: Builds the (not yet started) Robot. Defaults to
+                Robot() with hardware.
+            led_factory: Builds the LED controller (set_color,
+                set_brightness, set_pattern, update). Defaults to
+                LEDController from src.core.led_manager.
+            voice_factory: Builds the voice stack. Defaults to a
+                WakeWordPipeline with its wake word model pre-loaded.
+            patterns_factory: Builds compound emotion patterns. Defaults
+                to one warmed instance per compound emotion.
+            config: Bring-up configuration
+            tracer: Tracer to record into (default: process-wide tracer)
+            head_factory: Builds the head controller from the started
+                robot. Defaults to HeadController.from_config() on the
+                robot's servo driver.
+            config_loader: Robot configuration source (default:
+                ConfigLoader() reading config/)
+        """
+        self.config = config or BringupConfig()
+        self.tracer = tracer or get_startup_tracer()
+        self.config_loader = config_loader or ConfigLoader()
+        self._robot_config: Optional[RobotConfig] = None
+
+        self._robot_factory = robot_factory or self._create_robot
+        self._led_factory = led_factory or self._create_led
+        self._voice_factory = voice_factory or self._create_voice
+        self._patterns_factory = patterns_factory or self._create_compound_patterns
+        self._head_factory = head_factory or self._create_head
+
+        self._status: Dict[str, StageStatus] = {
+            "safety": StageStatus.PENDING,
+            "led": StageStatus.PENDING,
+            "head": StageStatus.PENDING,
+            "voice": StageStatus.PENDING,
+            "compound_patterns": StageStatus.PENDING,
+        }
+        self._results: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # Results
+    # =========================================================================
+
+    @property
+    def robot_config(self) -> RobotConfig:
+        """Robot configuration (loaded by the safety stage)."""
+        config = self._robot_config
+        return config if config is not None else self.config_loader.config
+
+    @property
+    def robot(self) -> Optional[Any]:
+        """Started Robot (None until the safety stage succeeds)."""
+        return self._results.get("safety")
+
+    @property
+    def led(self) -> Optional[Any]:
+        """LED controller showing the boot frame (None if unavailable)."""
+        return self._results.get("led")
+
+    @property
+    def head(self) -> Optional[Any]:
+        """Head controller (None if disabled or unavailable)."""
+        return self._results.get("head")
+
+    @property
+    def voice(self) -> Optional[Any]:
+        """Voice stack (None until the background stage finishes)."""
+        return self._results.get("voice")
+
+    @property
+    def compound_patterns(self) -> Optional[Dict[str, Any]]:
+        """Compound emotion patterns by name (None until ready)."""
+        return self._results.get("compound_patterns")
+
+    def get_status(self) -> Dict[str, str]:
+        """Get stage statuses.
+
+        Returns:
+            Dictionary of stage name to status value
+        """
+        with self._lock:
+            return {name: status.value for name, status in self._status.items()}
+
+    def _set_status(self, stage: str, status: StageStatus) -> None:
+        with self._lock:
+            self._status[stage] = status
+
+    # =========================================================================
+    # Bring-Up
+    # =========================================================================
+
+    def run(self) -> bool:
+        """Run the foreground stages and launch the background stages.
+
+        Returns:
+            True if the safety stage succeeded (robot READY). On False,
+            no LED, head, voice or pattern stage was started.
+        """
+        if not self._run_safety():
+            for stage in ("led", "head", "voice", "compound_patterns"):
+                self._set_status(stage, StageStatus.SKIPPED)
+            return False
+
+        self._run_boot_frame()
+        if self.config.enable_head:
+            self._run_head()
+        else:
+            self._set_status("head", StageStatus.SKIPPED)
+        self._start_config_reload()
+
+        background = [
+            ("voice", self.config.enable_voice, self._voice_factory),
+            ("compound_patterns", self.config.enable_compound_patterns, self._patterns_factory),
+        ]
+        # Settle every status before any worker can finish and check them
+        for stage, enabled, factory in background:
+            if not enabled:
+                self._set_status(stage, StageStatus.SKIPPED)
+                continue
+            self._set_status(stage, StageStatus.RUNNING)
+            self._threads.append(threading.Thread(
+                target=self._run_background,
+                args=(stage, factory),
+                name=f"Bringup-{stage}",
+                daemon=True,
+            ))
+        for thread in self._threads:
+            thread.start()
+        if not self._threads:
+            self.tracer.mark(BACKGROUND_DONE_MARK)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background stages.
+
+        Args:
+            timeout: Seconds to wait for each stage (None = forever)
+
+        Returns:
+            True if every background stage finished (ready or failed)
+        """
+        for thread in self._threads:
+            thread.join(timeout)
+        return not any(thread.is_alive() for thread in self._threads)
+
+    def _run_safety(self) -> bool:
+        """Stage 1: construct and start the robot (safety + servos)."""
+        self._set_status("safety", StageStatus.RUNNING)
+        try:
+            with self.tracer.phase("config", kind="init"):
+                self._robot_config = self.config_loader.load()
+            with self.tracer.phase("robot", kind="init"):
+                robot = self._robot_factory()
+            with self.tracer.phase("robot.start", kind="init"):
+                started = robot.start()
+        except Exception as e:
+            _logger.error("Bring-up aborted: safety stage failed: %s", e)
+            self._errors["safety"] = str(e)
+            self._set_status("safety", StageStatus.FAILED)
+            return False
+
+        if not started:
+            _logger.error("Bring-up aborted: robot failed to start")
+            self._errors["safety"] = "robot.start() returned False"
+            self._set_status("safety", StageStatus.FAILED)
+            return False
+
+        self._results["safety"] = robot
+        self._set_status("safety", StageStatus.READY)
+        return True
+
+    def _run_boot_frame(self) -> None:
+        """Stage 2: show the booting frame (non-fatal)."""
+        self._set_status("led", StageStatus.RUNNING)
+        try:
+            with self.tracer.phase("led", kind="init"):
+                led = self._led_factory()
+            with self.tracer.phase("led.boot_frame", kind="init"):
+                led.set_brightness(self.config.boot_brightness)
+                led.set_color(self.config.boot_color)
+                if hasattr(led, "set_pattern"):
+                    led.set_pattern(self.config.boot_pattern)
+                led.update()
+        except Exception as e:
+            _logger.warning("Boot frame unavailable: %s", e)
+            self._errors["led"] = str(e)
+            self._set_status("led", StageStatus.FAILED)
+            return
+
+        self.tracer.mark(FIRST_EXPRESSION_MARK)
+        self._results["led"] = led
+        self._set_status("led", StageStatus.READY)
+
+    def _run_head(self) -> None:
+        """Stage 3: bring up the head controller (non-fatal)."""
+        self._set_status("head", StageStatus.RUNNING)
+        try:
+            with self.tracer.phase("head", kind="init"):
+                head = self._head_factory(self.robot)
+        except Exception as e:
+            _logger.warning("Head controller unavailable: %s", e)
+            self._errors["head"] = str(e)
+            self._set_status("head", StageStatus.FAILED)
+            return
+
+        self._results["head"] = head
+        self._set_status("head", StageStatus.READY)
+
+    def _run_background(self, stage: str, factory: Callable[[], Any]) -> None:
+        """Stage 4 worker: initialize one subsystem (non-fatal)."""
+        try:
+            with self.tracer.phase(stage, kind="init"):
+                result = factory()
+        except Exception as e:
+            _logger.warning("Background stage %s failed: %s", stage, e)
+            self._errors[stage] = str(e)
+            self._set_status(stage, StageStatus.FAILED)
+        else:
+            self._results[stage] = result
+            self._set_status(stage, StageStatus.READY)
+        finally:
+            with self._lock:
+                done = all(s not in (StageStatus.PENDING, StageStatus.RUNNING)
+                           for s in self._status.values())
+            if done:
+                self.tracer.mark(BACKGROUND_DONE_MARK)
+
+    # =========================================================================
+    # Config Hot Reload
+    # =========================================================================
+
+    def _start_config_reload(self) -> None:
+        """Apply config hot reloads to the LED and head controllers."""
+        self.config_loader.register_callback(self._apply_config)
+        interval_s = self.config.config_watch_interval_s
+        if interval_s is not None:
+            self.config_loader.start_watching(interval_s=interval_s)
+
+    def _apply_config(self, old: RobotConfig, new: RobotConfig) -> None:
+        """ConfigLoader callback: apply hot-reloadable sections."""
+        led = self.led
+        if led is not None and new.led != old.led:
+            led.set_brightness(new.led.brightness)
+            if hasattr(led, "target_fps"):
+                led.target_fps = new.led.target_fps
+        head = self.head
+        if head is not None and new.animation != old.animation:
+            head.apply_config(new)
+
+    # =========================================================================
+    # Default Factories
+    # =========================================================================
+
+    def _create_robot(self) -> Any:
+        """Default robot factory: Robot with hardware, from the config."""
+        robot_module = self.tracer.import_module("src.core.robot")
+        return robot_module.Robot.from_config(self.robot_config)
+
+    def _create_led(self) -> Any:
+        """Default LED factory: dual-ring LEDController at boot brightness."""
+        led_module = self.tracer.import_module("src.core.led_manager")
+        led = led_module.LEDController.from_config(
+            self.robot_config, brightness=self.config.boot_brightness,
+        )
+        led.initialize_hardware()  # False in mock mode; frames still render
+        return led
+
+    def _create_head(self, robot: Any) -> Any:
+        """Default head factory: HeadController on the robot's servo driver."""
+        if robot.servo_driver is None:
+            raise RuntimeError("robot has no servo driver")
+        head_module = self.tracer.import_module("src.control.head_controller")
+        return head_module.HeadController.from_config(self.robot_config, robot.servo_driver)
+
+    def _create_voice(self) -> Any:
+        """Default voice factory: pipeline with its wake word model loaded."""
+        pipeline_module = self.tracer.import_module("src.voice.pipeline")
+        models_module = self.tracer.import_module("src.voice.models")
+        pipeline = pipeline_module.WakeWordPipeline()
+        with self.tracer.phase("voice.model", kind="init"):
+            models_module.get_wake_word_model_manager().acquire(
+                pipeline.config.wake_models,
+                warmup=pipeline.config.model_warmup,
+            )
+        return pipeline
+
+    def _create_compound_patterns(self) -> Dict[str, Any]:
+        """Default patterns factory: one warmed instance per compound emotion."""
+        patterns_module = self.tracer.import_module("src.animation.emotion_patterns")
+        patterns = {}
+        for name, class_name in COMPOUND_PATTERN_CLASSES.items():
+            pattern = getattr(patterns_module, class_name)()
+            pattern.render(0.0)  # First render builds per-pattern tables
+            patterns[name] = pattern
+        return patterns
+
+    # =========================================================================
+    # Reporting
+    # =========================================================================
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get the bring-up report.
+
+        Returns:
+            Dictionary with stage statuses and errors, the tracer
+            timeline, time to first expression and whether it met target
+        """
+        first = self.tracer.get_mark(FIRST_EXPRESSION_MARK)
+        report = self.tracer.to_dict()
+        report['stages'] = self.get_status()
+        report['errors'] = dict(self._errors)
+        report['first_expression_ms'] = None if first is None else first * 1000.0
+        report['first_expression_target_ms'] = self.config.first_expression_target_s * 1000.0
+        report['first_expression_met'] = (
+            first is not None and first <= self.config.first_expression_target_s
+        )
+        return report
+
+    def shutdown(self) -> None:
+        """Stop config hot reload, stop the robot and blank the LEDs."""
+        self.config_loader.stop_watching()
+        self.config_loader.unregister_callback(self._apply_config)
+        led = self.led
+        if led is not None:
+            try:
+                led.clear()
+            except Exception as e:
+                _logger.warning("LED clear failed during shutdown: %s", e)
+        robot = self.robot
+        if robot is not None:
+            robot.stop()
@@ -24,27 +24,51 @@ import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, Any, Callable, List, Tuple
-
-# Import pattern system
-from led.patterns import (
-    PatternBase,
-    PatternConfig,
-    BreathingPattern,
-    PulsePattern,
-    SpinPattern,
-    PATTERN_REGISTRY,
-    RGB
-)
-
-# Import animation system
-from animation.timing import AnimationPlayer, AnimationSequence
-from animation.emotions import (
-    EmotionState,
-    EmotionConfig,
-    EmotionManager,
-    EMOTION_CONFIGS
-)
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, Tuple
+
+# Conditional import for both package and path-based usage
+# - Package import: from src.core.led_manager (uses src.led, src.animation)
+# - Path import: when src/ is in sys.path (uses led, animation)
+try:
+    # Import pattern system
+    from led.patterns import (
+        PatternBase,
+        PatternConfig,
+        BreathingPattern,
+        PulsePattern,
+        SpinPattern,
+        PATTERN_REGISTRY,
+        RGB
+    )
+
+    # Import animation system
+    from animation.timing import AnimationPlayer, AnimationSequence
+    from animation.emotions import (
+        EmotionState,
+        EmotionConfig,
+        EmotionManager,
+        EMOTION_CONFIGS
+    )
+except ImportError:
+    from src.led.patterns import (
+        PatternBase,
+        PatternConfig,
+        BreathingPattern,
+        PulsePattern,
+        SpinPattern,
+        PATTERN_REGISTRY,
+        RGB
+    )
+    from src.animation.timing import AnimationPlayer, AnimationSequence
+    from src.animation.emotions import (
+        EmotionState,
+        EmotionConfig,
+        EmotionManager,
+        EMOTION_CONFIGS
+    )
+
+if TYPE_CHECKING:
+    from utils.config import RobotConfig
 
 # Module logger
 _logger = logging.getLogger(__name__)
@@ -131,6 +155,28 @@ class LEDController:
         _logger.info(f"LEDController initialized: {num_pixels} pixels/ring, "
                     f"{target_fps}Hz, brightness={brightness}")
 
+    @classmethod
+    def from_config(cls, config: "RobotConfig", **kwargs: Any) -> "LEDController":
+        """Create an LED controller from a compiled configuration.
+
+        Args:
+            config: RobotConfig from src.utils.config
+            **kwargs: Constructor arguments; these override config values
+                (e.g. brightness for a dim boot frame).
+
+        Returns:
+            LEDController instance
+        """
+        params: Dict[str, Any] = {
+            "num_pixels": config.hardware.led_num_pixels,
+            "left_pin": config.hardware.led_left_pin,
+            "right_pin": config.hardware.led_right_pin,
+            "target_fps": config.led.target_fps,
+            "brightness": config.led.brightness,
+        }
+        params.update(kwargs)
+        return cls(**params)
+
     def initialize_hardware(self) -> bool:
         """Initialize LED hardware (rpi_ws281x).
 
@@ -4,7 +4,7 @@ This module provides the main Robot class that ties together all subsystems:
 - Servo control via PCA9685Driver
 - Safety coordination via SafetyCoordinator
 - Arm kinematics via ArmKinematics
-- Optional IMU via BNO085Driver
+- Optional IMU via BNO085Driver, sampled in the background by IMUSampler
 
 Design Philosophy:
     - Impossible to misuse: state machine enforces valid operations
@@ -14,7 +14,13 @@ Design Philosophy:
 
 Thread Model:
     - Main control loop is single-threaded for determinism
+    - Loop ticks sit on an absolute deadline grid (next += period), so
+      phase does not drift; overruns follow the configured policy
+    - step() times its phases (watchdog, IMU, arm, callback) into rolling
+      histograms; budgets and a periodic summary line flag slow phases
     - Safety systems run in daemon threads (watchdog, GPIO monitor)
+    - IMU is read by a sampler thread; step() only takes the latest
+      snapshot, so slow I2C reads do not add control-loop jitter
     - IMU failure is non-fatal (logged, continues)
     - Servo failure IS fatal (triggers E-stop)
 
@@ -32,7 +38,10 @@ import logging
 import math
 import time
 import threading
-from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
 
 from .robot_state import (
     RobotState,
@@ -43,10 +52,42 @@ from .robot_state import (
     HardwareError,
 )
 from .safety_coordinator import SafetyCoordinator
+from src.drivers.sensor.imu.history import IMUHistory
+from src.drivers.sensor.imu.sampler import IMUSampler, IMUSnapshot
 from src.kinematics.arm_kinematics import ArmKinematics
+from src.safety.current_limiter import ServoCurrentProfile
+from src.utils.lock_profiler import get_lock_report, is_lock_profiling_enabled
+from src.utils.timing_stats import LatencyHistogram, PhaseBudgetCallback, PhaseTimer
+
+if TYPE_CHECKING:
+    from src.utils.config import RobotConfig
 
 _logger = logging.getLogger(__name__)
 
+# Control loop overrun policies
+OVERRUN_SKIP = "skip"            # Drop missed ticks, stay on the phase grid
+OVERRUN_CATCH_UP = "catch_up"    # Run missed ticks back-to-back (bounded)
+OVERRUN_POLICIES = (OVERRUN_SKIP, OVERRUN_CATCH_UP)
+
+# Timed phases of one control loop iteration ("compute" = step() before
+# the deadline wait; "callback" = run_control_loop's iteration callback)
+LOOP_PHASES = ("watchdog", "imu", "arm", "compute", "callback")
+
+
+@dataclass
+class _ArmTrajectory:
+    """Pre-solved arm trajectory streamed by step(), one frame per tick."""
+    shoulder_deg: np.ndarray
+    elbow_deg: np.ndarray
+    shoulder_channel: int
+    elbow_channel: int
+    target: Tuple[float, float]
+    index: int = 1  # Frame 0 is the start position
+
+    @property
+    def remaining(self) -> int:
+        return len(self.shoulder_deg) - self.index
+
 
 class Robot:
     """Main robot orchestrator class.
@@ -74,6 +115,14 @@ class Robot:
     DEFAULT_WATCHDOG_TIMEOUT_MS: int = 500
     DEFAULT_ARM_L1_MM: float = 80.0
     DEFAULT_ARM_L2_MM: float = 60.0
+    DEFAULT_IMU_SAMPLE_HZ: float = 100.0
+    DEFAULT_IMU_HISTORY_SIZE: int = 256
+    DEFAULT_OVERRUN_POLICY: str = OVERRUN_SKIP
+    DEFAULT_BUSY_WAIT_US: int = 500
+    DEFAULT_MAX_CATCH_UP_TICKS: int = 3
+    DEFAULT_PHASE_LOG_INTERVAL_S: float = 60.0
+    DEFAULT_ESTOP_GPIO_PIN: int = 26
+    DEFAULT_ESTOP_DEBOUNCE_MS: int = 50
 
     def __init__(
         self,
@@ -85,6 +134,15 @@ class Robot:
         arm_l1_mm: float = DEFAULT_ARM_L1_MM,
         arm_l2_mm: float = DEFAULT_ARM_L2_MM,
         enable_hardware: bool = True,
+        imu_sample_hz: Optional[float] = DEFAULT_IMU_SAMPLE_HZ,
+        overrun_policy: str = DEFAULT_OVERRUN_POLICY,
+        busy_wait_us: int = DEFAULT_BUSY_WAIT_US,
+        max_catch_up_ticks: int = DEFAULT_MAX_CATCH_UP_TICKS,
+        phase_budgets_ms: Optional[Dict[str, float]] = None,
+        phase_log_interval_s: Optional[float] = DEFAULT_PHASE_LOG_INTERVAL_S,
+        estop_gpio_pin: int = DEFAULT_ESTOP_GPIO_PIN,
+        estop_debounce_ms: int = DEFAULT_ESTOP_DEBOUNCE_MS,
+        current_profile: Optional[ServoCurrentProfile] = None,
     ) -> None:
         """Initialize robot orchestrator.
 
@@ -98,9 +156,30 @@ class Robot:
             arm_l1_mm: First arm link length in millimeters.
             arm_l2_mm: Second arm link length in millimeters.
             enable_hardware: If False, skips hardware initialization (testing).
+            imu_sample_hz: IMU background sampling rate. None reads the IMU
+                synchronously inside step() instead.
+            overrun_policy: What step() does after missing a deadline:
+                "skip" drops the missed ticks and resumes on the next
+                deadline of the grid; "catch_up" runs missed ticks
+                back-to-back (up to max_catch_up_ticks, then skips).
+            busy_wait_us: Final part of each wait spent spinning instead of
+                sleeping, for sub-millisecond wake precision (0 = sleep only).
+            max_catch_up_ticks: Most ticks "catch_up" will replay.
+            phase_budgets_ms: Optional budgets for LOOP_PHASES, e.g.
+                {"watchdog": 2.0}. Phases over budget are counted and
+                reported to register_phase_budget_callback() callbacks.
+            phase_log_interval_s: Seconds between INFO log lines
+                summarizing phase timing. None disables the log line.
+            estop_gpio_pin: GPIO pin for the E-stop button.
+            estop_debounce_ms: Debounce time for the E-stop button.
+            current_profile: Servo current profile for the current limiter
+                (None = default MG90S profile).
 
         Raises:
-            ValueError: If control_loop_hz or watchdog_timeout_ms is not positive.
+            ValueError: If control_loop_hz, watchdog_timeout_ms or
+                imu_sample_hz is not positive, overrun_policy is unknown,
+                busy_wait_us/max_catch_up_ticks is negative, a phase budget
+                is invalid, or phase_log_interval_s is not positive.
         """
         if control_loop_hz <= 0:
             raise ValueError(
@@ -110,6 +189,23 @@ class Robot:
             raise ValueError(
                 f"watchdog_timeout_ms must be positive, got {watchdog_timeout_ms}"
             )
+        if imu_sample_hz is not None and imu_sample_hz <= 0:
+            raise ValueError(
+                f"imu_sample_hz must be positive, got {imu_sample_hz}"
+            )
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(
+                f"overrun_policy must be one of {OVERRUN_POLICIES}, got {overrun_policy!r}"
+            )
+        if busy_wait_us < 0 or max_catch_up_ticks < 0:
+            raise ValueError(
+                f"busy_wait_us and max_catch_up_ticks must be non-negative, "
+                f"got {busy_wait_us} and {max_catch_up_ticks}"
+            )
+        if phase_log_interval_s is not None and phase_log_interval_s <= 0:
+            raise ValueError(
+                f"phase_log_interval_s must be positive, got {phase_log_interval_s}"
+            )
 
         # Configuration
         self._control_loop_hz = control_loop_hz
@@ -134,6 +230,14 @@ class Robot:
         # Store IMU (optional)
         self._imu = imu
         self._last_imu_data: Optional[Any] = None
+        self._imu_sampler: Optional[IMUSampler] = None
+        if imu is not None and imu_sample_hz is not None:
+            self._imu_sampler = IMUSampler(
+                imu,
+                rate_hz=imu_sample_hz,
+                name="RobotIMUSampler",
+                history=IMUHistory(self.DEFAULT_IMU_HISTORY_SIZE),
+            )
 
         # Create safety coordinator
         self._safety: Optional[SafetyCoordinator] = None
@@ -142,15 +246,41 @@ class Robot:
                 servo_driver=self._servo_driver,
                 gpio_provider=gpio_provider,
                 watchdog_timeout_ms=watchdog_timeout_ms,
+                estop_gpio_pin=estop_gpio_pin,
+                estop_debounce_ms=estop_debounce_ms,
+                current_profile=current_profile,
             )
 
         # Create arm kinematics
         self._arm = ArmKinematics(l1=arm_l1_mm, l2=arm_l2_mm)
 
+        # Arm motion state (last commanded target, active trajectory)
+        self._arm_position: Optional[Tuple[float, float]] = None
+        self._arm_trajectory: Optional[_ArmTrajectory] = None
+
         # Control loop state
         self._iteration_count: int = 0
         self._last_step_time: float = 0.0
 
+        # Deadline scheduling (perf_counter clock; None = start a new grid)
+        self._overrun_policy = overrun_policy
+        self._busy_wait_s = busy_wait_us / 1_000_000.0
+        self._max_catch_up_ticks = max_catch_up_ticks
+        self._next_deadline: Optional[float] = None
+        self._jitter = LatencyHistogram()    # Wake time - deadline
+        self._overruns = LatencyHistogram()  # Lateness of missed deadlines
+        self._skipped_ticks: int = 0
+
+        # Per-phase timing (validates budgets before any hardware is touched)
+        self._phases = PhaseTimer(
+            LOOP_PHASES,
+            budgets_s={
+                name: budget / 1000.0 for name, budget in (phase_budgets_ms or {}).items()
+            },
+        )
+        self._phase_log_interval_s = phase_log_interval_s
+        self._next_phase_log: Optional[float] = None
+
         _logger.debug(
             "Robot initialized: hz=%d, watchdog=%dms, arm=%.1fx%.1fmm",
             control_loop_hz,
@@ -159,6 +289,31 @@ class Robot:
             arm_l2_mm,
         )
 
+    @classmethod
+    def from_config(cls, config: "RobotConfig", **kwargs: Any) -> "Robot":
+        """Create a robot from a compiled configuration.
+
+        Args:
+            config: RobotConfig from src.utils.config
+            **kwargs: Constructor arguments; these override config values
+                (e.g. servo_driver, enable_hardware=False).
+
+        Returns:
+            Robot instance
+        """
+        params: Dict[str, Any] = {
+            "control_loop_hz": config.control.loop_hz,
+            "watchdog_timeout_ms": config.control.watchdog_timeout_ms,
+            "arm_l1_mm": config.arm.l1_mm,
+            "arm_l2_mm": config.arm.l2_mm,
+            "imu_sample_hz": config.control.imu_sample_hz,
+            "estop_gpio_pin": config.safety.estop_gpio_pin,
+            "estop_debounce_ms": config.safety.estop_debounce_ms,
+            "current_profile": ServoCurrentProfile.from_config(config),
+        }
+        params.update(kwargs)
+        return cls(**params)
+
     # =========================================================================
     # Properties
     # =========================================================================
@@ -193,6 +348,38 @@ class Robot:
         """Get IMU instance."""
         return self._imu
 
+    @property
+    def imu_sampler(self) -> Optional[IMUSampler]:
+        """Get background IMU sampler (None without IMU or when disabled)."""
+        return self._imu_sampler
+
+    @property
+    def imu_snapshot(self) -> Optional[IMUSnapshot]:
+        """Latest IMU snapshot, without blocking (None if not sampled yet).
+
+        Intended for consumers outside the control loop such as head
+        stabilization; check snapshot.age() before trusting it.
+        """
+        if self._imu_sampler is None:
+            return None
+        return self._imu_sampler.latest
+
+    @property
+    def arm_trajectory_active(self) -> bool:
+        """True while step() is streaming an arm trajectory."""
+        return self._arm_trajectory is not None
+
+    @property
+    def imu_history(self) -> Optional[IMUHistory]:
+        """Recent IMU samples for windowed queries (None without sampler).
+
+        Example:
+            >>> roll, pitch = robot.imu_history.window(duration_s=0.2).complementary_tilt()
+        """
+        if self._imu_sampler is None:
+            return None
+        return self._imu_sampler.history
+
     @property
     def arm(self) -> ArmKinematics:
         """Get arm kinematics solver."""
@@ -247,9 +434,17 @@ class Robot:
                     return False
                 safety_started = True
 
+                # IMU sampling (non-fatal)
+                if self._imu_sampler is not None:
+                    try:
+                        self._imu_sampler.start()
+                    except Exception as e:
+                        _logger.warning("IMU sampler failed to start (continuing): %s", e)
+
                 # Transition state
                 self._state = RobotState.READY
                 self._iteration_count = 0
+                self._next_deadline = None
                 _logger.info("Robot started successfully")
                 return True
 
@@ -276,6 +471,11 @@ class Robot:
             if self._safety is not None:
                 self._safety.stop()
 
+            if self._imu_sampler is not None:
+                self._imu_sampler.stop()
+
+            self._arm_trajectory = None
+
             # Don't change state - leave it as E_STOPPED or current
             if self._state == RobotState.READY:
                 self._state = RobotState.E_STOPPED
@@ -295,6 +495,7 @@ class Robot:
         """
         with self._state_lock:
             _logger.warning("Emergency stop triggered: %s", source)
+            self._arm_trajectory = None
 
             latency = -1.0
             if self._safety is not None:
@@ -337,6 +538,7 @@ class Robot:
             # Transition to READY
             self._state = RobotState.READY
             self._iteration_count = 0
+            self._next_deadline = None
             _logger.info("Robot reset successful")
             return True
 
@@ -355,9 +557,10 @@ class Robot:
         Each iteration:
         1. Check state is READY
         2. Feed watchdog (with safety checks)
-        3. Read IMU (if available, non-fatal on failure)
+        3. Take the latest IMU snapshot (if available, never blocks)
+           and send the next arm trajectory frame (if one is active)
         4. Call iteration callback (if provided)
-        5. Sleep to maintain target frequency
+        5. Wait for the next absolute deadline (sleep, then spin)
 
         Args:
             iteration_callback: Optional function called each iteration.
@@ -380,6 +583,10 @@ class Robot:
             max_iterations,
         )
 
+        # Start a fresh deadline grid; earlier manual step() calls may have
+        # left one far in the past
+        self._next_deadline = None
+
         iterations = 0
         while True:
             # Check iteration limit
@@ -395,7 +602,9 @@ class Robot:
             # Call callback
             if iteration_callback is not None:
                 try:
+                    callback_start = time.perf_counter()
                     iteration_callback(self)
+                    self._phases.record("callback", time.perf_counter() - callback_start)
                 except Exception as e:
                     _logger.error("Control loop callback error: %s", e)
                     self.emergency_stop(source=f"callback_error:{type(e).__name__}")
@@ -408,13 +617,17 @@ class Robot:
         """Execute single control loop iteration.
 
         Useful for manual control or testing. Performs all safety
-        checks and timing management.
+        checks and timing management: returns at the tick's absolute
+        deadline (first call: one period after it started), or
+        immediately after a missed deadline, per the overrun policy.
 
         Returns:
             True if step succeeded, False if loop should exit.
         """
         try:
-            step_start = time.perf_counter()
+            clock = time.perf_counter
+            step_start = clock()
+            phases = self._phases
 
             # Check state
             if self.state != RobotState.READY:
@@ -428,28 +641,42 @@ class Robot:
                         if self._state == RobotState.READY:
                             self._state = RobotState.E_STOPPED
                     return False
-
-            # Read IMU (non-fatal)
-            if self._imu is not None:
+            t_watchdog = clock()
+            phases.record("watchdog", t_watchdog - step_start)
+
+            # Take latest IMU snapshot (never blocks on I2C)
+            if self._imu_sampler is not None:
+                snapshot = self._imu_sampler.latest
+                if snapshot is not None:
+                    self._last_imu_data = snapshot
+            # Read IMU synchronously when sampling is disabled (non-fatal)
+            elif self._imu is not None:
                 try:
                     self._last_imu_data = self._imu.read_orientation()
                 except Exception as e:
                     _logger.warning("IMU read failed (continuing): %s", e)
                     # Don't trigger E-stop for IMU failure
-
-            # Calculate sleep time to maintain frequency
-            elapsed = time.perf_counter() - step_start
-            sleep_time = self._control_loop_period_s - elapsed
-
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-            elif elapsed > self._control_loop_period_s * 1.5:
-                # Log warning if significantly over period
-                _logger.warning(
-                    "Control loop iteration took %.1fms (target: %.1fms)",
-                    elapsed * 1000,
-                    self._control_loop_period_s * 1000,
-                )
+            t_imu = clock()
+            phases.record("imu", t_imu - t_watchdog)
+
+            # Stream next pre-solved arm frame
+            trajectory = self._arm_trajectory
+            if trajectory is not None:
+                self._stream_arm_frame(trajectory)
+            t_arm = clock()
+            phases.record("arm", t_arm - t_imu)
+            phases.record("compute", t_arm - step_start)
+
+            # Periodic phase summary (logged before the wait, inside the slack)
+            if self._phase_log_interval_s is not None:
+                if self._next_phase_log is None:
+                    self._next_phase_log = t_arm + self._phase_log_interval_s
+                elif t_arm >= self._next_phase_log:
+                    self._next_phase_log = t_arm + self._phase_log_interval_s
+                    _logger.info("Control loop phases: %s", phases.format_line())
+
+            # Wait for this tick's absolute deadline
+            self._wait_for_deadline(step_start)
 
             self._last_step_time = time.perf_counter() - step_start
             return True
@@ -459,6 +686,95 @@ class Robot:
             self.emergency_stop(source=f"step_error:{type(e).__name__}")
             return False
 
+    def _wait_for_deadline(self, step_start: float) -> None:
+        """Wait for the current tick's deadline and schedule the next one.
+
+        Deadlines advance by exactly one period (next += period), so the
+        loop stays phase-locked regardless of how long each step took.
+        """
+        period = self._control_loop_period_s
+        deadline = self._next_deadline
+        if deadline is None:
+            deadline = step_start + period
+
+        now = time.perf_counter()
+        if now <= deadline:
+            # Sleep most of the wait, spin the tail for precise wake-up
+            remaining = deadline - now
+            if remaining > self._busy_wait_s:
+                time.sleep(remaining - self._busy_wait_s)
+            while time.perf_counter() < deadline:
+                pass
+            self._jitter.add(time.perf_counter() - deadline)
+            self._next_deadline = deadline + period
+            return
+
+        # Missed the deadline: 'late' past it, 'missed' further ticks also past
+        late = now - deadline
+        missed = int(late / period)
+        self._overruns.add(late)
+        if self._overrun_policy == OVERRUN_CATCH_UP and missed <= self._max_catch_up_ticks:
+            self._next_deadline = deadline + period
+        else:
+            self._skipped_ticks += missed
+            self._next_deadline = deadline + (missed + 1) * period
+
+        if missed:
+            _logger.warning(
+                "Control loop overran by %.1fms (period %.1fms, %s %d tick(s))",
+                late * 1000,
+                period * 1000,
+                "catching up" if self._next_deadline == deadline + period else "skipped",
+                missed,
+            )
+
+    def get_timing_stats(self) -> Dict[str, Any]:
+        """Get control loop timing statistics.
+
+        Returns:
+            Dictionary with period, policy, skipped tick count, rolling
+            histograms of wake-up jitter and deadline overruns (ms), and
+            per-phase percentiles under "phases"
+        """
+        return {
+            "period_ms": self._control_loop_period_s * 1000,
+            "overrun_policy": self._overrun_policy,
+            "busy_wait_us": self._busy_wait_s * 1_000_000,
+            "skipped_ticks": self._skipped_ticks,
+            "jitter": self._jitter.to_dict(),
+            "overrun": self._overruns.to_dict(),
+            "phases": self._phases.to_dict(),
+        }
+
+    def register_phase_budget_callback(self, callback: PhaseBudgetCallback) -> None:
+        """Register a callback fired when a loop phase exceeds its budget.
+
+        Callbacks run synchronously on the control loop thread; keep them
+        fast. Exceptions are logged and do not stop the loop.
+
+        Args:
+            callback: Function with signature (phase, duration_s, budget_s).
+                - phase: One of LOOP_PHASES
+                - duration_s: Measured phase duration
+                - budget_s: Configured budget
+
+        Example:
+            >>> robot = Robot(phase_budgets_ms={"watchdog": 2.0})
+            >>> robot.register_phase_budget_callback(
+            ...     lambda phase, took, budget: print(f"{phase}: {took * 1e3:.1f}ms")
+            ... )
+        """
+        self._phases.register_callback(callback)
+
+    def set_phase_budget(self, phase: str, budget_ms: Optional[float]) -> None:
+        """Set or clear (None) the budget of a loop phase.
+
+        Raises:
+            ValueError: If phase is not in LOOP_PHASES or budget_ms is not
+                positive.
+        """
+        self._phases.set_budget(phase, budget_ms / 1000.0 if budget_ms is not None else None)
+
     # =========================================================================
     # Servo Command Methods
     # =========================================================================
@@ -525,24 +841,48 @@ class Robot:
         elbow_up: bool = True,
         shoulder_channel: int = 0,
         elbow_channel: int = 1,
+        duration_s: Optional[float] = None,
+        start: Optional[Tuple[float, float]] = None,
     ) -> bool:
         """Set arm end-effector position using inverse kinematics.
 
+        With duration_s, plans a smooth straight-line Cartesian path from
+        the current position, solves every waypoint in one batch IK call,
+        and lets step() stream one frame per control-loop tick. Otherwise
+        both servos move to the target immediately. A new call replaces
+        any trajectory still in progress.
+
         Args:
             x: Target X position in millimeters.
             y: Target Y position in millimeters.
             elbow_up: If True, prefer elbow-up configuration.
             shoulder_channel: Servo channel for shoulder joint.
             elbow_channel: Servo channel for elbow joint.
+            duration_s: Trajectory duration in seconds. None moves immediately.
+            start: Trajectory start (x, y) in millimeters. Default is the
+                last commanded position; with no known position the arm
+                moves immediately.
 
         Returns:
-            True if position was reachable and set, False if unreachable.
+            True if the position (and every waypoint) was reachable and the
+            move was started, False if unreachable.
 
         Raises:
+            ValueError: If duration_s is not positive.
             RobotStateError: If not in READY state.
             SafetyViolationError: If movement blocked by safety system.
             HardwareError: If servo communication fails.
         """
+        if duration_s is not None:
+            if duration_s <= 0:
+                raise ValueError(f"duration_s must be positive, got {duration_s}")
+            path_start = start if start is not None else self._arm_position
+            if path_start is not None:
+                return self._plan_arm_trajectory(
+                    path_start, (x, y), duration_s, elbow_up,
+                    shoulder_channel, elbow_channel,
+                )
+
         # Solve IK
         result = self._arm.solve_ik(x, y, elbow_up=elbow_up)
         if result is None:
@@ -563,11 +903,69 @@ class Robot:
         elbow_deg = max(0.0, min(180.0, elbow_deg))
 
         # Set both servos
+        self._arm_trajectory = None
         self.set_servo_angle(shoulder_channel, shoulder_deg)
         self.set_servo_angle(elbow_channel, elbow_deg)
+        self._arm_position = (x, y)
 
         return True
 
+    def _plan_arm_trajectory(
+        self,
+        start: Tuple[float, float],
+        target: Tuple[float, float],
+        duration_s: float,
+        elbow_up: bool,
+        shoulder_channel: int,
+        elbow_channel: int,
+    ) -> bool:
+        """Plan and batch-solve a Cartesian arm path for step() to stream."""
+        if self.state != RobotState.READY:
+            raise RobotStateError(
+                f"Cannot move arm in state {self.state.name}",
+                from_state=self.state,
+            )
+
+        frames = max(2, math.ceil(duration_s * self._control_loop_hz) + 1)
+        xs, ys = self._arm.plan_cartesian_path(start, target, frames)
+        shoulder_rad, elbow_rad, reachable = self._arm.solve_ik_batch(xs, ys, elbow_up=elbow_up)
+        if not reachable.all():
+            first = int(np.argmin(reachable))
+            _logger.warning(
+                "Arm path (%.1f, %.1f) -> (%.1f, %.1f) leaves workspace at (%.1f, %.1f)",
+                start[0], start[1], target[0], target[1], xs[first], ys[first],
+            )
+            return False
+
+        # Convert and clamp to servo range (0-180) for the whole path at once
+        self._arm_trajectory = _ArmTrajectory(
+            shoulder_deg=np.clip(np.degrees(shoulder_rad), 0.0, 180.0),
+            elbow_deg=np.clip(np.degrees(elbow_rad), 0.0, 180.0),
+            shoulder_channel=shoulder_channel,
+            elbow_channel=elbow_channel,
+            target=(float(target[0]), float(target[1])),
+        )
+        _logger.debug("Arm trajectory planned: %d frames over %.2fs", frames, duration_s)
+        return True
+
+    def _stream_arm_frame(self, trajectory: _ArmTrajectory) -> None:
+        """Send the next trajectory frame to the arm servos (from step())."""
+        i = trajectory.index
+        try:
+            self.set_servo_angle(trajectory.shoulder_channel, float(trajectory.shoulder_deg[i]))
+            self.set_servo_angle(trajectory.elbow_channel, float(trajectory.elbow_deg[i]))
+        except SafetyViolationError as e:
+            # Movement refused by safety: abandon the gesture, keep running
+            _logger.warning("Arm trajectory aborted: %s", e)
+            if self._arm_trajectory is trajectory:
+                self._arm_trajectory = None
+            return
+
+        trajectory.index = i + 1
+        if trajectory.remaining <= 0 and self._arm_trajectory is trajectory:
+            self._arm_position = trajectory.target
+            self._arm_trajectory = None
+
     # =========================================================================
     # Diagnostics
     # =========================================================================
@@ -589,9 +987,16 @@ class Robot:
                     "l1_mm": self._arm.l1,
                     "l2_mm": self._arm.l2,
                     "max_reach_mm": self._arm.max_reach,
+                    "position_mm": self._arm_position,
+                    "trajectory_frames_remaining": (
+                        self._arm_trajectory.remaining if self._arm_trajectory else 0
+                    ),
                 },
             }
 
+            # Loop timing (jitter/overrun histograms)
+            diag["timing"] = self.get_timing_stats()
+
             # Safety diagnostics
             if self._safety is not None:
                 diag["safety"] = self._safety.get_diagnostics()
@@ -599,8 +1004,15 @@ class Robot:
             # IMU data
             if self._last_imu_data is not None:
                 diag["imu"] = {"last_reading": str(self._last_imu_data)}
+            if self._imu_sampler is not None:
+                diag.setdefault("imu", {})["sampler"] = self._imu_sampler.get_statistics()
+
+        # Lock contention (outside _state_lock so the report does not
+        # perturb the locks it is measuring)
+        if is_lock_profiling_enabled():
+            diag["locks"] = get_lock_report()
 
-            return diag
+        return diag
 
     # =========================================================================
     # Context Manager
@@ -34,14 +34,14 @@ Example:
 """
 
 import logging
-import threading
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple
 
 from src.safety.emergency_stop import EmergencyStop, SafetyState
 from src.safety.watchdog import ServoWatchdog
-from src.safety.current_limiter import CurrentLimiter, StallCondition
+from src.safety.current_limiter import CurrentLimiter, ServoCurrentProfile, StallCondition
+from src.utils.lock_profiler import create_lock
 
 _logger = logging.getLogger(__name__)
 
@@ -96,6 +96,7 @@ class SafetyCoordinator:
         watchdog_timeout_ms: int = 500,
         estop_gpio_pin: int = 26,
         estop_debounce_ms: int = 50,
+        current_profile: Optional[ServoCurrentProfile] = None,
     ) -> None:
         """Initialize safety coordinator.
 
@@ -105,6 +106,8 @@ class SafetyCoordinator:
             watchdog_timeout_ms: Watchdog timeout in milliseconds.
             estop_gpio_pin: GPIO pin for E-stop button.
             estop_debounce_ms: Debounce time for E-stop button.
+            current_profile: Servo current profile for the current
+                limiter. If None, uses the default MG90S profile.
 
         Raises:
             ValueError: If watchdog_timeout_ms is not positive.
@@ -120,7 +123,7 @@ class SafetyCoordinator:
         self._estop_gpio_pin = estop_gpio_pin
 
         # Thread safety (RLock for reentrant access in get_diagnostics)
-        self._lock = threading.RLock()
+        self._lock = create_lock("core.safety_coordinator")
         self._started = False
         self._last_estop_source: Optional[str] = None
 
@@ -139,6 +142,7 @@ class SafetyCoordinator:
         )
 
         self._current_limiter = CurrentLimiter(
+            profile=current_profile,
             pca_driver=servo_driver,
         )
 
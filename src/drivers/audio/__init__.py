@@ -3,8 +3,11 @@
 This module provides drivers for the OpenDuck Mini V3 audio subsystem:
 - INMP441Driver: I2S MEMS microphone for voice capture
 - AudioCapturePipeline: Continuous capture with ring buffer and VAD
-- VoiceActivityDetector: Simple energy-based speech detection
+- VoiceActivityDetector: Energy-based speech detection (live and frame-based)
 - I2SBusManager: Thread-safe singleton for I2S bus access
+- PolyphaseResampler: Streaming anti-aliased sample rate conversion
+- FeatureExtractor: Per-chunk energy, ZCR and spectral features
+- AudioDispatcher: Off-callback chunk fan-out with bounded per-subscriber queues
 - MAX98357A: I2S amplifier for audio output (planned)
 
 Three complementary APIs are provided:
@@ -83,10 +86,32 @@ from .audio_capture import (
     AudioCaptureState,
     AudioRingBuffer,
     AudioSample,
+    VADConfig,
+    VADEvent,
+    VADResult,
+    VADState,
     VoiceActivityDetector,
     create_capture_pipeline,
 )
 
+# Per-chunk feature extraction
+from .features import (
+    ChunkFeatures,
+    FeatureExtractor,
+)
+
+# Callback dispatch off the real-time thread
+from .dispatch import (
+    AudioDispatcher,
+    AudioSubscription,
+)
+
+# Streaming polyphase resampler
+from .resampler import (
+    PolyphaseResampler,
+    design_lowpass,
+)
+
 # I2S bus manager
 from .i2s_bus import (
     I2SBusManager,
@@ -113,8 +138,21 @@ __all__ = [
     "AudioCaptureState",
     "AudioRingBuffer",
     "AudioSample",
+    "VADConfig",
+    "VADEvent",
+    "VADResult",
+    "VADState",
     "VoiceActivityDetector",
     "create_capture_pipeline",
+    # Feature extraction
+    "ChunkFeatures",
+    "FeatureExtractor",
+    # Dispatch
+    "AudioDispatcher",
+    "AudioSubscription",
+    # Resampler
+    "PolyphaseResampler",
+    "design_lowpass",
     # I2S bus manager
     "I2SBusManager",
     "I2SConfig",
@@ -1,6 +1,6 @@
 """Audio Capture Pipeline for INMP441 I2S Microphone
 
-This module provides a complete audio capture pipeline with thread-safe ring buffer,
+This module provides a complete audio capture pipeline with a lock-free SPSC ring buffer,
 continuous background capture, and foundation voice activity detection (VAD).
 
 Hardware:
@@ -18,7 +18,9 @@ Connections (I2S):
 
 Thread Safety:
     All public methods are thread-safe using appropriate locking mechanisms.
-    The capture runs in a dedicated background thread to avoid blocking.
+    The capture runs in a dedicated background thread to avoid blocking; the
+    audio callback only copies into the ring buffer without taking any lock.
+    Level metering, VAD and user callbacks run on an AudioDispatcher thread.
 
 Example:
     ```python
@@ -52,10 +54,13 @@ import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .dispatch import DEFAULT_SUBSCRIBER_QUEUE, AudioDispatcher
+from .features import ChunkFeatures, FeatureExtractor, chunk_mean_square
+
 # FIX H2-HIGH-003: Add logger for error handling
 _logger = logging.getLogger(__name__)
 
@@ -89,6 +94,11 @@ class AudioCaptureConfig:
         chunk_size_ms: Size of audio chunks for processing in ms (default: 20)
         vad_threshold_db: Voice activity detection threshold in dB (default: -40.0)
         vad_min_speech_ms: Minimum speech duration for VAD trigger (default: 100)
+        vad_spectral_flatness_max: Reject chunks flatter than this as noise
+            (None disables the spectral test; ~0.4 separates voiced speech
+            from broadband noise)
+        spectral_features: Compute band energies/flatness for every chunk
+            even when the VAD spectral test is off (default: False)
         device_index: Audio device index (None for default)
     """
     sample_rate: int = 16000
@@ -98,6 +108,8 @@ class AudioCaptureConfig:
     chunk_size_ms: int = 20
     vad_threshold_db: float = -40.0
     vad_min_speech_ms: int = 100
+    vad_spectral_flatness_max: Optional[float] = None
+    spectral_features: bool = False
     device_index: Optional[int] = None
 
     def __post_init__(self) -> None:
@@ -116,6 +128,10 @@ class AudioCaptureConfig:
             raise ValueError(f"vad_threshold_db must be <= 0, got {self.vad_threshold_db}")
         if self.vad_min_speech_ms < 10:
             raise ValueError(f"vad_min_speech_ms must be at least 10ms, got {self.vad_min_speech_ms}")
+        if self.vad_spectral_flatness_max is not None and not 0.0 < self.vad_spectral_flatness_max <= 1.0:
+            raise ValueError(
+                f"vad_spectral_flatness_max must be in (0, 1], got {self.vad_spectral_flatness_max}"
+            )
 
     @property
     def samples_per_buffer(self) -> int:
@@ -152,30 +168,47 @@ class AudioSample:
 
 
 class AudioRingBuffer:
-    """Thread-safe circular buffer for audio samples.
+    """Single-producer/single-consumer ring buffer for audio samples.
 
-    Implements a lock-free write, lock-protected read ring buffer optimized
-    for continuous audio capture with low latency.
+    Lock-free: the producer (audio callback) only advances ``_head`` and the
+    consumer only advances ``_tail``, so write() never blocks on a reader.
+    Storage is mirrored - every frame is written at ``pos`` and
+    ``pos + capacity`` - so any window of up to ``capacity`` frames is a
+    single contiguous slice and reads never need to stitch a wraparound.
 
-    The buffer stores float32 audio samples normalized to -1.0 to 1.0 range.
+    Frames are stored interleaved in a flat array (float32 by default;
+    capture sources that keep raw PCM use int32); reads return
+    ``(N, channels)`` views of it, which for mono costs nothing extra.
+
+    When the producer laps the consumer, the oldest frames are dropped. The
+    producer never touches ``_tail``; the consumer skips ahead on its next
+    read. Dropped frames are counted in ``overflow_samples``.
+
+    Torn reads are detected seqlock-style: the producer publishes the end
+    of each write in ``_reserve`` before copying, and readers retry if a
+    write that could have overlapped their window started during the copy.
 
     Thread Safety:
-        - write(): Thread-safe, uses atomic operations where possible
-        - read(): Thread-safe, returns a copy of data
-        - get_available(): Thread-safe snapshot (may be stale)
-        - clear(): Thread-safe
+        - write(): Producer only (one thread, e.g. the PortAudio callback)
+        - read_and_consume(), consume_into(), clear(): Consumer only
+        - read(), read_into(), read_from(), get_available(): Any thread
+          (non-consuming)
+        - view_latest(): Any thread, but the view is unsynchronized
 
     Attributes:
-        capacity: Maximum number of samples the buffer can hold
+        capacity: Maximum number of frames the buffer can hold
         dtype: NumPy data type for samples (float32)
     """
 
-    def __init__(self, capacity: int, channels: int = 1) -> None:
+    _MAX_READ_RETRIES = 3
+
+    def __init__(self, capacity: int, channels: int = 1, dtype: Any = np.float32) -> None:
         """Initialize ring buffer.
 
         Args:
-            capacity: Maximum number of samples to store
+            capacity: Maximum number of frames to store
             channels: Number of audio channels (default: 1)
+            dtype: Sample storage type (default: float32)
 
         Raises:
             ValueError: If capacity <= 0 or channels < 1
@@ -187,17 +220,22 @@ class AudioRingBuffer:
 
         self._capacity = capacity
         self._channels = channels
-        self._buffer = np.zeros((capacity, channels), dtype=np.float32)
-        self._write_pos = 0
-        self._read_pos = 0
-        self._available = 0
-        self._lock = threading.Lock()
-        self._total_written = 0
+        self._dtype = np.dtype(dtype)
+        self._buffer = np.zeros(2 * capacity * channels, dtype=self._dtype)
+        self._frames = self._buffer.reshape(2 * capacity, channels)
+
+        # Monotonic frame counters (never wrapped)
+        self._head = 0       # Frames published by producer
+        self._reserve = 0    # End of the write in progress (>= _head)
+        self._tail = 0       # Frames consumed (or cleared) by consumer
+
+        # Producer-owned statistics
         self._overflow_count = 0
+        self._overflow_samples = 0
 
     @property
     def capacity(self) -> int:
-        """Return buffer capacity in samples."""
+        """Return buffer capacity in frames."""
         return self._capacity
 
     @property
@@ -205,16 +243,31 @@ class AudioRingBuffer:
         """Return number of channels."""
         return self._channels
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the sample storage type."""
+        return self._dtype
+
     @property
     def overflow_count(self) -> int:
-        """Return number of overflow events (oldest data dropped)."""
-        with self._lock:
-            return self._overflow_count
+        """Return number of writes that dropped unread data."""
+        return self._overflow_count
+
+    @property
+    def overflow_samples(self) -> int:
+        """Return total frames dropped because the consumer fell behind."""
+        return self._overflow_samples
+
+    @property
+    def total_written(self) -> int:
+        """Return total frames written since creation (the write position)."""
+        return self._head
 
     def write(self, samples: np.ndarray) -> int:
         """Write samples to the buffer, overwriting oldest data if full.
 
-        Thread-safe. If buffer is full, oldest samples are overwritten.
+        Producer only. Never blocks; samples are cast to the buffer dtype as
+        they are copied in, so no temporary array is allocated.
 
         Args:
             samples: NumPy array of audio samples. Shape should be (N,) for mono
@@ -222,7 +275,7 @@ class AudioRingBuffer:
                     to -1.0 to 1.0 range.
 
         Returns:
-            Number of samples actually written (may be less if buffer smaller than input)
+            Number of frames actually written (may be less if buffer smaller than input)
 
         Raises:
             ValueError: If sample shape incompatible with buffer channels
@@ -241,129 +294,286 @@ class AudioRingBuffer:
         if num_samples == 0:
             return 0
 
+        capacity = self._capacity
+        head = self._head
+        dropped = 0
+
         # If input larger than capacity, only keep the newest samples
-        if num_samples > self._capacity:
-            samples = samples[-self._capacity:]
-            num_samples = self._capacity
+        if num_samples > capacity:
+            dropped = num_samples - capacity
+            samples = samples[-capacity:]
+            num_samples = capacity
+
+        unread = min(head - self._tail, capacity)
+        if unread + num_samples > capacity:
+            dropped += min(unread, unread + num_samples - capacity)
+        if dropped:
+            self._overflow_count += 1
+            self._overflow_samples += dropped
+
+        # Announce the write before touching storage (see read_into)
+        self._reserve = head + num_samples
+
+        pos = head % capacity
+        first = min(num_samples, capacity - pos)
+        frames = self._frames
+        # Primary and mirror copies of the part up to the wrap point...
+        frames[pos:pos + first] = samples[:first]
+        frames[pos + capacity:pos + capacity + first] = samples[:first]
+        # ...and of the part that wraps to the start
+        if first < num_samples:
+            rest = num_samples - first
+            frames[:rest] = samples[first:]
+            frames[capacity:capacity + rest] = samples[first:]
+
+        self._head = head + num_samples
+        return num_samples
 
-        with self._lock:
-            # Calculate how much will fit before wraparound
-            space_to_end = self._capacity - self._write_pos
+    def _window_start(self, num_samples: int, origin: Optional[int]) -> Tuple[int, int]:
+        """Return (start frame, frame count) of a read window.
 
-            if num_samples <= space_to_end:
-                # Simple case: fits without wraparound
-                self._buffer[self._write_pos:self._write_pos + num_samples] = samples
-            else:
-                # Need to wrap around
-                self._buffer[self._write_pos:] = samples[:space_to_end]
-                remaining = num_samples - space_to_end
-                self._buffer[:remaining] = samples[space_to_end:]
+        ``origin`` None selects the newest unconsumed frames; otherwise the
+        window starts at absolute frame ``origin``, or at the oldest frame
+        still stored if ``origin`` has been overwritten.
+        """
+        head = self._head
+        if origin is None:
+            tail = max(self._tail, head - self._capacity)
+            actual = min(num_samples, head - tail)
+            return head - actual, actual
+        start = max(origin, head - self._capacity)
+        return start, max(0, min(num_samples, head - start))
+
+    def _copy_window(self, out: np.ndarray, num_samples: int,
+                     origin: Optional[int]) -> Tuple[int, int]:
+        """Copy a window into ``out``, retrying if the producer overwrote it.
+
+        Returns:
+            (start frame, frames copied)
+        """
+        capacity = self._capacity
+        out2d = out.reshape(-1, self._channels)
+        for _ in range(self._MAX_READ_RETRIES):
+            start, actual = self._window_start(num_samples, origin)
+            if actual == 0:
+                return start, 0
+            pos = start % capacity
+            out2d[:actual] = self._frames[pos:pos + actual]
+            # Frames before valid_from may have been overwritten mid-copy
+            valid_from = self._reserve - capacity
+            if valid_from <= start:
+                return start, actual
+        # Producer keeps lapping us: keep only the frames it cannot have touched
+        torn = min(valid_from - start, actual)
+        out2d[:actual - torn] = out2d[torn:actual]
+        return start + torn, actual - torn
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy the newest samples into a caller-provided array.
+
+        Allocation-free peek: does not remove data from the buffer.
+
+        Args:
+            out: Array of the buffer dtype, shape (N,) for mono or (N, channels);
+                N is the number of frames requested
 
-            # Update write position
-            old_write_pos = self._write_pos
-            self._write_pos = (self._write_pos + num_samples) % self._capacity
+        Returns:
+            Number of frames copied into the start of ``out`` (may be fewer
+            than N if insufficient data is available)
+
+        Raises:
+            ValueError: If ``out`` size is not a multiple of channels
+        """
+        if out.size % self._channels:
+            raise ValueError(
+                f"out size ({out.size}) is not a multiple of channels ({self._channels})"
+            )
+        _, actual = self._copy_window(out, out.size // self._channels, None)
+        return actual
 
-            # Check for overflow (write position passed read position)
-            old_available = self._available
-            self._available = min(self._available + num_samples, self._capacity)
+    def read_from(self, position: int, out: np.ndarray) -> Tuple[int, int]:
+        """Copy samples starting at an absolute frame position.
 
-            if old_available + num_samples > self._capacity:
-                overflow_samples = (old_available + num_samples) - self._capacity
-                self._overflow_count += 1
-                # Move read position forward to maintain buffer integrity
-                self._read_pos = self._write_pos
+        Cursor-based read for additional readers (e.g. a dispatcher thread)
+        that track their own position instead of consuming. Does not move
+        the consumer's read position.
 
-            self._total_written += num_samples
+        Args:
+            position: Absolute frame index (see total_written)
+            out: Array of the buffer dtype, shape (N,) for mono or (N, channels)
 
-        return num_samples
+        Returns:
+            (start, count): absolute index of the first frame copied and the
+            number of frames copied. ``start > position`` means the frames
+            in between were overwritten before they could be read.
+
+        Raises:
+            ValueError: If ``out`` size is not a multiple of channels
+        """
+        if out.size % self._channels:
+            raise ValueError(
+                f"out size ({out.size}) is not a multiple of channels ({self._channels})"
+            )
+        return self._copy_window(out, out.size // self._channels, position)
 
     def read(self, num_samples: int) -> np.ndarray:
-        """Read samples from the buffer.
+        """Read the newest samples from the buffer.
 
-        Thread-safe. Returns a copy of the data to prevent race conditions.
+        Returns a copy of the data to prevent races with the producer.
         Does not remove data from buffer (peek behavior).
 
         Args:
-            num_samples: Number of samples to read. If more than available,
-                        returns all available samples.
+            num_samples: Number of frames to read. If more than available,
+                        returns all available frames.
 
         Returns:
             NumPy array of shape (N, channels) with the requested samples.
             May be shorter than requested if insufficient data available.
         """
-        with self._lock:
-            actual_samples = min(num_samples, self._available)
+        out = np.empty((max(0, min(num_samples, self._capacity)), self._channels),
+                       dtype=self._dtype)
+        actual = self.read_into(out)
+        return out[:actual]
 
-            if actual_samples == 0:
-                return np.zeros((0, self._channels), dtype=np.float32)
+    def view_latest(self, num_samples: int) -> np.ndarray:
+        """Return a zero-copy view of the newest samples.
 
-            # Calculate read position for the most recent samples
-            # We want the NEWEST samples, so read from (write_pos - actual_samples)
-            start_pos = (self._write_pos - actual_samples) % self._capacity
+        The view aliases the ring storage and is not synchronized with the
+        producer: it stays valid until ``capacity - N`` more frames are
+        written. Use read_into() when a stable copy is needed.
 
-            if start_pos + actual_samples <= self._capacity:
-                # Simple case: no wraparound
-                result = self._buffer[start_pos:start_pos + actual_samples].copy()
-            else:
-                # Wraparound case
-                first_part = self._buffer[start_pos:]
-                second_part_len = actual_samples - len(first_part)
-                second_part = self._buffer[:second_part_len]
-                result = np.vstack([first_part, second_part])
+        Args:
+            num_samples: Number of frames to view
 
-            return result
+        Returns:
+            Read-only (N, channels) view, N <= available frames
+        """
+        start, actual = self._window_start(num_samples, None)
+        pos = start % self._capacity
+        view = self._frames[pos:pos + actual]
+        view.flags.writeable = False
+        return view
 
-    def read_and_consume(self, num_samples: int) -> np.ndarray:
-        """Read and remove samples from the buffer.
+    def consume_into(self, out: np.ndarray) -> int:
+        """Copy and remove the oldest unread samples into ``out``.
 
-        Thread-safe. Returns a copy of the data and removes it from buffer.
+        Consumer only. Allocation-free counterpart of read_and_consume().
 
         Args:
-            num_samples: Number of samples to read and remove.
+            out: Array of the buffer dtype, shape (N,) for mono or (N, channels)
 
         Returns:
-            NumPy array of shape (N, channels) with the consumed samples.
+            Number of frames consumed
         """
-        with self._lock:
-            actual_samples = min(num_samples, self._available)
+        if out.size % self._channels:
+            raise ValueError(
+                f"out size ({out.size}) is not a multiple of channels ({self._channels})"
+            )
+        start, actual = self._copy_window(out, out.size // self._channels, self._tail)
+        self._tail = start + actual
+        return actual
 
-            if actual_samples == 0:
-                return np.zeros((0, self._channels), dtype=np.float32)
+    def read_and_consume(self, num_samples: int) -> np.ndarray:
+        """Read and remove the oldest unread samples from the buffer.
 
-            if self._read_pos + actual_samples <= self._capacity:
-                result = self._buffer[self._read_pos:self._read_pos + actual_samples].copy()
-            else:
-                first_part = self._buffer[self._read_pos:]
-                second_part_len = actual_samples - len(first_part)
-                second_part = self._buffer[:second_part_len]
-                result = np.vstack([first_part, second_part])
+        Consumer only. Returns a copy of the data.
 
-            self._read_pos = (self._read_pos + actual_samples) % self._capacity
-            self._available -= actual_samples
+        Args:
+            num_samples: Number of frames to read and remove.
 
-            return result
+        Returns:
+            NumPy array of shape (N, channels) with the consumed samples.
+        """
+        out = np.empty((max(0, min(num_samples, self._capacity)), self._channels),
+                       dtype=self._dtype)
+        actual = self.consume_into(out)
+        return out[:actual]
 
     def get_available(self) -> int:
-        """Get number of samples available for reading.
+        """Get number of frames available for reading.
 
-        Thread-safe but result may be stale immediately after return.
+        Lock-free snapshot; may be stale immediately after return.
 
         Returns:
-            Number of samples currently available in buffer
+            Number of frames currently available in buffer
         """
-        with self._lock:
-            return self._available
+        return min(self._head - self._tail, self._capacity)
 
     def clear(self) -> None:
-        """Clear the buffer, discarding all samples.
+        """Discard all unread samples.
 
-        Thread-safe. Resets read and write positions.
+        Consumer only. Moves the read position up to the write position;
+        storage is not zeroed since it will be overwritten.
         """
-        with self._lock:
-            self._write_pos = 0
-            self._read_pos = 0
-            self._available = 0
-            # Note: We don't zero the buffer for performance, data will be overwritten
+        self._tail = self._head
+
+
+@dataclass
+class VADConfig:
+    """Configuration for frame-based voice activity detection.
+
+    Attributes:
+        sample_rate: Sample rate of processed frames (16000)
+        energy_threshold_db: Speech energy threshold in dBFS (-40.0)
+        min_speech_ms: Energy must stay above threshold this long before
+            speech is reported (100)
+        hangover_ms: Speech is held this long after energy drops (300)
+        max_spectral_flatness: Frames flatter than this are treated as noise
+            (None disables the spectral test; ~0.4 separates voiced speech
+            from broadband noise)
+    """
+    sample_rate: int = 16000
+    energy_threshold_db: float = -40.0
+    min_speech_ms: int = 100
+    hangover_ms: int = 300
+    max_spectral_flatness: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.sample_rate <= 0:
+            raise ValueError(f"sample_rate must be positive, got {self.sample_rate}")
+        if self.energy_threshold_db > 0:
+            raise ValueError(
+                f"energy_threshold_db must be <= 0, got {self.energy_threshold_db}"
+            )
+        if self.min_speech_ms < 0 or self.hangover_ms < 0:
+            raise ValueError("min_speech_ms and hangover_ms must be >= 0")
+        if self.max_spectral_flatness is not None and not 0.0 < self.max_spectral_flatness <= 1.0:
+            raise ValueError(
+                f"max_spectral_flatness must be in (0, 1], got {self.max_spectral_flatness}"
+            )
+
+
+class VADState(Enum):
+    """VAD frame state machine states."""
+    SILENCE = auto()    # No speech
+    SPEECH = auto()     # Speech confirmed
+    HANGOVER = auto()   # Energy dropped, holding speech briefly
+
+
+class VADEvent(Enum):
+    """Transitions reported with a frame result."""
+    NONE = auto()
+    SPEECH_START = auto()
+    SPEECH_END = auto()
+
+
+@dataclass
+class VADResult:
+    """Result of processing one frame.
+
+    Attributes:
+        is_speech: Whether the frame should be treated as speech
+        state: State after this frame
+        event: Transition that occurred on this frame
+        energy_db: Frame RMS energy in dBFS
+        spectral_flatness: Frame spectral flatness (None if not computed)
+    """
+    is_speech: bool
+    state: VADState
+    event: VADEvent
+    energy_db: float
+    spectral_flatness: Optional[float] = None
 
 
 class VoiceActivityDetector:
@@ -377,7 +587,29 @@ class VoiceActivityDetector:
         1. Calculate RMS energy of audio frame
         2. Convert to dB scale
         3. Compare against threshold
-        4. Apply minimum duration filter to avoid false positives
+        4. Optionally reject noise-like frames by spectral flatness
+        5. Apply minimum duration filter to avoid false positives
+
+    Two detection modes share the threshold and the spectral test:
+
+    - is_speech(): live capture. Onset is measured in wall-clock time.
+    - process_frame(): frame state machine with onset and hangover counted
+      in audio time (samples seen), so results are identical whether audio
+      arrives live or is replayed faster than real time. Used to gate wake
+      word inference.
+
+    Frame state machine:
+        SILENCE ──(active for min_speech_ms)──→ SPEECH
+        SPEECH ──(inactive)──→ HANGOVER
+        HANGOVER ──(active)──→ SPEECH
+        HANGOVER ──(hangover_ms inactive)──→ SILENCE
+
+    Frames in SPEECH and HANGOVER report is_speech=True, so trailing
+    syllables still reach the wake word detector.
+
+    Features are computed once per chunk by a shared FeatureExtractor.
+    Callers that already have ChunkFeatures for the chunk (e.g. the capture
+    pipeline's level meter) pass them in and nothing is recomputed.
 
     Thread Safety:
         All public methods are thread-safe.
@@ -385,6 +617,8 @@ class VoiceActivityDetector:
     Attributes:
         threshold_db: Energy threshold in dB for speech detection
         min_speech_ms: Minimum continuous speech duration for positive detection
+        hangover_ms: Speech hold time after energy drops (process_frame only)
+        spectral_flatness_max: Flatness above which a frame is treated as noise
     """
 
     # Constants for dB calculation
@@ -395,7 +629,9 @@ class VoiceActivityDetector:
         self,
         threshold_db: float = -40.0,
         min_speech_ms: int = 100,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        spectral_flatness_max: Optional[float] = None,
+        hangover_ms: int = 300
     ) -> None:
         """Initialize voice activity detector.
 
@@ -403,21 +639,39 @@ class VoiceActivityDetector:
             threshold_db: Energy threshold in dB (default: -40.0)
             min_speech_ms: Minimum speech duration in ms (default: 100)
             sample_rate: Sample rate for duration calculations (default: 16000)
+            spectral_flatness_max: Spectral flatness limit for speech, 0-1
+                (default: None, energy only)
+            hangover_ms: Speech hold time after energy drops, in ms of
+                audio (default: 300, process_frame only)
 
         Raises:
             ValueError: If parameters are out of valid range
         """
         if threshold_db > 0:
             raise ValueError(f"threshold_db must be <= 0, got {threshold_db}")
-        if min_speech_ms < 10:
-            raise ValueError(f"min_speech_ms must be >= 10, got {min_speech_ms}")
+        if min_speech_ms < 0:
+            raise ValueError(f"min_speech_ms must be >= 0, got {min_speech_ms}")
+        if hangover_ms < 0:
+            raise ValueError(f"hangover_ms must be >= 0, got {hangover_ms}")
         if sample_rate <= 0:
             raise ValueError(f"sample_rate must be positive, got {sample_rate}")
+        if spectral_flatness_max is not None and not 0.0 < spectral_flatness_max <= 1.0:
+            raise ValueError(
+                f"spectral_flatness_max must be in (0, 1], got {spectral_flatness_max}"
+            )
 
         self._threshold_db = threshold_db
         self._min_speech_ms = min_speech_ms
         self._sample_rate = sample_rate
         self._min_speech_samples = int(sample_rate * min_speech_ms / 1000)
+        self._hangover_ms = hangover_ms
+        self._spectral_flatness_max = spectral_flatness_max
+
+        # Feature extraction (scratch buffers guarded by their own lock)
+        self._extractor = FeatureExtractor(
+            sample_rate, spectral=spectral_flatness_max is not None
+        )
+        self._extract_lock = threading.Lock()
 
         # State tracking for continuous detection
         self._lock = threading.Lock()
@@ -425,6 +679,40 @@ class VoiceActivityDetector:
         self._last_speech_probability = 0.0
         self._is_speaking = False
 
+        # Frame state machine (process_frame), counted in samples
+        self._state = VADState.SILENCE
+        self._above_samples = 0
+        self._below_samples = 0
+
+        # Frame statistics
+        self._frames = 0
+        self._speech_frames = 0
+        self._speech_segments = 0
+        self._noise_rejected_frames = 0
+
+    @classmethod
+    def from_config(cls, config: VADConfig) -> 'VoiceActivityDetector':
+        """Create a detector from a VADConfig.
+
+        Args:
+            config: VAD configuration
+
+        Returns:
+            VoiceActivityDetector with the configured thresholds
+        """
+        return cls(
+            threshold_db=config.energy_threshold_db,
+            min_speech_ms=config.min_speech_ms,
+            sample_rate=config.sample_rate,
+            spectral_flatness_max=config.max_spectral_flatness,
+            hangover_ms=config.hangover_ms,
+        )
+
+    @property
+    def state(self) -> VADState:
+        """Current frame state (process_frame)."""
+        return self._state
+
     @property
     def threshold_db(self) -> float:
         """Current threshold in dB."""
@@ -438,6 +726,50 @@ class VoiceActivityDetector:
         with self._lock:
             self._threshold_db = value
 
+    def set_threshold_db(self, threshold_db: float) -> None:
+        """Set the energy threshold (e.g. after noise calibration).
+
+        Args:
+            threshold_db: New threshold in dBFS
+
+        Raises:
+            ValueError: If threshold_db > 0
+        """
+        self.threshold_db = threshold_db
+
+    @property
+    def spectral_flatness_max(self) -> Optional[float]:
+        """Spectral flatness limit for speech (None if disabled)."""
+        return self._spectral_flatness_max
+
+    def analyze(self, samples: np.ndarray) -> ChunkFeatures:
+        """Compute features for a chunk.
+
+        Thread-safe. Spectral features are only computed when the spectral
+        test is enabled.
+
+        Args:
+            samples: Audio samples (normalized -1.0 to 1.0)
+
+        Returns:
+            ChunkFeatures for the chunk
+        """
+        with self._extract_lock:
+            return self._extractor.extract(samples)
+
+    def is_noise_like(self, features: ChunkFeatures) -> bool:
+        """Check whether a chunk's spectrum is too flat to be voiced speech.
+
+        Args:
+            features: Features of the chunk
+
+        Returns:
+            True if the spectral test is enabled and the chunk fails it
+        """
+        if self._spectral_flatness_max is None or features.spectral_flatness is None:
+            return False
+        return features.spectral_flatness > self._spectral_flatness_max
+
     def _calculate_rms(self, samples: np.ndarray) -> float:
         """Calculate RMS (Root Mean Square) energy of samples.
 
@@ -447,16 +779,7 @@ class VoiceActivityDetector:
         Returns:
             RMS value (0.0 to 1.0 for normalized audio)
         """
-        if len(samples) == 0:
-            return 0.0
-
-        # Flatten if multi-channel
-        if samples.ndim > 1:
-            samples = samples.flatten()
-
-        # Calculate RMS
-        rms = np.sqrt(np.mean(samples ** 2))
-        return float(rms)
+        return math.sqrt(chunk_mean_square(samples))
 
     def _rms_to_db(self, rms: float) -> float:
         """Convert RMS amplitude to decibels.
@@ -483,26 +806,35 @@ class VoiceActivityDetector:
         rms = self._calculate_rms(samples)
         return self._rms_to_db(rms)
 
-    def is_speech(self, samples: np.ndarray) -> bool:
+    def is_speech(
+        self,
+        samples: np.ndarray,
+        features: Optional[ChunkFeatures] = None
+    ) -> bool:
         """Detect if samples contain speech.
 
         Simple energy-based detection. Returns True if:
         1. Energy exceeds threshold AND
-        2. Speech has been continuous for min_speech_ms
+        2. The chunk is not noise-like (when the spectral test is enabled) AND
+        3. Speech has been continuous for min_speech_ms
 
         Thread-safe.
 
         Args:
             samples: Audio samples to analyze
+            features: Precomputed features of samples (computed if None)
 
         Returns:
             True if speech detected, False otherwise
         """
-        energy_db = self.get_energy_db(samples)
+        if features is None:
+            features = self.analyze(samples)
         current_time = time.monotonic()
+        active = (features.energy_db >= self._threshold_db
+                  and not self.is_noise_like(features))
 
         with self._lock:
-            if energy_db >= self._threshold_db:
+            if active:
                 if self._speech_start_time is None:
                     self._speech_start_time = current_time
 
@@ -528,7 +860,11 @@ class VoiceActivityDetector:
         with self._lock:
             return self._last_speech_probability
 
-    def update_probability(self, samples: np.ndarray) -> float:
+    def update_probability(
+        self,
+        samples: np.ndarray,
+        features: Optional[ChunkFeatures] = None
+    ) -> float:
         """Update and return speech probability.
 
         Maps energy to a 0.0-1.0 probability score:
@@ -536,15 +872,21 @@ class VoiceActivityDetector:
         - At threshold: 0.5
         - Above (threshold + 10dB): 1.0
 
+        Noise-like chunks (spectral test enabled and failed) are capped at
+        0.5, i.e. never above the speech threshold.
+
         Thread-safe.
 
         Args:
             samples: Audio samples to analyze
+            features: Precomputed features of samples (computed if None)
 
         Returns:
             Updated speech probability (0.0 to 1.0)
         """
-        energy_db = self.get_energy_db(samples)
+        if features is None:
+            features = self.analyze(samples)
+        energy_db = features.energy_db
 
         # Linear mapping with some headroom
         lower_bound = self._threshold_db - 20.0
@@ -552,14 +894,101 @@ class VoiceActivityDetector:
 
         probability = (energy_db - lower_bound) / (upper_bound - lower_bound)
         probability = max(0.0, min(1.0, probability))
+        if self.is_noise_like(features):
+            probability = min(probability, 0.5)
 
         with self._lock:
             self._last_speech_probability = probability
 
         return probability
 
+    def process_frame(
+        self,
+        audio: np.ndarray,
+        features: Optional[ChunkFeatures] = None
+    ) -> VADResult:
+        """Advance the frame state machine by one frame.
+
+        Onset and hangover are counted in samples of audio, not wall-clock
+        time. Thread-safe.
+
+        Args:
+            audio: float32 mono samples at sample_rate
+            features: Precomputed features of audio (computed if None)
+
+        Returns:
+            VADResult for this frame
+        """
+        if features is None:
+            features = self.analyze(audio)
+        n = len(audio)
+        rate = self._sample_rate
+        event = VADEvent.NONE
+
+        with self._lock:
+            active = features.energy_db >= self._threshold_db
+            if active and self.is_noise_like(features):
+                active = False
+                self._noise_rejected_frames += 1
+
+            if active:
+                self._above_samples += n
+                self._below_samples = 0
+                if self._state == VADState.HANGOVER:
+                    self._state = VADState.SPEECH
+                elif (self._state == VADState.SILENCE
+                        and self._above_samples * 1000 >= self._min_speech_ms * rate):
+                    self._state = VADState.SPEECH
+                    self._speech_segments += 1
+                    event = VADEvent.SPEECH_START
+            else:
+                self._above_samples = 0
+                if self._state == VADState.SPEECH:
+                    self._state = VADState.HANGOVER
+                    self._below_samples = n
+                elif self._state == VADState.HANGOVER:
+                    self._below_samples += n
+
+                if (self._state == VADState.HANGOVER
+                        and self._below_samples * 1000 >= self._hangover_ms * rate):
+                    self._state = VADState.SILENCE
+                    event = VADEvent.SPEECH_END
+
+            is_speech = self._state != VADState.SILENCE
+            self._frames += 1
+            if is_speech:
+                self._speech_frames += 1
+
+            return VADResult(
+                is_speech=is_speech,
+                state=self._state,
+                event=event,
+                energy_db=features.energy_db,
+                spectral_flatness=features.spectral_flatness,
+            )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get frame statistics (process_frame).
+
+        Thread-safe.
+
+        Returns:
+            Dictionary with frames, speech_frames, speech_ratio,
+            speech_segments, noise_rejected_frames, threshold_db
+        """
+        with self._lock:
+            frames = self._frames
+            return {
+                'frames': frames,
+                'speech_frames': self._speech_frames,
+                'speech_ratio': self._speech_frames / frames if frames else 0.0,
+                'speech_segments': self._speech_segments,
+                'noise_rejected_frames': self._noise_rejected_frames,
+                'threshold_db': self._threshold_db,
+            }
+
     def reset(self) -> None:
-        """Reset VAD state.
+        """Reset VAD state and frame statistics (threshold is kept).
 
         Thread-safe. Call when starting new utterance detection.
         """
@@ -567,17 +996,30 @@ class VoiceActivityDetector:
             self._speech_start_time = None
             self._last_speech_probability = 0.0
             self._is_speaking = False
+            self._state = VADState.SILENCE
+            self._above_samples = 0
+            self._below_samples = 0
+            self._frames = 0
+            self._speech_frames = 0
+            self._speech_segments = 0
+            self._noise_rejected_frames = 0
 
 
 class AudioCapturePipeline:
     """Continuous audio capture pipeline with VAD support.
 
     Provides background audio capture from INMP441 microphone with:
-    - Thread-safe ring buffer for sample storage
+    - Lock-free ring buffer for sample storage
     - Continuous background capture thread
     - Voice activity detection
     - Callback support for real-time processing
 
+    The PortAudio callback only copies each block into the ring buffer.
+    A dispatcher thread reads chunks from the ring, updates the level meter
+    and VAD, and fans chunks out to callbacks through bounded
+    per-callback queues, so a slow callback drops its own chunks (counted
+    in get_statistics()) instead of causing audio dropouts.
+
     Latency: Designed for <50ms end-to-end latency
 
     Thread Safety:
@@ -617,8 +1059,18 @@ class AudioCapturePipeline:
         self._vad = VoiceActivityDetector(
             threshold_db=self._config.vad_threshold_db,
             min_speech_ms=self._config.vad_min_speech_ms,
-            sample_rate=self._config.sample_rate
+            sample_rate=self._config.sample_rate,
+            spectral_flatness_max=self._config.vad_spectral_flatness_max
+        )
+
+        # Per-chunk features shared by level meter, VAD and callers
+        # (owned by the capture callback thread)
+        self._features = FeatureExtractor(
+            self._config.sample_rate,
+            spectral=(self._config.spectral_features
+                      or self._config.vad_spectral_flatness_max is not None)
         )
+        self._last_features: Optional[ChunkFeatures] = None
 
         # Thread management
         self._state = AudioCaptureState.STOPPED
@@ -626,9 +1078,19 @@ class AudioCapturePipeline:
         self._capture_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
 
-        # Callbacks for new audio chunks
+        # Callbacks for new audio chunks (delivered by the dispatcher)
         self._callbacks: List[Callable[[np.ndarray], None]] = []
         self._callbacks_lock = threading.Lock()
+        self._dispatcher = AudioDispatcher(
+            self._ring_buffer,
+            self._config.samples_per_chunk,
+            on_chunk=self._analyze_chunk,
+            poll_interval_s=self._config.chunk_size_ms / 2000.0,
+            name="AudioDispatch"
+        )
+
+        # PortAudio status flags seen by the callback (overflow etc.)
+        self._status_events = 0
 
         # Current audio level (thread-safe)
         self._current_level_db = -100.0
@@ -678,6 +1140,7 @@ class AudioCapturePipeline:
 
         try:
             self._stop_event.clear()
+            self._dispatcher.start()
             self._capture_thread = threading.Thread(
                 target=self._capture_loop,
                 name="AudioCapture",
@@ -689,6 +1152,7 @@ class AudioCapturePipeline:
                 self._state = AudioCaptureState.RUNNING
 
         except Exception as e:
+            self._dispatcher.stop()
             with self._state_lock:
                 self._state = AudioCaptureState.ERROR
             raise RuntimeError(f"Failed to start audio capture: {e}")
@@ -720,6 +1184,7 @@ class AudioCapturePipeline:
             if self._capture_thread.is_alive():
                 # FIX H-HIGH-001: Log error and set ERROR state when thread fails to stop
                 _logger.error("Capture thread failed to stop within 2.0s timeout")
+                self._dispatcher.stop()
                 with self._state_lock:
                     self._state = AudioCaptureState.ERROR
                 # FIX H2-HIGH-004: Clear thread reference even on failure
@@ -729,6 +1194,12 @@ class AudioCapturePipeline:
         # FIX H2-HIGH-004: Clear thread reference on success
         self._capture_thread = None
 
+        # Dispatcher flushes captured chunks, then subscribers drain
+        if not self._dispatcher.stop():
+            with self._state_lock:
+                self._state = AudioCaptureState.ERROR
+            return False
+
         with self._state_lock:
             self._state = AudioCaptureState.STOPPED
 
@@ -742,34 +1213,16 @@ class AudioCapturePipeline:
         chunk_samples = self._config.samples_per_chunk
 
         def audio_callback(indata: np.ndarray, frames: int, time_info, status) -> None:
-            """Sounddevice callback for incoming audio."""
-            if status:
-                # Log status (overflow, underflow, etc.) - non-blocking
-                pass
-
-            # Convert to float32 if needed and normalize
-            audio_data = indata.astype(np.float32)
-
-            # Write to ring buffer
-            self._ring_buffer.write(audio_data)
+            """Sounddevice callback: copy into the ring, nothing else.
 
-            # Update current level
-            rms = np.sqrt(np.mean(audio_data ** 2))
-            level_db = 20.0 * math.log10(max(rms, 1e-10))
-            with self._level_lock:
-                self._current_level_db = level_db
-
-            # Update VAD probability
-            self._vad.update_probability(audio_data)
+            Real-time thread - no locks, no allocation, no user code. Level,
+            VAD and callbacks run on the dispatcher thread.
+            """
+            if status:
+                # Overflow/underflow flags; counted, reported in get_statistics()
+                self._status_events += 1
 
-            # Call registered callbacks
-            with self._callbacks_lock:
-                for callback in self._callbacks:
-                    try:
-                        callback(audio_data)
-                    except Exception as e:
-                        # FIX H-MED-001: Log callback errors instead of silent swallow
-                        _logger.warning(f"Audio callback error: {e}")
+            self._ring_buffer.write(indata)
 
         try:
             # Open audio stream
@@ -793,6 +1246,25 @@ class AudioCapturePipeline:
         finally:
             self._stream = None
 
+    def _analyze_chunk(self, chunk: np.ndarray) -> None:
+        """Dispatcher hook: level meter and VAD for one chunk.
+
+        Runs on the dispatcher thread before the chunk is fanned out.
+
+        Args:
+            chunk: Read-only (frames, channels) float32 chunk
+        """
+        # Energy, ZCR and spectrum computed once for this chunk
+        features = self._features.extract(chunk)
+
+        # Update current level
+        with self._level_lock:
+            self._current_level_db = features.energy_db
+            self._last_features = features
+
+        # Update VAD probability (reuses the same features)
+        self._vad.update_probability(chunk, features)
+
     def get_audio(self, duration_ms: int) -> AudioSample:
         """Get recent audio samples.
 
@@ -813,9 +1285,9 @@ class AudioCapturePipeline:
         num_samples = int(self._config.sample_rate * duration_ms / 1000)
         samples = self._ring_buffer.read(num_samples)
 
-        # Flatten to 1D if mono
+        # Flatten to 1D if mono (read() returns a fresh contiguous array)
         if self._config.channels == 1 and samples.ndim > 1:
-            samples = samples.flatten()
+            samples = samples.reshape(-1)
 
         return AudioSample(
             samples=samples,
@@ -836,6 +1308,18 @@ class AudioCapturePipeline:
         with self._level_lock:
             return self._current_level_db
 
+    def get_features(self) -> Optional[ChunkFeatures]:
+        """Get features of the most recent audio chunk.
+
+        Thread-safe. Band energies and spectral flatness are populated only
+        when spectral features are enabled in the config.
+
+        Returns:
+            ChunkFeatures of the last captured chunk, or None before capture
+        """
+        with self._level_lock:
+            return self._last_features
+
     def is_speech_detected(self) -> bool:
         """Check if speech is currently detected.
 
@@ -848,20 +1332,30 @@ class AudioCapturePipeline:
         audio = self.get_audio(self._config.chunk_size_ms)
         return self._vad.is_speech(audio.samples)
 
-    def add_callback(self, callback: Callable[[np.ndarray], None]) -> None:
+    def add_callback(
+        self,
+        callback: Callable[[np.ndarray], None],
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE
+    ) -> None:
         """Add callback for new audio chunks.
 
-        Callback is called for each new audio chunk captured.
-        Callbacks should be fast to avoid blocking capture.
+        Callback is called for each new audio chunk captured, on its own
+        worker thread. The chunk is a read-only (frames, channels) array
+        shared with other callbacks. A callback that falls more than
+        max_queue chunks behind loses its oldest chunks (counted as
+        "dropped" in get_statistics()); capture and other callbacks are
+        not delayed.
 
         Thread-safe.
 
         Args:
             callback: Function taking np.ndarray of audio samples
+            max_queue: Chunks buffered for this callback (default: 8)
         """
         with self._callbacks_lock:
             if callback not in self._callbacks:
                 self._callbacks.append(callback)
+                self._dispatcher.subscribe(callback, max_queue=max_queue)
 
     def remove_callback(self, callback: Callable[[np.ndarray], None]) -> None:
         """Remove a registered callback.
@@ -874,6 +1368,24 @@ class AudioCapturePipeline:
         with self._callbacks_lock:
             if callback in self._callbacks:
                 self._callbacks.remove(callback)
+                self._dispatcher.unsubscribe(callback)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get capture and dispatch statistics.
+
+        Thread-safe snapshot.
+
+        Returns:
+            Dictionary with overflow_samples, overflow_count, status_events
+            and dispatcher statistics (chunks_dispatched, skipped_frames,
+            per-callback delivered/dropped/errors)
+        """
+        return {
+            "overflow_samples": self._ring_buffer.overflow_samples,
+            "overflow_count": self._ring_buffer.overflow_count,
+            "status_events": self._status_events,
+            "dispatch": self._dispatcher.get_statistics(),
+        }
 
     def clear_buffer(self) -> None:
         """Clear the audio ring buffer.
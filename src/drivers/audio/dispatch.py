@@ -0,0 +1,405 @@
+"""Audio Callback Dispatch off the Real-Time Thread
+
+This module moves per-chunk processing and subscriber fan-out out of the
+PortAudio callback. The callback only copies its block into an
+AudioRingBuffer (a copy plus index updates, no locks); a dispatcher thread
+reads fixed-size chunks from the ring with its own cursor and hands each
+chunk to every subscriber through a bounded per-subscriber queue.
+
+Design:
+    - Dispatcher polls the ring's write position, so the producer never
+      signals (no lock or condition variable on the audio thread)
+    - One optional on_chunk hook runs on the dispatcher thread before
+      fan-out (level meter, VAD, feature extraction)
+    - Each subscriber has its own worker thread and bounded queue; when a
+      subscriber falls behind its oldest chunks are dropped and counted,
+      and no other subscriber (or the capture) is delayed
+    - Chunks are read-only arrays shared by all subscribers (one copy per
+      chunk, made on the dispatcher thread)
+    - Frames overwritten in the ring before the dispatcher read them are
+      counted as skipped_frames
+
+Thread Safety:
+    subscribe()/unsubscribe()/get_statistics() may be called from any
+    thread at any time, including while running.
+
+Example:
+    ```python
+    from src.drivers.audio.audio_capture import AudioRingBuffer
+    from src.drivers.audio.dispatch import AudioDispatcher
+
+    ring = AudioRingBuffer(capacity=16000)
+    dispatcher = AudioDispatcher(ring, chunk_frames=320)
+    dispatcher.subscribe(slow_consumer, max_queue=4)
+    dispatcher.start()
+
+    # audio callback: ring.write(indata)  -- nothing else
+
+    dispatcher.stop()
+    print(dispatcher.get_statistics()["subscribers"])
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+# Default bounded queue length per subscriber (chunks)
+DEFAULT_SUBSCRIBER_QUEUE = 8
+
+# Default ring polling interval in seconds
+DEFAULT_POLL_INTERVAL_S = 0.005
+
+
+# =============================================================================
+# Subscriber
+# =============================================================================
+
+class AudioSubscription:
+    """One subscriber: a bounded drop-oldest queue drained by its own thread.
+
+    Thread Safety:
+        offer() is called by the dispatcher thread; the callback runs on
+        the subscription's worker thread. Counters are read without locks
+        (snapshot values).
+
+    Attributes:
+        callback: Function receiving each chunk (read-only np.ndarray)
+        max_queue: Maximum queued chunks before the oldest is dropped
+        name: Name used for the worker thread and statistics
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[np.ndarray], None],
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE,
+        name: Optional[str] = None
+    ) -> None:
+        """Initialize subscription.
+
+        Args:
+            callback: Function taking one np.ndarray chunk
+            max_queue: Queue bound in chunks (>= 1)
+            name: Optional name (defaults to the callback's name)
+
+        Raises:
+            ValueError: If max_queue < 1
+        """
+        if max_queue < 1:
+            raise ValueError(f"max_queue must be at least 1, got {max_queue}")
+
+        self.callback = callback
+        self.max_queue = max_queue
+        self.name = name or getattr(callback, "__name__", repr(callback))
+
+        self._queue: Deque[np.ndarray] = deque()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def depth(self) -> int:
+        """Chunks currently queued."""
+        return len(self._queue)
+
+    def offer(self, chunk: np.ndarray) -> bool:
+        """Queue a chunk, dropping the oldest if the queue is full.
+
+        Args:
+            chunk: Read-only chunk
+
+        Returns:
+            True if nothing was dropped
+        """
+        with self._cond:
+            dropped = len(self._queue) >= self.max_queue
+            if dropped:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(chunk)
+            self._cond.notify()
+        return not dropped
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if running)."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"AudioSub-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop the worker thread after it drains queued chunks.
+
+        Args:
+            timeout: Seconds to wait for the worker
+
+        Returns:
+            True if the worker stopped within timeout
+        """
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                _logger.error(f"Audio subscriber {self.name} failed to stop within {timeout}s")
+                return False
+        self._thread = None
+        return True
+
+    def _run(self) -> None:
+        """Worker loop: deliver queued chunks to the callback."""
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                chunk = self._queue.popleft()
+            try:
+                self.callback(chunk)
+                self.delivered += 1
+            except Exception as e:
+                self.errors += 1
+                _logger.warning(f"Audio callback error ({self.name}): {e}")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get subscriber statistics.
+
+        Returns:
+            Dictionary with delivered, dropped, errors, depth, max_queue
+        """
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "depth": self.depth,
+            "max_queue": self.max_queue,
+        }
+
+
+# =============================================================================
+# Dispatcher
+# =============================================================================
+
+class AudioDispatcher:
+    """Reads fixed-size chunks from a ring buffer and fans them out.
+
+    The ring must provide ``channels``, ``total_written`` and
+    ``read_from(position, out)`` (AudioRingBuffer does).
+
+    Attributes:
+        chunk_frames: Frames per dispatched chunk
+        poll_interval_s: Sleep between ring polls when no chunk is ready
+    """
+
+    def __init__(
+        self,
+        ring: Any,
+        chunk_frames: int,
+        on_chunk: Optional[Callable[[np.ndarray], None]] = None,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+        name: str = "AudioDispatch"
+    ) -> None:
+        """Initialize dispatcher.
+
+        Args:
+            ring: Source ring buffer
+            chunk_frames: Frames per chunk (> 0)
+            on_chunk: Optional hook run on every chunk before fan-out
+            poll_interval_s: Ring polling interval in seconds (> 0)
+            name: Dispatcher thread name
+
+        Raises:
+            ValueError: If chunk_frames or poll_interval_s is not positive
+        """
+        if chunk_frames <= 0:
+            raise ValueError(f"chunk_frames must be positive, got {chunk_frames}")
+        if poll_interval_s <= 0:
+            raise ValueError(f"poll_interval_s must be positive, got {poll_interval_s}")
+
+        self._ring = ring
+        self.chunk_frames = chunk_frames
+        self.poll_interval_s = poll_interval_s
+        self._on_chunk = on_chunk
+        self._name = name
+
+        self._scratch = np.empty((chunk_frames, ring.channels), dtype=np.float32)
+        self._cursor = 0
+
+        self._subscriptions: List[AudioSubscription] = []
+        self._subs_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics (dispatcher thread only)
+        self._chunks_dispatched = 0
+        self._skipped_frames = 0
+        self._hook_errors = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the dispatcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(
+        self,
+        callback: Callable[[np.ndarray], None],
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE,
+        name: Optional[str] = None
+    ) -> AudioSubscription:
+        """Register a subscriber.
+
+        Thread-safe. If the dispatcher is running, the subscriber's worker
+        starts immediately and receives chunks from the next dispatch.
+
+        Args:
+            callback: Function taking one read-only np.ndarray chunk
+            max_queue: Subscriber queue bound in chunks
+            name: Optional subscriber name
+
+        Returns:
+            The new AudioSubscription
+        """
+        subscription = AudioSubscription(callback, max_queue, name)
+        with self._subs_lock:
+            self._subscriptions.append(subscription)
+            if self.running:
+                subscription.start()
+        return subscription
+
+    def unsubscribe(self, callback: Callable[[np.ndarray], None]) -> bool:
+        """Remove the subscriber(s) registered with ``callback``.
+
+        Thread-safe. Queued chunks are still delivered before the worker
+        exits.
+
+        Args:
+            callback: Callback passed to subscribe()
+
+        Returns:
+            True if a subscriber was removed
+        """
+        with self._subs_lock:
+            removed = [s for s in self._subscriptions if s.callback == callback]
+            self._subscriptions = [s for s in self._subscriptions if s.callback != callback]
+        for subscription in removed:
+            subscription.stop()
+        return bool(removed)
+
+    def start(self) -> None:
+        """Start dispatching from the current ring write position."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._cursor = self._ring.total_written
+        with self._subs_lock:
+            for subscription in self._subscriptions:
+                subscription.start()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Stop the dispatcher and subscriber threads.
+
+        Args:
+            timeout: Seconds to wait for each thread
+
+        Returns:
+            True if all threads stopped within timeout
+        """
+        self._stop_event.set()
+        ok = True
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                _logger.error(f"{self._name} failed to stop within {timeout}s")
+                ok = False
+            self._thread = None
+        with self._subs_lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            ok = subscription.stop(timeout) and ok
+        return ok
+
+    def poll(self) -> int:
+        """Dispatch every complete chunk currently in the ring.
+
+        Called by the dispatcher thread; also usable directly when driving
+        the dispatcher synchronously (e.g. tests or offline processing).
+
+        Returns:
+            Number of chunks dispatched
+        """
+        dispatched = 0
+        while self._ring.total_written - self._cursor >= self.chunk_frames:
+            start, count = self._ring.read_from(self._cursor, self._scratch)
+            if start > self._cursor:
+                self._skipped_frames += start - self._cursor
+            self._cursor = start + count
+            if count < self.chunk_frames:
+                break  # Lapped mid-read; wait for a full chunk
+
+            chunk = self._scratch.copy()
+            chunk.flags.writeable = False
+            self._dispatch(chunk)
+            dispatched += 1
+        return dispatched
+
+    def _dispatch(self, chunk: np.ndarray) -> None:
+        """Run the hook and fan a chunk out to subscribers."""
+        if self._on_chunk is not None:
+            try:
+                self._on_chunk(chunk)
+            except Exception as e:
+                self._hook_errors += 1
+                _logger.warning(f"{self._name} chunk hook error: {e}")
+
+        with self._subs_lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.offer(chunk)
+        self._chunks_dispatched += 1
+
+    def _run(self) -> None:
+        """Dispatcher loop."""
+        while not self._stop_event.is_set():
+            if not self.poll():
+                self._stop_event.wait(self.poll_interval_s)
+        self.poll()  # Flush chunks completed before stop
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get dispatcher statistics.
+
+        Returns:
+            Dictionary with chunks_dispatched, skipped_frames, hook_errors
+            and per-subscriber statistics keyed by name
+        """
+        with self._subs_lock:
+            subscriptions = list(self._subscriptions)
+        return {
+            "chunks_dispatched": self._chunks_dispatched,
+            "skipped_frames": self._skipped_frames,
+            "hook_errors": self._hook_errors,
+            "subscribers": {s.name: s.get_statistics() for s in subscriptions},
+        }
@@ -0,0 +1,238 @@
+"""Per-Chunk Audio Feature Extraction
+
+This module computes the per-chunk features used across the audio stack in
+a single pass, so the level meter, VAD, noise calibrator and wake word
+pipeline share one result instead of each squaring the same samples.
+
+Features:
+    - mean_square / rms / energy_db: chunk energy (one dot product)
+    - zcr: zero-crossing rate (crossings per sample)
+    - band_energies_db: energy per frequency band (one rFFT)
+    - spectral_flatness: geometric / arithmetic mean of the power spectrum
+      over the speech band. Near 0 for tonal/harmonic (voiced) audio,
+      ~0.5 or higher for broadband noise
+
+Design:
+    - Window, FFT bin tables and scratch buffers are built once per chunk
+      length and reused
+    - Spectral features can be disabled (spectral=False) for callers that
+      only need energy
+    - Multi-channel input: energy over all samples, ZCR and spectrum from
+      the first channel
+
+Example:
+    ```python
+    from src.drivers.audio.features import FeatureExtractor
+
+    extractor = FeatureExtractor(sample_rate=16000)
+    features = extractor.extract(chunk)   # float32 [-1, 1]
+
+    level_db = features.energy_db
+    if features.spectral_flatness < 0.35:
+        print("tonal / voiced")
+    ```
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Energy floor: 1e-10 amplitude = -200 dBFS
+EPSILON = 1e-10
+
+# Default analysis bands in Hz (low rumble, voice fundamentals, formants, sibilance)
+DEFAULT_BAND_EDGES_HZ: Tuple[float, ...] = (0.0, 300.0, 1000.0, 3000.0, 8000.0)
+
+# Band over which spectral flatness is measured
+FLATNESS_BAND_HZ: Tuple[float, float] = (250.0, 4000.0)
+
+
+def mean_square_to_db(mean_square: float) -> float:
+    """Convert mean-square amplitude to dBFS (full scale = 1.0).
+
+    Args:
+        mean_square: Mean of squared samples
+
+    Returns:
+        Level in dBFS, floored at 20*log10(EPSILON)
+    """
+    return 10.0 * math.log10(max(mean_square, EPSILON * EPSILON))
+
+
+def chunk_mean_square(samples: np.ndarray) -> float:
+    """Mean of squared samples in one dot product (no squared temporary).
+
+    Args:
+        samples: float samples, any shape
+
+    Returns:
+        Mean square (0.0 for an empty chunk)
+    """
+    if samples.size == 0:
+        return 0.0
+    flat = samples.reshape(-1)
+    return float(np.dot(flat, flat)) / flat.size
+
+
+@dataclass
+class ChunkFeatures:
+    """Features of one audio chunk.
+
+    Attributes:
+        num_samples: Samples per channel in the chunk
+        mean_square: Mean of squared samples
+        rms: Root-mean-square amplitude
+        energy_db: RMS level in dBFS
+        zcr: Zero crossings per sample (0.0 to 1.0)
+        band_energies_db: Energy per band in dBFS (None if spectral disabled)
+        spectral_flatness: Spectral flatness 0.0-1.0 (None if spectral disabled)
+    """
+    num_samples: int
+    mean_square: float
+    rms: float
+    energy_db: float
+    zcr: float
+    band_energies_db: Optional[np.ndarray] = None
+    spectral_flatness: Optional[float] = None
+
+    @classmethod
+    def silent(cls) -> ChunkFeatures:
+        """Features of an empty chunk."""
+        return cls(
+            num_samples=0,
+            mean_square=0.0,
+            rms=0.0,
+            energy_db=mean_square_to_db(0.0),
+            zcr=0.0,
+        )
+
+
+class FeatureExtractor:
+    """Computes ChunkFeatures once per chunk.
+
+    Thread Safety:
+        Not thread-safe (reuses scratch buffers). Use one extractor per
+        thread; ChunkFeatures results are plain values and safe to share.
+
+    Attributes:
+        sample_rate: Sample rate in Hz
+        band_edges_hz: Band boundaries in Hz (N edges → N-1 bands)
+        spectral: Whether band energies and flatness are computed
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        band_edges_hz: Sequence[float] = DEFAULT_BAND_EDGES_HZ,
+        spectral: bool = True,
+    ) -> None:
+        """Initialize extractor.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            band_edges_hz: Ascending band edges in Hz
+            spectral: Compute spectral features (costs one rFFT per chunk)
+
+        Raises:
+            ValueError: If sample_rate <= 0 or band edges are invalid
+        """
+        if sample_rate <= 0:
+            raise ValueError(f"sample_rate must be positive, got {sample_rate}")
+        edges = tuple(float(e) for e in band_edges_hz)
+        if len(edges) < 2 or any(b <= a for a, b in zip(edges, edges[1:])):
+            raise ValueError(f"band_edges_hz must be ascending with >= 2 edges, got {edges}")
+
+        self.sample_rate = sample_rate
+        self.band_edges_hz = edges
+        self.spectral = spectral
+
+        # Per-length tables (rebuilt only when the chunk length changes)
+        self._length = 0
+        self._window: Optional[np.ndarray] = None
+        self._windowed: Optional[np.ndarray] = None
+        self._band_starts: Optional[np.ndarray] = None
+        self._band_ends: Optional[np.ndarray] = None
+        self._flat_slice = slice(0, 0)
+        self._power_scale = 1.0
+
+    def _prepare(self, n: int) -> None:
+        """Build window and bin tables for chunk length n."""
+        self._length = n
+        self._window = np.hanning(n).astype(np.float32)
+        self._windowed = np.empty(n, dtype=np.float32)
+
+        bin_hz = self.sample_rate / n
+        n_bins = n // 2 + 1
+        bins = np.clip(
+            np.ceil(np.asarray(self.band_edges_hz) / bin_hz).astype(np.intp), 0, n_bins
+        )
+        self._band_starts = bins[:-1]
+        self._band_ends = bins[1:]
+
+        lo = int(math.ceil(FLATNESS_BAND_HZ[0] / bin_hz))
+        hi = min(int(FLATNESS_BAND_HZ[1] / bin_hz) + 1, n_bins)
+        self._flat_slice = slice(lo, hi)
+
+        # Parseval scaling so band energies are comparable with energy_db
+        self._power_scale = 2.0 / (n * float(np.dot(self._window, self._window)))
+
+    def extract(self, samples: np.ndarray) -> ChunkFeatures:
+        """Compute features of one chunk.
+
+        Args:
+            samples: float32 samples in [-1, 1], shape (N,) or (N, channels)
+
+        Returns:
+            ChunkFeatures for the chunk
+        """
+        n = len(samples)
+        if n == 0:
+            return ChunkFeatures.silent()
+
+        mean_square = chunk_mean_square(samples)
+        mono = samples if samples.ndim == 1 else samples[:, 0]
+
+        if n > 1:
+            signs = np.signbit(mono)
+            zcr = np.count_nonzero(signs[1:] != signs[:-1]) / (n - 1)
+        else:
+            zcr = 0.0
+
+        features = ChunkFeatures(
+            num_samples=n,
+            mean_square=mean_square,
+            rms=math.sqrt(mean_square),
+            energy_db=mean_square_to_db(mean_square),
+            zcr=float(zcr),
+        )
+
+        if self.spectral and n >= 16:
+            self._extract_spectral(mono, features)
+
+        return features
+
+    def _extract_spectral(self, mono: np.ndarray, features: ChunkFeatures) -> None:
+        """Fill band energies and spectral flatness from one rFFT."""
+        if self._length != len(mono):
+            self._prepare(len(mono))
+
+        np.multiply(mono, self._window, out=self._windowed)
+        spectrum = np.fft.rfft(self._windowed)
+        power = spectrum.real * spectrum.real + spectrum.imag * spectrum.imag
+
+        cumulative = np.concatenate(([0.0], np.cumsum(power)))
+        band_ms = (cumulative[self._band_ends] - cumulative[self._band_starts]) * self._power_scale
+        features.band_energies_db = 10.0 * np.log10(np.maximum(band_ms, EPSILON * EPSILON))
+
+        flat_band = power[self._flat_slice]
+        if len(flat_band):
+            arithmetic = float(np.mean(flat_band))
+            if arithmetic > EPSILON * EPSILON:
+                geometric = math.exp(float(np.mean(np.log(flat_band + EPSILON * EPSILON))))
+                features.spectral_flatness = min(geometric / arithmetic, 1.0)
+            else:
+                features.spectral_flatness = 1.0  # Digital silence: no structure
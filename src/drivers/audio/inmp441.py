@@ -29,10 +29,13 @@ Key Features:
     - Thread-safe operation with proper locking
     - dB level calculation for volume detection
     - Configurable gain and buffer sizes
+    - Real-time callback only copies into a ring buffer; gain, level and
+      queueing run on a dispatcher thread (see dispatch.py)
 
 Thread Safety:
     All operations use internal locking to prevent race conditions during
     audio capture and buffer access. Safe for multi-threaded applications.
+    The PortAudio callback takes no locks.
 
 Example:
     ```python
@@ -70,7 +73,7 @@ import time
 import threading
 import queue
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 from enum import Enum
 
 try:
@@ -78,6 +81,16 @@ try:
 except ImportError:
     np = None  # type: ignore
 
+try:
+    from .audio_capture import AudioRingBuffer
+    from .dispatch import DEFAULT_SUBSCRIBER_QUEUE, AudioDispatcher
+    DISPATCH_AVAILABLE = True
+except ImportError:
+    AudioRingBuffer = None  # type: ignore
+    AudioDispatcher = None  # type: ignore
+    DEFAULT_SUBSCRIBER_QUEUE = 8
+    DISPATCH_AVAILABLE = False
+
 # I2S library imports - platform specific
 try:
     # Attempt to import sounddevice for cross-platform I2S/audio support
@@ -284,6 +297,22 @@ class INMP441Driver:
 
         # Audio buffer (thread-safe queue)
         self._sample_queue: queue.Queue = queue.Queue(maxsize=100)
+        self._queue_drops = 0
+
+        # Lock-free ring written by the capture callback, drained by the
+        # dispatcher thread (gain, level, sample queue, subscribers)
+        self._ring_buffer: Optional[Any] = None
+        self._dispatcher: Optional[Any] = None
+        self._status_events = 0
+        if DISPATCH_AVAILABLE:
+            self._ring_buffer = AudioRingBuffer(self.MAX_BUFFER_SAMPLES, channels=1)
+            self._dispatcher = AudioDispatcher(
+                self._ring_buffer,
+                self.config.buffer_frames,
+                on_chunk=self._process_block,
+                poll_interval_s=self.config.buffer_frames / self.config.sample_rate / 2,
+                name="INMP441-Dispatch"
+            )
 
         # Stream reference
         self._stream: Optional[Any] = None
@@ -411,6 +440,9 @@ class INMP441Driver:
                 except queue.Empty:
                     break
 
+        if self._dispatcher is not None:
+            self._dispatcher.start()
+
         # Start capture thread
         self._capture_thread = threading.Thread(
             target=self._capture_loop,
@@ -475,6 +507,13 @@ class INMP441Driver:
                     self._capture_thread = None
                 return False
 
+        if self._dispatcher is not None and not self._dispatcher.stop(self.config.timeout_seconds):
+            with self._lock:
+                self._state = CaptureState.ERROR
+                self._error_message = "Dispatcher thread failed to stop"
+                self._capture_thread = None
+            return False
+
         with self._lock:
             self._state = CaptureState.STOPPED
             # FIX H2-HIGH-004: Clear thread reference on success
@@ -495,48 +534,20 @@ class INMP441Driver:
         try:
             # Configure input stream
             def audio_callback(indata, frames, callback_time, status):
-                """Callback for incoming audio data."""
+                """Callback for incoming audio data.
+
+                Real-time thread: copy into the ring and return. Gain,
+                level and queueing happen in _process_block on the
+                dispatcher thread.
+                """
                 if status:
-                    # Log status warnings (e.g., buffer overruns)
-                    pass
+                    # Buffer over/underruns; counted, reported via get_statistics()
+                    self._status_events += 1
 
                 if self._stop_event.is_set():
                     return
 
-                # FIX H-MED-003: Cache gain value for thread-safe access
-                with self._lock:
-                    gain = self.config.gain
-                    smoothing = self.config.level_smoothing
-
-                # Apply gain
-                samples = indata[:, 0] * gain
-
-                # Convert to int16
-                samples_int16 = (samples * 32767).astype(np.int16)
-
-                # Calculate level
-                rms = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
-                if rms > 0:
-                    level_db = 20 * math.log10(rms / 1.0)  # Normalized
-                else:
-                    level_db = self.DB_FLOOR
-
-                # Update smoothed level (using cached smoothing from H-MED-003 fix)
-                with self._lock:
-                    self._current_level_db = (
-                        smoothing * level_db +
-                        (1 - smoothing) * self._current_level_db
-                    )
-
-                # Queue samples (drop oldest if full)
-                try:
-                    self._sample_queue.put_nowait(samples_int16)
-                except queue.Full:
-                    try:
-                        self._sample_queue.get_nowait()
-                        self._sample_queue.put_nowait(samples_int16)
-                    except queue.Empty:
-                        pass
+                self._ring_buffer.write(indata[:, 0])
 
             # FIX H2-HIGH-001: Wrap stream creation to handle exceptions properly
             try:
@@ -595,39 +606,120 @@ class INMP441Driver:
                     for _ in range(self.config.buffer_frames)
                 ]
 
-            # Calculate mock level
-            if np is not None:
-                rms = np.sqrt(np.mean(mock_samples.astype(np.float64) ** 2))
+            if self._ring_buffer is not None:
+                # Same path as hardware: ring -> dispatcher -> _process_block
+                self._ring_buffer.write(mock_samples.astype(np.float32) / 32767.0)
             else:
+                # Fallback without numpy: level and queue inline
                 rms = math.sqrt(sum(s ** 2 for s in mock_samples) / len(mock_samples))
+                if rms > 0:
+                    level_db = 20 * math.log10(rms / self.REFERENCE_AMPLITUDE)
+                else:
+                    level_db = self.DB_FLOOR
+                self._update_level(level_db)
+                self._enqueue_block(mock_samples)
 
-            if rms > 0:
-                level_db = 20 * math.log10(rms / self.REFERENCE_AMPLITUDE)
-            else:
-                level_db = self.DB_FLOOR
+            # Simulate real-time capture rate
+            time.sleep(self.config.buffer_frames / self.config.sample_rate)
 
-            with self._lock:
-                alpha = self.config.level_smoothing
-                self._current_level_db = (
-                    alpha * level_db +
-                    (1 - alpha) * self._current_level_db
-                )
+    def _process_block(self, chunk: Any) -> None:
+        """Dispatcher hook: gain, level and sample queue for one block.
+
+        Runs on the dispatcher thread, never on the audio callback.
 
-            # Queue mock samples
+        Args:
+            chunk: Read-only float32 block, shape (buffer_frames, 1)
+        """
+        # FIX H-MED-003: Cache gain value for thread-safe access
+        with self._lock:
+            gain = self.config.gain
+
+        # Apply gain
+        samples = chunk[:, 0] * gain
+
+        # Convert to int16
+        samples_int16 = (samples * 32767).astype(np.int16)
+
+        # Calculate level (normalized full scale = 1.0)
+        rms = math.sqrt(float(np.dot(samples, samples)) / len(samples))
+        if rms > 0:
+            level_db = 20 * math.log10(rms)
+        else:
+            level_db = self.DB_FLOOR
+
+        self._update_level(level_db)
+        self._enqueue_block(samples_int16)
+
+    def _update_level(self, level_db: float) -> None:
+        """Fold one block level into the smoothed level."""
+        with self._lock:
+            smoothing = self.config.level_smoothing
+            self._current_level_db = (
+                smoothing * level_db +
+                (1 - smoothing) * self._current_level_db
+            )
+
+    def _enqueue_block(self, block: Any) -> None:
+        """Queue a block for read_samples(), dropping the oldest if full."""
+        try:
+            self._sample_queue.put_nowait(block)
+        except queue.Full:
             try:
-                if np is not None:
-                    self._sample_queue.put_nowait(mock_samples)
-                else:
-                    self._sample_queue.put_nowait(mock_samples)
-            except queue.Full:
-                try:
-                    self._sample_queue.get_nowait()
-                    self._sample_queue.put_nowait(mock_samples)
-                except queue.Empty:
-                    pass
+                self._sample_queue.get_nowait()
+                self._queue_drops += 1
+                self._sample_queue.put_nowait(block)
+            except (queue.Empty, queue.Full):
+                pass
 
-            # Simulate real-time capture rate
-            time.sleep(self.config.buffer_frames / self.config.sample_rate)
+    def add_callback(
+        self,
+        callback: Callable[[Any], None],
+        max_queue: int = DEFAULT_SUBSCRIBER_QUEUE
+    ) -> None:
+        """Subscribe to raw capture blocks.
+
+        Callbacks run on their own thread with a bounded queue; a slow
+        callback loses its oldest blocks (counted in get_statistics())
+        without delaying capture or other subscribers.
+
+        Args:
+            callback: Function receiving a read-only float32 block of
+                shape (buffer_frames, 1), before gain.
+            max_queue: Maximum queued blocks for this callback.
+
+        Raises:
+            RuntimeError: If NumPy is not available.
+        """
+        if self._dispatcher is None:
+            raise RuntimeError("NumPy required for audio callbacks")
+        self._dispatcher.subscribe(callback, max_queue)
+
+    def remove_callback(self, callback: Callable[[Any], None]) -> None:
+        """Unsubscribe a callback added with add_callback().
+
+        Args:
+            callback: Callback to remove.
+        """
+        if self._dispatcher is not None:
+            self._dispatcher.unsubscribe(callback)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get capture and dispatch statistics.
+
+        Returns:
+            Dictionary with ring overflow, sample queue drops, stream
+            status events and dispatcher statistics.
+        """
+        stats: Dict[str, Any] = {
+            "queue_drops": self._queue_drops,
+            "status_events": self._status_events,
+        }
+        if self._ring_buffer is not None:
+            stats["overflow_samples"] = self._ring_buffer.overflow_samples
+            stats["overflow_count"] = self._ring_buffer.overflow_count
+        if self._dispatcher is not None:
+            stats["dispatch"] = self._dispatcher.get_statistics()
+        return stats
 
     def read_samples(self, num_samples: int) -> Any:
         """Read audio samples from the capture buffer.
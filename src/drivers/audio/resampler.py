@@ -0,0 +1,313 @@
+"""Streaming Polyphase FIR Resampler
+
+This module provides an anti-aliased sample rate converter for continuous
+audio streams, used to bring the INMP441's 48kHz capture down to the 16kHz
+expected by OpenWakeWord and the VAD.
+
+Design:
+    - Kaiser-windowed sinc lowpass designed once per (up, down) ratio and
+      cached process-wide
+    - Filter history carried across chunks, so chunk boundaries are seamless
+      (processing a stream in any chunking gives identical output)
+    - Integer decimation (48k→16k, 32k→16k, ...) runs entirely in
+      pre-allocated buffers: one small matrix multiply plus one strided
+      diagonal sum per chunk, no per-chunk allocation
+    - Rational ratios (e.g. 44.1k→16k) use a polyphase gather with cached
+      index tables
+
+Quality (default design, 48k→16k, 96 taps):
+    - Passband: flat to ~6kHz (<0.05dB), -3.6dB at 7kHz
+    - Stopband: >70dB attenuation above ~8.7kHz, i.e. every alias landing
+      below 7.3kHz is suppressed by >70dB
+    - Group delay: (num_taps - 1) / 2 input samples (~1ms)
+
+Compare with 3-sample box averaging, which only attenuates a 12kHz tone
+(aliased onto 4kHz) by ~9.5dB.
+
+Example:
+    ```python
+    from src.drivers.audio.resampler import PolyphaseResampler
+
+    resampler = PolyphaseResampler(48000, 16000)
+
+    for chunk in stream:                 # float32 chunks at 48kHz
+        out = resampler.process(chunk)   # float32 view at 16kHz
+        consume(out)                     # valid until the next process() call
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Default filter design parameters
+DEFAULT_TAPS_PER_PHASE = 32
+DEFAULT_ROLLOFF = 0.9
+DEFAULT_KAISER_BETA = 8.6  # ~80dB stopband
+
+
+@functools.lru_cache(maxsize=16)
+def design_lowpass(
+    up: int,
+    down: int,
+    taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+    rolloff: float = DEFAULT_ROLLOFF,
+    kaiser_beta: float = DEFAULT_KAISER_BETA,
+) -> np.ndarray:
+    """Design the prototype lowpass filter for an up/down ratio.
+
+    The filter runs at the intermediate rate (input rate * up) and cuts off
+    at ``rolloff`` times the lower of the two Nyquist frequencies. Results
+    are cached, so every resampler with the same ratio shares one design.
+
+    Args:
+        up: Interpolation factor (L)
+        down: Decimation factor (M)
+        taps_per_phase: Filter length per output phase
+        rolloff: Cutoff as a fraction of the narrower Nyquist (0-1)
+        kaiser_beta: Kaiser window shape (higher = more stopband attenuation)
+
+    Returns:
+        Read-only float32 taps of length ``taps_per_phase * max(up, down)``
+        (rounded up to a multiple of ``up``), with DC gain ``up``
+    """
+    if up < 1 or down < 1:
+        raise ValueError(f"up and down must be >= 1, got {up}/{down}")
+    if not 0.0 < rolloff <= 1.0:
+        raise ValueError(f"rolloff must be in (0, 1], got {rolloff}")
+
+    num_taps = taps_per_phase * max(up, down)
+    num_taps += -num_taps % up  # Whole number of taps per polyphase branch
+    cutoff = rolloff / max(up, down)  # Fraction of intermediate-rate Nyquist
+    n = np.arange(num_taps, dtype=np.float64) - (num_taps - 1) / 2.0
+    taps = cutoff * np.sinc(cutoff * n) * np.kaiser(num_taps, kaiser_beta)
+    taps *= up / taps.sum()  # Unity passband gain after zero-stuffing
+
+    taps = taps.astype(np.float32)
+    taps.flags.writeable = False
+    return taps
+
+
+class PolyphaseResampler:
+    """Streaming anti-aliased rational resampler.
+
+    Converts ``input_rate`` to ``output_rate`` as ``up/down`` after reducing
+    by the GCD. Each instance keeps its own filter state, so use one
+    instance per stream.
+
+    Thread Safety:
+        Not thread-safe. Each stream should be processed by a single thread.
+
+    Attributes:
+        input_rate: Input sample rate in Hz
+        output_rate: Output sample rate in Hz
+        up: Interpolation factor after GCD reduction
+        down: Decimation factor after GCD reduction
+    """
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        max_chunk: int = 4096,
+        taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+        rolloff: float = DEFAULT_ROLLOFF,
+        kaiser_beta: float = DEFAULT_KAISER_BETA,
+        gain: float = 1.0,
+    ) -> None:
+        """Initialize resampler.
+
+        Args:
+            input_rate: Input sample rate in Hz
+            output_rate: Output sample rate in Hz
+            max_chunk: Largest input chunk (samples) passed to process()
+            taps_per_phase: Filter length per output phase
+            rolloff: Cutoff as a fraction of the output Nyquist
+            kaiser_beta: Kaiser window shape
+            gain: Scale folded into the filter taps, e.g. 1/2**31 to
+                normalize raw int32 samples with no extra pass
+
+        Raises:
+            ValueError: If rates or max_chunk are not positive
+        """
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError(
+                f"Sample rates must be positive, got {input_rate}/{output_rate}"
+            )
+        if max_chunk <= 0:
+            raise ValueError(f"max_chunk must be positive, got {max_chunk}")
+
+        g = math.gcd(input_rate, output_rate)
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.up = output_rate // g
+        self.down = input_rate // g
+        self.max_chunk = max_chunk
+
+        taps = design_lowpass(self.up, self.down, taps_per_phase, rolloff, kaiser_beta)
+        self._num_taps = len(taps)
+        if gain != 1.0:
+            taps = (taps * np.float32(gain)).astype(np.float32)
+
+        if self.up == 1:
+            # Decimation: H[p, j] = reversed_taps[j*M + p]
+            m = self.down
+            k = self._num_taps // m
+            self._phase_taps = np.ascontiguousarray(taps[::-1].reshape(k, m).T)
+            self._window = self._num_taps
+        else:
+            # Rational: per-phase sub-filters, reversed for dot with windows
+            # h_p[i] = taps[p + i*L], applied to x[idx - i]
+            self._sub_taps = np.ascontiguousarray(
+                taps.reshape(-1, self.up).T[:, ::-1]
+            )
+            self._window = self._sub_taps.shape[1]
+            self._gather_cache: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+        max_out = self.output_length(max_chunk) + 2
+        k_cols = self._phase_taps.shape[1] if self.up == 1 else 1
+        self._buf = np.zeros(self._window + self.down + max_chunk, dtype=np.float32)
+        self._z = np.empty((max_out + k_cols, k_cols), dtype=np.float32)
+        self._out = np.empty(max_out, dtype=np.float32)
+        self.reset()
+
+    @property
+    def num_taps(self) -> int:
+        """Prototype filter length."""
+        return self._num_taps
+
+    @property
+    def group_delay_s(self) -> float:
+        """Filter group delay in seconds."""
+        return (self._num_taps - 1) / 2.0 / (self.input_rate * self.up)
+
+    def output_length(self, n_input: int) -> int:
+        """Upper bound on outputs produced for ``n_input`` input samples."""
+        return -(-n_input * self.up // self.down)
+
+    def reset(self) -> None:
+        """Clear filter history (start of a new stream)."""
+        self._buf[:] = 0.0
+        # Buffer always starts at the window of the next output sample
+        self._pending = self._window - 1
+        self._phase = 0  # Rational path: next output position in 1/up input samples
+
+    def process(self, audio: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Resample one chunk of a continuous stream.
+
+        Args:
+            audio: 1-D input samples. Any real dtype or strided view (e.g. one
+                channel of interleaved int32) is converted to float32 while
+                being copied into the filter buffer - no separate pass
+            out: Optional float32 destination with room for
+                output_length(len(audio)) samples
+
+        Returns:
+            Resampled float32 samples. Without ``out`` this is a view into an
+            internal buffer, valid until the next call.
+
+        Raises:
+            ValueError: If the chunk exceeds max_chunk
+        """
+        n = len(audio)
+        if n > self.max_chunk:
+            raise ValueError(f"Chunk of {n} samples exceeds max_chunk={self.max_chunk}")
+
+        start = self._pending
+        self._buf[start:start + n] = audio
+        self._pending = start + n
+
+        if self.up == 1:
+            result = self._decimate(out)
+        else:
+            result = self._resample_rational(out)
+        return result
+
+    def _decimate(self, out: Optional[np.ndarray]) -> np.ndarray:
+        """Integer decimation on the pre-allocated buffers."""
+        m = self.down
+        taps = self._window
+        pending = self._pending
+        n_out = (pending - taps) // m + 1 if pending >= taps else 0
+        dest = self._out if out is None else out
+        if n_out <= 0:
+            return dest[:0]
+
+        k = self._phase_taps.shape[1]
+        rows = n_out + k - 1
+        blocks = self._buf[:rows * m].reshape(rows, m)
+        z = self._z[:rows]
+        np.matmul(blocks, self._phase_taps, out=z)
+
+        # y[n] = sum_j z[n + j, j]  (strided diagonal view, no copy)
+        item = z.itemsize
+        diagonals = np.lib.stride_tricks.as_strided(
+            z, shape=(n_out, k), strides=(k * item, (k + 1) * item)
+        )
+        result = dest[:n_out]
+        np.sum(diagonals, axis=1, out=result)
+
+        consumed = n_out * m
+        remaining = pending - consumed
+        self._buf[:remaining] = self._buf[consumed:pending]
+        self._pending = remaining
+        return result
+
+    def _resample_rational(self, out: Optional[np.ndarray]) -> np.ndarray:
+        """Rational L/M resampling via polyphase gather."""
+        up, down = self.up, self.down
+        width = self._window
+        pending = self._pending
+
+        # Output n uses window ending at input index idx_n, phase p_n
+        key = (self._phase, pending)
+        cached = self._gather_cache.get(key)
+        if cached is None:
+            positions = self._phase + np.arange(0, (pending + 1) * up, down)
+            idx = positions // up + (width - 1)
+            valid = idx < pending
+            idx, phases = idx[valid], positions[valid] % up
+            if len(self._gather_cache) > 64:
+                self._gather_cache.clear()
+            cached = (idx, phases)
+            self._gather_cache[key] = cached
+        idx, phases = cached
+
+        dest = self._out if out is None else out
+        n_out = len(idx)
+        if n_out == 0:
+            return dest[:0]
+
+        windows = np.lib.stride_tricks.sliding_window_view(self._buf[:pending], width)
+        starts = idx - (width - 1)
+        result = dest[:n_out]
+        np.einsum('ij,ij->i', windows[starts], self._sub_taps[phases], out=result)
+
+        # Advance to the first position not yet produced
+        next_position = self._phase + n_out * down
+        consumed = next_position // up
+        self._phase = next_position - consumed * up
+        remaining = pending - consumed
+        self._buf[:remaining] = self._buf[consumed:pending]
+        self._pending = remaining
+        return result
+
+
+def box_decimate(audio: np.ndarray, factor: int) -> np.ndarray:
+    """Reference box-average decimator (the pre-polyphase behaviour).
+
+    Kept for benchmarks and A/B comparison only.
+
+    Args:
+        audio: Input samples
+        factor: Integer decimation factor
+
+    Returns:
+        float32 samples averaged over non-overlapping blocks of ``factor``
+    """
+    n_output = len(audio) // factor
+    return audio[:n_output * factor].reshape(-1, factor).mean(axis=1).astype(np.float32)
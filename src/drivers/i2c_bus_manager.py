@@ -11,6 +11,16 @@ Design Pattern:
     - Singleton: Ensures single I2C bus instance
     - Context Manager: RAII-style lock acquisition/release
     - Thread-safe: Uses threading.RLock for reentrant locking
+    - Priority scheduling: Waiters are admitted by priority class
+      (SAFETY > MOTION > SENSING > DIAGNOSTICS), FIFO within a class
+
+Transaction Scheduling:
+    An in-flight I2C transaction cannot be preempted, but when the bus is
+    released the highest-priority waiter goes next, so an E-stop disable_all()
+    never queues behind pending IMU reads or calibration traffic. The wait
+    queue is bounded (SAFETY requests are never rejected), bus time is
+    accounted per client, and run_batch() sends several small transactions
+    under one acquisition.
 
 Hardware:
     - Raspberry Pi I2C Bus 1 (default)
@@ -28,6 +38,10 @@ Example:
         device = SomeI2CDevice(bus, address=0x40)
         device.write_data(...)
     # Lock automatically released
+
+    # Prioritized, accounted access
+    with manager.acquire_bus(BusPriority.SENSING, client="bno085") as bus:
+        imu.read(bus)
     ```
 
 Prevents:
@@ -36,9 +50,13 @@ Prevents:
     - Race conditions in multi-threaded applications
 """
 
+import heapq
+import itertools
 import threading
+import time
 from contextlib import contextmanager
-from typing import Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 try:
     import board
@@ -48,6 +66,53 @@ except ImportError:
     board = None
     busio = None
 
+from src.utils.lock_profiler import LockType, create_lock
+
+
+class BusPriority(IntEnum):
+    """Priority classes for I2C bus admission (lower value = served first)."""
+
+    SAFETY = 0       # E-stop / servo disable
+    MOTION = 1       # Servo position writes
+    SENSING = 2      # IMU and other sensor reads
+    DIAGNOSTICS = 3  # Calibration, self-test, telemetry
+
+
+class BusQueueFullError(RuntimeError):
+    """Raised when the bus wait queue is full (never for SAFETY requests)."""
+
+
+class _ClientStats:
+    """Per-client bus usage counters (protected by the scheduler condition)."""
+
+    __slots__ = (
+        "acquisitions", "transactions", "rejected", "timeouts",
+        "wait_total_s", "wait_max_s", "bus_time_s", "hold_max_s",
+    )
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.transactions = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.wait_total_s = 0.0
+        self.wait_max_s = 0.0
+        self.bus_time_s = 0.0
+        self.hold_max_s = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        count = self.acquisitions
+        return {
+            "acquisitions": count,
+            "transactions": self.transactions,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": self.wait_total_s * 1000 / count if count else 0.0,
+            "wait_max_ms": self.wait_max_s * 1000,
+            "bus_time_ms": self.bus_time_s * 1000,
+            "hold_max_ms": self.hold_max_s * 1000,
+        }
+
 
 class I2CBusManager:
     """Thread-safe singleton manager for I2C bus access.
@@ -59,17 +124,31 @@ class I2CBusManager:
         _instance: Singleton instance (class variable)
         _lock: Lock for thread-safe singleton initialization
         _bus: Shared I2C bus instance
-        _bus_lock: Reentrant lock for bus access synchronization
+        _bus_lock: Reentrant lock for bus access synchronization, created by
+            the first get_instance() so enable_lock_profiling() can still
+            instrument it
+        max_queue_depth: Maximum waiters before non-SAFETY requests are rejected
     """
 
     # Class-level singleton state
     _instance: Optional['I2CBusManager'] = None
     _lock = threading.Lock()
     _bus: Optional['busio.I2C'] = None
-    _bus_lock = threading.RLock()  # Reentrant lock for nested acquisition
+    _bus_lock: Optional[LockType] = None  # Created on first get_instance()
     _lock_count = 0  # Track lock acquisition count
     _lock_count_lock = threading.Lock()  # Protect lock count updates
 
+    # Transaction scheduler state (all protected by _sched_cond)
+    max_queue_depth = 16
+    _sched_cond = threading.Condition(threading.Lock())
+    _waiters: List[list] = []  # Heap of [priority, sequence, thread_id]
+    _sequence = itertools.count()
+    _owner: Optional[int] = None
+    _owner_depth = 0
+    _owner_client: Optional[str] = None
+    _owner_since = 0.0
+    _client_stats: Dict[str, _ClientStats] = {}
+
     @classmethod
     def get_instance(cls) -> 'I2CBusManager':
         """Get singleton instance of I2C bus manager.
@@ -89,6 +168,9 @@ class I2CBusManager:
             # Second check (locked) - thread-safe initialization
             with cls._lock:
                 if cls._instance is None:
+                    if cls._bus_lock is None:
+                        # Deferred so runtime enable_lock_profiling() applies
+                        cls._bus_lock = create_lock("drivers.i2c_bus")
                     # Create instance and initialize bus atomically under lock
                     # This prevents partial object visibility to other threads
                     cls._instance = cls.__new__(cls)
@@ -135,17 +217,34 @@ class I2CBusManager:
         pass
 
     @contextmanager
-    def acquire_bus(self):
+    def acquire_bus(
+        self,
+        priority: BusPriority = BusPriority.MOTION,
+        client: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
         """Acquire exclusive access to I2C bus.
 
         Context manager that acquires bus lock before yielding bus instance,
         and automatically releases lock when exiting context.
 
         Ensures thread-safe, serialized access to I2C bus across all devices.
+        When contended, waiters are admitted in priority order. Nested
+        acquisition by the owning thread always succeeds immediately.
+
+        Args:
+            priority: Admission priority class (default: MOTION)
+            client: Name used for bus-time accounting (default: "unknown")
+            timeout: Maximum seconds to wait for the bus (None = forever)
 
         Yields:
             busio.I2C: The I2C bus instance
 
+        Raises:
+            BusQueueFullError: If max_queue_depth waiters are already queued
+                (never raised for SAFETY priority)
+            TimeoutError: If the bus was not granted within timeout
+
         Example:
             ```python
             manager = I2CBusManager.get_instance()
@@ -155,7 +254,9 @@ class I2CBusManager:
             # Lock automatically released
             ```
         """
-        self._bus_lock.acquire()
+        self._admit(priority, client or "unknown", timeout)
+        bus_lock = self._bus_lock  # Release the same lock even across reset()
+        bus_lock.acquire()
         with self._lock_count_lock:
             I2CBusManager._lock_count += 1
         try:
@@ -163,7 +264,144 @@ class I2CBusManager:
         finally:
             with self._lock_count_lock:
                 I2CBusManager._lock_count -= 1
-            self._bus_lock.release()
+            bus_lock.release()
+            self._release()
+
+    def run_batch(
+        self,
+        operations: Sequence[Callable[[Any], Any]],
+        priority: BusPriority = BusPriority.MOTION,
+        client: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Run several bus transactions under a single acquisition.
+
+        Args:
+            operations: Callables taking the bus instance, run in order
+            priority: Admission priority class (default: MOTION)
+            client: Name used for bus-time accounting
+            timeout: Maximum seconds to wait for the bus (None = forever)
+
+        Returns:
+            List of each operation's return value, in order
+
+        Raises:
+            BusQueueFullError: If the wait queue is full
+            TimeoutError: If the bus was not granted within timeout
+        """
+        with self.acquire_bus(priority, client, timeout) as bus:
+            results = [operation(bus) for operation in operations]
+            if len(operations) > 1:
+                with self._sched_cond:
+                    # _admit() already counted one transaction
+                    self._stats_for(client or "unknown").transactions += len(operations) - 1
+            return results
+
+    # =========================================================================
+    # Transaction Scheduler
+    # =========================================================================
+
+    @classmethod
+    def _stats_for(cls, client: str) -> _ClientStats:
+        """Get or create per-client stats (caller holds _sched_cond)."""
+        stats = cls._client_stats.get(client)
+        if stats is None:
+            stats = _ClientStats()
+            cls._client_stats[client] = stats
+        return stats
+
+    @classmethod
+    def _admit(cls, priority: BusPriority, client: str, timeout: Optional[float]) -> None:
+        """Block until this thread owns the bus, honouring priority order."""
+        me = threading.get_ident()
+        with cls._sched_cond:
+            if cls._owner == me:
+                # Nested acquisition by owner - already accounted
+                cls._owner_depth += 1
+                return
+
+            stats = cls._stats_for(client)
+            start = time.perf_counter()
+
+            if cls._owner is not None or cls._waiters:
+                if (priority != BusPriority.SAFETY
+                        and len(cls._waiters) >= cls.max_queue_depth):
+                    stats.rejected += 1
+                    raise BusQueueFullError(
+                        f"I2C bus queue full ({len(cls._waiters)} waiters), "
+                        f"rejected {priority.name} request from {client}"
+                    )
+
+                ticket = [int(priority), next(cls._sequence), me]
+                heapq.heappush(cls._waiters, ticket)
+                deadline = None if timeout is None else start + timeout
+                try:
+                    while cls._owner is not None or cls._waiters[0] is not ticket:
+                        remaining = None if deadline is None else deadline - time.perf_counter()
+                        if remaining is not None and remaining <= 0:
+                            stats.timeouts += 1
+                            raise TimeoutError(
+                                f"I2C bus not granted to {client} within {timeout}s"
+                            )
+                        cls._sched_cond.wait(remaining)
+                finally:
+                    cls._waiters.remove(ticket)
+                    heapq.heapify(cls._waiters)
+                    # Head of queue may have changed either way
+                    cls._sched_cond.notify_all()
+
+            now = time.perf_counter()
+            wait_s = now - start
+            stats.acquisitions += 1
+            stats.transactions += 1
+            stats.wait_total_s += wait_s
+            if wait_s > stats.wait_max_s:
+                stats.wait_max_s = wait_s
+            cls._owner = me
+            cls._owner_depth = 1
+            cls._owner_client = client
+            cls._owner_since = now
+
+    @classmethod
+    def _release(cls) -> None:
+        """Release ownership on the outermost exit and wake the next waiter."""
+        with cls._sched_cond:
+            cls._owner_depth -= 1
+            if cls._owner_depth > 0:
+                return
+            hold_s = time.perf_counter() - cls._owner_since
+            stats = cls._stats_for(cls._owner_client or "unknown")
+            stats.bus_time_s += hold_s
+            if hold_s > stats.hold_max_s:
+                stats.hold_max_s = hold_s
+            cls._owner = None
+            cls._owner_client = None
+            if cls._waiters:
+                cls._sched_cond.notify_all()
+
+    def get_bus_stats(self) -> Dict[str, Any]:
+        """Get scheduler and per-client bus usage statistics.
+
+        Returns:
+            Dict with 'queue_depth', 'max_queue_depth', 'owner' (client name
+            or None) and 'clients' mapping client name to wait/bus-time stats
+        """
+        with self._sched_cond:
+            return {
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self.max_queue_depth,
+                "owner": self._owner_client,
+                "clients": {
+                    name: stats.as_dict()
+                    for name, stats in sorted(self._client_stats.items())
+                },
+            }
+
+    @classmethod
+    def reset_bus_stats(cls) -> None:
+        """Clear per-client bus accounting."""
+        with cls._sched_cond:
+            cls._client_stats.clear()
 
     def get_bus(self) -> 'busio.I2C':
         """Get direct access to I2C bus.
@@ -198,7 +436,9 @@ class I2CBusManager:
         """Reset singleton instance.
 
         FOR TESTING ONLY - Resets singleton state to allow fresh initialization.
-        Should never be called in production code.
+        Should never be called in production code, and never while another
+        thread holds or waits for the bus: scheduler ownership and the wait
+        queue are cleared as well.
         """
         with cls._lock:
             if cls._bus is not None:
@@ -208,8 +448,16 @@ class I2CBusManager:
                     pass
             cls._instance = None
             cls._bus = None
+            cls._bus_lock = None  # Recreated with the current profiling setting
             with cls._lock_count_lock:
                 cls._lock_count = 0
+        with cls._sched_cond:
+            cls._owner = None
+            cls._owner_depth = 0
+            cls._owner_client = None
+            cls._owner_since = 0.0
+            cls._waiters.clear()
+            cls._client_stats.clear()
 
 
 # Module-level convenience function
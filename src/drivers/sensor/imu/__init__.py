@@ -5,8 +5,14 @@ and orientation tracking.
 
 Supported IMUs:
     - BNO085: 9-DOF absolute orientation sensor with sensor fusion
+
+IMUSampler reads any supported IMU on a background thread and publishes
+immutable IMUSnapshot values for the control loop; IMUHistory keeps the
+last samples for vectorized windowed queries (tilt, rates, filtering).
 """
 
 from .bno085 import BNO085Driver, IMUData
+from .history import IMUHistory, IMUWindow
+from .sampler import IMUSampler, IMUSnapshot
 
-__all__ = ['BNO085Driver', 'IMUData']
+__all__ = ['BNO085Driver', 'IMUData', 'IMUHistory', 'IMUSampler', 'IMUSnapshot', 'IMUWindow']
@@ -73,7 +73,7 @@ except ImportError:
     BNO08X_I2C = None
 
 # Import I2C Bus Manager
-from ...i2c_bus_manager import I2CBusManager
+from ...i2c_bus_manager import BusPriority, I2CBusManager
 
 
 @dataclass
@@ -158,6 +158,7 @@ class BNO085Driver:
 
         # Get I2C Bus Manager singleton
         self.bus_manager = I2CBusManager.get_instance()
+        self._bus_client = f"bno085@0x{self.address:02x}"
 
         # Initialize sensor
         self._initialize_sensor()
@@ -184,7 +185,7 @@ class BNO085Driver:
 
         try:
             # CRITICAL: Use I2C Bus Manager to prevent collisions
-            with self.bus_manager.acquire_bus() as i2c_bus:
+            with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client) as i2c_bus:
                 # Initialize BNO085 sensor on managed bus
                 self._sensor = BNO08X_I2C(i2c_bus, address=self.address)
 
@@ -219,7 +220,7 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus before I2C operation
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client):
                     # Read quaternion from sensor
                     quat_i, quat_j, quat_k, quat_real = self._sensor.quaternion
 
@@ -256,7 +257,7 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus before I2C operation
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client):
                     quat_i, quat_j, quat_k, quat_real = self._sensor.quaternion
 
                     return Quaternion(
@@ -284,7 +285,7 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus before I2C operation
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client):
                     accel_x, accel_y, accel_z = self._sensor.acceleration
                     return (accel_x, accel_y, accel_z)
 
@@ -306,13 +307,45 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus before I2C operation
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client):
                     gyro_x, gyro_y, gyro_z = self._sensor.gyro
                     return (gyro_x, gyro_y, gyro_z)
 
             except Exception as e:
                 raise RuntimeError(f"Failed to read gyroscope: {e}")
 
+    def read_sample(self) -> Tuple[Quaternion, Tuple[float, float, float], Tuple[float, float, float]]:
+        """Read quaternion, acceleration and gyro in one bus transaction.
+
+        Takes the driver lock and the I2C bus once for all three reports,
+        instead of three separate read_* calls. Used by IMUSampler.
+
+        Returns:
+            Tuple of (quaternion, (ax, ay, az) in m/s², (gx, gy, gz) in rad/s)
+
+        Raises:
+            RuntimeError: If sensor read fails
+        """
+        with self._lock:
+            if not self._initialized:
+                raise RuntimeError("Sensor not initialized")
+
+            try:
+                # CRITICAL: Acquire bus before I2C operation
+                with self.bus_manager.acquire_bus(BusPriority.SENSING, self._bus_client):
+                    quat_i, quat_j, quat_k, quat_real = self._sensor.quaternion
+                    acceleration = tuple(self._sensor.acceleration)
+                    gyro = tuple(self._sensor.gyro)
+
+                return (
+                    Quaternion(w=quat_real, x=quat_i, y=quat_j, z=quat_k),
+                    acceleration,
+                    gyro,
+                )
+
+            except Exception as e:
+                raise RuntimeError(f"Failed to read IMU sample: {e}")
+
     @staticmethod
     def _quaternion_to_euler(w: float, x: float, y: float, z: float) -> Tuple[float, float, float]:
         """Convert quaternion to Euler angles (heading, roll, pitch).
@@ -371,7 +404,7 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus for calibration commands
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.DIAGNOSTICS, self._bus_client):
                     # BNO085 auto-calibrates, this is a placeholder
                     # for future calibration commands if needed
                     time.sleep(0.5)
@@ -391,7 +424,7 @@ class BNO085Driver:
 
             try:
                 # CRITICAL: Acquire bus for reset command
-                with self.bus_manager.acquire_bus():
+                with self.bus_manager.acquire_bus(BusPriority.DIAGNOSTICS, self._bus_client):
                     # Sensor reset would go here
                     pass
 
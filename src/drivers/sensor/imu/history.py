@@ -0,0 +1,386 @@
+"""Fixed-size IMU time-series buffer with vectorized window queries.
+
+Keeps the last ``capacity`` IMU samples (timestamp, quaternion,
+acceleration, gyro, Euler angles) in one preallocated NumPy array for
+head stabilization and fall/tilt detection. Appends are O(1) writes
+into preallocated storage; queries select a "last N ms" or "last N samples"
+window and operate on it with vectorized NumPy, without copying.
+
+Design:
+    - Storage is mirrored like AudioRingBuffer: every row is written at
+      ``pos`` and ``pos + capacity``, so any window is one contiguous
+      slice and window() returns read-only views, never a stitched copy
+    - Timestamps are monotonic, so "last N ms" is a binary search
+    - Single writer (normally IMUSampler), any number of readers; a view
+      stays valid until ``capacity - len(window)`` further appends, so
+      call IMUWindow.copy() to keep a window longer than that
+    - Fields a sample did not provide (e.g. no quaternion from an
+      orientation-only IMU) are stored as NaN
+
+Example:
+    >>> from src.drivers.sensor.imu import IMUHistory
+    >>> history = IMUHistory(capacity=256)
+    >>> sampler = IMUSampler(imu, rate_hz=100.0, history=history)
+    >>> recent = history.window(duration_s=0.2)
+    >>> roll, pitch = recent.complementary_tilt(alpha=0.98)
+    >>> rate, when = recent.peak_angular_rate()
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Column layout of one stored row
+_T = 0
+_QUAT = slice(1, 5)      # w, x, y, z
+_ACCEL = slice(5, 8)     # m/s²
+_GYRO = slice(8, 11)     # rad/s
+_EULER = slice(11, 14)   # heading, roll, pitch (degrees)
+_ROW_WIDTH = 14
+
+# Field name -> column slice, for the generic statistics
+FIELDS = {
+    'quaternion': _QUAT,
+    'acceleration': _ACCEL,
+    'gyro': _GYRO,
+    'euler': _EULER,
+}
+
+
+def quaternion_to_euler(quaternions: np.ndarray) -> np.ndarray:
+    """Convert quaternions to Euler angles in one vectorized pass.
+
+    Same convention as BNO085Driver._quaternion_to_euler.
+
+    Args:
+        quaternions: (N, 4) array of (w, x, y, z)
+
+    Returns:
+        (N, 3) array of (heading 0-360, roll -180..180, pitch -90..90)
+        in degrees
+    """
+    q = np.asarray(quaternions, dtype=np.float64)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    roll = np.arctan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    pitch = np.arcsin(np.clip(2.0 * (w * y - z * x), -1.0, 1.0))
+    yaw = np.arctan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+
+    euler = np.degrees(np.stack((yaw, roll, pitch), axis=1))
+    euler[:, 0] %= 360.0
+    return euler
+
+
+def accel_tilt(acceleration: np.ndarray) -> np.ndarray:
+    """Roll and pitch implied by the gravity vector.
+
+    Only valid while the robot is not accelerating; the complementary
+    filter uses it as the slow, drift-free reference.
+
+    Args:
+        acceleration: (N, 3) array of (x, y, z) in m/s²
+
+    Returns:
+        (N, 2) array of (roll, pitch) in degrees
+    """
+    a = np.asarray(acceleration, dtype=np.float64)
+    roll = np.arctan2(a[:, 1], a[:, 2])
+    pitch = np.arctan2(-a[:, 0], np.hypot(a[:, 1], a[:, 2]))
+    return np.degrees(np.stack((roll, pitch), axis=1))
+
+
+@dataclass(frozen=True)
+class IMUWindow:
+    """A window of IMU history (read-only views into the buffer).
+
+    Attributes:
+        timestamps: (N,) time.monotonic() values, ascending
+        quaternion: (N, 4) (w, x, y, z)
+        acceleration: (N, 3) m/s²
+        gyro: (N, 3) rad/s
+        euler: (N, 3) (heading, roll, pitch) in degrees
+    """
+    timestamps: np.ndarray
+    quaternion: np.ndarray
+    acceleration: np.ndarray
+    gyro: np.ndarray
+    euler: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and last sample (0 if < 2 samples)."""
+        if len(self.timestamps) < 2:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+
+    def copy(self) -> "IMUWindow":
+        """Detach the window from the ring (survives further appends)."""
+        return IMUWindow(
+            timestamps=self.timestamps.copy(),
+            quaternion=self.quaternion.copy(),
+            acceleration=self.acceleration.copy(),
+            gyro=self.gyro.copy(),
+            euler=self.euler.copy(),
+        )
+
+    def _field(self, field: str) -> np.ndarray:
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field {field!r}; expected one of {sorted(FIELDS)}")
+        return getattr(self, field)
+
+    def mean(self, field: str) -> np.ndarray:
+        """Per-axis mean of a field over the window.
+
+        Args:
+            field: "quaternion", "acceleration", "gyro" or "euler"
+
+        Raises:
+            ValueError: If field is unknown or the window is empty
+        """
+        values = self._field(field)
+        if len(values) == 0:
+            raise ValueError("Window is empty")
+        return values.mean(axis=0)
+
+    def variance(self, field: str) -> np.ndarray:
+        """Per-axis population variance of a field over the window.
+
+        Raises:
+            ValueError: If field is unknown or the window is empty
+        """
+        values = self._field(field)
+        if len(values) == 0:
+            raise ValueError("Window is empty")
+        return values.var(axis=0)
+
+    def low_pass(self, field: str, alpha: float) -> np.ndarray:
+        """Exponential low-pass of a field, evaluated at the newest sample.
+
+        Equivalent to running ``y = alpha * x + (1 - alpha) * y`` over the
+        window seeded with the first sample, computed as one weighted sum.
+
+        Args:
+            field: "quaternion", "acceleration", "gyro" or "euler"
+            alpha: Smoothing factor in (0, 1]; higher follows input faster
+
+        Returns:
+            Filtered per-axis value
+
+        Raises:
+            ValueError: If alpha is out of range, field unknown or window empty
+        """
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        values = self._field(field)
+        n = len(values)
+        if n == 0:
+            raise ValueError("Window is empty")
+
+        # weights[k] = alpha * (1 - alpha)^(n-1-k), seed gets (1 - alpha)^(n-1)
+        weights = alpha * (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+        weights[0] = (1.0 - alpha) ** (n - 1)
+        return weights @ values
+
+    def complementary_tilt(self, alpha: float = 0.98) -> Tuple[float, float]:
+        """Complementary-filter roll and pitch at the newest sample.
+
+        Blends integrated gyro rate (fast, drifts) with the accelerometer
+        tilt (slow, drift-free)::
+
+            angle[k] = alpha * (angle[k-1] + rate[k] * dt[k]) + (1 - alpha) * accel_angle[k]
+
+        seeded with the first accelerometer tilt. The recurrence is linear,
+        so it is evaluated in closed form as one weighted sum.
+
+        Args:
+            alpha: Gyro weight in [0, 1] (typical 0.95-0.99)
+
+        Returns:
+            (roll, pitch) in degrees
+
+        Raises:
+            ValueError: If alpha is out of range or the window is empty
+        """
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError(f"alpha must be in [0, 1], got {alpha}")
+        n = len(self.timestamps)
+        if n == 0:
+            raise ValueError("Window is empty")
+
+        reference = accel_tilt(self.acceleration)        # (n, 2)
+        if n == 1:
+            return float(reference[0, 0]), float(reference[0, 1])
+
+        dt = np.diff(self.timestamps)                     # (n-1,)
+        rate = np.degrees(self.gyro[1:, :2])              # roll/pitch rates
+        drive = alpha * rate * dt[:, None] + (1.0 - alpha) * reference[1:]
+
+        decay = alpha ** np.arange(n - 2, -1, -1, dtype=np.float64)
+        angles = alpha ** (n - 1) * reference[0] + decay @ drive
+        return float(angles[0]), float(angles[1])
+
+    def angular_rate(self) -> np.ndarray:
+        """Per-sample angular rate magnitude in rad/s, shape (N,)."""
+        g = self.gyro
+        return np.sqrt(np.einsum('ij,ij->i', g, g))
+
+    def peak_angular_rate(self) -> Tuple[float, float]:
+        """Largest angular rate magnitude in the window.
+
+        Returns:
+            (rate in rad/s, timestamp of the peak)
+
+        Raises:
+            ValueError: If the window is empty
+        """
+        if len(self.timestamps) == 0:
+            raise ValueError("Window is empty")
+        rates = self.angular_rate()
+        index = int(np.nanargmax(rates)) if not np.isnan(rates).all() else 0
+        return float(rates[index]), float(self.timestamps[index])
+
+    def euler_from_quaternion(self) -> np.ndarray:
+        """Batched quaternion -> (heading, roll, pitch) for every sample."""
+        return quaternion_to_euler(self.quaternion)
+
+
+class IMUHistory:
+    """Mirrored ring of IMU samples.
+
+    Thread Safety:
+        append()/append_sample()/clear(): single writer only.
+        window(), latest_timestamp, __len__: any thread (see module
+        docstring for view lifetime).
+
+    Attributes:
+        capacity: Maximum number of samples retained
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Initialize history.
+
+        Args:
+            capacity: Number of samples retained (256 = 2.56s at 100Hz)
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self._capacity = capacity
+        self._rows = np.full((2 * capacity, _ROW_WIDTH), np.nan, dtype=np.float64)
+        self._head = 0  # Samples appended since creation (never wrapped)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained."""
+        return self._capacity
+
+    @property
+    def total_appended(self) -> int:
+        """Samples appended since creation (or last clear)."""
+        return self._head
+
+    @property
+    def latest_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest sample (None if empty)."""
+        head = self._head
+        if head == 0:
+            return None
+        return float(self._rows[(head - 1) % self._capacity, _T])
+
+    def __len__(self) -> int:
+        return min(self._head, self._capacity)
+
+    def append(self, snapshot) -> None:
+        """Append an IMUSnapshot.
+
+        Args:
+            snapshot: IMUSnapshot (or any object with the same fields)
+        """
+        self.append_sample(
+            timestamp=snapshot.timestamp,
+            quaternion=snapshot.quaternion,
+            acceleration=snapshot.acceleration,
+            gyro=snapshot.gyro,
+            euler=(snapshot.heading, snapshot.roll, snapshot.pitch),
+        )
+
+    def append_sample(
+        self,
+        timestamp: float,
+        quaternion: Optional[Sequence[float]] = None,
+        acceleration: Optional[Sequence[float]] = None,
+        gyro: Optional[Sequence[float]] = None,
+        euler: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Append one sample (O(1)).
+
+        Args:
+            timestamp: time.monotonic() of the sample; must not go backwards
+            quaternion: (w, x, y, z) or None
+            acceleration: (x, y, z) in m/s² or None
+            gyro: (x, y, z) in rad/s or None
+            euler: (heading, roll, pitch) in degrees or None
+        """
+        pos = self._head % self._capacity
+        row = self._rows[pos]
+        row[_T] = timestamp
+        row[_QUAT] = np.nan if quaternion is None else quaternion
+        row[_ACCEL] = np.nan if acceleration is None else acceleration
+        row[_GYRO] = np.nan if gyro is None else gyro
+        row[_EULER] = np.nan if euler is None else euler
+        self._rows[pos + self._capacity] = row
+        self._head += 1
+
+    def window(
+        self,
+        duration_s: Optional[float] = None,
+        count: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> IMUWindow:
+        """Select the newest samples as read-only views.
+
+        With neither argument the whole history is returned. With both,
+        the smaller window wins.
+
+        Args:
+            duration_s: Keep samples newer than ``now - duration_s``
+            count: Keep at most this many newest samples
+            now: Reference time for duration_s (default: newest sample)
+
+        Returns:
+            IMUWindow over the selected samples (may be empty)
+        """
+        head = self._head
+        n = min(head, self._capacity)
+        if count is not None:
+            n = min(n, max(count, 0))
+
+        end = head % self._capacity + self._capacity
+        rows = self._rows[end - n:end]
+
+        if duration_s is not None and n:
+            timestamps = rows[:, _T]
+            reference = timestamps[-1] if now is None else now
+            start = int(np.searchsorted(timestamps, reference - duration_s, side='left'))
+            rows = rows[start:]
+
+        rows = rows.view()
+        rows.flags.writeable = False
+        return IMUWindow(
+            timestamps=rows[:, _T],
+            quaternion=rows[:, _QUAT],
+            acceleration=rows[:, _ACCEL],
+            gyro=rows[:, _GYRO],
+            euler=rows[:, _EULER],
+        )
+
+    def clear(self) -> None:
+        """Drop all samples (writer only)."""
+        self._head = 0
+        self._rows.fill(np.nan)
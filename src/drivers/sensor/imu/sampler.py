@@ -0,0 +1,293 @@
+"""Background IMU sampler with latest-value publication.
+
+Moves IMU I2C reads out of the control loop. A daemon thread reads
+quaternion, acceleration and gyro as one batch (BNO085Driver.read_sample)
+at a fixed rate, converts to Euler angles and publishes an immutable
+IMUSnapshot. Readers take the latest snapshot with a plain attribute
+read: no lock, no I2C, no blocking.
+
+Design:
+    - Publication is a single reference assignment (atomic in CPython);
+      snapshots are frozen, so a reader never sees a half-written sample
+    - Timestamps use time.monotonic(), so sample age is immune to
+      wall-clock jumps
+    - The sampler schedules on absolute deadlines; a read that overruns
+      its period skips the missed ticks instead of bursting to catch up
+    - Read failures are counted and logged once per failure streak;
+      the last good snapshot stays published (check its age)
+    - IMUs without read_sample() fall back to read_orientation()
+      (Euler only, quaternion/accel/gyro None)
+    - An optional IMUHistory receives every snapshot for windowed queries
+
+Example:
+    >>> from src.drivers.sensor.imu import BNO085Driver, IMUSampler
+    >>> sampler = IMUSampler(BNO085Driver(), rate_hz=100.0)
+    >>> sampler.start()
+    >>> snapshot = sampler.latest
+    >>> if snapshot is not None and snapshot.age() < 0.05:
+    ...     print(snapshot.pitch)
+    >>> sampler.stop()
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .bno085 import BNO085Driver
+from .history import IMUHistory
+
+_logger = logging.getLogger(__name__)
+
+# Default sampling rate (2x the 50Hz control loop)
+DEFAULT_SAMPLE_HZ = 100.0
+
+
+@dataclass(frozen=True)
+class IMUSnapshot:
+    """Immutable IMU sample published by IMUSampler.
+
+    Attributes:
+        heading: Compass heading in degrees (0-360, 0=North)
+        roll: Roll angle in degrees (-180 to 180)
+        pitch: Pitch angle in degrees (-90 to 90)
+        quaternion: Orientation as (w, x, y, z), or None if unavailable
+        acceleration: (x, y, z) acceleration in m/s², or None
+        gyro: (x, y, z) angular velocity in rad/s, or None
+        timestamp: time.monotonic() when the read completed
+        sequence: Sample number since the sampler started (1-based)
+        read_duration_s: Time the read took (I2C + conversion)
+    """
+    heading: float
+    roll: float
+    pitch: float
+    quaternion: Optional[Tuple[float, float, float, float]]
+    acceleration: Optional[Tuple[float, float, float]]
+    gyro: Optional[Tuple[float, float, float]]
+    timestamp: float
+    sequence: int
+    read_duration_s: float
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since this sample was taken.
+
+        Args:
+            now: time.monotonic() value to measure against (default: now)
+        """
+        if now is None:
+            now = time.monotonic()
+        return now - self.timestamp
+
+
+class IMUSampler:
+    """Reads an IMU on a background thread and publishes snapshots.
+
+    Thread Safety:
+        latest, get_sample_age() and get_statistics() never block and may
+        be called from any thread. start()/stop() must not race each other.
+
+    Attributes:
+        imu: IMU driver (BNO085Driver or compatible)
+        rate_hz: Target sampling rate
+        history: IMUHistory fed by the sampler thread, or None
+    """
+
+    def __init__(
+        self,
+        imu: Any,
+        rate_hz: float = DEFAULT_SAMPLE_HZ,
+        name: str = "IMUSampler",
+        history: Optional[IMUHistory] = None,
+    ) -> None:
+        """Initialize sampler (does not start the thread).
+
+        Args:
+            imu: Driver with read_sample() or read_orientation()
+            rate_hz: Sampling rate in Hz
+            name: Thread name
+            history: Optional ring that every snapshot is appended to
+
+        Raises:
+            ValueError: If rate_hz is not positive
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+
+        self.imu = imu
+        self.rate_hz = rate_hz
+        self._period_s = 1.0 / rate_hz
+        self._name = name
+        self._batched = hasattr(imu, "read_sample")
+        self.history = history
+
+        # Published by the sampler thread, read lock-free by consumers
+        self._latest: Optional[IMUSnapshot] = None
+
+        self._stop_event = threading.Event()
+        self._first_sample = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics (written only by the sampler thread)
+        self._sequence = 0
+        self._read_errors = 0
+        self._consecutive_errors = 0
+        self._skipped_ticks = 0
+        self._last_error: Optional[str] = None
+        self._read_time_total_s = 0.0
+        self._read_time_max_s = 0.0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    @property
+    def is_running(self) -> bool:
+        """True while the sampler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampler thread (no-op if already running)."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        _logger.debug("IMU sampler started at %.0fHz (batched=%s)", self.rate_hz, self._batched)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the sampler thread.
+
+        The last snapshot stays available after stopping.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                _logger.warning("IMU sampler thread did not exit within %.1fs", timeout)
+        self._thread = None
+
+    def wait_for_sample(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first snapshot is published.
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            True if a snapshot is available
+        """
+        return self._first_sample.wait(timeout)
+
+    # =========================================================================
+    # Consumer API (non-blocking)
+    # =========================================================================
+
+    @property
+    def latest(self) -> Optional[IMUSnapshot]:
+        """Most recent snapshot, or None before the first good read."""
+        return self._latest
+
+    def get_sample_age(self) -> Optional[float]:
+        """Seconds since the latest snapshot was taken (None if none yet)."""
+        snapshot = self._latest
+        return None if snapshot is None else snapshot.age()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get sampler statistics.
+
+        Returns:
+            Dictionary with sample and error counts, skipped ticks
+            (reads that overran their period), sample age and read times
+        """
+        samples = self._sequence
+        age = self.get_sample_age()
+        return {
+            'running': self.is_running,
+            'rate_hz': self.rate_hz,
+            'batched': self._batched,
+            'samples': samples,
+            'read_errors': self._read_errors,
+            'consecutive_errors': self._consecutive_errors,
+            'skipped_ticks': self._skipped_ticks,
+            'last_error': self._last_error,
+            'sample_age_ms': None if age is None else age * 1000.0,
+            'read_time_avg_ms': (self._read_time_total_s / samples * 1000.0) if samples else 0.0,
+            'read_time_max_ms': self._read_time_max_s * 1000.0,
+        }
+
+    # =========================================================================
+    # Sampler Thread
+    # =========================================================================
+
+    def sample_once(self) -> Optional[IMUSnapshot]:
+        """Take and publish one sample on the calling thread.
+
+        Used by the sampler thread; also handy for tests and tools.
+
+        Returns:
+            The published snapshot, or None if the read failed
+        """
+        start = time.monotonic()
+        try:
+            if self._batched:
+                quat, acceleration, gyro = self.imu.read_sample()
+                quaternion = (quat.w, quat.x, quat.y, quat.z)
+                heading, roll, pitch = BNO085Driver._quaternion_to_euler(*quaternion)
+            else:
+                data = self.imu.read_orientation()
+                heading, roll, pitch = data.heading, data.roll, data.pitch
+                quaternion = acceleration = gyro = None
+        except Exception as e:
+            self._read_errors += 1
+            self._consecutive_errors += 1
+            self._last_error = str(e)
+            if self._consecutive_errors == 1:
+                _logger.warning("IMU read failed (keeping last sample): %s", e)
+            return None
+
+        end = time.monotonic()
+        if self._consecutive_errors:
+            _logger.info("IMU reads recovered after %d failures", self._consecutive_errors)
+            self._consecutive_errors = 0
+
+        duration = end - start
+        self._sequence += 1
+        self._read_time_total_s += duration
+        if duration > self._read_time_max_s:
+            self._read_time_max_s = duration
+
+        snapshot = IMUSnapshot(
+            heading=heading,
+            roll=roll,
+            pitch=pitch,
+            quaternion=quaternion,
+            acceleration=acceleration,
+            gyro=gyro,
+            timestamp=end,
+            sequence=self._sequence,
+            read_duration_s=duration,
+        )
+        if self.history is not None:
+            self.history.append(snapshot)
+        self._latest = snapshot
+        self._first_sample.set()
+        return snapshot
+
+    def _run(self) -> None:
+        """Sampler thread main loop (absolute-deadline schedule)."""
+        next_deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            self.sample_once()
+
+            next_deadline += self._period_s
+            now = time.monotonic()
+            if now > next_deadline:
+                # Overran: skip the missed ticks rather than bursting
+                missed = int((now - next_deadline) / self._period_s) + 1
+                self._skipped_ticks += missed
+                next_deadline += missed * self._period_s
+            self._stop_event.wait(next_deadline - now)
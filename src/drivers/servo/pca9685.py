@@ -15,9 +15,9 @@ Connections:
     - GND -> GND (Pi Pin 6)
 """
 
+import struct
 import time
-import threading
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 try:
     import board
     import busio
@@ -29,7 +29,8 @@ except ImportError:
     PCA9685 = None
 
 # Import I2C Bus Manager for thread-safe bus access
-from ..i2c_bus_manager import I2CBusManager
+from ..i2c_bus_manager import BusPriority, I2CBusManager
+from src.utils.lock_profiler import create_lock
 
 
 class PCA9685Driver:
@@ -43,6 +44,13 @@ class PCA9685Driver:
         multiple threads. Uses a single lock to protect hardware I2C access and
         internal channel state modifications.
 
+    Register Cache:
+        A write-through shadow of the last (ON, OFF) register pair written to
+        each channel lets servo writes that would not change the register be
+        skipped (common during holds and at the end of eased moves). Disable
+        writes are never skipped. The cache is invalidated by disable_all(),
+        deinit() and invalidate_register_cache(); see get_register_cache_stats().
+
     Attributes:
         i2c: I2C bus instance
         pca: PCA9685 controller instance
@@ -55,6 +63,10 @@ class PCA9685Driver:
     SERVO_MAX_PULSE = 2000  # Maximum pulse width (180 degrees)
     SERVO_FREQUENCY = 50    # Standard servo frequency (50Hz = 20ms period)
 
+    # Register layout for auto-increment burst writes
+    LED0_ON_L = 0x06        # First channel register (ON_L, ON_H, OFF_L, OFF_H per channel)
+    REGISTERS_PER_CHANNEL = 4
+
     def __init__(
         self,
         address: int = 0x40,
@@ -80,10 +92,18 @@ class PCA9685Driver:
         self.address = address
         self.frequency = frequency
         self.channels = {}  # Track channel states
-        self._lock = threading.RLock()  # Reentrant lock allows nested acquisitions by same thread
+        # Shadow of last (ON, OFF) registers written per channel; None = unknown
+        self._shadow_regs: Dict[int, Optional[Tuple[int, int]]] = {
+            channel: None for channel in range(16)
+        }
+        self._register_writes = 0
+        self._skipped_writes = 0
+        self._skipped_by_channel: Dict[int, int] = {channel: 0 for channel in range(16)}
+        self._lock = create_lock("drivers.pca9685")  # Reentrant lock allows nested acquisitions by same thread
 
         # Get I2C Bus Manager singleton for coordinated bus access
         self.bus_manager = I2CBusManager.get_instance()
+        self._bus_client = f"pca9685@0x{address:02x}"
 
         # Initialize I2C and PCA9685
         if board is None or busio is None or PCA9685 is None:
@@ -95,7 +115,9 @@ class PCA9685Driver:
         try:
             # CRITICAL FIX (BUG #3): Use I2CBusManager instead of creating independent bus
             # This prevents race conditions during initialization
-            with self.bus_manager.acquire_bus() as i2c_bus_instance:
+            with self.bus_manager.acquire_bus(
+                BusPriority.MOTION, self._bus_client
+            ) as i2c_bus_instance:
                 # Initialize PCA9685 on managed bus
                 self.pca = PCA9685(i2c_bus_instance, address=address)
                 self.pca.frequency = frequency
@@ -104,6 +126,7 @@ class PCA9685Driver:
                 # This happens under bus lock protection
                 for channel in range(16):
                     self.pca.channels[channel].duty_cycle = 0
+                    self._shadow_regs[channel] = self._duty_to_registers(0)
                     self.channels[channel] = {
                         'angle': None,
                         'enabled': False
@@ -133,7 +156,7 @@ class PCA9685Driver:
         with self._lock:
             # Convert to duty cycle (0-65535)
             duty_cycle = int((off / 4095) * 65535)
-            self.pca.channels[channel].duty_cycle = duty_cycle
+            self._write_channel(channel, duty_cycle)
 
     def set_servo_angle(self, channel: int, angle: float) -> None:
         """Set servo to specific angle.
@@ -162,13 +185,204 @@ class PCA9685Driver:
             pulse_length = 1_000_000 // self.frequency  # Period in microseconds
             duty_cycle = int((pulse_width / pulse_length) * 65535)
 
-            # Set PWM
-            self.pca.channels[channel].duty_cycle = duty_cycle
+            # Set PWM (skipped if the register already holds this value)
+            self._write_channel(channel, duty_cycle)
 
             # Update channel state
             self.channels[channel]['angle'] = angle
             self.channels[channel]['enabled'] = True
 
+    def set_servo_angles(self, angles: Dict[int, float]) -> None:
+        """Set several servos in one coalesced I2C burst.
+
+        All channel registers are computed first, then written under a single
+        driver lock and bus acquisition. Contiguous channels are sent as one
+        auto-increment transaction (the Adafruit library enables MODE1 AI when
+        setting the frequency), so e.g. head pan/tilt on channels 12-13 costs
+        one I2C write instead of two.
+
+        Validation happens before anything is written: an invalid entry
+        raises and leaves every servo untouched.
+
+        Args:
+            angles: Dict of {channel: angle} pairs (channel 0-15, angle 0-180)
+
+        Raises:
+            ValueError: If any channel or angle is out of range
+        """
+        for channel, angle in angles.items():
+            if not 0 <= channel <= 15:
+                raise ValueError(f"Channel must be 0-15, got {channel}")
+            if not 0 <= angle <= 180:
+                raise ValueError(f"Angle must be 0-180°, got {angle}")
+
+        if not angles:
+            return
+
+        pulse_length = 1_000_000 // self.frequency  # Period in microseconds
+        duties = {
+            channel: int((self._angle_to_pulse(angle) / pulse_length) * 65535)
+            for channel, angle in angles.items()
+        }
+
+        # Thread-safe hardware and state modification
+        with self._lock:
+            self._write_duty_cycles(duties)
+
+            for channel, angle in angles.items():
+                self.channels[channel]['angle'] = angle
+                self.channels[channel]['enabled'] = True
+
+    def _write_duty_cycles(self, duties: Dict[int, int]) -> None:
+        """Write 16-bit duty cycles for several channels (lock must be held).
+
+        Uses raw auto-increment bursts when the underlying PCA9685 exposes its
+        I2C device, otherwise falls back to per-channel duty_cycle writes.
+
+        Args:
+            duties: Dict of {channel: duty_cycle} with duty_cycle 0-65535
+        """
+        duties = {
+            channel: duty_cycle
+            for channel, duty_cycle in duties.items()
+            if not self._is_cached(channel, duty_cycle)
+        }
+        if not duties:
+            return
+
+        i2c_device = getattr(self.pca, 'i2c_device', None)
+        if i2c_device is None:
+            for channel, duty_cycle in duties.items():
+                self._write_channel(channel, duty_cycle, force=True)
+            return
+
+        with self.bus_manager.acquire_bus(BusPriority.MOTION, self._bus_client):
+            with i2c_device:
+                for start, regs in self._coalesce_runs(duties):
+                    buffer = bytearray(1 + len(regs) * 4)
+                    buffer[0] = self.LED0_ON_L + start * self.REGISTERS_PER_CHANNEL
+                    for i, (on, off) in enumerate(regs):
+                        struct.pack_into('<HH', buffer, 1 + i * 4, on, off)
+                        self._shadow_regs[start + i] = None
+                    i2c_device.write(buffer)
+                    # Shadow only what actually reached the bus
+                    for i, pair in enumerate(regs):
+                        self._shadow_regs[start + i] = pair
+                    self._register_writes += len(regs)
+
+    def _write_channel(
+        self,
+        channel: int,
+        duty_cycle: int,
+        force: bool = False,
+        priority: BusPriority = BusPriority.MOTION,
+    ) -> bool:
+        """Write one channel's duty cycle through the register cache (lock must be held).
+
+        Args:
+            channel: Channel number (0-15)
+            duty_cycle: Duty cycle 0-65535
+            force: If True, write even if the shadow register matches
+            priority: I2C bus admission priority for the write
+
+        Returns:
+            True if the register was written, False if the write was skipped
+        """
+        if not force and self._is_cached(channel, duty_cycle):
+            return False
+        # Invalidate first so a failed write never leaves a stale shadow
+        self._shadow_regs[channel] = None
+        with self.bus_manager.acquire_bus(priority, self._bus_client):
+            self.pca.channels[channel].duty_cycle = duty_cycle
+        self._shadow_regs[channel] = self._duty_to_registers(duty_cycle)
+        self._register_writes += 1
+        return True
+
+    def _is_cached(self, channel: int, duty_cycle: int) -> bool:
+        """Check the shadow register, counting a skip on hit (lock must be held)."""
+        if self._shadow_regs[channel] == self._duty_to_registers(duty_cycle):
+            self._skipped_writes += 1
+            self._skipped_by_channel[channel] += 1
+            return True
+        return False
+
+    def _invalidate_shadow(self) -> None:
+        """Mark every shadow register unknown (lock must be held)."""
+        for channel in range(16):
+            self._shadow_regs[channel] = None
+
+    def invalidate_register_cache(self) -> None:
+        """Force the next write to every channel to reach the hardware.
+
+        Call after anything that changes PCA9685 registers behind the
+        driver's back, e.g. a chip reset, brownout or another process
+        writing the same device.
+        """
+        with self._lock:
+            self._invalidate_shadow()
+
+    def get_register_cache_stats(self) -> dict:
+        """Get register cache statistics.
+
+        Returns:
+            Dict with 'writes' (register writes sent), 'skipped' (redundant
+            writes avoided), 'skip_ratio' and 'skipped_by_channel'
+        """
+        with self._lock:
+            total = self._register_writes + self._skipped_writes
+            return {
+                'writes': self._register_writes,
+                'skipped': self._skipped_writes,
+                'skip_ratio': self._skipped_writes / total if total else 0.0,
+                'skipped_by_channel': {
+                    channel: count
+                    for channel, count in self._skipped_by_channel.items()
+                    if count
+                },
+            }
+
+    @staticmethod
+    def _duty_to_registers(duty_cycle: int) -> Tuple[int, int]:
+        """Convert a 16-bit duty cycle to 12-bit (ON, OFF) register values.
+
+        Mirrors adafruit_pca9685.PWMChannel.duty_cycle so burst writes are
+        bit-identical to per-channel writes.
+
+        Args:
+            duty_cycle: Duty cycle 0-65535
+
+        Returns:
+            Tuple of (on, off) register values
+        """
+        if duty_cycle == 0xFFFF:
+            return (0x1000, 0)       # Fully on
+        if duty_cycle < 0x0010:
+            return (0, 0x1000)       # Fully off
+        return (0, duty_cycle >> 4)
+
+    @classmethod
+    def _coalesce_runs(
+        cls, duties: Dict[int, int]
+    ) -> List[Tuple[int, List[Tuple[int, int]]]]:
+        """Group channels into runs of consecutive channel numbers.
+
+        Args:
+            duties: Dict of {channel: duty_cycle}
+
+        Returns:
+            List of (start_channel, [(on, off), ...]) runs in channel order
+        """
+        runs: List[Tuple[int, List[Tuple[int, int]]]] = []
+        previous = None
+        for channel in sorted(duties):
+            regs = cls._duty_to_registers(duties[channel])
+            if previous is not None and channel == previous + 1:
+                runs[-1][1].append(regs)
+            else:
+                runs.append((channel, [regs]))
+            previous = channel
+        return runs
+
     def _angle_to_pulse(self, angle: float) -> int:
         """Convert angle to pulse width in microseconds.
 
@@ -199,7 +413,7 @@ class PCA9685Driver:
         with self._lock:
             pulse_length = 1_000_000 // self.frequency
             duty_cycle = int((pulse_us / pulse_length) * 65535)
-            self.pca.channels[channel].duty_cycle = duty_cycle
+            self._write_channel(channel, duty_cycle)
 
     def disable_channel(self, channel: int) -> None:
         """Disable (power off) a servo channel.
@@ -212,7 +426,8 @@ class PCA9685Driver:
 
         # Thread-safe hardware and state modification
         with self._lock:
-            self.pca.channels[channel].duty_cycle = 0
+            # SAFETY: Always write-through, never skipped by the register cache
+            self._write_channel(channel, 0, force=True, priority=BusPriority.SAFETY)
             self.channels[channel]['enabled'] = False
 
     def disable_all(self) -> None:
@@ -220,9 +435,13 @@ class PCA9685Driver:
 
         SAFETY CRITICAL: Uses hardware sleep mode for <5ms shutdown.
         Fallback to individual channel disable if sleep mode unavailable.
+        Acquires the I2C bus at SAFETY priority so it is served ahead of any
+        queued motion, sensing or diagnostics transactions.
         """
         # Thread-safe emergency shutdown
-        with self._lock:
+        with self._lock, self.bus_manager.acquire_bus(BusPriority.SAFETY, self._bus_client):
+            # Output state after sleep/fallback no longer matches the shadow
+            self._invalidate_shadow()
             # SAFETY: Use hardware sleep mode for instant shutdown (<5ms)
             try:
                 if hasattr(self.pca, 'sleep'):
@@ -231,12 +450,12 @@ class PCA9685Driver:
                     for channel in range(16):
                         self.channels[channel]['enabled'] = False
                 else:
-                    # Fallback: disable channels individually (lock already held)
+                    # Fallback: disable channels individually (locks already held)
                     for channel in range(16):
                         self.pca.channels[channel].duty_cycle = 0
                         self.channels[channel]['enabled'] = False
             except Exception:
-                # Last resort: disable channels individually (lock already held)
+                # Last resort: disable channels individually (locks already held)
                 for channel in range(16):
                     self.pca.channels[channel].duty_cycle = 0
                     self.channels[channel]['enabled'] = False
@@ -261,6 +480,7 @@ class PCA9685Driver:
         """Deinitialize driver and disable all channels."""
         self.disable_all()
         self.pca.deinit()
+        self.invalidate_register_cache()
 
 
 class ServoController:
@@ -312,12 +532,26 @@ class ServoController:
     def move_multiple(self, moves: dict, delay: float = 0.0) -> None:
         """Move multiple servos simultaneously.
 
+        All limits are checked before any servo moves, then the whole set is
+        sent as one coalesced write via PCA9685Driver.set_servo_angles().
+
         Args:
             moves: Dict of {channel: angle} pairs
             delay: Optional delay after movement (seconds)
+
+        Raises:
+            ValueError: If any angle exceeds its configured limits
         """
         for channel, angle in moves.items():
-            self.move_servo(channel, angle)
+            if channel in self.servo_limits:
+                min_angle, max_angle = self.servo_limits[channel]
+                if not min_angle <= angle <= max_angle:
+                    raise ValueError(
+                        f"Angle {angle}° outside limits [{min_angle}°, {max_angle}°] "
+                        f"for channel {channel}"
+                    )
+
+        self.driver.set_servo_angles(moves)
 
         if delay > 0:
             time.sleep(delay)
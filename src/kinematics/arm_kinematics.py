@@ -20,7 +20,7 @@ Mathematical Foundation:
 from __future__ import annotations
 
 import math
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
@@ -81,6 +81,7 @@ class ArmKinematics:
         self._l2 = float(l2)
         self._max_reach = self._l1 + self._l2
         self._min_reach = abs(self._l1 - self._l2)
+        self._boundary_cache: Dict[int, np.ndarray] = {}
 
     @property
     def l1(self) -> float:
@@ -266,6 +267,137 @@ class ArmKinematics:
 
         return (end_x, end_y)
 
+    def solve_ik_batch(
+        self, xs: np.ndarray, ys: np.ndarray, elbow_up: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve inverse kinematics for many targets in one vectorized pass.
+
+        Array version of solve_ik() for trajectories: same conventions and
+        the same answers, without per-point validation overhead.
+
+        Args:
+            xs: Target X coordinates in millimeters (any shape).
+            ys: Target Y coordinates in millimeters (same shape as xs).
+            elbow_up: Elbow configuration for every target. Default is True.
+
+        Returns:
+            A tuple (shoulder_angles, elbow_angles, reachable) of arrays with
+            the input shape. Angles are in radians; entries where reachable
+            is False (outside the workspace, NaN or infinite) are NaN.
+
+        Raises:
+            ValueError: If xs and ys have different shapes.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if xs.shape != ys.shape:
+            raise ValueError(f"xs and ys must have the same shape, got {xs.shape} and {ys.shape}")
+
+        distance_squared = xs * xs + ys * ys
+        distance = np.sqrt(distance_squared)
+        at_origin = distance < _EPSILON
+
+        reachable = (
+            np.isfinite(distance)
+            & (distance >= self._min_reach - _EPSILON)
+            & (distance <= self._max_reach + _EPSILON)
+            & ~at_origin
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_elbow = np.clip(
+                (self._l1**2 + self._l2**2 - distance_squared) / (2 * self._l1 * self._l2),
+                -1.0, 1.0,
+            )
+            cos_alpha = np.clip(
+                (distance_squared + self._l1**2 - self._l2**2) / (2 * distance * self._l1),
+                -1.0, 1.0,
+            )
+        elbow_interior = np.arccos(cos_elbow)
+        alpha = np.arccos(cos_alpha)
+        angle_to_target = np.arctan2(ys, xs)
+
+        if elbow_up:
+            elbow = elbow_interior - math.pi
+            shoulder = angle_to_target + alpha
+        else:
+            elbow = math.pi - elbow_interior
+            shoulder = angle_to_target - alpha
+        shoulder = np.arctan2(np.sin(shoulder), np.cos(shoulder))
+
+        # Origin is reachable only with equal links (folded arm, as solve_ik)
+        if abs(self._l1 - self._l2) < _EPSILON:
+            shoulder = np.where(at_origin, 0.0, shoulder)
+            elbow = np.where(at_origin, math.pi, elbow)
+            reachable = reachable | at_origin
+
+        shoulder = np.where(reachable, shoulder, np.nan)
+        elbow = np.where(reachable, elbow, np.nan)
+        return (shoulder, elbow, reachable)
+
+    def solve_fk_batch(
+        self, shoulder_angles: np.ndarray, elbow_angles: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve forward kinematics for many joint configurations at once.
+
+        Array version of solve_fk().
+
+        Args:
+            shoulder_angles: Shoulder angles in radians (any shape).
+            elbow_angles: Elbow angles in radians (same shape).
+
+        Returns:
+            A tuple (xs, ys) of end effector positions in millimeters.
+
+        Raises:
+            ValueError: If shapes differ or any angle is NaN or infinity.
+        """
+        shoulder = np.asarray(shoulder_angles, dtype=np.float64)
+        elbow = np.asarray(elbow_angles, dtype=np.float64)
+        if shoulder.shape != elbow.shape:
+            raise ValueError(
+                f"Angle arrays must have the same shape, got {shoulder.shape} and {elbow.shape}"
+            )
+        if not (np.isfinite(shoulder).all() and np.isfinite(elbow).all()):
+            raise ValueError("Angles must be finite (no NaN or infinity)")
+
+        total = shoulder + elbow
+        xs = self._l1 * np.cos(shoulder) + self._l2 * np.cos(total)
+        ys = self._l1 * np.sin(shoulder) + self._l2 * np.sin(total)
+        return (xs, ys)
+
+    @staticmethod
+    def plan_cartesian_path(
+        start: Tuple[float, float], end: Tuple[float, float], num_points: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Plan a straight-line Cartesian path with smooth start and stop.
+
+        Points follow a smoothstep easing (zero velocity at both ends),
+        so servo motion does not jerk at the start or end of a gesture.
+
+        Args:
+            start: (x, y) start position in millimeters.
+            end: (x, y) end position in millimeters.
+            num_points: Number of waypoints including both ends (>= 2).
+
+        Returns:
+            A tuple (xs, ys) of waypoint arrays of length num_points.
+
+        Raises:
+            ValueError: If num_points is less than 2.
+        """
+        if num_points < 2:
+            raise ValueError(f"num_points must be at least 2, got {num_points}")
+
+        t = np.linspace(0.0, 1.0, num_points)
+        s = t * t * (3.0 - 2.0 * t)
+        xs = start[0] + (end[0] - start[0]) * s
+        ys = start[1] + (end[1] - start[1]) * s
+        return (xs, ys)
+
     def get_workspace_boundary(self, num_points: int = 100) -> np.ndarray:
         """
         Generate points along the workspace boundary.
@@ -290,33 +422,36 @@ class ArmKinematics:
         if num_points < 4:
             raise ValueError(f"num_points must be at least 4, got {num_points}")
 
-        # Distribute points between outer and inner arcs
-        outer_points = num_points // 2
-        inner_points = num_points - outer_points
-
-        boundary = []
-
-        # Outer boundary (maximum reach) - full circle
-        for i in range(outer_points):
-            angle = 2 * math.pi * i / outer_points
-            x = self._max_reach * math.cos(angle)
-            y = self._max_reach * math.sin(angle)
-            boundary.append([x, y])
-
-        # Inner boundary (minimum reach) - full circle if min_reach > 0
-        if self._min_reach > _EPSILON:
-            for i in range(inner_points):
-                # Traverse in opposite direction for continuous boundary
-                angle = 2 * math.pi * (inner_points - 1 - i) / inner_points
-                x = self._min_reach * math.cos(angle)
-                y = self._min_reach * math.sin(angle)
-                boundary.append([x, y])
-        else:
-            # If min_reach is ~0, just add origin points
-            for _ in range(inner_points):
-                boundary.append([0.0, 0.0])
+        # Link lengths are fixed per instance, so boundaries are cached
+        cached = self._boundary_cache.get(num_points)
+        if cached is None:
+            # Distribute points between outer and inner arcs
+            outer_points = num_points // 2
+            inner_points = num_points - outer_points
+
+            # Outer boundary (maximum reach) - full circle
+            outer_angles = 2 * np.pi * np.arange(outer_points) / outer_points
+            outer = self._max_reach * np.column_stack(
+                (np.cos(outer_angles), np.sin(outer_angles))
+            )
 
-        return np.array(boundary, dtype=np.float64)
+            # Inner boundary (minimum reach) - traversed in opposite direction
+            # for a continuous boundary; all origin points if min_reach is ~0
+            if self._min_reach > _EPSILON:
+                inner_angles = (
+                    2 * np.pi * (inner_points - 1 - np.arange(inner_points)) / inner_points
+                )
+                inner = self._min_reach * np.column_stack(
+                    (np.cos(inner_angles), np.sin(inner_angles))
+                )
+            else:
+                inner = np.zeros((inner_points, 2))
+
+            cached = np.vstack((outer, inner)).astype(np.float64)
+            self._boundary_cache[num_points] = cached
+
+        # Copy so callers cannot corrupt the cache
+        return cached.copy()
 
     def __repr__(self) -> str:
         """Return string representation of the kinematics solver."""
@@ -29,14 +29,16 @@ Do not modify without thorough testing on actual hardware.
 
 from __future__ import annotations
 
-import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
+from src.utils.lock_profiler import create_lock
+
 if TYPE_CHECKING:
     from ..drivers.servo.pca9685 import PCA9685Driver
+    from ..utils.config import RobotConfig
 
 
 class StallCondition(Enum):
@@ -104,6 +106,20 @@ class ServoCurrentProfile:
         if self.thermal_time_constant_s <= 0:
             raise ValueError(f"thermal_time_constant_s must be positive, got {self.thermal_time_constant_s}")
 
+    @classmethod
+    def from_config(cls, config: "RobotConfig") -> "ServoCurrentProfile":
+        """Create a profile from the safety section of a compiled configuration.
+
+        Args:
+            config: RobotConfig from src.utils.config
+
+        Returns:
+            ServoCurrentProfile with the configured no-load and stall currents
+        """
+        return cls(
+            no_load_ma=config.safety.max_current_no_load_ma,
+            stall_ma=config.safety.max_current_stall_ma,
+        )
 
 @dataclass
 class _ChannelState:
@@ -260,7 +276,23 @@ class CurrentLimiter:
         }
 
         # Thread safety lock (reentrant for nested calls)
-        self._lock = threading.RLock()
+        self._lock = create_lock("safety.current_limiter")
+
+    @classmethod
+    def from_config(cls, config: "RobotConfig", **kwargs: Any) -> "CurrentLimiter":
+        """Create a current limiter from a compiled configuration.
+
+        Args:
+            config: RobotConfig from src.utils.config
+            **kwargs: Constructor arguments; these override config values
+                (e.g. pca_driver, stall_timeout_s).
+
+        Returns:
+            CurrentLimiter instance
+        """
+        params: Dict[str, Any] = {"profile": ServoCurrentProfile.from_config(config)}
+        params.update(kwargs)
+        return cls(**params)
 
     def estimate_current(self, channel: int) -> float:
         """Estimate current draw for a servo channel in milliamps.
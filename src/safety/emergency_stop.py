@@ -51,6 +51,8 @@ from enum import Enum, auto
 from typing import Optional, Callable, List, Any, Protocol
 from dataclasses import dataclass
 
+from src.utils.lock_profiler import create_lock
+
 # Module logger for safety-critical logging
 _logger = logging.getLogger(__name__)
 
@@ -241,7 +243,7 @@ class EmergencyStop:
         self._auto_reset = auto_reset
 
         # Thread safety - RLock allows recursive calls from callbacks (Issue #2)
-        self._lock = threading.RLock()
+        self._lock = create_lock("safety.emergency_stop")
 
         # State management
         self._state = SafetyState.INIT
@@ -20,6 +20,7 @@ import threading
 import time
 from typing import Optional
 
+from src.utils.lock_profiler import create_lock
 from .emergency_stop import EmergencyStop
 
 _logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ class ServoWatchdog:
         self._timeout_ms = timeout_ms
         self._timeout_sec = timeout_ms / 1000.0
 
-        self._lock = threading.Lock()
+        self._lock = create_lock("safety.watchdog", reentrant=False)
         self._last_feed_time: Optional[float] = None
         self._expired = False
         self._running = False
@@ -0,0 +1,580 @@
+"""Robot configuration loader.
+
+Parses the YAML files in config/ once and compiles them into frozen
+dataclasses that runtime classes take their parameters from:
+
+    config/robot_config.yaml     -> arm, control, animation
+    config/safety_config.yaml    -> safety
+    config/hardware_config.yaml  -> hardware, led
+
+Consumers:
+    - Robot.from_config: arm, control, safety (E-stop pin and debounce,
+      servo current profile for the CurrentLimiter)
+    - CurrentLimiter.from_config: safety (servo current profile)
+    - LEDController.from_config: hardware (ring pins and size), led
+    - HeadController.from_config / apply_config: animation
+    - StagedBringup: loads the config and applies hot reloads to the LED
+      controller and head controller it brought up
+
+Only settings with a consumer are compiled; the remaining YAML keys
+(servo angle/pulse limits, I2C addresses, IMU limits) are documentation
+for the hardware and are not read here.
+
+Design:
+    - Missing files, sections and keys fall back to the same defaults the
+      runtime classes use, so a partial config never changes behaviour
+    - Every section validates itself in __post_init__ (ValueError)
+    - The parsed YAML is cached in marshal form, keyed by each file's
+      mtime and size: startup skips the YAML parser unless a file changed.
+      The cache only holds plain data; validation still runs on every load
+    - Hot reload polls file mtimes and applies only HOT_RELOADABLE sections
+      (LED brightness, animation timings). Safety, hardware and
+      control-loop changes are logged and need a restart
+
+Example:
+    >>> from src.utils.config import ConfigLoader
+    >>> loader = ConfigLoader()
+    >>> config = loader.load()
+    >>> robot = Robot.from_config(config)
+    >>> leds = LEDController.from_config(config)
+    >>> loader.register_callback(
+    ...     lambda old, new: leds.set_brightness(new.led.brightness)
+    ... )
+    >>> loader.start_watching(interval_s=1.0)
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+_logger = logging.getLogger(__name__)
+
+# Bump when the cached layout or file set changes
+CONFIG_CACHE_VERSION = 1
+
+# Config source name -> file name in the config directory
+CONFIG_FILES: Dict[str, str] = {
+    "robot": "robot_config.yaml",
+    "safety": "safety_config.yaml",
+    "hardware": "hardware_config.yaml",
+}
+
+# Sections a running robot may change without a restart
+HOT_RELOADABLE = ("led", "animation")
+
+DEFAULT_POLL_INTERVAL_S = 1.0
+
+# Called as (old_config, new_config) after a hot reload was applied
+ConfigChangeCallback = Callable[["RobotConfig", "RobotConfig"], None]
+
+
+def default_config_dir() -> Path:
+    """Directory holding the YAML files ($OPENDUCK_CONFIG_DIR or <repo>/config)."""
+    env = os.environ.get("OPENDUCK_CONFIG_DIR")
+    if env:
+        return Path(env).expanduser()
+    return Path(__file__).resolve().parents[2] / "config"
+
+
+def default_cache_dir() -> Path:
+    """Directory for parsed-config caches ($OPENDUCK_CACHE_DIR/config)."""
+    root = os.environ.get("OPENDUCK_CACHE_DIR") or os.path.join("~", ".cache", "openduck")
+    return Path(root).expanduser() / "config"
+
+
+# =============================================================================
+# Schema
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ArmSettings:
+    """2-DOF arm link lengths (robot_config.yaml: kinematics.arm_2dof)."""
+    l1_mm: float = 80.0
+    l2_mm: float = 60.0
+
+    def __post_init__(self):
+        """Validate link lengths."""
+        if self.l1_mm <= 0 or self.l2_mm <= 0:
+            raise ValueError(f"arm link lengths must be positive, got {self.l1_mm}, {self.l2_mm}")
+
+
+@dataclass(frozen=True)
+class ControlSettings:
+    """Control loop timing (robot_config.yaml: control)."""
+    loop_hz: int = 50
+    watchdog_timeout_ms: int = 500
+    imu_sample_hz: Optional[float] = 100.0
+
+    def __post_init__(self):
+        """Validate rates and timeout."""
+        if self.loop_hz <= 0:
+            raise ValueError(f"loop_hz must be positive, got {self.loop_hz}")
+        if self.watchdog_timeout_ms <= 0:
+            raise ValueError(f"watchdog_timeout_ms must be positive, got {self.watchdog_timeout_ms}")
+        if self.imu_sample_hz is not None and self.imu_sample_hz <= 0:
+            raise ValueError(f"imu_sample_hz must be positive, got {self.imu_sample_hz}")
+
+
+@dataclass(frozen=True)
+class SafetySettings:
+    """E-stop and servo current profile (safety_config.yaml)."""
+    estop_gpio_pin: int = 26
+    estop_debounce_ms: int = 50
+    max_current_no_load_ma: float = 220.0
+    max_current_stall_ma: float = 900.0
+
+    def __post_init__(self):
+        """Validate limits."""
+        if not 0 <= self.estop_gpio_pin <= 27:
+            raise ValueError(f"estop_gpio_pin must be 0-27, got {self.estop_gpio_pin}")
+        if self.estop_debounce_ms < 0:
+            raise ValueError(f"estop_debounce_ms must be >= 0, got {self.estop_debounce_ms}")
+        for name in ("max_current_no_load_ma", "max_current_stall_ma"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+
+
+@dataclass(frozen=True)
+class HardwareSettings:
+    """LED ring wiring (hardware_config.yaml: gpio.neopixel)."""
+    led_left_pin: int = 18
+    led_right_pin: int = 13
+    led_num_pixels: int = 16
+
+    def __post_init__(self):
+        """Validate pins."""
+        if self.led_left_pin == self.led_right_pin:
+            raise ValueError(f"LED ring pins must differ, both are {self.led_left_pin}")
+        if self.led_num_pixels <= 0:
+            raise ValueError(f"led_num_pixels must be positive, got {self.led_num_pixels}")
+
+
+@dataclass(frozen=True)
+class LEDSettings:
+    """LED output (hot reloadable; hardware_config.yaml: gpio.neopixel)."""
+    brightness: int = 128
+    target_fps: int = 50
+
+    def __post_init__(self):
+        """Validate brightness and refresh rate."""
+        if not 0 <= self.brightness <= 255:
+            raise ValueError(f"brightness must be 0-255, got {self.brightness}")
+        if self.target_fps <= 0:
+            raise ValueError(f"target_fps must be positive, got {self.target_fps}")
+
+
+@dataclass(frozen=True)
+class AnimationSettings:
+    """Animation timings (hot reloadable; robot_config.yaml: animation)."""
+    head_default_speed_ms: int = 300
+    head_easing: str = "ease_in_out"
+
+    def __post_init__(self):
+        """Validate timings."""
+        if self.head_default_speed_ms <= 0:
+            raise ValueError(f"head_default_speed_ms must be > 0, got {self.head_default_speed_ms}")
+
+
+@dataclass(frozen=True)
+class RobotConfig:
+    """Compiled robot configuration.
+
+    Attributes:
+        arm: Arm link lengths
+        control: Control loop timing
+        safety: E-stop and servo current profile
+        hardware: LED ring wiring
+        led: LED output (hot reloadable)
+        animation: Animation timings (hot reloadable)
+        sources: Files the configuration was read from
+    """
+    arm: ArmSettings = field(default_factory=ArmSettings)
+    control: ControlSettings = field(default_factory=ControlSettings)
+    safety: SafetySettings = field(default_factory=SafetySettings)
+    hardware: HardwareSettings = field(default_factory=HardwareSettings)
+    led: LEDSettings = field(default_factory=LEDSettings)
+    animation: AnimationSettings = field(default_factory=AnimationSettings)
+    sources: Tuple[str, ...] = ()
+
+    def head_config(self, pan_channel: int = 12, tilt_channel: int = 13) -> Any:
+        """Build a HeadConfig using the configured animation timings.
+
+        Args:
+            pan_channel: PCA9685 channel for pan servo
+            tilt_channel: PCA9685 channel for tilt servo
+
+        Returns:
+            HeadConfig instance
+        """
+        from src.control.head_controller import HeadConfig
+
+        return HeadConfig(
+            pan_channel=pan_channel,
+            tilt_channel=tilt_channel,
+            default_speed_ms=self.animation.head_default_speed_ms,
+            easing=self.animation.head_easing,
+        )
+
+
+def _get(data: Mapping[str, Any], path: str, default: Any = None) -> Any:
+    """Look up a dotted path in nested mappings (default if any level is missing)."""
+    node: Any = data
+    for key in path.split("."):
+        if not isinstance(node, Mapping) or key not in node:
+            return default
+        node = node[key]
+    return default if node is None else node
+
+
+def _section(cls: type, values: Mapping[str, Any]) -> Any:
+    """Build a settings dataclass from the values that are present."""
+    return cls(**{k: v for k, v in values.items() if v is not None})
+
+
+def compile_config(raw: Mapping[str, Mapping[str, Any]], sources: Tuple[str, ...] = ()) -> RobotConfig:
+    """Compile parsed YAML documents into a RobotConfig.
+
+    Args:
+        raw: Parsed documents keyed by CONFIG_FILES name (missing = empty)
+        sources: File paths recorded in the result
+
+    Returns:
+        Validated RobotConfig
+
+    Raises:
+        ValueError: If a value is out of range
+    """
+    robot = raw.get("robot") or {}
+    safety = raw.get("safety") or {}
+    hardware = raw.get("hardware") or {}
+
+    # YAML brightness is 0.0-1.0; LEDController takes 0-255
+    ring_brightness = _get(hardware, "gpio.neopixel.ring_1.brightness")
+    brightness = _get(robot, "led.brightness")
+    if brightness is None and ring_brightness is not None:
+        brightness = int(round(float(ring_brightness) * 255))
+
+    return RobotConfig(
+        arm=_section(ArmSettings, {
+            "l1_mm": _get(robot, "kinematics.arm_2dof.l1"),
+            "l2_mm": _get(robot, "kinematics.arm_2dof.l2"),
+        }),
+        control=_section(ControlSettings, {
+            "loop_hz": _get(robot, "control.loop_hz"),
+            "watchdog_timeout_ms": _get(robot, "control.watchdog_timeout_ms"),
+            "imu_sample_hz": _get(robot, "control.imu_sample_hz"),
+        }),
+        safety=_section(SafetySettings, {
+            "estop_gpio_pin": _get(safety, "emergency_stop.gpio_pin"),
+            "estop_debounce_ms": _get(safety, "emergency_stop.debounce_ms"),
+            "max_current_no_load_ma": _get(safety, "servos.max_current_no_load_ma"),
+            "max_current_stall_ma": _get(safety, "servos.max_current_stall_ma"),
+        }),
+        hardware=_section(HardwareSettings, {
+            "led_left_pin": _get(hardware, "gpio.neopixel.ring_1.data_pin"),
+            "led_right_pin": _get(hardware, "gpio.neopixel.ring_2.data_pin"),
+            "led_num_pixels": _get(hardware, "gpio.neopixel.ring_1.num_leds"),
+        }),
+        led=_section(LEDSettings, {
+            "brightness": brightness,
+            "target_fps": _get(robot, "led.target_fps"),
+        }),
+        animation=_section(AnimationSettings, {
+            "head_default_speed_ms": _get(robot, "animation.head_default_speed_ms"),
+            "head_easing": _get(robot, "animation.head_easing"),
+        }),
+        sources=sources,
+    )
+
+
+# =============================================================================
+# Loader
+# =============================================================================
+
+
+FileKey = Tuple[Tuple[str, int, int], ...]  # (name, mtime_ns, size) per file
+
+
+class ConfigLoader:
+    """Load, cache and hot-reload the robot configuration.
+
+    Thread Safety:
+        load() and check_for_changes() serialize on an internal lock. The
+        config property is a single attribute read and never blocks.
+        Callbacks run on the thread that detected the change (the watcher
+        thread when start_watching() is used).
+
+    Attributes:
+        config_dir: Directory holding the YAML files
+        cache_dir: Directory for the parsed cache (None disables caching)
+    """
+
+    def __init__(
+        self,
+        config_dir: Optional[Union[str, Path]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        use_cache: bool = True,
+    ) -> None:
+        """Initialize loader.
+
+        Args:
+            config_dir: YAML directory (default: default_config_dir())
+            cache_dir: Cache directory (default: default_cache_dir())
+            use_cache: If False, always parse the YAML files
+        """
+        self.config_dir = Path(config_dir) if config_dir is not None else default_config_dir()
+        if use_cache:
+            self.cache_dir: Optional[Path] = (
+                Path(cache_dir) if cache_dir is not None else default_cache_dir()
+            )
+        else:
+            self.cache_dir = None
+
+        self._config: Optional[RobotConfig] = None
+        self._file_key: Optional[FileKey] = None
+        self._lock = threading.Lock()
+        self._callbacks: List[ConfigChangeCallback] = []
+        self._watch_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stats = {"loads": 0, "cache_hits": 0, "reloads": 0, "reload_errors": 0}
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    @property
+    def config(self) -> RobotConfig:
+        """Current configuration (loads on first access)."""
+        config = self._config
+        return config if config is not None else self.load()
+
+    def load(self) -> RobotConfig:
+        """Load the configuration, replacing the current one.
+
+        Returns:
+            Compiled RobotConfig
+
+        Raises:
+            ValueError: If a value is out of range or a file is not valid YAML
+        """
+        with self._lock:
+            key = self._stat_files()
+            self._config = self._compile(key)
+            self._file_key = key
+            return self._config
+
+    def cache_path(self) -> Optional[Path]:
+        """Cache file for this config directory (None if caching is off)."""
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(str(self.config_dir.resolve()).encode()).hexdigest()[:16]
+        return self.cache_dir / f"config_v{CONFIG_CACHE_VERSION}_{digest}.marshal"
+
+    def _stat_files(self) -> FileKey:
+        """Stat every config file (missing files get a zero entry)."""
+        entries = []
+        for name, filename in CONFIG_FILES.items():
+            try:
+                st = os.stat(self.config_dir / filename)
+                entries.append((name, st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                entries.append((name, 0, 0))
+        return tuple(entries)
+
+    def _compile(self, key: FileKey) -> RobotConfig:
+        """Parse (or load cached) documents for key and compile them."""
+        self._stats["loads"] += 1
+        raw = self._load_cache(key)
+        if raw is None:
+            raw = self._parse(key)
+            self._save_cache(key, raw)
+        else:
+            self._stats["cache_hits"] += 1
+        sources = tuple(
+            str(self.config_dir / CONFIG_FILES[name]) for name, mtime, _ in key if mtime
+        )
+        return compile_config(raw, sources)
+
+    def _parse(self, key: FileKey) -> Dict[str, Any]:
+        """Parse the YAML files that exist."""
+        import yaml
+
+        raw: Dict[str, Any] = {}
+        for name, mtime, _ in key:
+            if not mtime:
+                continue
+            path = self.config_dir / CONFIG_FILES[name]
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    document = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in {path}: {e}") from e
+            if document is not None and not isinstance(document, dict):
+                raise ValueError(f"{path} must contain a mapping, got {type(document).__name__}")
+            raw[name] = document or {}
+        return raw
+
+    def _load_cache(self, key: FileKey) -> Optional[Dict[str, Any]]:
+        """Return cached documents for key, or None on a miss."""
+        path = self.cache_path()
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                cached = marshal.load(f)
+            if cached.get("key") != [list(entry) for entry in key]:
+                return None
+            return cached["raw"]
+        except Exception as e:
+            _logger.warning("Ignoring unusable config cache %s: %s", path, e)
+            return None
+
+    def _save_cache(self, key: FileKey, raw: Dict[str, Any]) -> None:
+        """Write the parsed documents for key (atomic replace, never fatal)."""
+        path = self.cache_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "wb") as f:
+                marshal.dump({"key": [list(entry) for entry in key], "raw": raw}, f)
+            os.replace(tmp, path)
+        except (OSError, ValueError) as e:
+            # ValueError: a document holds a type marshal cannot store
+            _logger.warning("Could not write config cache %s: %s", path, e)
+
+    # -------------------------------------------------------------------------
+    # Hot reload
+    # -------------------------------------------------------------------------
+
+    def register_callback(self, callback: ConfigChangeCallback) -> None:
+        """Register a callback for applied hot reloads.
+
+        Args:
+            callback: Function with signature (old_config, new_config).
+                Exceptions are logged and swallowed.
+        """
+        self._callbacks.append(callback)
+
+    def unregister_callback(self, callback: ConfigChangeCallback) -> bool:
+        """Unregister a callback.
+
+        Returns:
+            True if callback was found and removed, False otherwise.
+        """
+        try:
+            self._callbacks.remove(callback)
+            return True
+        except ValueError:
+            return False
+
+    def check_for_changes(self) -> bool:
+        """Reload if any config file changed and apply hot-reloadable sections.
+
+        Sections outside HOT_RELOADABLE keep their running values; a change
+        to them is logged as needing a restart. An invalid file is logged
+        and the running configuration is kept.
+
+        Returns:
+            True if a new configuration was applied
+        """
+        with self._lock:
+            if self._config is None:
+                return False
+            key = self._stat_files()
+            if key == self._file_key:
+                return False
+            self._file_key = key  # Do not retry a broken file every poll
+
+            old = self._config
+            try:
+                loaded = self._compile(key)
+            except Exception as e:
+                self._stats["reload_errors"] += 1
+                _logger.error("Config reload failed, keeping current config: %s", e)
+                return False
+
+            frozen = [
+                f.name for f in fields(RobotConfig)
+                if f.name not in HOT_RELOADABLE and f.name != "sources"
+                and getattr(loaded, f.name) != getattr(old, f.name)
+            ]
+            if frozen:
+                _logger.warning(
+                    "Config changes to %s need a restart and were not applied",
+                    ", ".join(frozen),
+                )
+            new = replace(old, **{name: getattr(loaded, name) for name in HOT_RELOADABLE})
+            if new == old:
+                return False
+            self._config = new
+            self._stats["reloads"] += 1
+
+        _logger.info("Config reloaded: %s", ", ".join(
+            name for name in HOT_RELOADABLE if getattr(new, name) != getattr(old, name)
+        ))
+        for callback in list(self._callbacks):
+            try:
+                callback(old, new)
+            except Exception as e:
+                _logger.error("Config change callback error: %s", e)
+        return True
+
+    def start_watching(self, interval_s: float = DEFAULT_POLL_INTERVAL_S) -> None:
+        """Poll config file mtimes on a daemon thread.
+
+        Args:
+            interval_s: Seconds between polls
+
+        Raises:
+            ValueError: If interval_s is not positive
+        """
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be positive, got {interval_s}")
+        if self._watch_thread is not None and self._watch_thread.is_alive():
+            return
+        if self._config is None:
+            self.load()
+        self._stop_event.clear()
+        self._watch_thread = threading.Thread(
+            target=self._watch, args=(interval_s,), name="ConfigWatcher", daemon=True,
+        )
+        self._watch_thread.start()
+
+    def stop_watching(self, timeout: float = 2.0) -> None:
+        """Stop the polling thread."""
+        self._stop_event.set()
+        if self._watch_thread is not None:
+            self._watch_thread.join(timeout=timeout)
+            self._watch_thread = None
+
+    def _watch(self, interval_s: float) -> None:
+        """Polling loop."""
+        while not self._stop_event.wait(timeout=interval_s):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                _logger.error("Config watcher error: %s", e)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get load/cache/reload counters."""
+        return dict(self._stats)
+
+
+def load_config(config_dir: Optional[Union[str, Path]] = None) -> RobotConfig:
+    """Load the robot configuration once (cached parse).
+
+    Args:
+        config_dir: YAML directory (default: default_config_dir())
+
+    Returns:
+        Compiled RobotConfig
+    """
+    return ConfigLoader(config_dir).load()
@@ -0,0 +1,194 @@
+"""Package import-time profiling for OpenDuck Mini V3.
+
+Cold start on the Pi is dominated by imports (NumPy, ONNX runtime, audio
+backends). This module measures how long importing a package takes in a
+fresh interpreter, so results are not skewed by modules already cached in
+``sys.modules``, and which modules account for the time.
+
+Per package it records:
+
+    - Wall time of ``import <package>`` over several fresh interpreters
+      (median/min/max)
+    - Number of modules the import pulled in
+    - The slowest modules by self time, from ``python -X importtime``
+
+Example:
+    >>> from src.utils.import_profiler import profile_import, format_import_report
+    >>> profiles = [profile_import("src.voice"), profile_import("src.led")]
+    >>> print(format_import_report(profiles))
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Packages covered by the import-time benchmark
+DEFAULT_PACKAGES: Tuple[str, ...] = ("src.voice", "src.animation", "src.core", "src.led")
+
+# Number of slowest modules kept per profile
+DEFAULT_TOP_MODULES = 10
+
+# Firmware root (directory containing ``src``)
+_FIRMWARE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs in the child interpreter: time the import, report what it loaded
+_CHILD_SNIPPET = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(set(sys.modules) - before)
+print(json.dumps({{"wall_ms": elapsed * 1000.0, "loaded": loaded}}))
+"""
+
+
+@dataclass
+class ImportProfile:
+    """Import-time measurements for one package.
+
+    Attributes:
+        module: Imported package or module name
+        wall_ms: Wall time of each run in milliseconds
+        loaded_modules: Modules newly loaded by the import (last run)
+        slowest: (module, self_ms, cumulative_ms) by self time, slowest first
+    """
+    module: str
+    wall_ms: List[float] = field(default_factory=list)
+    loaded_modules: List[str] = field(default_factory=list)
+    slowest: List[Tuple[str, float, float]] = field(default_factory=list)
+
+    @property
+    def median_ms(self) -> float:
+        """Median wall time in milliseconds."""
+        return statistics.median(self.wall_ms) if self.wall_ms else 0.0
+
+    @property
+    def min_ms(self) -> float:
+        """Fastest wall time in milliseconds."""
+        return min(self.wall_ms) if self.wall_ms else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        """Slowest wall time in milliseconds."""
+        return max(self.wall_ms) if self.wall_ms else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "module": self.module,
+            "median_ms": self.median_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "runs": len(self.wall_ms),
+            "modules_loaded": len(self.loaded_modules),
+            "slowest": [
+                {"module": name, "self_ms": self_ms, "cumulative_ms": cumulative_ms}
+                for name, self_ms, cumulative_ms in self.slowest
+            ],
+        }
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, float, float]]:
+    """Parse ``python -X importtime`` output.
+
+    Args:
+        stderr: Child interpreter stderr
+
+    Returns:
+        (module, self_ms, cumulative_ms) per imported module
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = float(parts[0])
+            cumulative_us = float(parts[1])
+        except ValueError:
+            continue  # Header row
+        rows.append((parts[2].strip(), self_us / 1000.0, cumulative_us / 1000.0))
+    return rows
+
+
+def profile_import(
+    module: str,
+    repeat: int = 5,
+    top: int = DEFAULT_TOP_MODULES,
+    python: Optional[str] = None,
+    cwd: Optional[str] = None
+) -> ImportProfile:
+    """Measure importing a module in fresh interpreters.
+
+    Args:
+        module: Module to import, e.g. "src.voice"
+        repeat: Number of fresh interpreters to time
+        top: Number of slowest modules to keep
+        python: Interpreter to run (default: the current one)
+        cwd: Working directory (default: firmware root)
+
+    Returns:
+        ImportProfile for the module
+
+    Raises:
+        RuntimeError: If the import fails in the child interpreter
+    """
+    profile = ImportProfile(module=module)
+    command = [python or sys.executable, "-X", "importtime", "-c",
+               _CHILD_SNIPPET.format(module=module)]
+
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            command,
+            cwd=cwd or _FIRMWARE_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            last_line = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+            raise RuntimeError(f"import {module} failed: {last_line[0]}")
+
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        profile.wall_ms.append(report["wall_ms"])
+        profile.loaded_modules = report["loaded"]
+        rows = parse_importtime(result.stderr)
+
+    loaded = set(profile.loaded_modules)
+    rows = [row for row in rows if row[0] in loaded]
+    profile.slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return profile
+
+
+def format_import_report(profiles: Sequence[ImportProfile]) -> str:
+    """Format profiles as a human-readable report.
+
+    Args:
+        profiles: Profiles to report
+
+    Returns:
+        Multi-line report string
+    """
+    lines = [
+        f"{'package':<16} {'median':>9} {'min':>9} {'max':>9} {'modules':>8}",
+        "-" * 55,
+    ]
+    for p in profiles:
+        lines.append(
+            f"{p.module:<16} {p.median_ms:>7.1f}ms {p.min_ms:>7.1f}ms "
+            f"{p.max_ms:>7.1f}ms {len(p.loaded_modules):>8d}"
+        )
+    for p in profiles:
+        if not p.slowest:
+            continue
+        lines.append("")
+        lines.append(f"{p.module}: slowest modules (self / cumulative)")
+        for name, self_ms, cumulative_ms in p.slowest:
+            lines.append(f"  {self_ms:>7.1f}ms {cumulative_ms:>8.1f}ms  {name}")
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+"""Lazy package exports (PEP 562).
+
+Packages whose exports pull in heavy dependencies (NumPy, ONNX backends,
+the robot and kinematics stack) resolve each exported name on first
+attribute access instead of importing every submodule up front:
+
+    - ``import package`` loads no submodule
+    - The first ``package.Name`` imports the defining module and caches the
+      value in the package globals, so later lookups are plain attribute
+      reads that never reach ``__getattr__`` again
+    - A missing optional module only fails the names it provides
+
+Example:
+    >>> # src/voice/__init__.py
+    >>> from src.utils.lazy_exports import make_lazy
+    >>> _LAZY_EXPORTS = {'VADConfig': '.vad', 'WakeWordPipeline': '.pipeline'}
+    >>> __all__ = list(_LAZY_EXPORTS)
+    >>> __getattr__, __dir__ = make_lazy(__name__, _LAZY_EXPORTS, __all__)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Sequence, Tuple
+
+
+def make_lazy(
+    package: str,
+    exports: Mapping[str, str],
+    all_names: Sequence[str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> defining module. Names starting with "."
+            are resolved relative to package.
+        all_names: The package's ``__all__``
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace. The
+        returned __getattr__ raises AttributeError for names the package
+        does not export, and ImportError if the defining module (or its
+        backend) is unavailable.
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)  # Cache: later lookups bypass __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(all_names))
+
+    return __getattr__, __dir__
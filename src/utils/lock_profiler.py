@@ -0,0 +1,405 @@
+"""Opt-in lock contention profiling for OpenDuck Mini V3.
+
+The safety stack nests several locks on the control-loop path, e.g.
+``SafetyCoordinator.feed_watchdog`` -> ``CurrentLimiter`` -> ``PCA9685Driver``
+-> ``I2CBusManager``. This module provides a drop-in lock factory that, when
+profiling is enabled, records per named lock:
+
+    - Acquisition and contention counts
+    - Wait time (blocked in acquire) and hold time (outermost acquire -> release)
+    - The call site that acquired the lock, with per-site wait/hold totals
+    - The call site currently holding the lock
+
+Zero-Overhead Design:
+    ``create_lock()`` decides at construction time. With profiling disabled it
+    returns a plain ``threading.RLock``/``threading.Lock``, so production code
+    pays nothing. Enable profiling BEFORE the instrumented objects are created,
+    either with the ``OPENDUCK_LOCK_PROFILING=1`` environment variable or with
+    ``enable_lock_profiling()``. Class-level locks are created on first use
+    (I2CBusManager creates its bus lock in the first ``get_instance()``).
+
+Example:
+    >>> from src.utils.lock_profiler import enable_lock_profiling, create_lock
+    >>> enable_lock_profiling()
+    >>> lock = create_lock("example.lock")
+    >>> with lock:
+    ...     pass
+    >>> print(format_lock_report())
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Environment variable that enables profiling at import time
+LOCK_PROFILING_ENV = "OPENDUCK_LOCK_PROFILING"
+
+# Number of call sites included per lock in reports
+DEFAULT_TOP_SITES = 5
+
+_enabled: bool = os.environ.get(LOCK_PROFILING_ENV, "").strip().lower() in (
+    "1", "true", "yes", "on"
+)
+
+# Call site key: (code object, line number) - formatted lazily in reports
+_SiteKey = Tuple[Any, int]
+
+
+def enable_lock_profiling() -> None:
+    """Enable instrumentation for locks created from now on."""
+    global _enabled
+    _enabled = True
+
+
+def disable_lock_profiling() -> None:
+    """Disable instrumentation for locks created from now on.
+
+    Locks that were already created instrumented keep recording.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_lock_profiling_enabled() -> bool:
+    """Check if newly created locks will be instrumented."""
+    return _enabled
+
+
+def _format_site(site: Optional[_SiteKey]) -> Optional[str]:
+    """Format a call site key as 'file.py:line function'."""
+    if site is None:
+        return None
+    code, lineno = site
+    return f"{os.path.basename(code.co_filename)}:{lineno} {code.co_name}"
+
+
+class LockStats:
+    """Aggregated statistics for all locks sharing one name.
+
+    Several instances may share a name (e.g. two PCA9685Driver boards);
+    their statistics are merged. Updates are protected by an internal
+    plain lock that is never itself instrumented.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.contentions = 0
+        self.failed_acquires = 0
+        self.wait_total_s = 0.0
+        self.wait_max_s = 0.0
+        self.hold_total_s = 0.0
+        self.hold_max_s = 0.0
+        # site -> [acquisitions, contentions, wait_total, wait_max, hold_total, hold_max]
+        self._sites: Dict[_SiteKey, List[float]] = {}
+        self._holder: Optional[_SiteKey] = None
+
+    def _site_entry(self, site: _SiteKey) -> List[float]:
+        entry = self._sites.get(site)
+        if entry is None:
+            entry = [0, 0, 0.0, 0.0, 0.0, 0.0]
+            self._sites[site] = entry
+        return entry
+
+    def record_acquire(self, site: _SiteKey, wait_s: float, contended: bool) -> None:
+        """Record a successful outermost acquisition."""
+        with self._lock:
+            self.acquisitions += 1
+            self.wait_total_s += wait_s
+            if wait_s > self.wait_max_s:
+                self.wait_max_s = wait_s
+            entry = self._site_entry(site)
+            entry[0] += 1
+            entry[2] += wait_s
+            if wait_s > entry[3]:
+                entry[3] = wait_s
+            if contended:
+                self.contentions += 1
+                entry[1] += 1
+            self._holder = site
+
+    def record_failed(self, site: _SiteKey, wait_s: float) -> None:
+        """Record a non-blocking or timed-out acquire that did not succeed."""
+        with self._lock:
+            self.failed_acquires += 1
+            self.contentions += 1
+            self.wait_total_s += wait_s
+            entry = self._site_entry(site)
+            entry[1] += 1
+            entry[2] += wait_s
+
+    def record_release(self, site: _SiteKey, hold_s: float) -> None:
+        """Record the outermost release of a hold started at ``site``."""
+        with self._lock:
+            self.hold_total_s += hold_s
+            if hold_s > self.hold_max_s:
+                self.hold_max_s = hold_s
+            entry = self._site_entry(site)
+            entry[4] += hold_s
+            if hold_s > entry[5]:
+                entry[5] = hold_s
+            self._holder = None
+
+    def reset(self) -> None:
+        """Clear all counters (the current holder is kept)."""
+        with self._lock:
+            self.acquisitions = 0
+            self.contentions = 0
+            self.failed_acquires = 0
+            self.wait_total_s = 0.0
+            self.wait_max_s = 0.0
+            self.hold_total_s = 0.0
+            self.hold_max_s = 0.0
+            self._sites.clear()
+
+    def snapshot(self, top_sites: int = DEFAULT_TOP_SITES) -> Dict[str, Any]:
+        """Get a JSON-friendly snapshot, times in milliseconds.
+
+        Args:
+            top_sites: Number of call sites to include, ranked by total
+                wait + hold time.
+
+        Returns:
+            Dictionary of aggregate and per-site statistics.
+        """
+        with self._lock:
+            count = self.acquisitions
+            sites = sorted(
+                self._sites.items(),
+                key=lambda item: item[1][2] + item[1][4],
+                reverse=True,
+            )[:top_sites]
+            return {
+                "acquisitions": count,
+                "contentions": self.contentions,
+                "failed_acquires": self.failed_acquires,
+                "contention_rate": self.contentions / count if count else 0.0,
+                "wait_total_ms": self.wait_total_s * 1000,
+                "wait_avg_ms": self.wait_total_s * 1000 / count if count else 0.0,
+                "wait_max_ms": self.wait_max_s * 1000,
+                "hold_total_ms": self.hold_total_s * 1000,
+                "hold_avg_ms": self.hold_total_s * 1000 / count if count else 0.0,
+                "hold_max_ms": self.hold_max_s * 1000,
+                "holder": _format_site(self._holder),
+                "sites": [
+                    {
+                        "site": _format_site(site),
+                        "acquisitions": int(entry[0]),
+                        "contentions": int(entry[1]),
+                        "wait_total_ms": entry[2] * 1000,
+                        "wait_max_ms": entry[3] * 1000,
+                        "hold_total_ms": entry[4] * 1000,
+                        "hold_max_ms": entry[5] * 1000,
+                    }
+                    for site, entry in sites
+                ],
+            }
+
+
+# Global registry of stats by lock name
+_registry: Dict[str, LockStats] = {}
+_registry_lock = threading.Lock()
+
+
+def _stats_for(name: str) -> LockStats:
+    with _registry_lock:
+        stats = _registry.get(name)
+        if stats is None:
+            stats = LockStats(name)
+            _registry[name] = stats
+        return stats
+
+
+class InstrumentedLock:
+    """Lock wrapper recording wait time, hold time and call sites.
+
+    Behaves like ``threading.RLock`` (or ``threading.Lock`` when
+    ``reentrant=False``) for ``acquire``/``release`` and the context manager
+    protocol. For reentrant locks only the outermost acquire/release pair is
+    timed; nested acquisitions by the owner are passed straight through.
+
+    Attributes:
+        name: Lock name used as the reporting key.
+    """
+
+    def __init__(self, name: str, reentrant: bool = True) -> None:
+        """Create an instrumented lock.
+
+        Args:
+            name: Reporting key, e.g. "safety.emergency_stop".
+            reentrant: If True, wraps an RLock; otherwise a plain Lock.
+        """
+        self.name = name
+        self._reentrant = reentrant
+        self._lock = threading.RLock() if reentrant else threading.Lock()
+        self._stats = _stats_for(name)
+        # Owner bookkeeping is only written by the thread holding the lock
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._acquired_at = 0.0
+        self._site: Optional[_SiteKey] = None
+
+    def _acquire(self, blocking: bool, timeout: float, frame_depth: int) -> bool:
+        me = threading.get_ident()
+        if self._reentrant and self._owner == me:
+            # Nested acquisition by the owner never blocks
+            self._lock.acquire()
+            self._depth += 1
+            return True
+
+        frame = sys._getframe(frame_depth)
+        site = (frame.f_code, frame.f_lineno)
+
+        contended = False
+        wait_s = 0.0
+        if not self._lock.acquire(False):
+            contended = True
+            if not blocking:
+                self._stats.record_failed(site, 0.0)
+                return False
+            start = time.perf_counter()
+            acquired = self._lock.acquire(True, timeout)
+            wait_s = time.perf_counter() - start
+            if not acquired:
+                self._stats.record_failed(site, wait_s)
+                return False
+
+        self._owner = me
+        self._depth = 1
+        self._site = site
+        self._stats.record_acquire(site, wait_s, contended)
+        self._acquired_at = time.perf_counter()
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """Acquire the lock (same semantics as threading.RLock.acquire)."""
+        return self._acquire(blocking, timeout, 2)
+
+    def release(self) -> None:
+        """Release the lock (same semantics as threading.RLock.release).
+
+        Raises:
+            RuntimeError: If a reentrant lock is released by a thread that
+                does not own it, or the lock is not held.
+        """
+        if self._owner != threading.get_ident():
+            # Bookkeeping belongs to the owner; leave it untouched
+            if self._reentrant:
+                raise RuntimeError("cannot release un-acquired lock")
+            if not self._lock.locked():
+                raise RuntimeError("release unlocked lock")
+
+        if self._depth > 1:
+            self._depth -= 1
+            self._lock.release()
+            return
+
+        hold_s = time.perf_counter() - self._acquired_at
+        site = self._site
+        self._owner = None
+        self._depth = 0
+        self._site = None
+        self._lock.release()
+        if site is not None:
+            self._stats.record_release(site, hold_s)
+
+    def locked(self) -> bool:
+        """Check if the lock is currently held by any thread."""
+        if not self._reentrant:
+            return self._lock.locked()
+        # RLock has no locked() before Python 3.14: probe it instead. The
+        # probe succeeds when the lock is free or already ours.
+        if not self._lock.acquire(False):
+            return True
+        held = self._owner == threading.get_ident()
+        self._lock.release()
+        return held
+
+    def __enter__(self) -> bool:
+        return self._acquire(True, -1, 2)
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"InstrumentedLock(name={self.name!r}, reentrant={self._reentrant}, "
+            f"held={self._depth > 0})"
+        )
+
+
+LockType = Union[InstrumentedLock, Any]
+
+
+def create_lock(name: str, reentrant: bool = True) -> LockType:
+    """Create a lock, instrumented only if profiling is enabled.
+
+    Args:
+        name: Reporting key for the lock (dotted, e.g. "drivers.pca9685").
+        reentrant: If True, returns an RLock-compatible lock.
+
+    Returns:
+        InstrumentedLock when profiling is enabled, otherwise a plain
+        threading.RLock/threading.Lock with zero extra overhead.
+    """
+    if _enabled:
+        return InstrumentedLock(name, reentrant=reentrant)
+    return threading.RLock() if reentrant else threading.Lock()
+
+
+def get_lock_report(top_sites: int = DEFAULT_TOP_SITES) -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every instrumented lock.
+
+    Args:
+        top_sites: Number of call sites to include per lock.
+
+    Returns:
+        Dictionary mapping lock name to its snapshot. Empty when no
+        instrumented locks have been created.
+    """
+    with _registry_lock:
+        items = list(_registry.items())
+    return {name: stats.snapshot(top_sites) for name, stats in sorted(items)}
+
+
+def reset_lock_stats() -> None:
+    """Clear counters on all instrumented locks."""
+    with _registry_lock:
+        items = list(_registry.values())
+    for stats in items:
+        stats.reset()
+
+
+def format_lock_report(top_sites: int = 3) -> str:
+    """Format the lock report as a human-readable table.
+
+    Args:
+        top_sites: Number of call sites to list per lock.
+
+    Returns:
+        Multi-line report string, locks ordered by total wait time.
+    """
+    report = get_lock_report(top_sites)
+    if not report:
+        return "Lock profiling: no instrumented locks (set OPENDUCK_LOCK_PROFILING=1)"
+
+    lines = [
+        f"{'lock':<32} {'acq':>8} {'cont%':>6} {'wait avg/max ms':>17} {'hold avg/max ms':>17}"
+    ]
+    ordered = sorted(report.items(), key=lambda item: item[1]["wait_total_ms"], reverse=True)
+    for name, stats in ordered:
+        lines.append(
+            f"{name:<32} {stats['acquisitions']:>8} "
+            f"{stats['contention_rate'] * 100:>5.1f}% "
+            f"{stats['wait_avg_ms']:>8.3f}/{stats['wait_max_ms']:<8.3f}"
+            f"{stats['hold_avg_ms']:>8.3f}/{stats['hold_max_ms']:<8.3f}"
+        )
+        for site in stats["sites"]:
+            lines.append(
+                f"    {site['site']:<44} acq={site['acquisitions']} "
+                f"wait={site['wait_total_ms']:.3f}ms hold={site['hold_total_ms']:.3f}ms"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,203 @@
+"""Startup-phase tracing for OpenDuck Mini V3.
+
+Records how long each subsystem takes to import and initialize during
+bring-up, on whichever thread it runs, plus named milestones such as the
+first LED expression. Used by the staged bring-up (src/core/bringup.py)
+and scripts/startup_report.py.
+
+Per phase it records:
+
+    - Subsystem name and kind ("import" or "init")
+    - Start offset from tracer creation and duration
+    - Thread the phase ran on (foreground vs background stages)
+    - Error message if the phase raised
+
+Example:
+    >>> from src.utils.startup_profiler import StartupTracer
+    >>> tracer = StartupTracer()
+    >>> robot_module = tracer.import_module("src.core.robot")
+    >>> with tracer.phase("robot", kind="init"):
+    ...     robot = robot_module.Robot(enable_hardware=False)
+    >>> tracer.mark("first_expression")
+    >>> print(tracer.format_report())
+"""
+
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StartupPhase:
+    """One traced import or initialization step.
+
+    Attributes:
+        name: Subsystem or module name
+        kind: "import" or "init"
+        start_s: Start offset from tracer creation in seconds
+        duration_s: Duration in seconds
+        thread: Name of the thread the phase ran on
+        error: Exception message if the phase failed, else None
+    """
+    name: str
+    kind: str
+    start_s: float
+    duration_s: float
+    thread: str
+    error: Optional[str] = None
+
+    @property
+    def end_s(self) -> float:
+        """End offset from tracer creation in seconds."""
+        return self.start_s + self.duration_s
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (milliseconds)."""
+        return {
+            'name': self.name,
+            'kind': self.kind,
+            'start_ms': self.start_s * 1000.0,
+            'duration_ms': self.duration_s * 1000.0,
+            'thread': self.thread,
+            'error': self.error,
+        }
+
+
+class StartupTracer:
+    """Collects startup phases and milestones.
+
+    Thread Safety:
+        phase(), import_module() and mark() may be called from any thread.
+    """
+
+    def __init__(self, origin: Optional[float] = None) -> None:
+        """Initialize tracer.
+
+        Args:
+            origin: time.monotonic() value treated as t=0 (default: now)
+        """
+        self._origin = time.monotonic() if origin is None else origin
+        self._lock = threading.Lock()
+        self._phases: List[StartupPhase] = []
+        self._marks: Dict[str, float] = {}
+
+    def elapsed(self) -> float:
+        """Seconds since the tracer origin."""
+        return time.monotonic() - self._origin
+
+    @contextmanager
+    def phase(self, name: str, kind: str = "init") -> Iterator[None]:
+        """Trace the enclosed block as one phase.
+
+        Exceptions are recorded on the phase and re-raised.
+
+        Args:
+            name: Subsystem or module name
+            kind: "import" or "init"
+        """
+        start = self.elapsed()
+        error: Optional[str] = None
+        try:
+            yield
+        except BaseException as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record = StartupPhase(
+                name=name,
+                kind=kind,
+                start_s=start,
+                duration_s=self.elapsed() - start,
+                thread=threading.current_thread().name,
+                error=error,
+            )
+            with self._lock:
+                self._phases.append(record)
+
+    def import_module(self, module_name: str) -> Any:
+        """Import a module inside an "import" phase.
+
+        Already-imported modules are recorded with their (near zero) cost.
+
+        Args:
+            module_name: Absolute module name
+
+        Returns:
+            The imported module
+        """
+        with self.phase(module_name, kind="import"):
+            return importlib.import_module(module_name)
+
+    def mark(self, name: str) -> float:
+        """Record a milestone at the current time (first call wins).
+
+        Args:
+            name: Milestone name, e.g. "first_expression"
+
+        Returns:
+            Milestone offset in seconds
+        """
+        now = self.elapsed()
+        with self._lock:
+            return self._marks.setdefault(name, now)
+
+    def get_mark(self, name: str) -> Optional[float]:
+        """Get a milestone offset in seconds (None if not reached)."""
+        with self._lock:
+            return self._marks.get(name)
+
+    @property
+    def phases(self) -> List[StartupPhase]:
+        """Recorded phases in completion order."""
+        with self._lock:
+            return list(self._phases)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        with self._lock:
+            phases = sorted(self._phases, key=lambda p: p.start_s)
+            marks = dict(self._marks)
+        return {
+            'phases': [p.to_dict() for p in phases],
+            'marks_ms': {name: t * 1000.0 for name, t in marks.items()},
+            'total_ms': max((p.end_s for p in phases), default=0.0) * 1000.0,
+        }
+
+    def format_report(self) -> str:
+        """Format phases and milestones as a timeline."""
+        with self._lock:
+            phases = sorted(self._phases, key=lambda p: p.start_s)
+            marks = sorted(self._marks.items(), key=lambda item: item[1])
+
+        lines = [
+            f"{'start':>9} {'duration':>10}  {'kind':<6} {'thread':<18} name",
+            "-" * 70,
+        ]
+        for p in phases:
+            status = f"  FAILED ({p.error})" if p.error else ""
+            lines.append(
+                f"{p.start_s * 1000:>7.1f}ms {p.duration_s * 1000:>8.1f}ms  "
+                f"{p.kind:<6} {p.thread[:18]:<18} {p.name}{status}"
+            )
+        if marks:
+            lines.append("")
+            for name, t in marks:
+                lines.append(f"{t * 1000:>7.1f}ms  * {name}")
+        return "\n".join(lines)
+
+
+# Process-wide tracer used when callers do not supply one
+_default_tracer: Optional[StartupTracer] = None
+_default_lock = threading.Lock()
+
+
+def get_startup_tracer() -> StartupTracer:
+    """Get the process-wide startup tracer (created on first call)."""
+    global _default_tracer
+    with _default_lock:
+        if _default_tracer is None:
+            _default_tracer = StartupTracer()
+        return _default_tracer
@@ -0,0 +1,348 @@
+"""Rolling latency histograms for real-time loops.
+
+Fixed-bucket histogram over the last N samples, cheap enough to update
+every control-loop tick:
+
+    - add() is O(log buckets) (bisect) plus O(1) bookkeeping, and writes
+      into storage preallocated at construction; nothing grows
+    - Evicting the oldest sample decrements its bucket, so counts always
+      describe exactly the rolling window
+    - Percentiles are estimated from the buckets (linear within a bucket),
+      so reports never sort the window
+
+Bucket edges are upper bounds in seconds; the last bucket catches
+everything above the largest edge.
+
+PhaseTimer groups one histogram per named phase of a loop iteration and
+adds per-phase budgets, an over-budget callback and a one-line summary
+for periodic logging.
+
+Example:
+    >>> from src.utils.timing_stats import LatencyHistogram, PhaseTimer
+    >>> jitter = LatencyHistogram(window=1000)
+    >>> jitter.add(0.00012)
+    >>> jitter.percentile(99)
+    >>> print(jitter.to_dict())
+    >>> phases = PhaseTimer(("read", "write"), budgets_s={"read": 0.002})
+    >>> phases.record("read", 0.0031)  # Over budget -> callbacks fire
+    >>> print(phases.format_line())
+"""
+
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+_logger = logging.getLogger(__name__)
+
+# Default edges: 10us .. 50ms, roughly 1-2-5 spaced
+DEFAULT_EDGES_S = (
+    10e-6, 20e-6, 50e-6,
+    100e-6, 200e-6, 500e-6,
+    1e-3, 2e-3, 5e-3,
+    10e-3, 20e-3, 50e-3,
+)
+
+DEFAULT_WINDOW = 1000
+
+# Called as (phase, duration_s, budget_s) when a phase exceeds its budget
+PhaseBudgetCallback = Callable[[str, float, float], None]
+
+
+def _format_edge(seconds: float) -> str:
+    """Format a bucket edge as a short label ('50us', '2ms')."""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:g}us"
+    return f"{seconds * 1e3:g}ms"
+
+
+class LatencyHistogram:
+    """Rolling fixed-bucket histogram of durations in seconds.
+
+    Thread Safety:
+        Single writer (the loop that calls add()). Readers may call the
+        report methods from any thread; a report taken during an add() can
+        be off by one sample, never corrupt.
+
+    Attributes:
+        window: Number of most recent samples described by the counts
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        edges_s: Sequence[float] = DEFAULT_EDGES_S,
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            window: Rolling window size in samples
+            edges_s: Ascending bucket upper bounds in seconds
+
+        Raises:
+            ValueError: If window is not positive or edges are not ascending
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if not edges_s or any(b <= a for a, b in zip(edges_s, edges_s[1:])):
+            raise ValueError("edges_s must be a non-empty ascending sequence")
+
+        self.window = window
+        self._edges = tuple(float(e) for e in edges_s)
+        self._counts = array('l', [0] * (len(self._edges) + 1))
+        self._buckets = array('l', [0] * window)   # bucket index per slot
+        self._values = array('d', [0.0] * window)  # value per slot
+        self._pos = 0
+        self._size = 0
+        self._sum = 0.0
+        self._total = 0  # Lifetime samples
+
+    def add(self, value_s: float) -> None:
+        """Record one duration in seconds (evicts the oldest when full)."""
+        pos = self._pos
+        if self._size == self.window:
+            self._counts[self._buckets[pos]] -= 1
+            self._sum -= self._values[pos]
+        else:
+            self._size += 1
+
+        bucket = bisect_left(self._edges, value_s)
+        self._buckets[pos] = bucket
+        self._values[pos] = value_s
+        self._counts[bucket] += 1
+        self._sum += value_s
+        self._total += 1
+        self._pos = pos + 1 if pos + 1 < self.window else 0
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        for i in range(len(self._counts)):
+            self._counts[i] = 0
+        self._pos = 0
+        self._size = 0
+        self._sum = 0.0
+        self._total = 0
+
+    @property
+    def count(self) -> int:
+        """Samples currently in the window."""
+        return self._size
+
+    @property
+    def total(self) -> int:
+        """Samples recorded since creation (or reset)."""
+        return self._total
+
+    def mean(self) -> float:
+        """Mean of the window in seconds (0.0 if empty)."""
+        return self._sum / self._size if self._size else 0.0
+
+    def max(self) -> float:
+        """Exact maximum of the window in seconds (0.0 if empty)."""
+        if not self._size:
+            return 0.0
+        return max(self._values[:self._size])
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile of the window from the buckets.
+
+        Linear interpolation inside the bucket holding the rank, capped at
+        the exact window maximum; samples in the overflow bucket report the
+        largest edge.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Estimated value in seconds (0.0 if empty)
+        """
+        if not self._size:
+            return 0.0
+        rank = q / 100.0 * self._size
+        seen = 0
+        lower = 0.0
+        for bucket, count in enumerate(self._counts):
+            if count and seen + count >= rank:
+                if bucket == len(self._edges):
+                    return self._edges[-1]
+                upper = min(self._edges[bucket], self.max())
+                return lower + (upper - lower) * max(rank - seen, 0.0) / count
+            seen += count
+            if bucket < len(self._edges):
+                lower = self._edges[bucket]
+        return self._edges[-1]
+
+    def to_dict(
+        self,
+        scale: float = 1e3,
+        unit: str = "ms",
+        include_buckets: bool = True,
+    ) -> Dict[str, Any]:
+        """Summarize the window.
+
+        Args:
+            scale: Multiplier applied to values (default: seconds -> ms)
+            unit: Unit suffix for value keys
+            include_buckets: Include per-bucket counts
+
+        Returns:
+            Dictionary with count, total, mean/p50/p90/p99/max and
+            (optionally) per-bucket counts labelled by upper edge
+        """
+        summary: Dict[str, Any] = {
+            'count': self._size,
+            'total': self._total,
+            f'mean_{unit}': self.mean() * scale,
+            f'p50_{unit}': self.percentile(50) * scale,
+            f'p90_{unit}': self.percentile(90) * scale,
+            f'p99_{unit}': self.percentile(99) * scale,
+            f'max_{unit}': self.max() * scale,
+        }
+        if include_buckets:
+            buckets: Dict[str, int] = {}
+            for bucket, count in enumerate(self._counts):
+                if bucket < len(self._edges):
+                    label = f"<={_format_edge(self._edges[bucket])}"
+                else:
+                    label = f">{_format_edge(self._edges[-1])}"
+                buckets[label] = count
+            summary['buckets'] = buckets
+        return summary
+
+
+class PhaseTimer:
+    """Rolling per-phase timing for a loop iteration.
+
+    One LatencyHistogram per phase, all allocated at construction, so
+    record() only updates preallocated storage. Phases may carry a budget;
+    a recording above budget is counted and reported to registered
+    callbacks.
+
+    Thread Safety:
+        Single writer (the loop that calls record()), like LatencyHistogram.
+        Callbacks run on the writer's thread and must be fast. Register
+        callbacks before the loop starts.
+
+    Attributes:
+        phases: Phase names in report order
+    """
+
+    def __init__(
+        self,
+        phases: Sequence[str],
+        window: int = DEFAULT_WINDOW,
+        edges_s: Sequence[float] = DEFAULT_EDGES_S,
+        budgets_s: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        """Initialize phase timer.
+
+        Args:
+            phases: Phase names
+            window: Rolling window size per phase, in samples
+            edges_s: Histogram bucket upper bounds in seconds
+            budgets_s: Optional per-phase budgets in seconds
+
+        Raises:
+            ValueError: If phases is empty, or a budget names an unknown
+                phase or is not positive
+        """
+        if not phases:
+            raise ValueError("phases must not be empty")
+        self.phases = tuple(phases)
+        self._histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram(window, edges_s) for name in self.phases
+        }
+        self._budgets: Dict[str, Optional[float]] = dict.fromkeys(self.phases)
+        self._over_budget: Dict[str, int] = dict.fromkeys(self.phases, 0)
+        self._callbacks: List[PhaseBudgetCallback] = []
+        for name, budget in (budgets_s or {}).items():
+            self.set_budget(name, budget)
+
+    def set_budget(self, phase: str, budget_s: Optional[float]) -> None:
+        """Set or clear (None) the budget of a phase.
+
+        Raises:
+            ValueError: If phase is unknown or budget_s is not positive
+        """
+        if phase not in self._histograms:
+            raise ValueError(f"Unknown phase {phase!r}, expected one of {self.phases}")
+        if budget_s is not None and budget_s <= 0:
+            raise ValueError(f"budget_s must be positive, got {budget_s}")
+        self._budgets[phase] = budget_s
+
+    def register_callback(self, callback: PhaseBudgetCallback) -> None:
+        """Register a callback fired when a phase exceeds its budget.
+
+        Args:
+            callback: Function with signature (phase, duration_s, budget_s).
+                Exceptions are logged and swallowed.
+        """
+        self._callbacks.append(callback)
+
+    def unregister_callback(self, callback: PhaseBudgetCallback) -> bool:
+        """Unregister a callback.
+
+        Returns:
+            True if callback was found and removed, False otherwise.
+        """
+        try:
+            self._callbacks.remove(callback)
+            return True
+        except ValueError:
+            return False
+
+    def record(self, phase: str, duration_s: float) -> None:
+        """Record one duration of a phase and check its budget."""
+        self._histograms[phase].add(duration_s)
+        budget = self._budgets[phase]
+        if budget is not None and duration_s > budget:
+            self._over_budget[phase] += 1
+            for callback in self._callbacks:
+                try:
+                    callback(phase, duration_s, budget)
+                except Exception as e:
+                    _logger.error("Phase budget callback error: %s", e)
+
+    def histogram(self, phase: str) -> LatencyHistogram:
+        """Get the histogram of a phase."""
+        return self._histograms[phase]
+
+    def reset(self) -> None:
+        """Drop all samples and over-budget counts (budgets are kept)."""
+        for name in self.phases:
+            self._histograms[name].reset()
+            self._over_budget[name] = 0
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize every phase (ms, without buckets).
+
+        Returns:
+            {phase: {count, total, mean/p50/p90/p99/max_ms, budget_ms,
+            over_budget}}
+        """
+        report: Dict[str, Dict[str, Any]] = {}
+        for name in self.phases:
+            summary = self._histograms[name].to_dict(include_buckets=False)
+            budget = self._budgets[name]
+            summary['budget_ms'] = budget * 1e3 if budget is not None else None
+            summary['over_budget'] = self._over_budget[name]
+            report[name] = summary
+        return report
+
+    def format_line(self) -> str:
+        """One-line key=value summary for periodic logs.
+
+        Example:
+            ``watchdog.p50_ms=0.012 watchdog.p99_ms=0.041 watchdog.max_ms=0.090
+            watchdog.over_budget=0 ...``
+        """
+        fields = []
+        for name in self.phases:
+            hist = self._histograms[name]
+            fields.append(
+                f"{name}.p50_ms={hist.percentile(50) * 1e3:.3f} "
+                f"{name}.p99_ms={hist.percentile(99) * 1e3:.3f} "
+                f"{name}.max_ms={hist.max() * 1e3:.3f} "
+                f"{name}.over_budget={self._over_budget[name]}"
+            )
+        return " ".join(fields)
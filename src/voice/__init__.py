@@ -25,6 +25,13 @@ Production Pipeline (recommended):
     pipeline.start()
     ```
 
+Lazy loading:
+    Importing ``src.voice`` loads no submodule. Each exported name is
+    resolved on first attribute access (PEP 562 module ``__getattr__``),
+    so ONNX/STT backends and NumPy load only when the component that
+    needs them is used, and a missing optional module only fails the
+    names it provides.
+
 Individual components can also be used standalone:
     ```python
     from src.voice import VoiceActivityDetector, VADConfig
@@ -33,85 +40,99 @@ Individual components can also be used standalone:
     from src.voice import IntentClassifier, IntentConfig
 
     # Create components
-    vad = VoiceActivityDetector(VADConfig(energy_threshold_db=-35))
+    vad = VoiceActivityDetector.from_config(VADConfig(energy_threshold_db=-35))
     wake = WakeWordDetector(WakeWordConfig(wake_words=["hey openduck"]))
     stt = SpeechToText(STTConfig(language="en"))
     intent = IntentClassifier(IntentConfig(confidence_threshold=0.6))
     ```
 """
 
-# VAD exports
-from src.voice.vad import (
-    VADConfig,
-    VADState,
-    VADEvent,
-    VADResult,
-    VoiceActivityDetector,
-)
-
-# Wake Word exports
-from src.voice.wake_word import (
-    WakeWordConfig,
-    WakeWordResult,
-    WakeWordDetector,
-)
-
-# STT exports
-from src.voice.stt import (
-    STTConfig,
-    STTResult,
-    STTBackend,
-    SpeechToText,
-)
-
-# Intent exports
-from src.voice.intent import (
-    IntentConfig,
-    IntentResult,
-    Intent,
-    Entity,
-    IntentClassifier,
-)
+from typing import TYPE_CHECKING, Dict
 
-# Production Pipeline exports
-from src.voice.pipeline import (
-    PipelineConfig,
-    PipelineState,
-    DetectionResult,
-    AudioPreprocessor,
-    NoiseCalibrator,
-    MultiFrameConfirmer,
-    WakeWordPipeline,
-)
+from src.utils.lazy_exports import make_lazy
 
-__all__ = [
+# Exported name -> defining module (imported on first access)
+_LAZY_EXPORTS: Dict[str, str] = {
     # VAD
-    'VADConfig',
-    'VADState',
-    'VADEvent',
-    'VADResult',
-    'VoiceActivityDetector',
+    'VADConfig': 'src.voice.vad',
+    'VADState': 'src.voice.vad',
+    'VADEvent': 'src.voice.vad',
+    'VADResult': 'src.voice.vad',
+    'VoiceActivityDetector': 'src.voice.vad',
     # Wake Word
-    'WakeWordConfig',
-    'WakeWordResult',
-    'WakeWordDetector',
+    'WakeWordConfig': 'src.voice.wake_word',
+    'WakeWordResult': 'src.voice.wake_word',
+    'WakeWordDetector': 'src.voice.wake_word',
     # STT
-    'STTConfig',
-    'STTResult',
-    'STTBackend',
-    'SpeechToText',
+    'STTConfig': 'src.voice.stt',
+    'STTResult': 'src.voice.stt',
+    'STTBackend': 'src.voice.stt',
+    'SpeechToText': 'src.voice.stt',
     # Intent
-    'IntentConfig',
-    'IntentResult',
-    'Intent',
-    'Entity',
-    'IntentClassifier',
+    'IntentConfig': 'src.voice.intent',
+    'IntentResult': 'src.voice.intent',
+    'Intent': 'src.voice.intent',
+    'Entity': 'src.voice.intent',
+    'IntentClassifier': 'src.voice.intent',
+    # Model manager
+    'ModelLoadMetrics': 'src.voice.models',
+    'SharedWakeWordModel': 'src.voice.models',
+    'WakeWordModelManager': 'src.voice.models',
+    'get_wake_word_model_manager': 'src.voice.models',
     # Production Pipeline
-    'PipelineConfig',
-    'PipelineState',
-    'DetectionResult',
-    'AudioPreprocessor',
-    'NoiseCalibrator',
-    'MultiFrameConfirmer',
-    'WakeWordPipeline',
-]
+    'PipelineConfig': 'src.voice.pipeline',
+    'PipelineState': 'src.voice.pipeline',
+    'DetectionResult': 'src.voice.pipeline',
+    'AudioPreprocessor': 'src.voice.pipeline',
+    'NoiseCalibrator': 'src.voice.pipeline',
+    'MultiFrameConfirmer': 'src.voice.pipeline',
+    'WakeWordPipeline': 'src.voice.pipeline',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+__getattr__, __dir__ = make_lazy(__name__, _LAZY_EXPORTS, __all__)
+
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from src.voice.vad import (
+        VADConfig,
+        VADState,
+        VADEvent,
+        VADResult,
+        VoiceActivityDetector,
+    )
+    from src.voice.wake_word import (
+        WakeWordConfig,
+        WakeWordResult,
+        WakeWordDetector,
+    )
+    from src.voice.stt import (
+        STTConfig,
+        STTResult,
+        STTBackend,
+        SpeechToText,
+    )
+    from src.voice.intent import (
+        IntentConfig,
+        IntentResult,
+        Intent,
+        Entity,
+        IntentClassifier,
+    )
+    from src.voice.models import (
+        ModelLoadMetrics,
+        SharedWakeWordModel,
+        WakeWordModelManager,
+        get_wake_word_model_manager,
+    )
+    from src.voice.pipeline import (
+        PipelineConfig,
+        PipelineState,
+        DetectionResult,
+        AudioPreprocessor,
+        NoiseCalibrator,
+        MultiFrameConfirmer,
+        WakeWordPipeline,
+    )
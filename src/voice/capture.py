@@ -0,0 +1,1018 @@
+"""Audio Capture Sources and Zero-Copy Ingestion for the Wake Word Pipeline
+
+This module provides the capture side of the wake word pipeline: pluggable
+sources that produce fixed-size S32_LE interleaved chunks, a zero-copy
+reader for byte pipes, and the bounded ring that hands chunks from the
+capture thread to the inference thread.
+
+Sources (all feed a shared ChunkRing):
+    - ArecordSource: ``arecord`` subprocess, read with readinto()
+    - SoundDeviceSource: in-process PortAudio/ALSA callback (the same stack
+      as AudioCapturePipeline and INMP441Driver), no subprocess or pipe.
+      The callback writes to a lock-free AudioRingBuffer; the capture
+      thread moves whole chunks into the ChunkRing
+    - FileReplaySource: WAV file or NumPy array, as fast as possible or
+      paced to real time - deterministic benchmarking without hardware
+
+Design:
+    - One pre-allocated bytearray per reader, filled with readinto() through
+      a memoryview, so the kernel copies straight into the chunk buffer
+    - Short reads are accumulated rather than discarded, so no samples are
+      lost and the stream never drifts out of frame alignment
+    - Completed chunks are returned as memoryviews; np.frombuffer() on them
+      gives the preprocessor a NumPy view with no copy
+    - Counters for short reads and dropped bytes (partial chunks discarded
+      at EOF or detach)
+    - ChunkRing: fixed pool of pre-allocated chunk slots between capture
+      and inference. When inference falls behind, the oldest queued chunk
+      is dropped, so capture never blocks and the kernel pipe never overruns
+    - Each chunk carries its capture timestamp and a sequence number, so the
+      consumer can measure queue latency and detect gaps
+
+Example:
+    ```python
+    from src.voice.capture import ChunkRing, FileReplaySource
+
+    # Deterministic replay through the full wake word pipeline
+    source = FileReplaySource(
+        "recordings/hey_openduck.wav",
+        sample_rate=48000, channels=2, chunk_frames=3840
+    )
+    pipeline = WakeWordPipeline(config, source=source)
+
+    # Or drive a ring directly
+    ring = ChunkRing(num_slots=8, chunk_bytes=source.chunk_bytes)
+    source.open()
+    producer = threading.Thread(target=source.run, args=(ring,))
+    producer.start()
+
+    chunk = ring.get(timeout=0.1)              # Consumer thread
+    samples = np.frombuffer(chunk.data, dtype=np.int32)  # no copy
+    ring.release(chunk)
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.drivers.audio.audio_capture import AudioRingBuffer
+from src.drivers.audio.resampler import PolyphaseResampler
+
+_logger = logging.getLogger(__name__)
+
+# Optional in-process capture backend
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+
+# Every source delivers signed 32-bit little-endian interleaved frames
+SAMPLE_BYTES = 4
+
+
+class PipeChunkReader:
+    """Reads fixed-size chunks from a stream into a reused buffer.
+
+    The stream should be unbuffered (``Popen(..., bufsize=0)``) so that
+    readinto() copies directly from the pipe into the chunk buffer instead
+    of going through an intermediate BufferedReader.
+
+    Thread Safety:
+        Not thread-safe. A reader belongs to the capture thread; statistics
+        are plain integers and safe to read from other threads.
+
+    Attributes:
+        chunk_bytes: Size of each chunk in bytes
+    """
+
+    def __init__(self, chunk_bytes: int) -> None:
+        """Initialize reader.
+
+        Args:
+            chunk_bytes: Size of each chunk in bytes
+
+        Raises:
+            ValueError: If chunk_bytes is not positive
+        """
+        if chunk_bytes <= 0:
+            raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+
+        self.chunk_bytes = chunk_bytes
+        self._buffer = bytearray(chunk_bytes)
+        self._view = memoryview(self._buffer)
+        self._filled = 0
+        self._stream: Optional[BinaryIO] = None
+        self._eof = False
+
+        # Statistics
+        self.chunks = 0
+        self.bytes_read = 0
+        self.short_reads = 0
+        self.dropped_bytes = 0
+
+    @property
+    def eof(self) -> bool:
+        """Check if the attached stream has reached end of file."""
+        return self._eof
+
+    def attach(self, stream: BinaryIO) -> None:
+        """Attach a new stream, discarding any partial chunk.
+
+        Args:
+            stream: Binary stream supporting readinto()
+        """
+        self.detach()
+        self._stream = stream
+        self._eof = False
+
+    def detach(self) -> None:
+        """Detach the stream, counting any partial chunk as dropped."""
+        self._drop_partial()
+        self._stream = None
+
+    def read_chunk(self, out: Optional[memoryview] = None) -> Optional[memoryview]:
+        """Read until one full chunk is available.
+
+        Blocks on the stream. Partial reads are kept and completed by
+        subsequent reads.
+
+        Args:
+            out: Writable buffer of chunk_bytes to fill instead of the
+                reader's own (e.g. a ChunkRing slot). If a call returns None
+                with data pending, the next call must pass the same buffer
+
+        Returns:
+            Memoryview of the filled chunk (the reader's own buffer is valid
+            until the next call), or None on EOF, detach, or if a
+            non-blocking stream has no data yet
+        """
+        stream = self._stream
+        if stream is None or self._eof:
+            return None
+
+        target = self._view if out is None else out
+        while self._filled < self.chunk_bytes:
+            wanted = self.chunk_bytes - self._filled
+            n = stream.readinto(target[self._filled:])
+            if n is None:
+                # Non-blocking stream with no data yet - keep the partial
+                return None
+            if n == 0:
+                self._eof = True
+                self._drop_partial()
+                return None
+            if n < wanted:
+                self.short_reads += 1
+            self._filled += n
+            self.bytes_read += n
+
+        self._filled = 0
+        self.chunks += 1
+        return target
+
+    def _drop_partial(self) -> None:
+        """Discard an incomplete chunk."""
+        if self._filled:
+            _logger.debug(f"Dropping {self._filled} bytes of partial chunk")
+            self.dropped_bytes += self._filled
+            self._filled = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get ingestion statistics.
+
+        Returns:
+            Dictionary with chunks, bytes_read, short_reads, dropped_bytes
+        """
+        return {
+            'chunks': self.chunks,
+            'bytes_read': self.bytes_read,
+            'short_reads': self.short_reads,
+            'dropped_bytes': self.dropped_bytes,
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+        self.chunks = 0
+        self.bytes_read = 0
+        self.short_reads = 0
+        self.dropped_bytes = 0
+
+
+# =============================================================================
+# Capture → Inference Handoff
+# =============================================================================
+
+@dataclass
+class CapturedChunk:
+    """A queued chunk handed to the consumer.
+
+    Attributes:
+        slot: Ring slot index (pass back via ChunkRing.release)
+        data: Memoryview of the slot, valid until released
+        capture_time: time.monotonic() when the chunk was completed
+        sequence: Monotonic chunk counter; a gap means chunks were dropped
+    """
+    slot: int
+    data: memoryview
+    capture_time: float
+    sequence: int
+
+
+class ChunkRing:
+    """Bounded pool of pre-allocated chunks between two threads.
+
+    The producer takes a free slot, fills it in place and commits it; the
+    consumer gets the oldest committed slot and releases it when done. If no
+    slot is free when the producer needs one, the oldest queued chunk is
+    dropped (drop-oldest policy), so the producer never waits on the
+    consumer. Slots held by the consumer are never overwritten.
+
+    Thread Safety:
+        Single producer, single consumer. Internal state is guarded by a
+        condition variable held only for index bookkeeping, never for I/O
+        or processing.
+
+    Attributes:
+        num_slots: Total chunk slots
+        chunk_bytes: Size of each slot in bytes
+    """
+
+    MIN_SLOTS = 3  # One filling, one being processed, one queued
+
+    def __init__(self, num_slots: int, chunk_bytes: int) -> None:
+        """Initialize ring.
+
+        Args:
+            num_slots: Number of chunk slots (>= 3)
+            chunk_bytes: Size of each slot in bytes
+
+        Raises:
+            ValueError: If num_slots < 3 or chunk_bytes is not positive
+        """
+        if num_slots < self.MIN_SLOTS:
+            raise ValueError(f"num_slots must be >= {self.MIN_SLOTS}, got {num_slots}")
+        if chunk_bytes <= 0:
+            raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+
+        self.num_slots = num_slots
+        self.chunk_bytes = chunk_bytes
+        self._buffer = bytearray(num_slots * chunk_bytes)
+        view = memoryview(self._buffer)
+        self._slots: List[memoryview] = [
+            view[i * chunk_bytes:(i + 1) * chunk_bytes] for i in range(num_slots)
+        ]
+        self._capture_times = [0.0] * num_slots
+        self._sequences = [0] * num_slots
+
+        self._cond = threading.Condition()
+        self._free: Deque[int] = deque(range(num_slots))
+        self._queued: Deque[int] = deque()
+        self._closed = False
+        self._next_sequence = 0
+
+        # Statistics
+        self.committed = 0
+        self.dropped_chunks = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of chunks waiting for the consumer."""
+        return len(self._queued)
+
+    @property
+    def closed(self) -> bool:
+        """Check if the producer has closed the ring."""
+        return self._closed
+
+    def slot(self, index: int) -> memoryview:
+        """Get the writable view of a slot.
+
+        Args:
+            index: Slot index from acquire_write()
+
+        Returns:
+            Memoryview of chunk_bytes
+        """
+        return self._slots[index]
+
+    def acquire_write(self, wait: bool = False) -> Optional[int]:
+        """Take a slot to fill.
+
+        Args:
+            wait: Wait for the consumer to free a slot instead of dropping
+                the oldest queued chunk (lossless replay). Live sources
+                leave this False so capture never blocks.
+
+        Returns:
+            Slot index. If none was free, the oldest queued chunk is dropped
+            and its slot reused. None only if waiting and the ring is closed.
+        """
+        with self._cond:
+            if wait:
+                while not self._free and not self._closed:
+                    self._cond.wait()
+                if not self._free:
+                    return None
+            if self._free:
+                return self._free.popleft()
+            self.dropped_chunks += 1
+            return self._queued.popleft()
+
+    def commit(self, index: int, capture_time: float) -> None:
+        """Queue a filled slot for the consumer.
+
+        Args:
+            index: Slot index from acquire_write()
+            capture_time: Timestamp to carry with the chunk
+        """
+        with self._cond:
+            self._capture_times[index] = capture_time
+            self._sequences[index] = self._next_sequence
+            self._next_sequence += 1
+            self._queued.append(index)
+            self.committed += 1
+            if len(self._queued) > self.max_depth:
+                self.max_depth = len(self._queued)
+            self._cond.notify()
+
+    def abort_write(self, index: int) -> None:
+        """Return an acquired slot without queuing it.
+
+        Args:
+            index: Slot index from acquire_write()
+        """
+        with self._cond:
+            self._free.append(index)
+            self._cond.notify_all()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[CapturedChunk]:
+        """Take the oldest queued chunk.
+
+        Args:
+            timeout: Seconds to wait for a chunk (None = forever)
+
+        Returns:
+            CapturedChunk, or None on timeout or if the ring is closed and
+            drained
+        """
+        with self._cond:
+            if not self._queued and not self._closed:
+                self._cond.wait(timeout)
+            if not self._queued:
+                return None
+            index = self._queued.popleft()
+            return CapturedChunk(
+                slot=index,
+                data=self._slots[index],
+                capture_time=self._capture_times[index],
+                sequence=self._sequences[index],
+            )
+
+    def release(self, chunk: CapturedChunk) -> None:
+        """Return a consumed chunk's slot to the pool.
+
+        Args:
+            chunk: Chunk from get()
+        """
+        with self._cond:
+            self._free.append(chunk.slot)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Mark the producer finished and wake the consumer."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        """Drop queued chunks and reopen (start of a new stream).
+
+        Must not be called while either thread is using the ring.
+        """
+        with self._cond:
+            self._free = deque(range(self.num_slots))
+            self._queued.clear()
+            self._closed = False
+            self._next_sequence = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get queue statistics.
+
+        Returns:
+            Dictionary with depth, max_depth, capacity, committed,
+            dropped_chunks
+        """
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'capacity': self.num_slots,
+            'committed': self.committed,
+            'dropped_chunks': self.dropped_chunks,
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+        self.committed = 0
+        self.dropped_chunks = 0
+        self.max_depth = 0
+
+
+# =============================================================================
+# Capture Sources
+# =============================================================================
+
+class CaptureSource(ABC):
+    """Base class for wake word pipeline audio sources.
+
+    A source produces chunks of ``chunk_frames`` S32_LE frames with
+    ``channels`` interleaved channels at ``sample_rate`` into a ChunkRing.
+    run() is the producer loop: it is called on the pipeline's capture
+    thread and returns on stop() or end of stream.
+
+    Attributes:
+        sample_rate: Sample rate in Hz
+        channels: Interleaved channels per frame
+        chunk_frames: Frames per chunk
+        chunk_bytes: Bytes per chunk
+    """
+
+    name = "base"
+
+    def __init__(self, sample_rate: int, channels: int, chunk_frames: int) -> None:
+        """Initialize source.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            channels: Interleaved channels per frame
+            chunk_frames: Frames per chunk
+
+        Raises:
+            ValueError: If any parameter is not positive
+        """
+        if sample_rate <= 0 or channels <= 0 or chunk_frames <= 0:
+            raise ValueError(
+                f"sample_rate, channels and chunk_frames must be positive, "
+                f"got {sample_rate}/{channels}/{chunk_frames}"
+            )
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.chunk_frames = chunk_frames
+        self.chunk_bytes = chunk_frames * channels * SAMPLE_BYTES
+        self._stop_event = threading.Event()
+
+    @abstractmethod
+    def open(self) -> None:
+        """Acquire the device or file. Called before run().
+
+        Raises:
+            RuntimeError: If the source cannot be opened
+        """
+
+    @abstractmethod
+    def run(self, ring: ChunkRing) -> None:
+        """Produce chunks into the ring until stopped or exhausted.
+
+        Args:
+            ring: Destination ring (chunk_bytes must match)
+        """
+
+    def stop(self) -> None:
+        """Ask run() to return. Safe to call from any thread."""
+        self._stop_event.set()
+
+    def close(self) -> None:
+        """Release the device or file. Called after run() returns."""
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get source statistics.
+
+        Returns:
+            Dictionary with at least 'source', 'short_reads' and
+            'dropped_bytes'
+        """
+        return {'source': self.name, 'short_reads': 0, 'dropped_bytes': 0}
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+
+
+class ArecordSource(CaptureSource):
+    """Captures through an ``arecord`` subprocess.
+
+    The pipe is opened unbuffered and read with readinto() straight into
+    ring slots (see PipeChunkReader).
+    """
+
+    name = "arecord"
+
+    def __init__(
+        self,
+        device: str,
+        sample_rate: int,
+        channels: int,
+        chunk_frames: int,
+        buffer_size: int = 8192,
+    ) -> None:
+        """Initialize source.
+
+        Args:
+            device: ALSA device string (e.g. "hw:1,0")
+            sample_rate: Sample rate in Hz
+            channels: Interleaved channels per frame
+            chunk_frames: Frames per chunk
+            buffer_size: arecord --buffer-size in frames
+        """
+        super().__init__(sample_rate, channels, chunk_frames)
+        self.device = device
+        self.buffer_size = buffer_size
+        self._process: Optional[subprocess.Popen] = None
+        self._reader = PipeChunkReader(self.chunk_bytes)
+
+    def open(self) -> None:
+        """Start the arecord subprocess.
+
+        Raises:
+            RuntimeError: If arecord exits immediately
+        """
+        cmd = [
+            "arecord",
+            "-D", self.device,
+            "-f", "S32_LE",
+            "-r", str(self.sample_rate),
+            "-c", str(self.channels),
+            "-t", "raw",
+            "--buffer-size", str(self.buffer_size)  # Larger buffer for stability
+        ]
+
+        _logger.debug(f"Starting audio capture: {' '.join(cmd)}")
+        self._stop_event.clear()
+
+        # Unbuffered pipe: readinto() copies straight into the chunk buffer
+        self._process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+
+        if self._process.poll() is not None:
+            raise RuntimeError("Failed to start audio capture")
+
+        self._reader.attach(self._process.stdout)
+        _logger.info("Audio capture started (arecord)")
+
+    def run(self, ring: ChunkRing) -> None:
+        """Read chunks from the pipe into ring slots.
+
+        Args:
+            ring: Destination ring
+        """
+        slot: Optional[int] = None
+        try:
+            while not self._stop_event.is_set():
+                if slot is None:
+                    slot = ring.acquire_write()
+
+                if self._reader.read_chunk(ring.slot(slot)) is None:
+                    if self._reader.eof:
+                        if not self._stop_event.is_set():
+                            _logger.warning("Audio capture stream ended")
+                        break
+                    continue
+
+                ring.commit(slot, time.monotonic())
+                slot = None
+        finally:
+            if slot is not None:
+                ring.abort_write(slot)
+
+    def stop(self) -> None:
+        """Terminate arecord; the blocked read returns EOF."""
+        super().stop()
+        if self._process:
+            self._process.terminate()
+
+    def close(self) -> None:
+        """Reap the subprocess and detach the pipe."""
+        if self._process:
+            self._process.terminate()
+            self._process.wait(timeout=2)
+            self._process = None
+        self._reader.detach()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get source statistics."""
+        stats = self._reader.get_statistics()
+        stats['source'] = self.name
+        return stats
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+        self._reader.reset_statistics()
+
+
+class SoundDeviceSource(CaptureSource):
+    """Captures in-process through a sounddevice (PortAudio) callback.
+
+    The callback only copies each block into a lock-free SPSC
+    AudioRingBuffer: it takes no lock and wakes no thread, so it never
+    blocks the real-time audio thread. run() drains whole chunks from that
+    buffer into the ChunkRing on the capture thread, where committing
+    (and signalling the consumer) is allowed to take the ring's lock. It
+    sleeps until the next chunk is due. If the capture thread falls behind
+    by more than BUFFER_CHUNKS chunks, the oldest frames are dropped.
+    """
+
+    name = "sounddevice"
+
+    BUFFER_CHUNKS = 4           # Callback-side buffer capacity, in chunks
+    MIN_DRAIN_WAIT_S = 0.001    # Poll interval once a chunk is due
+
+    def __init__(
+        self,
+        device: Optional[Union[str, int]],
+        sample_rate: int,
+        channels: int,
+        chunk_frames: int,
+        latency: Union[str, float] = "low",
+    ) -> None:
+        """Initialize source.
+
+        Args:
+            device: sounddevice device name/index (None = default input)
+            sample_rate: Sample rate in Hz
+            channels: Interleaved channels per frame
+            chunk_frames: Frames per chunk (used as the stream blocksize)
+            latency: PortAudio latency hint
+        """
+        super().__init__(sample_rate, channels, chunk_frames)
+        self.device = device
+        self.latency = latency
+        self._stream: Optional[Any] = None
+        self._buffer = AudioRingBuffer(
+            chunk_frames * self.BUFFER_CHUNKS, channels, dtype=np.int32
+        )
+        self._active = False  # Callback writes only while run() drains
+
+        # Statistics
+        self.callbacks = 0
+        self.overflows = 0
+        self.dropped_bytes = 0
+        self._overflow_base = 0
+
+    def open(self) -> None:
+        """Create the input stream (not started until run()).
+
+        Raises:
+            RuntimeError: If sounddevice is unavailable or the device fails
+        """
+        if not SOUNDDEVICE_AVAILABLE:
+            raise RuntimeError(
+                "sounddevice library not available. "
+                "Install with: pip install sounddevice"
+            )
+
+        self._stop_event.clear()
+        try:
+            self._stream = sd.RawInputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="int32",
+                blocksize=self.chunk_frames,
+                device=self.device,
+                latency=self.latency,
+                callback=self._callback,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to open sounddevice input: {e}")
+
+        _logger.info(f"Audio capture started (sounddevice, device={self.device})")
+
+    def _callback(self, indata: Any, frames: int, time_info: Any, status: Any) -> None:
+        """PortAudio callback: copy the block into the SPSC buffer (no lock)."""
+        if not self._active:
+            return
+
+        self.callbacks += 1
+        if status and status.input_overflow:
+            self.overflows += 1
+
+        self._buffer.write(
+            np.frombuffer(indata, dtype=np.int32).reshape(-1, self.channels)
+        )
+
+    def _drain(self, ring: ChunkRing) -> int:
+        """Move every complete chunk from the SPSC buffer into ring slots.
+
+        Runs on the capture thread; ring.commit() wakes the consumer.
+
+        Args:
+            ring: Destination ring
+
+        Returns:
+            Number of chunks committed
+        """
+        committed = 0
+        while self._buffer.get_available() >= self.chunk_frames:
+            slot = ring.acquire_write()
+            out = np.frombuffer(ring.slot(slot), dtype=np.int32)
+            self._buffer.consume_into(out.reshape(self.chunk_frames, self.channels))
+            ring.commit(slot, time.monotonic())
+            committed += 1
+        return committed
+
+    def run(self, ring: ChunkRing) -> None:
+        """Run the stream and drain chunks into the ring until stopped.
+
+        Args:
+            ring: Destination ring
+        """
+        if self._stream is None:
+            raise RuntimeError("Source not opened")
+
+        self._buffer.clear()
+        self._active = True
+        try:
+            with self._stream:
+                while not self._stop_event.is_set():
+                    self._drain(ring)
+                    # Sleep until the next chunk is due
+                    missing = self.chunk_frames - self._buffer.get_available()
+                    self._stop_event.wait(
+                        max(self.MIN_DRAIN_WAIT_S, missing / self.sample_rate)
+                    )
+        finally:
+            self._active = False
+            self.dropped_bytes += self._buffer.get_available() * self.channels * SAMPLE_BYTES
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Close the stream."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get source statistics.
+
+        dropped_bytes includes frames the callback overwrote because the
+        capture thread fell behind.
+        """
+        overflowed = self._buffer.overflow_samples - self._overflow_base
+        return {
+            'source': self.name,
+            'callbacks': self.callbacks,
+            'overflows': self.overflows,
+            'short_reads': 0,
+            'dropped_bytes': self.dropped_bytes + overflowed * self.channels * SAMPLE_BYTES,
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+        self.callbacks = 0
+        self.overflows = 0
+        self.dropped_bytes = 0
+        self._overflow_base = self._buffer.overflow_samples
+
+
+class FileReplaySource(CaptureSource):
+    """Replays a WAV file or NumPy array as if it were the microphone.
+
+    Audio is converted once at load time to the pipeline's capture format
+    (S32_LE, ``channels`` interleaved, ``sample_rate``): 16/24/32-bit PCM is
+    scaled to 32-bit, mono is duplicated across channels and other sample
+    rates are resampled with PolyphaseResampler.
+
+    By default replay is lossless and runs as fast as the consumer allows
+    (waiting for free ring slots instead of dropping), which makes the
+    whole pipeline deterministic for benchmarks. ``realtime=True`` paces
+    chunks to the capture clock; ``lossless=False`` reproduces the live
+    drop-oldest behaviour.
+    """
+
+    name = "file"
+
+    def __init__(
+        self,
+        audio: Union[str, Path, np.ndarray],
+        sample_rate: int,
+        channels: int,
+        chunk_frames: int,
+        audio_sample_rate: Optional[int] = None,
+        realtime: bool = False,
+        lossless: bool = True,
+        loops: int = 1,
+    ) -> None:
+        """Initialize source.
+
+        Args:
+            audio: WAV path, or an array of samples (1-D mono or
+                (frames, channels)); float arrays are taken as [-1, 1],
+                integer arrays by their dtype's full scale
+            sample_rate: Capture sample rate in Hz
+            channels: Interleaved channels per frame
+            chunk_frames: Frames per chunk
+            audio_sample_rate: Sample rate of an array input (defaults to
+                sample_rate; ignored for WAV files)
+            realtime: Pace chunks to real time
+            lossless: Wait for ring slots instead of dropping the oldest
+            loops: Number of times to play the audio
+
+        Raises:
+            ValueError: If the audio cannot be converted
+        """
+        super().__init__(sample_rate, channels, chunk_frames)
+        self.realtime = realtime
+        self.lossless = lossless
+        self.loops = loops
+
+        if isinstance(audio, np.ndarray):
+            source_rate = audio_sample_rate or sample_rate
+            samples = audio
+            self.path: Optional[Path] = None
+        else:
+            self.path = Path(audio)
+            samples, source_rate = load_wav(self.path)
+
+        self._data = memoryview(
+            to_capture_format(samples, source_rate, sample_rate, channels)
+        ).cast("B")
+
+        # Statistics
+        self.chunks = 0
+        self.dropped_bytes = 0
+
+    @property
+    def duration_s(self) -> float:
+        """Duration of one pass in seconds."""
+        return len(self._data) / (SAMPLE_BYTES * self.channels * self.sample_rate)
+
+    @property
+    def total_chunks(self) -> int:
+        """Whole chunks delivered per pass."""
+        return len(self._data) // self.chunk_bytes
+
+    def open(self) -> None:
+        """Prepare for replay."""
+        self._stop_event.clear()
+
+    def run(self, ring: ChunkRing) -> None:
+        """Copy chunks into the ring, paced or as fast as possible.
+
+        Args:
+            ring: Destination ring
+        """
+        period = self.chunk_frames / self.sample_rate
+        n_chunks = self.total_chunks
+        start = time.monotonic()
+        emitted = 0
+
+        for _ in range(self.loops):
+            for i in range(n_chunks):
+                if self._stop_event.is_set():
+                    return
+                if self.realtime:
+                    delay = start + (emitted + 1) * period - time.monotonic()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        return
+
+                slot = ring.acquire_write(wait=self.lossless)
+                if slot is None:
+                    return
+                offset = i * self.chunk_bytes
+                ring.slot(slot)[:] = self._data[offset:offset + self.chunk_bytes]
+                ring.commit(slot, time.monotonic())
+                self.chunks += 1
+                emitted += 1
+
+            # Trailing partial chunk is not delivered
+            self.dropped_bytes += len(self._data) - n_chunks * self.chunk_bytes
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get source statistics."""
+        return {
+            'source': self.name,
+            'chunks': self.chunks,
+            'short_reads': 0,
+            'dropped_bytes': self.dropped_bytes,
+        }
+
+    def reset_statistics(self) -> None:
+        """Reset counters."""
+        self.chunks = 0
+        self.dropped_bytes = 0
+
+
+# =============================================================================
+# Format Conversion
+# =============================================================================
+
+def load_wav(path: Union[str, Path]) -> Tuple[np.ndarray, int]:
+    """Load a PCM WAV file.
+
+    Args:
+        path: WAV file path
+
+    Returns:
+        Tuple of (samples as int16/int32 array shaped (frames, channels),
+        sample rate)
+
+    Raises:
+        ValueError: If the sample width is not 16, 24 or 32 bits
+    """
+    with wave.open(str(path), "rb") as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+
+    if width == 2:
+        samples = np.frombuffer(raw, dtype="<i2")
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4")
+    elif width == 3:
+        # Place 24-bit samples in the top three bytes of int32
+        packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(packed), 4), dtype=np.uint8)
+        padded[:, 1:] = packed
+        samples = padded.view("<i4").ravel()
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+
+    return samples.reshape(-1, channels), rate
+
+
+def to_capture_format(
+    samples: np.ndarray,
+    source_rate: int,
+    sample_rate: int,
+    channels: int,
+) -> np.ndarray:
+    """Convert audio to S32_LE interleaved frames at the capture rate.
+
+    Args:
+        samples: 1-D mono or (frames, channels) array; float in [-1, 1] or
+            integer at its dtype's full scale
+        source_rate: Sample rate of ``samples`` in Hz
+        sample_rate: Capture sample rate in Hz
+        channels: Output channels (mono input is duplicated)
+
+    Returns:
+        Contiguous little-endian int32 array of frames * channels samples
+
+    Raises:
+        ValueError: If the channel layout cannot be mapped
+    """
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        samples = samples[:, np.newaxis]
+    if samples.shape[1] not in (1, channels):
+        raise ValueError(
+            f"Cannot map {samples.shape[1]} channels onto {channels}"
+        )
+
+    if np.issubdtype(samples.dtype, np.integer):
+        scale = float(np.iinfo(samples.dtype).max) + 1.0
+        audio = samples.astype(np.float64) / scale
+    else:
+        audio = samples.astype(np.float64)
+
+    if source_rate != sample_rate:
+        audio = np.stack(
+            [_resample_block(audio[:, c], source_rate, sample_rate)
+             for c in range(audio.shape[1])],
+            axis=1,
+        )
+
+    if audio.shape[1] != channels:
+        audio = np.repeat(audio, channels, axis=1)
+
+    out = np.clip(np.round(audio * 2147483648.0), -2147483648, 2147483647)
+    return np.ascontiguousarray(out.astype("<i4")).ravel()
+
+
+def _resample_block(audio: np.ndarray, source_rate: int, sample_rate: int) -> np.ndarray:
+    """Resample a whole 1-D signal (load-time only, allocates)."""
+    resampler = PolyphaseResampler(source_rate, sample_rate)
+    step = resampler.max_chunk
+    parts: List[np.ndarray] = [
+        resampler.process(audio[i:i + step]).copy()
+        for i in range(0, len(audio), step)
+    ]
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
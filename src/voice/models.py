@@ -0,0 +1,388 @@
+"""Cached OpenWakeWord Model Loading for OpenDuck Mini V3
+
+This module keeps wake word inference sessions loaded across pipeline
+restarts. Cold start of an OpenWakeWord ONNX model on the Pi takes seconds
+(path scan, session creation, first-inference graph optimization), and
+WakeWordPipeline used to pay it on every start().
+
+Features:
+    - Model path resolution cached per model name (one directory scan,
+      download only when missing)
+    - Loaded sessions survive pipeline stop()/start()
+    - Optional pre-warm with one silent chunk so the first real chunk
+      does not pay first-inference cost
+    - Load-time metrics (resolve, load, warmup) per session
+    - Process-wide singleton so multiple pipelines share one session
+
+Design:
+    Pipelines receive a SharedWakeWordModel handle, not the model itself.
+    Handles serialize predict() on the session and reset the model's
+    streaming buffers when a different handle starts using it, so
+    pipelines taking turns on one session never see each other's audio
+    history. Pipelines running concurrently on different streams should
+    use separate managers.
+
+Example:
+    ```python
+    from src.voice.models import get_wake_word_model_manager
+
+    manager = get_wake_word_model_manager()
+    model = manager.acquire(["hey_jarvis"], warmup=True)
+    scores = model.predict(audio_int16)
+
+    print(manager.get_metrics())
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_logger = logging.getLogger(__name__)
+
+# Default OpenWakeWord model used by the pipeline
+DEFAULT_WAKE_MODEL = "hey_jarvis"
+
+# Silent warmup chunk: 80ms at 16kHz (OpenWakeWord frame size)
+WARMUP_SAMPLES = 1280
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+@dataclass
+class ModelLoadMetrics:
+    """Load-time metrics for one inference session.
+
+    Attributes:
+        model_paths: Resolved model file paths
+        resolve_ms: Time spent resolving (and downloading) model paths
+        load_ms: Time spent constructing the inference session
+        warmup_ms: Time spent on the silent warmup prediction (0 if none)
+        loaded_at: time.time() when the session finished loading
+        acquisitions: Number of acquire() calls served by this session
+    """
+    model_paths: List[str] = field(default_factory=list)
+    resolve_ms: float = 0.0
+    load_ms: float = 0.0
+    warmup_ms: float = 0.0
+    loaded_at: float = 0.0
+    acquisitions: int = 0
+
+    @property
+    def cold_start_ms(self) -> float:
+        """Total one-time cost paid by the first acquire()."""
+        return self.resolve_ms + self.load_ms + self.warmup_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'model_paths': list(self.model_paths),
+            'resolve_ms': self.resolve_ms,
+            'load_ms': self.load_ms,
+            'warmup_ms': self.warmup_ms,
+            'cold_start_ms': self.cold_start_ms,
+            'loaded_at': self.loaded_at,
+            'acquisitions': self.acquisitions,
+        }
+
+
+class _Session:
+    """A loaded model plus the state shared by its handles."""
+
+    def __init__(self, model: Any, metrics: ModelLoadMetrics) -> None:
+        self.model = model
+        self.metrics = metrics
+        self.lock = threading.Lock()
+        self.owner: Optional[SharedWakeWordModel] = None
+        self.warmed = False
+
+
+# =============================================================================
+# Shared Model Handle
+# =============================================================================
+
+class SharedWakeWordModel:
+    """Per-user handle on a shared inference session.
+
+    Implements the subset of openwakeword.model.Model used by the pipeline
+    (predict() and reset()).
+
+    Thread Safety:
+        predict() and reset() are serialized on the session lock.
+    """
+
+    def __init__(self, session: _Session, key: Tuple[str, ...]) -> None:
+        self._session = session
+        self.key = key
+
+    @property
+    def model(self) -> Any:
+        """The underlying OpenWakeWord model."""
+        return self._session.model
+
+    @property
+    def metrics(self) -> ModelLoadMetrics:
+        """Load-time metrics of the shared session."""
+        return self._session.metrics
+
+    def predict(self, audio_int16: np.ndarray) -> Dict[str, float]:
+        """Score one chunk.
+
+        Args:
+            audio_int16: 16kHz mono int16 audio
+
+        Returns:
+            Dictionary of model name to score
+        """
+        session = self._session
+        with session.lock:
+            if session.owner is not self:
+                # Another handle's stream history is in the model buffers
+                session.model.reset()
+                session.owner = self
+            return session.model.predict(audio_int16)
+
+    def reset(self) -> None:
+        """Clear the model's streaming state."""
+        session = self._session
+        with session.lock:
+            session.model.reset()
+            session.owner = self
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"SharedWakeWordModel(key={self.key})"
+
+
+# =============================================================================
+# Model Manager
+# =============================================================================
+
+def _default_resolver(names: Sequence[str]) -> Dict[str, str]:
+    """Resolve OpenWakeWord pretrained model paths, downloading if missing."""
+    import openwakeword
+
+    def scan() -> Dict[str, str]:
+        found: Dict[str, str] = {}
+        paths = openwakeword.get_pretrained_model_paths()
+        for name in names:
+            for path in paths:
+                if name.lower() in path.lower():
+                    found[name] = path
+                    break
+        return found
+
+    found = scan()
+    missing = [name for name in names if name not in found]
+    if missing:
+        _logger.warning(f"Wake word models not found, downloading: {missing}")
+        openwakeword.utils.download_models(missing)
+        found = scan()
+    return found
+
+
+def _default_loader(paths: List[str], inference_framework: str) -> Any:
+    """Construct an OpenWakeWord model."""
+    from openwakeword.model import Model
+
+    return Model(wakeword_model_paths=paths, inference_framework=inference_framework)
+
+
+class WakeWordModelManager:
+    """Loads, caches and shares OpenWakeWord inference sessions.
+
+    Use get_instance() (or get_wake_word_model_manager()) for the
+    process-wide manager; separate instances are useful for tests and
+    concurrent pipelines on independent streams.
+
+    Thread Safety:
+        All public methods are thread-safe. Loading happens under the
+        manager lock, so concurrent first acquire() calls load once.
+
+    Attributes:
+        inference_framework: OpenWakeWord backend ("onnx" or "tflite")
+    """
+
+    # Class-level singleton state
+    _instance: Optional['WakeWordModelManager'] = None
+    _init_lock = threading.Lock()
+
+    def __init__(
+        self,
+        inference_framework: str = "onnx",
+        resolver: Optional[Callable[[Sequence[str]], Dict[str, str]]] = None,
+        loader: Optional[Callable[[List[str], str], Any]] = None
+    ) -> None:
+        """Initialize manager.
+
+        Args:
+            inference_framework: OpenWakeWord backend
+            resolver: Maps model names to file paths (defaults to
+                OpenWakeWord's pretrained models)
+            loader: Builds a model from paths and framework (defaults to
+                openwakeword.model.Model)
+        """
+        self.inference_framework = inference_framework
+        self._resolver = resolver or _default_resolver
+        self._loader = loader or _default_loader
+
+        self._lock = threading.Lock()
+        self._paths: Dict[str, str] = {}
+        self._sessions: Dict[Tuple[str, ...], _Session] = {}
+
+    @classmethod
+    def get_instance(cls) -> 'WakeWordModelManager':
+        """Get the process-wide manager.
+
+        Returns:
+            WakeWordModelManager: The singleton instance
+        """
+        if cls._instance is None:
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the process-wide manager and its sessions.
+
+        FOR TESTING ONLY.
+        """
+        with cls._init_lock:
+            if cls._instance is not None:
+                cls._instance.unload()
+            cls._instance = None
+
+    def resolve_paths(self, names: Sequence[str]) -> List[str]:
+        """Resolve model names to file paths (cached).
+
+        Args:
+            names: Model names, e.g. ["hey_jarvis"]
+
+        Returns:
+            Paths in the same order as names
+
+        Raises:
+            ImportError: If OpenWakeWord is not installed
+            RuntimeError: If a model cannot be found or downloaded
+        """
+        with self._lock:
+            return self._resolve_locked(names)
+
+    def _resolve_locked(self, names: Sequence[str]) -> List[str]:
+        """resolve_paths() body; caller holds the lock."""
+        missing = [name for name in names if name not in self._paths]
+        if missing:
+            self._paths.update(self._resolver(missing))
+        unresolved = [name for name in names if name not in self._paths]
+        if unresolved:
+            raise RuntimeError(f"Could not find wake word models: {unresolved}")
+        return [self._paths[name] for name in names]
+
+    def acquire(
+        self,
+        names: Sequence[str] = (DEFAULT_WAKE_MODEL,),
+        warmup: bool = True
+    ) -> SharedWakeWordModel:
+        """Get a handle on the session for ``names``, loading it if needed.
+
+        Args:
+            names: Model names served by the session
+            warmup: Run one silent chunk through a newly loaded session
+
+        Returns:
+            SharedWakeWordModel handle
+
+        Raises:
+            ImportError: If OpenWakeWord is not installed
+            RuntimeError: If a model cannot be found or downloaded
+        """
+        key = tuple(names)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._load_locked(key)
+                self._sessions[key] = session
+            if warmup and not session.warmed:
+                self._warmup(session)
+            session.metrics.acquisitions += 1
+        return SharedWakeWordModel(session, key)
+
+    def _load_locked(self, key: Tuple[str, ...]) -> _Session:
+        """Resolve and load a session; caller holds the lock."""
+        started = time.monotonic()
+        paths = self._resolve_locked(key)
+        resolved = time.monotonic()
+        model = self._loader(paths, self.inference_framework)
+        loaded = time.monotonic()
+
+        metrics = ModelLoadMetrics(
+            model_paths=paths,
+            resolve_ms=(resolved - started) * 1000.0,
+            load_ms=(loaded - resolved) * 1000.0,
+            loaded_at=time.time(),
+        )
+        _logger.info(
+            f"Wake word model loaded: {list(key)} "
+            f"(resolve {metrics.resolve_ms:.0f}ms, load {metrics.load_ms:.0f}ms)"
+        )
+        return _Session(model, metrics)
+
+    def _warmup(self, session: _Session) -> None:
+        """Run one silent chunk so the first real chunk is not slow."""
+        started = time.monotonic()
+        with session.lock:
+            session.model.predict(np.zeros(WARMUP_SAMPLES, dtype=np.int16))
+            session.model.reset()
+            session.owner = None
+        session.metrics.warmup_ms = (time.monotonic() - started) * 1000.0
+        session.warmed = True
+
+    def is_loaded(self, names: Sequence[str] = (DEFAULT_WAKE_MODEL,)) -> bool:
+        """Check whether a session for ``names`` is loaded."""
+        with self._lock:
+            return tuple(names) in self._sessions
+
+    def unload(self, names: Optional[Sequence[str]] = None) -> None:
+        """Drop loaded sessions (all if names is None).
+
+        Existing handles keep their session alive until released.
+
+        Args:
+            names: Model names of the session to drop
+        """
+        with self._lock:
+            if names is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(tuple(names), None)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get load-time metrics of every loaded session.
+
+        Returns:
+            Dictionary of comma-joined model names to metrics
+        """
+        with self._lock:
+            return {
+                ",".join(key): session.metrics.to_dict()
+                for key, session in self._sessions.items()
+            }
+
+
+def get_wake_word_model_manager() -> WakeWordModelManager:
+    """Get the process-wide wake word model manager.
+
+    Returns:
+        WakeWordModelManager singleton
+    """
+    return WakeWordModelManager.get_instance()
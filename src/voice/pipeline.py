@@ -8,14 +8,20 @@ Key Features:
     - VAD-gated detection: Only process audio when speech is detected
     - Multi-frame confirmation: Require 3/5 frames above threshold
     - EMA noise floor tracking: Adaptive thresholding based on ambient noise
-    - 48kHz→16kHz resampling: Proper conversion for OpenWakeWord
+    - 48kHz→16kHz resampling: Anti-aliased polyphase FIR for OpenWakeWord
     - Cooldown mechanism: Prevent rapid re-triggers
 
 Architecture:
     INMP441 (48kHz S32_LE stereo)
         ↓
+    CaptureSource thread (arecord / sounddevice / file replay
+                          → ChunkRing, drop-oldest, never blocks)
+        ↓
+    Inference thread:
     AudioPreprocessor (resample to 16kHz mono float32)
         ↓
+    FeatureExtractor (energy, ZCR, spectrum once per chunk)
+        ↓
     NoiseCalibrator (track ambient noise floor)
         ↓
     VAD Gate (filter non-speech)
@@ -42,7 +48,6 @@ Authors: OpenDuck Team
 from __future__ import annotations
 
 import logging
-import subprocess
 import threading
 import time
 from collections import deque
@@ -52,8 +57,26 @@ from typing import Callable, Deque, Dict, List, Optional, Any
 
 import numpy as np
 
-from src.voice.vad import VoiceActivityDetector, VADConfig, VADState, VADResult
-from src.voice.wake_word import WakeWordDetector, WakeWordConfig, WakeWordResult
+from src.drivers.audio.audio_capture import (
+    VADConfig,
+    VADResult,
+    VADState,
+    VoiceActivityDetector,
+)
+from src.drivers.audio.features import FeatureExtractor
+from src.drivers.audio.resampler import PolyphaseResampler
+from src.voice.capture import (
+    ArecordSource,
+    CaptureSource,
+    CapturedChunk,
+    ChunkRing,
+    SoundDeviceSource,
+)
+from src.voice.models import (
+    DEFAULT_WAKE_MODEL,
+    SharedWakeWordModel,
+    get_wake_word_model_manager,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -73,10 +96,13 @@ class PipelineConfig:
         chunk_ms: Audio chunk size in milliseconds (80 for OpenWakeWord)
         channels: Input channels (2 for stereo I2S)
         device: ALSA device string
+        capture_backend: Default capture source ("arecord" or "sounddevice")
 
         # Wake word settings
         wake_words: List of wake words to detect
         threshold: Detection threshold (0.82+ recommended)
+        wake_models: OpenWakeWord model names (["hey_jarvis"])
+        model_warmup: Pre-warm a newly loaded model with a silent chunk
 
         # Multi-frame confirmation
         confirm_window: Number of frames in confirmation window (5)
@@ -89,12 +115,28 @@ class PipelineConfig:
         # VAD settings
         vad_threshold_db: VAD energy threshold (-40.0)
         vad_min_speech_ms: Minimum speech duration (100)
+        vad_max_spectral_flatness: Reject flat (noise-like) spectra even
+            when loud; None disables the spectral test (None)
 
         # Cooldown
         cooldown_seconds: Seconds between detections (3.0)
 
         # Calibration
         calibration_seconds: Startup noise calibration duration (2.0)
+
+        # Preprocessing
+        fused_preprocessing: Fold S32 normalization into the resampler and
+            convert to int16 in a reused buffer (True), or use the original
+            float round trip (False)
+
+        # Capture/inference handoff
+        queue_chunks: Chunk slots between capture and inference (8 = 640ms
+            of slack before the oldest chunk is dropped)
+
+        # Timing
+        stream_clock: Time calibration, cooldown and detections by audio
+            stream position instead of the wall clock (offline replay)
+        latency_window: Recent samples kept per latency stage (256)
     """
     # Audio settings
     input_sample_rate: int = 48000
@@ -102,10 +144,13 @@ class PipelineConfig:
     chunk_ms: int = 80  # 80ms = 1280 samples at 16kHz (OpenWakeWord optimal)
     channels: int = 2
     device: str = "hw:1,0"
+    capture_backend: str = "arecord"
 
     # Wake word settings
     wake_words: List[str] = field(default_factory=lambda: ["hey openduck"])
     threshold: float = 0.82  # Higher threshold to reduce false positives
+    wake_models: List[str] = field(default_factory=lambda: [DEFAULT_WAKE_MODEL])
+    model_warmup: bool = True
 
     # Multi-frame confirmation
     confirm_window: int = 5
@@ -118,6 +163,7 @@ class PipelineConfig:
     # VAD settings
     vad_threshold_db: float = -40.0
     vad_min_speech_ms: int = 100
+    vad_max_spectral_flatness: Optional[float] = None
 
     # Cooldown
     cooldown_seconds: float = 3.0
@@ -125,6 +171,16 @@ class PipelineConfig:
     # Calibration
     calibration_seconds: float = 2.0
 
+    # Preprocessing
+    fused_preprocessing: bool = True
+
+    # Capture/inference handoff
+    queue_chunks: int = 8
+
+    # Timing
+    stream_clock: bool = False
+    latency_window: int = 256
+
     def __post_init__(self) -> None:
         """Validate configuration."""
         if not (0.0 < self.threshold <= 1.0):
@@ -136,6 +192,15 @@ class PipelineConfig:
             )
         if not (0.0 < self.score_ema_alpha <= 1.0):
             raise ValueError(f"score_ema_alpha must be in (0, 1], got {self.score_ema_alpha}")
+        if self.capture_backend not in ("arecord", "sounddevice"):
+            raise ValueError(
+                f"capture_backend must be 'arecord' or 'sounddevice', "
+                f"got {self.capture_backend!r}"
+            )
+        if self.queue_chunks < ChunkRing.MIN_SLOTS:
+            raise ValueError(
+                f"queue_chunks must be >= {ChunkRing.MIN_SLOTS}, got {self.queue_chunks}"
+            )
 
     @property
     def output_chunk_samples(self) -> int:
@@ -170,6 +235,8 @@ class DetectionResult:
         noise_floor: Current noise floor estimate
         vad_active: Whether VAD detected speech
         timestamp: Detection timestamp
+        capture_timestamp: Capture time of the chunk that confirmed the
+            detection (None if unknown)
     """
     detected: bool
     wake_word: Optional[str]
@@ -179,6 +246,14 @@ class DetectionResult:
     noise_floor: float
     vad_active: bool
     timestamp: float
+    capture_timestamp: Optional[float] = None
+
+    @property
+    def latency_ms(self) -> Optional[float]:
+        """Capture-to-detection latency in milliseconds."""
+        if self.capture_timestamp is None:
+            return None
+        return (self.timestamp - self.capture_timestamp) * 1000.0
 
     @staticmethod
     def not_detected() -> DetectionResult:
@@ -195,6 +270,72 @@ class DetectionResult:
         )
 
 
+# =============================================================================
+# Stage Metrics
+# =============================================================================
+
+class StageLatency:
+    """Rolling latency window for one pipeline stage.
+
+    Keeps the most recent samples in a bounded deque; percentiles are only
+    computed when statistics are requested, not on the audio path.
+
+    Attributes:
+        window: Number of recent samples kept
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        """Initialize latency window.
+
+        Args:
+            window: Number of recent samples kept
+        """
+        self.window = window
+        self._samples_ms: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._max_ms = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample.
+
+        Args:
+            seconds: Elapsed time in seconds
+        """
+        ms = seconds * 1000.0
+        self._samples_ms.append(ms)
+        self._count += 1
+        if ms > self._max_ms:
+            self._max_ms = ms
+
+    def summary(self) -> Dict[str, float]:
+        """Get latency summary.
+
+        Returns:
+            Dictionary with count, p50_ms, p95_ms, p99_ms (over the recent
+            window) and max_ms (since reset)
+        """
+        if not self._samples_ms:
+            return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        p50, p95, p99 = np.percentile(np.fromiter(self._samples_ms, dtype=np.float64), [50, 95, 99])
+        return {
+            'count': self._count,
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'p99_ms': float(p99),
+            'max_ms': self._max_ms,
+        }
+
+    def samples_ms(self) -> List[float]:
+        """Get the recent samples in milliseconds (oldest first)."""
+        return list(self._samples_ms)
+
+    def reset(self) -> None:
+        """Clear all samples."""
+        self._samples_ms.clear()
+        self._count = 0
+        self._max_ms = 0.0
+
+
 # =============================================================================
 # Audio Preprocessor
 # =============================================================================
@@ -205,10 +346,20 @@ class AudioPreprocessor:
     Handles:
         - Stereo to mono conversion (left channel extraction)
         - S32_LE to float32 normalization
-        - 48kHz to 16kHz resampling (linear interpolation)
-
-    Note: Uses simple linear interpolation for resampling. For higher quality,
-    consider scipy.signal.resample_poly, but it adds ~50ms latency.
+        - 48kHz to 16kHz resampling (streaming polyphase FIR)
+        - float32 to int16 conversion for OpenWakeWord
+
+    Fused mode (config.fused_preprocessing, default):
+        The left channel is read as a strided int32 view of the raw bytes and
+        converted to float32 while being copied into the resampler, with the
+        1/2**31 normalization folded into the filter taps. That is one pass
+        over the 48kHz input; everything after runs on 16kHz output in reused
+        buffers, and to_int16() clips and casts into a reused int16 buffer.
+        Integer input cannot produce NaN/Inf, so no scan is needed.
+
+    The resampler carries filter state between calls, so process() must be
+    fed one continuous stream; call reset() after a gap or restart. Output
+    arrays are views into reused buffers, valid until the next call.
     """
 
     def __init__(self, config: PipelineConfig) -> None:
@@ -219,25 +370,48 @@ class AudioPreprocessor:
         """
         self.config = config
         self._resample_ratio = config.input_sample_rate / config.output_sample_rate
+        self._fused = config.fused_preprocessing
+        self._resampler = PolyphaseResampler(
+            config.input_sample_rate,
+            config.output_sample_rate,
+            max_chunk=max(config.input_chunk_samples, 4096),
+            gain=1.0 / 2147483648.0 if self._fused else 1.0,
+        )
+
+        # Reused buffers for int16 conversion
+        max_output = self._resampler.output_length(self._resampler.max_chunk) + 2
+        self._clip_buf = np.empty(max_output, dtype=np.float32)
+        self._int16_buf = np.empty(max_output, dtype=np.int16)
         _logger.info(
             f"AudioPreprocessor: {config.input_sample_rate}Hz → "
-            f"{config.output_sample_rate}Hz (ratio: {self._resample_ratio:.2f})"
+            f"{config.output_sample_rate}Hz (ratio: {self._resample_ratio:.2f}, "
+            f"{self._resampler.num_taps}-tap polyphase FIR)"
         )
 
+    def reset(self) -> None:
+        """Clear resampler history (start of a new stream)."""
+        self._resampler.reset()
+
     def process(self, raw_audio: bytes) -> np.ndarray:
         """Process raw audio bytes to normalized float32 at 16kHz.
 
         Args:
-            raw_audio: Raw bytes from arecord (S32_LE stereo)
+            raw_audio: Raw bytes from arecord (S32_LE stereo). Any bytes-like
+                object works; a memoryview from PipeChunkReader is wrapped
+                as a NumPy view without copying
 
         Returns:
             Normalized float32 array at 16kHz mono
         """
-        # Parse S32_LE stereo
+        # Parse S32_LE interleaved frames
         samples = np.frombuffer(raw_audio, dtype=np.int32)
 
-        # Extract left channel (INMP441 data is on left)
-        left_channel = samples[0::2]
+        # Left channel (INMP441 data is on left), as a strided view
+        left_channel = samples[0::self.config.channels]
+
+        if self._fused:
+            # Strided int32 view straight into the resampler (scale in taps)
+            return self._resample(left_channel)
 
         # Normalize to float32 [-1, 1]
         # S32_LE uses full 32-bit range
@@ -248,9 +422,7 @@ class AudioPreprocessor:
             _logger.warning("Audio contains NaN/Inf, replacing with zeros")
             audio_float = np.nan_to_num(audio_float, nan=0.0, posinf=0.0, neginf=0.0)
 
-        # Resample 48kHz → 16kHz using simple decimation
-        # For 3:1 ratio, we take every 3rd sample (with anti-aliasing)
-        # Note: Linear interpolation is faster but lower quality
+        # Resample 48kHz → 16kHz (anti-aliased, stateful across chunks)
         resampled = self._resample(audio_float)
 
         return resampled
@@ -258,32 +430,25 @@ class AudioPreprocessor:
     def _resample(self, audio: np.ndarray) -> np.ndarray:
         """Resample audio from input_sample_rate to output_sample_rate.
 
-        Uses simple decimation with averaging for anti-aliasing.
-        This is faster than scipy.signal.resample but slightly lower quality.
+        Uses a streaming polyphase FIR (see src.drivers.audio.resampler):
+        taps are designed once per ratio and filter history is carried across
+        chunks, so consecutive chunks join without boundary artifacts.
 
         Args:
             audio: Input audio at input_sample_rate
 
         Returns:
-            Resampled audio at output_sample_rate
+            Resampled audio at output_sample_rate (view into a reused buffer)
         """
-        ratio = int(self._resample_ratio)
+        max_chunk = self._resampler.max_chunk
+        if len(audio) <= max_chunk:
+            return self._resampler.process(audio)
 
-        if ratio == 3:  # 48kHz → 16kHz (common case)
-            # Simple 3:1 decimation with averaging
-            # Truncate to multiple of 3
-            n_output = len(audio) // ratio
-            truncated = audio[:n_output * ratio]
-
-            # Average every 3 samples (simple anti-aliasing)
-            reshaped = truncated.reshape(-1, ratio)
-            return reshaped.mean(axis=1).astype(np.float32)
-        else:
-            # General case: linear interpolation
-            n_output = int(len(audio) / self._resample_ratio)
-            x_old = np.arange(len(audio))
-            x_new = np.linspace(0, len(audio) - 1, n_output)
-            return np.interp(x_new, x_old, audio).astype(np.float32)
+        # Oversized input: resample in slices (allocates, not the hot path)
+        return np.concatenate([
+            self._resampler.process(audio[i:i + max_chunk]).copy()
+            for i in range(0, len(audio), max_chunk)
+        ])
 
     def process_int16(self, raw_audio: bytes) -> np.ndarray:
         """Process and return as int16 for OpenWakeWord.
@@ -297,9 +462,29 @@ class AudioPreprocessor:
         Returns:
             int16 array at 16kHz mono
         """
-        audio_float = self.process(raw_audio)
-        # Convert to int16 (OpenWakeWord expects this)
-        return (audio_float * 32767).astype(np.int16)
+        return self.to_int16(self.process(raw_audio))
+
+    def to_int16(self, audio_float: np.ndarray) -> np.ndarray:
+        """Convert processed float32 audio to int16 for OpenWakeWord.
+
+        In fused mode this clips (FIR overshoot must not wrap) and casts into
+        a reused buffer, two passes over the 16kHz chunk with no allocation.
+
+        Args:
+            audio_float: Normalized float32 audio from process()
+
+        Returns:
+            int16 array (view into a reused buffer in fused mode)
+        """
+        n = len(audio_float)
+        if not self._fused or n > len(self._int16_buf):
+            return (audio_float * 32767).astype(np.int16)
+
+        clipped = self._clip_buf[:n]
+        np.clip(audio_float, -1.0, 1.0, out=clipped)
+        out = self._int16_buf[:n]
+        np.multiply(clipped, 32767, out=out, casting='unsafe')
+        return out
 
 
 # =============================================================================
@@ -440,15 +625,21 @@ class MultiFrameConfirmer:
     This dramatically reduces false positives from single-frame spikes.
     """
 
-    def __init__(self, config: PipelineConfig) -> None:
+    def __init__(
+        self,
+        config: PipelineConfig,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
         """Initialize confirmer.
 
         Args:
             config: Pipeline configuration
+            clock: Time source for the cooldown (seconds)
         """
         self.config = config
+        self._clock = clock
         self._window: Deque[float] = deque(maxlen=config.confirm_window)
-        self._last_detection_time: float = 0.0
+        self._last_detection_time: Optional[float] = None
 
         _logger.info(
             f"MultiFrameConfirmer: {config.confirm_required}/"
@@ -486,18 +677,20 @@ class MultiFrameConfirmer:
         Returns:
             True if cooldown period hasn't elapsed
         """
-        elapsed = time.monotonic() - self._last_detection_time
+        if self._last_detection_time is None:
+            return False
+        elapsed = self._clock() - self._last_detection_time
         return elapsed < self.config.cooldown_seconds
 
     def record_detection(self) -> None:
         """Record that a detection occurred (starts cooldown)."""
-        self._last_detection_time = time.monotonic()
+        self._last_detection_time = self._clock()
         self._window.clear()
 
     def reset(self) -> None:
         """Reset confirmer state."""
         self._window.clear()
-        self._last_detection_time = 0.0
+        self._last_detection_time = None
 
 
 # =============================================================================
@@ -522,11 +715,26 @@ class WakeWordPipeline:
         on_state_change: Callback for state changes
     """
 
-    def __init__(self, config: Optional[PipelineConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        source: Optional[CaptureSource] = None,
+        detector: Optional[Any] = None
+    ) -> None:
         """Initialize the pipeline.
 
         Args:
             config: Pipeline configuration (uses defaults if None)
+            source: Audio source (defaults to config.capture_backend on
+                config.device). Must deliver input_sample_rate S32_LE
+                frames with config.channels channels.
+            detector: Wake word model with OpenWakeWord's interface
+                (predict(int16) -> {name: score}, reset()). If None, the
+                shared session from the process-wide model manager is
+                acquired on the first start() and kept across restarts.
+
+        Raises:
+            ValueError: If the source format does not match the config
         """
         self.config = config or PipelineConfig()
         self._state = PipelineState.IDLE
@@ -534,29 +742,57 @@ class WakeWordPipeline:
         # Components
         self._preprocessor = AudioPreprocessor(self.config)
         self._calibrator = NoiseCalibrator(self.config)
-        self._confirmer = MultiFrameConfirmer(self.config)
+        self._stream_time = 0.0
+        self._confirmer = MultiFrameConfirmer(self.config, clock=self._now)
 
         # VAD
         vad_config = VADConfig(
             sample_rate=self.config.output_sample_rate,
             energy_threshold_db=self.config.vad_threshold_db,
-            min_speech_ms=self.config.vad_min_speech_ms
+            min_speech_ms=self.config.vad_min_speech_ms,
+            max_spectral_flatness=self.config.vad_max_spectral_flatness,
         )
-        self._vad = VoiceActivityDetector(vad_config)
+        self._vad = VoiceActivityDetector.from_config(vad_config)
 
-        # Wake word detector (OpenWakeWord)
-        wake_config = WakeWordConfig(
-            wake_words=self.config.wake_words,
-            sensitivity=0.5,  # We use our own thresholding
-            sample_rate=self.config.output_sample_rate,
-            backend="openwakeword"
+        # Per-chunk features, shared by VAD and noise calibration
+        self._features = FeatureExtractor(
+            self.config.output_sample_rate,
+            spectral=self.config.vad_max_spectral_flatness is not None,
         )
-        self._wake_detector: Optional[Any] = None  # Lazy init
 
-        # Audio capture process
-        self._audio_process: Optional[subprocess.Popen] = None
+        # Wake word detector (OpenWakeWord, lazy init unless injected)
+        self._wake_detector: Optional[Any] = detector
+        self._detector_injected = detector is not None
+
+        # Audio capture source
+        self._source = source or self._create_source()
+        if (self._source.sample_rate != self.config.input_sample_rate
+                or self._source.channels != self.config.channels
+                or self._source.chunk_frames != self.config.input_chunk_samples):
+            raise ValueError(
+                f"Capture source format {self._source.sample_rate}Hz x "
+                f"{self._source.channels}ch / {self._source.chunk_frames} frames "
+                f"does not match pipeline config"
+            )
         self._running = False
+
+        # Capture → inference handoff (capture never blocks on inference)
+        self._ring = ChunkRing(self.config.queue_chunks, self._source.chunk_bytes)
+        self._capture_thread: Optional[threading.Thread] = None
         self._audio_thread: Optional[threading.Thread] = None
+        self._expected_sequence = 0
+        self._chunk_capture_time: Optional[float] = None
+
+        # Per-stage latency (queue wait, processing stages, end to end)
+        window = self.config.latency_window
+        self._latency = {
+            'queue_wait': StageLatency(window),
+            'preprocess': StageLatency(window),
+            'vad': StageLatency(window),
+            'wake_word': StageLatency(window),
+            'process': StageLatency(window),
+            'end_to_end': StageLatency(window),
+        }
 
         # Callbacks
         self.on_wake_word: Optional[Callable[[DetectionResult], None]] = None
@@ -568,16 +804,49 @@ class WakeWordPipeline:
             'vad_speech_frames': 0,
             'detections': 0,
             'false_positives_blocked': 0,
-            'cooldowns_triggered': 0
+            'cooldowns_triggered': 0,
+            'sequence_gaps': 0
         }
 
         _logger.info(f"WakeWordPipeline initialized: {self.config.wake_words}")
 
+    def _create_source(self) -> CaptureSource:
+        """Create the default capture source for config.capture_backend."""
+        if self.config.capture_backend == "sounddevice":
+            return SoundDeviceSource(
+                device=self.config.device,
+                sample_rate=self.config.input_sample_rate,
+                channels=self.config.channels,
+                chunk_frames=self.config.input_chunk_samples,
+            )
+        return ArecordSource(
+            device=self.config.device,
+            sample_rate=self.config.input_sample_rate,
+            channels=self.config.channels,
+            chunk_frames=self.config.input_chunk_samples,
+        )
+
     @property
     def state(self) -> PipelineState:
         """Get current pipeline state."""
         return self._state
 
+    @property
+    def source(self) -> CaptureSource:
+        """Get the audio capture source."""
+        return self._source
+
+    @property
+    def stream_time(self) -> float:
+        """Audio stream position in seconds (end of the last chunk)."""
+        return self._stream_time
+
+    def _now(self) -> float:
+        """Pipeline clock: stream position or time.monotonic()."""
+        if self.config.stream_clock:
+            return self._stream_time
+        return time.monotonic()
+
     @property
     def is_running(self) -> bool:
         """Check if pipeline is running."""
@@ -609,12 +878,18 @@ class WakeWordPipeline:
         _logger.info("Starting WakeWordPipeline...")
 
         # Initialize wake word detector (lazy init for better error handling)
-        self._init_wake_detector()
-
-        # Start audio capture
-        self._start_audio_capture()
-
-        # Start processing thread
+        if not self._detector_injected:
+            self._init_wake_detector()
+            self._wake_detector.reset()  # Fresh stream, no stale model buffers
+
+        # Start audio capture (fresh stream, no stale filter history)
+        self._preprocessor.reset()
+        self._ring.clear()
+        self._expected_sequence = 0
+        self._stream_time = 0.0
+        self._source.open()
+
+        # Start inference thread, then capture thread
         self._running = True
         self._set_state(PipelineState.CALIBRATING)
 
@@ -625,6 +900,13 @@ class WakeWordPipeline:
         )
         self._audio_thread.start()
 
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            name="WakeWordPipeline-Capture",
+            daemon=True
+        )
+        self._capture_thread.start()
+
         _logger.info("WakeWordPipeline started")
 
     def stop(self) -> None:
@@ -638,20 +920,50 @@ class WakeWordPipeline:
         _logger.info("Stopping WakeWordPipeline...")
         self._running = False
 
-        # Stop audio capture
-        if self._audio_process:
-            self._audio_process.terminate()
-            self._audio_process.wait(timeout=2)
-            self._audio_process = None
+        # Stop audio capture (capture thread returns and closes the ring)
+        self._source.stop()
+        if self._capture_thread:
+            self._capture_thread.join(timeout=2)
+            self._capture_thread = None
+        self._ring.close()
 
         # Wait for audio thread
         if self._audio_thread:
             self._audio_thread.join(timeout=2)
             self._audio_thread = None
 
+        self._source.close()
+
         self._set_state(PipelineState.IDLE)
         _logger.info("WakeWordPipeline stopped")
 
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a finite source (e.g. file replay) to be fully processed.
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            True if capture and inference have both finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in (self._capture_thread, self._audio_thread):
+            if thread is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+            if thread.is_alive():
+                return False
+        return True
+
+    def get_latency_samples(self) -> Dict[str, List[float]]:
+        """Get recent raw latency samples per stage (milliseconds).
+
+        Returns:
+            Dictionary of stage name to samples, oldest first
+        """
+        return {stage: window.samples_ms() for stage, window in self._latency.items()}
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get pipeline statistics.
 
@@ -659,44 +971,37 @@ class WakeWordPipeline:
             Dictionary with processing statistics
         """
         stats = self._stats.copy()
+        capture = self._source.get_statistics()
+        stats['short_reads'] = capture['short_reads']
+        stats['dropped_bytes'] = capture['dropped_bytes']
+        stats['capture'] = capture
+        stats['queue'] = self._ring.get_statistics()
+        stats['latency'] = {
+            stage: window.summary() for stage, window in self._latency.items()
+        }
         stats['state'] = self._state.name
         stats['noise_floor_db'] = self._calibrator.noise_floor_db
         stats['is_calibrated'] = self._calibrator.is_calibrated
         stats['vad_stats'] = self._vad.get_statistics()
+        if isinstance(self._wake_detector, SharedWakeWordModel):
+            stats['model'] = self._wake_detector.metrics.to_dict()
         return stats
 
     def _init_wake_detector(self) -> None:
-        """Initialize OpenWakeWord detector."""
-        try:
-            import openwakeword
-            from openwakeword.model import Model
-
-            # Get hey_jarvis model path
-            model_paths = openwakeword.get_pretrained_model_paths()
-            hey_jarvis_path = None
-
-            for path in model_paths:
-                if 'hey_jarvis' in path.lower():
-                    hey_jarvis_path = path
-                    break
-
-            if hey_jarvis_path is None:
-                _logger.warning("hey_jarvis model not found, downloading...")
-                openwakeword.utils.download_models(['hey_jarvis'])
-                model_paths = openwakeword.get_pretrained_model_paths()
-                for path in model_paths:
-                    if 'hey_jarvis' in path.lower():
-                        hey_jarvis_path = path
-                        break
+        """Acquire the shared OpenWakeWord session (loaded once per process)."""
+        if self._wake_detector is not None:
+            return  # Session survives stop()/start()
 
-            if hey_jarvis_path:
-                self._wake_detector = Model(
-                    wakeword_model_paths=[hey_jarvis_path],
-                    inference_framework="onnx"
-                )
-                _logger.info(f"OpenWakeWord initialized: {hey_jarvis_path}")
-            else:
-                raise RuntimeError("Could not find hey_jarvis model")
+        try:
+            self._wake_detector = get_wake_word_model_manager().acquire(
+                self.config.wake_models,
+                warmup=self.config.model_warmup,
+            )
+            metrics = self._wake_detector.metrics
+            _logger.info(
+                f"OpenWakeWord ready: {metrics.model_paths} "
+                f"(cold start {metrics.cold_start_ms:.0f}ms)"
+            )
 
         except ImportError:
             _logger.error("OpenWakeWord not installed")
@@ -708,78 +1013,108 @@ class WakeWordPipeline:
             _logger.error(f"Failed to initialize OpenWakeWord: {e}")
             raise
 
-    def _start_audio_capture(self) -> None:
-        """Start audio capture subprocess."""
-        cmd = [
-            "arecord",
-            "-D", self.config.device,
-            "-f", "S32_LE",
-            "-r", str(self.config.input_sample_rate),
-            "-c", str(self.config.channels),
-            "-t", "raw",
-            "--buffer-size", "8192"  # Larger buffer for stability
-        ]
-
-        _logger.debug(f"Starting audio capture: {' '.join(cmd)}")
-
-        self._audio_process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL
+    def _capture_loop(self) -> None:
+        """Capture stage: run the source's producer loop into the ring.
+
+        Live sources never wait on the ring: if inference falls behind,
+        acquire_write() drops the oldest queued chunk, so the device is
+        always drained at the capture rate.
+        """
+        _logger.info(
+            f"Capture loop started: source={self._source.name}, "
+            f"chunk_bytes={self._source.chunk_bytes}"
         )
 
-        if self._audio_process.poll() is not None:
-            raise RuntimeError("Failed to start audio capture")
+        try:
+            self._source.run(self._ring)
+        except Exception as e:
+            _logger.error(f"Capture loop error: {e}")
+            self._set_state(PipelineState.ERROR)
+        finally:
+            self._ring.close()
 
-        _logger.info("Audio capture started")
+        _logger.info("Capture loop ended")
 
     def _audio_loop(self) -> None:
-        """Main audio processing loop."""
-        # Calculate chunk size in bytes
-        # S32_LE stereo = 4 bytes/sample * 2 channels = 8 bytes/frame
-        bytes_per_frame = 4 * self.config.channels
-        chunk_samples = self.config.input_chunk_samples
-        chunk_bytes = chunk_samples * bytes_per_frame
+        """Inference stage: process chunks from the ring.
 
-        calibration_start = time.monotonic()
+        Runs preprocessing, VAD, wake word inference and state handling on
+        chunks queued by the capture stage, recording per-stage latency
+        against each chunk's capture timestamp.
+        """
+        calibration_start = self._now()
 
-        _logger.info(f"Audio loop started: chunk_bytes={chunk_bytes}")
+        _logger.info("Audio loop started")
 
         try:
-            while self._running and self._audio_process:
-                # Read audio chunk
-                raw_audio = self._audio_process.stdout.read(chunk_bytes)
-
-                if len(raw_audio) < chunk_bytes:
-                    _logger.warning(f"Short read: {len(raw_audio)}/{chunk_bytes}")
+            while self._running or self._ring.depth:
+                chunk = self._ring.get(timeout=0.1)
+                if chunk is None:
+                    if self._ring.closed:
+                        break
                     continue
 
-                # Process audio
-                audio_16k = self._preprocessor.process(raw_audio)
-
-                # Run VAD
-                vad_result = self._vad.process_frame(audio_16k)
-
-                # Handle state
-                if self._state == PipelineState.CALIBRATING:
-                    self._handle_calibration(
-                        vad_result, calibration_start
-                    )
-                elif self._state == PipelineState.LISTENING:
-                    self._handle_listening(audio_16k, vad_result)
-                elif self._state == PipelineState.COOLDOWN:
-                    self._handle_cooldown()
-
-                self._stats['frames_processed'] += 1
+                try:
+                    self._process_chunk(chunk, calibration_start)
+                finally:
+                    self._ring.release(chunk)
 
         except Exception as e:
             _logger.error(f"Audio loop error: {e}")
             import traceback
             traceback.print_exc()
             self._set_state(PipelineState.ERROR)
+            # Unblock a capture source waiting for free slots (lossless replay)
+            self._ring.close()
 
         _logger.info("Audio loop ended")
 
+    def _process_chunk(self, chunk: CapturedChunk, calibration_start: float) -> None:
+        """Run one captured chunk through the inference stages.
+
+        Args:
+            chunk: Chunk from the capture ring
+            calibration_start: Monotonic time calibration began
+        """
+        started = time.monotonic()
+        self._latency['queue_wait'].record(started - chunk.capture_time)
+
+        # Dropped chunks break stream continuity: restart the filter
+        if chunk.sequence != self._expected_sequence:
+            self._stats['sequence_gaps'] += 1
+            self._preprocessor.reset()
+        self._expected_sequence = chunk.sequence + 1
+        self._stream_time = (chunk.sequence + 1) * self.config.chunk_ms / 1000.0
+        self._chunk_capture_time = (
+            self._stream_time if self.config.stream_clock else chunk.capture_time
+        )
+
+        # Process audio (NumPy view over the ring slot, no copy)
+        audio_16k = self._preprocessor.process(chunk.data)
+        preprocessed = time.monotonic()
+        self._latency['preprocess'].record(preprocessed - started)
+
+        # Features once per chunk, then VAD (energy reaches the calibrator
+        # through vad_result)
+        features = self._features.extract(audio_16k)
+        vad_result = self._vad.process_frame(audio_16k, features)
+        self._latency['vad'].record(time.monotonic() - preprocessed)
+
+        # Handle state
+        if self._state == PipelineState.CALIBRATING:
+            self._handle_calibration(
+                vad_result, calibration_start
+            )
+        elif self._state == PipelineState.LISTENING:
+            self._handle_listening(audio_16k, vad_result)
+        elif self._state == PipelineState.COOLDOWN:
+            self._handle_cooldown()
+
+        self._stats['frames_processed'] += 1
+        finished = time.monotonic()
+        self._latency['process'].record(finished - started)
+        self._latency['end_to_end'].record(finished - chunk.capture_time)
+
     def _handle_calibration(
         self,
         vad_result: VADResult,
@@ -789,7 +1124,7 @@ class WakeWordPipeline:
 
         Collects noise samples for the configured duration.
         """
-        elapsed = time.monotonic() - start_time
+        elapsed = self._now() - start_time
 
         # Collect noise samples
         self._calibrator.add_calibration_sample(vad_result.energy_db)
@@ -872,11 +1207,13 @@ class WakeWordPipeline:
             return 0.0
 
         try:
-            # Convert to int16 for OpenWakeWord
-            audio_int16 = (audio_16k * 32767).astype(np.int16)
+            # Convert to int16 for OpenWakeWord (reused buffer in fused mode)
+            audio_int16 = self._preprocessor.to_int16(audio_16k)
 
             # Run prediction
+            started = time.monotonic()
             prediction = self._wake_detector.predict(audio_int16)
+            self._latency['wake_word'].record(time.monotonic() - started)
 
             # Get max score across models
             max_score = 0.0
@@ -924,7 +1261,8 @@ class WakeWordPipeline:
             confirm_count=confirm_count,
             noise_floor=self._calibrator.noise_floor_db,
             vad_active=True,
-            timestamp=time.monotonic()
+            timestamp=self._now(),
+            capture_timestamp=self._chunk_capture_time
         )
 
         # Fire callback
@@ -943,9 +1281,14 @@ class WakeWordPipeline:
 
         Clears all internal state and statistics.
         """
+        self._preprocessor.reset()
         self._calibrator.reset()
         self._confirmer.reset()
         self._vad.reset()
+        self._source.reset_statistics()
+        self._ring.reset_statistics()
+        for window in self._latency.values():
+            window.reset()
 
         if self._wake_detector:
             self._wake_detector.reset()
@@ -955,7 +1298,8 @@ class WakeWordPipeline:
             'vad_speech_frames': 0,
             'detections': 0,
             'false_positives_blocked': 0,
-            'cooldowns_triggered': 0
+            'cooldowns_triggered': 0,
+            'sequence_gaps': 0
         }
 
         _logger.info("Pipeline reset")
@@ -0,0 +1,34 @@
+"""Voice Activity Detection for the Wake Word Pipeline
+
+The wake word pipeline uses the capture driver's VoiceActivityDetector
+(src.drivers.audio.audio_capture). Its process_frame() state machine counts
+onset and hangover in audio time, so results are identical whether audio
+arrives live or is replayed faster than real time. This module re-exports
+it under the voice package.
+
+Example:
+    ```python
+    from src.voice.vad import VoiceActivityDetector, VADConfig
+
+    vad = VoiceActivityDetector.from_config(VADConfig(energy_threshold_db=-35))
+    result = vad.process_frame(audio_16k)   # float32 [-1, 1]
+    if result.is_speech:
+        run_wake_word(audio_16k)
+    ```
+"""
+
+from src.drivers.audio.audio_capture import (
+    VADConfig,
+    VADEvent,
+    VADResult,
+    VADState,
+    VoiceActivityDetector,
+)
+
+__all__ = [
+    'VADConfig',
+    'VADEvent',
+    'VADResult',
+    'VADState',
+    'VoiceActivityDetector',
+]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Control Loop Deadline Jitter Benchmark
+
+Runs Robot.run_control_loop() with mocked hardware and measures how well
+the absolute-deadline scheduler holds its phase:
+
+- Wake-up jitter (actual wake - deadline), from Robot.get_timing_stats()
+- Drift: where the deadline grid ends up after N ticks vs where it started
+
+The median wake-up error measures the scheduler itself (sleep + spin
+tail). The tail (p99/max) is dominated by host preemption, so it is only
+enforced when a budget is given, e.g. on the Pi with an idle system.
+
+Measured at the production rate (50Hz) and at 100Hz.
+
+Performance Targets:
+- p50 wake-up jitter: <0.2ms
+- p99 wake-up jitter: <1ms on target hardware (opt-in)
+- Grid drift over the run: <1ms (skipped ticks included)
+
+Configuration (environment variables):
+    OPENDUCK_LOOP_JITTER_P50_MS    p50 jitter budget in ms (default: 0.2)
+    OPENDUCK_LOOP_JITTER_P99_MS    p99 jitter budget in ms (default: unset,
+                                   report only)
+    OPENDUCK_LOOP_SECONDS          seconds per rate (default: 3.0)
+
+Run with:
+    pytest tests/performance/test_control_loop_jitter.py -v -s
+"""
+
+import os
+import time
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.robot import Robot
+
+
+# =============================================================================
+# BENCHMARK CONFIGURATION
+# =============================================================================
+
+JITTER_P50_BUDGET_MS = float(os.environ.get("OPENDUCK_LOOP_JITTER_P50_MS", "0.2"))
+_P99_ENV = os.environ.get("OPENDUCK_LOOP_JITTER_P99_MS")
+JITTER_P99_BUDGET_MS: Optional[float] = float(_P99_ENV) if _P99_ENV else None
+GRID_DRIFT_BUDGET_MS = 1.0
+RUN_SECONDS = float(os.environ.get("OPENDUCK_LOOP_SECONDS", "3.0"))
+
+
+class _BenchGPIO:
+    """Minimal RPi.GPIO stand-in (button never pressed)."""
+
+    BCM = 11
+    IN = 1
+    PUD_UP = 22
+    FALLING = 32
+
+    def setmode(self, mode): pass
+    def setup(self, pin, direction, pull_up_down=None): pass
+    def input(self, pin): return 1
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=None): pass
+    def remove_event_detect(self, pin): pass
+    def cleanup(self, pin=None): pass
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+@pytest.mark.parametrize("hz", [50, 100])
+def test_control_loop_phase_stability(hz: int) -> None:
+    """Loop keeps its deadline grid with low wake-up jitter."""
+    robot = Robot(
+        servo_driver=Mock(),
+        gpio_provider=_BenchGPIO(),
+        enable_hardware=False,
+        control_loop_hz=hz,
+        watchdog_timeout_ms=60000,
+        imu_sample_hz=None,
+    )
+    robot.start()
+    iterations = int(RUN_SECONDS * hz)
+    period_s = 1.0 / hz
+
+    start = time.perf_counter()
+    robot.run_control_loop(max_iterations=iterations)
+    elapsed = time.perf_counter() - start
+    stats = robot.get_timing_stats()
+    robot.stop()
+
+    jitter = stats["jitter"]
+    ticks = iterations + stats["skipped_ticks"]
+    # First deadline is one period after the first step started (~start)
+    drift_ms = (robot._next_deadline - start - (ticks + 1) * period_s) * 1000
+    print(f"\n{hz}Hz x {iterations}: elapsed {elapsed:.3f}s, grid drift {drift_ms:+.3f}ms, "
+          f"jitter p50 {jitter['p50_ms']:.3f}ms p90 {jitter['p90_ms']:.3f}ms "
+          f"p99 {jitter['p99_ms']:.3f}ms max {jitter['max_ms']:.3f}ms, "
+          f"overruns {stats['overrun']['total']}, skipped {stats['skipped_ticks']}")
+
+    assert jitter["p50_ms"] < JITTER_P50_BUDGET_MS
+    if JITTER_P99_BUDGET_MS is not None:
+        assert jitter["p99_ms"] < JITTER_P99_BUDGET_MS
+    assert abs(drift_ms) < GRID_DRIFT_BUDGET_MS
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Emergency Stop End-to-End Latency Benchmark
+
+Measures the full shutdown path of the safety stack - from the moment a
+trigger is requested to the moment every active PWM channel has been
+written to zero - while the rest of the firmware is busy:
+
+- LED thread rendering eye frames at 50Hz
+- HeadController animation thread streaming pan/tilt writes at 50Hz
+- Audio loop running ring buffer + VAD on 80ms chunks
+- Control loop feeding the SafetyCoordinator watchdog at 50Hz
+
+Paths benchmarked:
+- PCA9685Driver.disable_all()
+- EmergencyStop.trigger()
+- SafetyCoordinator.trigger_estop()
+- HeadEmergencyStop.trigger() (wired to HeadController.emergency_stop)
+
+The real safety classes and the real PCA9685Driver are used. Only the
+hardware edges are replaced: GPIO with a mock provider, and the Adafruit
+PCA9685 object with a tracing backend that timestamps every channel write
+and simulates I2C transaction time.
+
+Every trial must complete with all active channels disabled. The latency
+tail is dominated by host scheduling, so the p99 budget is only enforced
+when one is given, e.g. on the Pi with an idle system.
+
+Performance Targets:
+- p99 trigger -> all channels disabled: <5ms on target hardware (opt-in)
+
+Configuration (environment variables):
+    OPENDUCK_ESTOP_P99_BUDGET_MS   p99 budget in ms (default: unset,
+                                   report only)
+    OPENDUCK_ESTOP_TRIALS          trials per path (default: 200)
+    OPENDUCK_ESTOP_TRACE           optional path to write a JSON trace
+
+Run with:
+    pytest tests/performance/test_estop_latency.py -v -s
+    OPENDUCK_ESTOP_P99_BUDGET_MS=5 pytest tests/performance/test_estop_latency.py
+    OPENDUCK_ESTOP_TRACE=estop_trace.json pytest tests/performance/test_estop_latency.py
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+
+# =============================================================================
+# BENCHMARK CONFIGURATION
+# =============================================================================
+
+_P99_ENV = os.environ.get("OPENDUCK_ESTOP_P99_BUDGET_MS")
+P99_BUDGET_MS: Optional[float] = float(_P99_ENV) if _P99_ENV else None
+TRIALS_PER_PATH = int(os.environ.get("OPENDUCK_ESTOP_TRIALS", "200"))
+TRACE_PATH = os.environ.get("OPENDUCK_ESTOP_TRACE")
+
+# Simulated I2C time for one PCA9685 register write (~4 bytes at 400kHz)
+I2C_WRITE_TIME_S = 0.0001
+
+NUM_CHANNELS = 16
+HEAD_PAN_CHANNEL = 12
+HEAD_TILT_CHANNEL = 13
+
+
+# =============================================================================
+# HARDWARE DOUBLES
+# =============================================================================
+
+class _BenchGPIO:
+    """Minimal RPi.GPIO stand-in (button never pressed)."""
+
+    BCM = 11
+    IN = 1
+    PUD_UP = 22
+    FALLING = 32
+
+    def setmode(self, mode): pass
+    def setup(self, pin, direction, pull_up_down=None): pass
+    def input(self, pin): return 1
+    def add_event_detect(self, pin, edge, callback=None, bouncetime=0): pass
+    def remove_event_detect(self, pin): pass
+    def cleanup(self, pin=None): pass
+
+
+class _TracingChannel:
+    """PWM channel that timestamps the first zero write after arming."""
+
+    def __init__(self, owner: "_TracingPCA", index: int) -> None:
+        self._owner = owner
+        self._index = index
+        self._duty = 0
+
+    @property
+    def duty_cycle(self) -> int:
+        return self._duty
+
+    @duty_cycle.setter
+    def duty_cycle(self, value: int) -> None:
+        # Real I2C writes block in an ioctl with the GIL released
+        time.sleep(I2C_WRITE_TIME_S)
+        self._duty = value
+        if value == 0:
+            self._owner.mark_disabled(self._index)
+
+
+class _TracingPCA:
+    """Adafruit PCA9685 stand-in that records when channels go dark."""
+
+    def __init__(self, i2c_bus: Any = None, address: int = 0x40) -> None:
+        self.address = address
+        self.frequency = 50
+        self.channels = [_TracingChannel(self, i) for i in range(NUM_CHANNELS)]
+        self._trace_lock = threading.Lock()
+        self._disabled_at: List[Optional[float]] = [None] * NUM_CHANNELS
+        self.sleep_calls = 0
+
+    def arm(self) -> List[int]:
+        """Clear disable timestamps and return the currently active channels."""
+        with self._trace_lock:
+            self._disabled_at = [None] * NUM_CHANNELS
+        return [i for i, ch in enumerate(self.channels) if ch.duty_cycle != 0]
+
+    def mark_disabled(self, index: int) -> None:
+        now = time.perf_counter()
+        with self._trace_lock:
+            if self._disabled_at[index] is None:
+                self._disabled_at[index] = now
+
+    def disabled_at(self) -> List[Optional[float]]:
+        with self._trace_lock:
+            return list(self._disabled_at)
+
+    def sleep(self) -> None:
+        """MODE1 SLEEP: one register write turns every output off."""
+        time.sleep(I2C_WRITE_TIME_S)
+        self.sleep_calls += 1
+        for channel in self.channels:
+            channel._duty = 0
+        now = time.perf_counter()
+        with self._trace_lock:
+            for i in range(NUM_CHANNELS):
+                if self._disabled_at[i] is None:
+                    self._disabled_at[i] = now
+
+    def deinit(self) -> None:
+        pass
+
+
+# =============================================================================
+# BACKGROUND LOAD
+# =============================================================================
+
+class _LoadThreads:
+    """Background threads that mimic a busy robot during the benchmark."""
+
+    def __init__(self, head_controller: Any, safety_holder: Dict[str, Any]) -> None:
+        self._head = head_controller
+        self._safety_holder = safety_holder
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.counters = {"led_frames": 0, "head_moves": 0, "audio_chunks": 0, "watchdog_feeds": 0}
+
+    def start(self) -> None:
+        for name, target in (
+            ("bench-led", self._led_loop),
+            ("bench-head", self._head_loop),
+            ("bench-audio", self._audio_loop),
+            ("bench-control", self._control_loop),
+        ):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+    def _led_loop(self) -> None:
+        from src.led.color_utils import hsv_to_rgb, brightness_adjust
+
+        frame = 0
+        while not self._stop.is_set():
+            pixels = [
+                brightness_adjust(hsv_to_rgb((frame * 3 + i * 22) % 360, 0.8, 1.0), 0.6)
+                for i in range(NUM_CHANNELS)
+            ]
+            assert len(pixels) == NUM_CHANNELS
+            frame += 1
+            self.counters["led_frames"] += 1
+            self._stop.wait(0.02)
+
+    def _head_loop(self) -> None:
+        toggle = False
+        while not self._stop.is_set():
+            toggle = not toggle
+            try:
+                self._head.look_at(pan=30 if toggle else -30, tilt=10 if toggle else -10, duration_ms=200)
+                self.counters["head_moves"] += 1
+            except Exception:
+                pass
+            self._stop.wait(0.2)
+
+    def _audio_loop(self) -> None:
+        from src.drivers.audio.audio_capture import AudioRingBuffer, VoiceActivityDetector
+
+        rng = np.random.default_rng(26)
+        ring = AudioRingBuffer(capacity=16000, channels=1)
+        vad = VoiceActivityDetector(sample_rate=16000)
+        chunk = (rng.standard_normal(1280) * 0.05).astype(np.float32)
+        raw = (rng.standard_normal(3840 * 2) * 2**28).astype(np.int32)
+        while not self._stop.is_set():
+            # Stand-in for the wake word preprocessor's S32_LE -> float path
+            left = raw[0::2].astype(np.float32) / 2147483648.0
+            _ = left[: (len(left) // 3) * 3].reshape(-1, 3).mean(axis=1)
+            ring.write(chunk.reshape(-1, 1))
+            ring.read_and_consume(1280)
+            vad.update_probability(chunk)
+            self.counters["audio_chunks"] += 1
+            self._stop.wait(0.01)
+
+    def _control_loop(self) -> None:
+        while not self._stop.is_set():
+            safety = self._safety_holder.get("coordinator")
+            if safety is not None:
+                safety.feed_watchdog()
+                self.counters["watchdog_feeds"] += 1
+            self._stop.wait(0.02)
+
+
+# =============================================================================
+# HARNESS
+# =============================================================================
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile matching PerformanceProfiler.get_stats()."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(len(sorted_samples) * pct))
+    return sorted_samples[index]
+
+
+class EStopLatencyHarness:
+    """Runs trigger trials against the live safety stack and records traces.
+
+    Each trial re-enables the servos, arms the tracing backend, calls the
+    trigger under test and measures trigger -> last active channel disabled.
+    """
+
+    def __init__(self, driver: Any, pca: _TracingPCA, head: Any) -> None:
+        self.driver = driver
+        self.pca = pca
+        self.head = head
+        self.trace: List[Dict[str, Any]] = []
+        self._rng = random.Random(26)
+
+    def enable_all_servos(self) -> None:
+        for channel in range(NUM_CHANNELS):
+            if channel in (HEAD_PAN_CHANNEL, HEAD_TILT_CHANNEL):
+                continue
+            self.driver.set_servo_angle(channel, 90.0)
+
+    def run_trial(
+        self,
+        path: str,
+        trial: int,
+        trigger: Callable[[], Any],
+        channels: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        """Run one trigger and return its trace record."""
+        active = self.pca.arm()
+        if channels is not None:
+            active = [ch for ch in active if ch in channels]
+
+        t0 = time.perf_counter()
+        reported = trigger()
+        t_return = time.perf_counter()
+
+        stamps = self.pca.disabled_at()
+        offsets = {
+            ch: (stamps[ch] - t0) * 1000 if stamps[ch] is not None else None
+            for ch in active
+        }
+        missing = [ch for ch, off in offsets.items() if off is None]
+        latency_ms = max((off for off in offsets.values() if off is not None), default=0.0)
+
+        record = {
+            "path": path,
+            "trial": trial,
+            "latency_ms": latency_ms,
+            "return_ms": (t_return - t0) * 1000,
+            "reported_ms": reported if isinstance(reported, (int, float)) else None,
+            "active_channels": active,
+            "missing_channels": missing,
+            "channel_offsets_ms": {str(ch): off for ch, off in offsets.items()},
+        }
+        self.trace.append(record)
+        return record
+
+    def settle(self) -> None:
+        """Random gap so triggers land at different phases of the load threads."""
+        time.sleep(self._rng.uniform(0.002, 0.012))
+
+    @staticmethod
+    def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        samples = sorted(r["latency_ms"] for r in records)
+        return {
+            "count": len(samples),
+            "min_ms": samples[0] if samples else 0.0,
+            "p50_ms": _percentile(samples, 0.50),
+            "p95_ms": _percentile(samples, 0.95),
+            "p99_ms": _percentile(samples, 0.99),
+            "max_ms": samples[-1] if samples else 0.0,
+            "incomplete_trials": sum(1 for r in records if r["missing_channels"]),
+        }
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def estop_bench():
+    """Live safety stack on tracing hardware with background load running."""
+    with patch('src.drivers.servo.pca9685.board') as mock_board, \
+         patch('src.drivers.servo.pca9685.busio') as mock_busio, \
+         patch('src.drivers.servo.pca9685.PCA9685', side_effect=_TracingPCA), \
+         patch('src.drivers.i2c_bus_manager.board') as mock_mgr_board, \
+         patch('src.drivers.i2c_bus_manager.busio') as mock_mgr_busio:
+
+        mock_board.SCL = mock_mgr_board.SCL = Mock()
+        mock_board.SDA = mock_mgr_board.SDA = Mock()
+        mock_busio.I2C.return_value = mock_mgr_busio.I2C.return_value = Mock()
+
+        from src.drivers.i2c_bus_manager import I2CBusManager
+        from src.drivers.servo.pca9685 import PCA9685Driver
+        from src.control.head_controller import HeadController, HeadConfig
+
+        I2CBusManager.reset()
+        driver = PCA9685Driver()
+        head = HeadController(
+            driver, HeadConfig(pan_channel=HEAD_PAN_CHANNEL, tilt_channel=HEAD_TILT_CHANNEL)
+        )
+
+        safety_holder: Dict[str, Any] = {}
+        load = _LoadThreads(head, safety_holder)
+        harness = EStopLatencyHarness(driver, driver.pca, head)
+        harness.safety_holder = safety_holder
+        harness.load = load
+
+        load.start()
+        time.sleep(0.1)  # Let the load threads reach steady state
+        try:
+            yield harness
+        finally:
+            load.stop()
+            head.emergency_stop()
+            coordinator = safety_holder.pop("coordinator", None)
+            if coordinator is not None:
+                coordinator.stop()
+            I2CBusManager.reset()
+            if TRACE_PATH:
+                _append_trace(TRACE_PATH, harness.trace)
+
+
+def _append_trace(path: str, records: List[Dict[str, Any]]) -> None:
+    """Merge trial records into a JSON trace file (one run per test)."""
+    existing: List[Dict[str, Any]] = []
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                existing = json.load(f)
+        except (OSError, ValueError):
+            existing = []
+    existing.extend(records)
+    with open(path, "w") as f:
+        json.dump(existing, f, indent=2)
+
+
+def _assert_within_budget(path: str, records: List[Dict[str, Any]]) -> None:
+    stats = EStopLatencyHarness.summarize(records)
+    print(
+        f"\n  {path}: p50={stats['p50_ms']:.3f}ms p95={stats['p95_ms']:.3f}ms "
+        f"p99={stats['p99_ms']:.3f}ms max={stats['max_ms']:.3f}ms "
+        f"(n={stats['count']}, budget p99<{P99_BUDGET_MS}ms)"
+    )
+
+    # REQUIREMENT: Every trial ran and disabled every active channel
+    assert stats['count'] == TRIALS_PER_PATH, \
+        f"{path}: {stats['count']}/{TRIALS_PER_PATH} trials completed"
+    assert stats['incomplete_trials'] == 0, \
+        f"{path}: {stats['incomplete_trials']} trials left channels enabled"
+
+    if P99_BUDGET_MS is None:
+        return
+
+    # REQUIREMENT: p99 trigger -> all channels disabled within budget
+    assert stats['p99_ms'] < P99_BUDGET_MS, \
+        f"{path}: p99 latency {stats['p99_ms']:.3f}ms exceeds budget {P99_BUDGET_MS}ms"
+
+
+# =============================================================================
+# LATENCY BENCHMARKS
+# =============================================================================
+
+class TestEStopLatencyUnderLoad:
+    """End-to-end E-stop latency with LED, head, audio and control threads busy."""
+
+    def test_load_threads_are_busy(self, estop_bench):
+        """Sanity check: the background load is actually running."""
+        time.sleep(0.25)
+        counters = estop_bench.load.counters
+        assert counters["led_frames"] > 0
+        assert counters["head_moves"] > 0
+        assert counters["audio_chunks"] > 0
+
+    def test_pca9685_disable_all_latency(self, estop_bench):
+        """PCA9685Driver.disable_all() -> all 16 channels dark."""
+        records = []
+        for trial in range(TRIALS_PER_PATH):
+            estop_bench.enable_all_servos()
+            estop_bench.settle()
+            records.append(estop_bench.run_trial(
+                "pca9685.disable_all", trial, estop_bench.driver.disable_all
+            ))
+
+        _assert_within_budget("pca9685.disable_all", records)
+
+    def test_emergency_stop_trigger_latency(self, estop_bench):
+        """EmergencyStop.trigger() -> all 16 channels dark."""
+        from src.safety.emergency_stop import EmergencyStop, SafetyState
+
+        e_stop = EmergencyStop(estop_bench.driver, gpio_provider=_BenchGPIO(), auto_reset=True)
+        e_stop.start()
+
+        records = []
+        for trial in range(TRIALS_PER_PATH):
+            estop_bench.enable_all_servos()
+            estop_bench.settle()
+            records.append(estop_bench.run_trial(
+                "emergency_stop.trigger", trial, lambda: e_stop.trigger(source="benchmark")
+            ))
+            assert e_stop.state == SafetyState.RESET_REQUIRED
+            assert e_stop.reset()
+
+        e_stop.cleanup()
+        _assert_within_budget("emergency_stop.trigger", records)
+
+    def test_safety_coordinator_trigger_latency(self, estop_bench):
+        """SafetyCoordinator.trigger_estop() with the watchdog being fed."""
+        from src.core.safety_coordinator import SafetyCoordinator
+
+        records = []
+        for trial in range(TRIALS_PER_PATH):
+            coordinator = SafetyCoordinator(
+                estop_bench.driver,
+                gpio_provider=_BenchGPIO(),
+                watchdog_timeout_ms=500,
+            )
+            assert coordinator.start()
+            estop_bench.safety_holder["coordinator"] = coordinator
+
+            estop_bench.enable_all_servos()
+            estop_bench.settle()
+            records.append(estop_bench.run_trial(
+                "safety_coordinator.trigger_estop", trial,
+                lambda: coordinator.trigger_estop("benchmark"),
+            ))
+
+            estop_bench.safety_holder.pop("coordinator", None)
+            coordinator.stop()
+
+        _assert_within_budget("safety_coordinator.trigger_estop", records)
+
+    def test_head_emergency_stop_latency(self, estop_bench):
+        """HeadEmergencyStop.trigger() -> pan and tilt channels dark."""
+        from src.control.head_safety import HeadEmergencyStop
+
+        head_stop = HeadEmergencyStop()
+        head_stop.register_callback(estop_bench.head.emergency_stop)
+
+        records = []
+        for trial in range(TRIALS_PER_PATH):
+            estop_bench.head.look_at(pan=20, tilt=5, duration_ms=100)
+            estop_bench.settle()
+            records.append(estop_bench.run_trial(
+                "head_emergency_stop.trigger", trial,
+                lambda: head_stop.trigger("benchmark"),
+                channels=[HEAD_PAN_CHANNEL, HEAD_TILT_CHANNEL],
+            ))
+            assert head_stop.reset()
+            assert estop_bench.head.reset_emergency()
+
+        _assert_within_budget("head_emergency_stop.trigger", records)
+
+    def test_reported_latency_does_not_undercount(self, estop_bench):
+        """EmergencyStop's self-reported latency covers the measured disable."""
+        from src.safety.emergency_stop import EmergencyStop
+
+        e_stop = EmergencyStop(estop_bench.driver, gpio_provider=_BenchGPIO(), auto_reset=True)
+        e_stop.start()
+
+        for trial in range(10):
+            estop_bench.enable_all_servos()
+            record = estop_bench.run_trial(
+                "emergency_stop.reported", trial, lambda: e_stop.trigger(source="benchmark")
+            )
+            # trigger() starts its own clock after ours, so allow a small skew
+            assert record["reported_ms"] + 0.5 >= record["latency_ms"]
+            e_stop.reset()
+
+        e_stop.cleanup()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-v', '-s', '--tb=short'])
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Package Import-Time Benchmark
+
+Imports firmware packages in fresh interpreters (see
+src/utils/import_profiler.py) so nothing is already cached in sys.modules.
+
+Measured:
+- Median cold import time of src.voice, src.animation, src.core, src.led
+- Modules pulled in by ``import src.voice``, ``src.core``, ``src.animation``
+
+Performance Targets:
+- ``import src.voice`` under 50ms (configurable): the package is lazy
+  (PEP 562) and must not load NumPy, ONNX or any voice submodule
+- ``src.core`` and ``src.animation`` are lazy too: importing the package
+  loads none of its submodules
+- Exported names still resolve on first access
+
+Configuration (environment variables):
+    OPENDUCK_VOICE_IMPORT_BUDGET_MS  median budget for src.voice (default: 50)
+    OPENDUCK_IMPORT_REPEAT           fresh interpreters per package (default: 3)
+
+Run with:
+    pytest tests/performance/test_import_time.py -v -s
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.import_profiler import DEFAULT_PACKAGES, parse_importtime, profile_import
+
+
+# =============================================================================
+# BENCHMARK CONFIGURATION
+# =============================================================================
+
+VOICE_BUDGET_MS = float(os.environ.get("OPENDUCK_VOICE_IMPORT_BUDGET_MS", "50"))
+REPEAT = int(os.environ.get("OPENDUCK_IMPORT_REPEAT", "3"))
+
+# Modules that must stay unloaded after importing a lazy package
+HEAVY_MODULES = ("numpy", "onnxruntime", "openwakeword", "sounddevice")
+
+# Packages whose __init__ resolves exports on first access
+LAZY_PACKAGES = ("src.voice", "src.core", "src.animation")
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+class TestLazyPackageImport:
+    """Lazy packages are cheap to import and load submodules on first use."""
+
+    @pytest.mark.parametrize("package", LAZY_PACKAGES)
+    def test_import_loads_no_submodules(self, package):
+        profile = profile_import(package, repeat=REPEAT)
+        print(f"\nimport {package}: median {profile.median_ms:.1f}ms, "
+              f"{len(profile.loaded_modules)} modules")
+
+        loaded = set(profile.loaded_modules)
+        assert not loaded & set(HEAVY_MODULES)
+        assert not [m for m in loaded if m.startswith(package + ".")]
+        if package == "src.voice":
+            assert profile.median_ms < VOICE_BUDGET_MS
+
+    def test_exports_resolve_on_first_access(self):
+        code = (
+            "import sys, src.voice as v\n"
+            "assert 'src.voice.vad' not in sys.modules\n"
+            "cls = v.VADConfig\n"
+            "assert 'src.voice.vad' in sys.modules\n"
+            "assert 'VADConfig' in vars(v)\n"
+            "assert 'src.voice.pipeline' not in sys.modules\n"
+            "assert 'VADConfig' in dir(v)\n"
+            "try:\n"
+            "    v.NotAnExport\n"
+            "except AttributeError:\n"
+            "    pass\n"
+            "else:\n"
+            "    raise SystemExit('expected AttributeError')\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+
+class TestPackageImportBenchmark:
+    """Reports cold import cost of each firmware package."""
+
+    @pytest.mark.parametrize("package", DEFAULT_PACKAGES)
+    def test_package_import_time(self, package):
+        try:
+            profile = profile_import(package, repeat=REPEAT, top=3)
+        except RuntimeError as e:
+            pytest.skip(f"{package} not importable here: {e}")
+
+        print(f"\nimport {package}: median {profile.median_ms:.1f}ms "
+              f"(min {profile.min_ms:.1f}, max {profile.max_ms:.1f}), "
+              f"{len(profile.loaded_modules)} modules")
+        for name, self_ms, cumulative_ms in profile.slowest:
+            print(f"  {self_ms:7.1f}ms self {cumulative_ms:8.1f}ms cum  {name}")
+
+        assert len(profile.wall_ms) == REPEAT
+        assert profile.median_ms > 0.0
+
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _abc\n"
+            "import time:      2500 |       2620 | src.voice\n"
+        )
+        rows = parse_importtime(stderr)
+        assert rows == [("_abc", 0.12, 0.12), ("src.voice", 2.5, 2.62)]
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Wake-Word Resampler Benchmark: Polyphase FIR vs Box Decimator
+
+Compares the streaming PolyphaseResampler used by AudioPreprocessor with
+the 3-sample box-average decimator it replaced, on the production
+48kHz -> 16kHz path with 80ms chunks (3840 -> 1280 samples).
+
+Measured:
+- CPU cost per 80ms chunk (p50/p99), as a fraction of real time
+- Passband gain at speech frequencies (300Hz - 4kHz)
+- Alias rejection for tones above the 8kHz output Nyquist
+
+The filter response targets are always enforced. Per-chunk timing on a
+shared host is dominated by preemption, so the p99 budget is only
+enforced when one is given, e.g. on the Pi with an idle system.
+
+Performance Targets:
+- p99 per-chunk cost < 2% of the chunk period (1.6ms) - leaves the
+  wake-word CPU budget (<30% on RPi4) to inference (opt-in)
+- Passband ripple < 0.1dB up to 4kHz
+- Aliases landing below 7kHz attenuated by > 60dB (box: ~9.5dB at 12kHz)
+
+Configuration (environment variables):
+    OPENDUCK_RESAMPLER_BUDGET_MS   p99 per-chunk budget in ms (default:
+                                   unset, report only; 1.6 on target)
+    OPENDUCK_RESAMPLER_ITERATIONS  timed chunks per resampler (default: 500)
+
+Run with:
+    pytest tests/performance/test_resampler_performance.py -v -s
+    OPENDUCK_RESAMPLER_BUDGET_MS=1.6 pytest tests/performance/test_resampler_performance.py
+"""
+
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pytest
+
+from src.drivers.audio.resampler import PolyphaseResampler, box_decimate
+
+
+# =============================================================================
+# BENCHMARK CONFIGURATION
+# =============================================================================
+
+_P99_ENV = os.environ.get("OPENDUCK_RESAMPLER_BUDGET_MS")
+P99_BUDGET_MS: Optional[float] = float(_P99_ENV) if _P99_ENV else None
+ITERATIONS = int(os.environ.get("OPENDUCK_RESAMPLER_ITERATIONS", "500"))
+
+INPUT_RATE = 48000
+OUTPUT_RATE = 16000
+CHUNK_MS = 80
+CHUNK_SAMPLES = INPUT_RATE * CHUNK_MS // 1000
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def _tone(freq_hz: float, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(INPUT_RATE * seconds)) / INPUT_RATE
+    return (0.5 * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+
+
+def _stream(process: Callable[[np.ndarray], np.ndarray], audio: np.ndarray) -> np.ndarray:
+    """Feed audio in 80ms chunks and join the output."""
+    return np.concatenate([
+        np.array(process(audio[i:i + CHUNK_SAMPLES]), copy=True)
+        for i in range(0, len(audio), CHUNK_SAMPLES)
+    ])
+
+
+def _gain_db(process_factory: Callable[[], Callable], freq_hz: float) -> float:
+    """Output RMS relative to input RMS, after the filter settles."""
+    out = _stream(process_factory(), _tone(freq_hz))[OUTPUT_RATE // 10:]
+    rms = np.sqrt(np.mean(out.astype(np.float64) ** 2))
+    return 20 * np.log10(max(rms, 1e-12) / (0.5 / np.sqrt(2)))
+
+
+def _polyphase() -> Callable[[np.ndarray], np.ndarray]:
+    return PolyphaseResampler(INPUT_RATE, OUTPUT_RATE, max_chunk=CHUNK_SAMPLES).process
+
+
+def _box() -> Callable[[np.ndarray], np.ndarray]:
+    return lambda chunk: box_decimate(chunk, INPUT_RATE // OUTPUT_RATE)
+
+
+def _time_chunks(process: Callable[[np.ndarray], np.ndarray]) -> Dict[str, float]:
+    chunk = np.random.default_rng(0).standard_normal(CHUNK_SAMPLES).astype(np.float32)
+    for _ in range(20):  # Warm-up
+        process(chunk)
+
+    samples: List[float] = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        process(chunk)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    n = len(samples)
+    return {
+        "p50_ms": samples[n // 2],
+        "p99_ms": samples[min(n - 1, int(n * 0.99))],
+        "realtime_pct": 100.0 * samples[n // 2] / CHUNK_MS,
+    }
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+class TestResamplerCost:
+    """CPU cost per 80ms chunk."""
+
+    def test_polyphase_within_budget(self):
+        poly = _time_chunks(_polyphase())
+        box = _time_chunks(_box())
+
+        print(
+            f"\n[RESAMPLER] 80ms chunk, {ITERATIONS} iterations\n"
+            f"  polyphase: p50={poly['p50_ms']:.3f}ms p99={poly['p99_ms']:.3f}ms "
+            f"({poly['realtime_pct']:.2f}% of real time)\n"
+            f"  box:       p50={box['p50_ms']:.3f}ms p99={box['p99_ms']:.3f}ms "
+            f"({box['realtime_pct']:.2f}% of real time)"
+        )
+
+        # REQUIREMENT: Keeps up with real time (median well under a chunk)
+        assert poly["p50_ms"] < CHUNK_MS, (
+            f"Polyphase p50 {poly['p50_ms']:.3f}ms exceeds the {CHUNK_MS}ms chunk period"
+        )
+
+        if P99_BUDGET_MS is None:
+            return
+
+        assert poly["p99_ms"] < P99_BUDGET_MS, (
+            f"Polyphase p99 {poly['p99_ms']:.3f}ms exceeds {P99_BUDGET_MS}ms budget"
+        )
+
+    def test_steady_state_does_not_allocate(self):
+        """Output is a view into the same pre-allocated buffer every chunk."""
+        process = _polyphase()
+        chunk = np.zeros(CHUNK_SAMPLES, dtype=np.float32)
+        first = process(chunk)
+        second = process(chunk)
+
+        assert len(first) == len(second) == CHUNK_SAMPLES // 3
+        assert np.shares_memory(first, second)
+
+
+class TestResamplerQuality:
+    """Passband flatness and alias rejection vs the box decimator."""
+
+    @pytest.mark.parametrize("freq_hz", [300, 1000, 2000, 4000])
+    def test_passband_flat(self, freq_hz):
+        poly = _gain_db(_polyphase, freq_hz)
+        box = _gain_db(_box, freq_hz)
+        print(f"\n[PASSBAND] {freq_hz}Hz: polyphase={poly:+.3f}dB box={box:+.3f}dB")
+
+        assert abs(poly) < 0.1
+
+    @pytest.mark.parametrize("freq_hz", [9000, 12000, 20000])
+    def test_alias_rejection(self, freq_hz):
+        alias_hz = abs(freq_hz - OUTPUT_RATE * round(freq_hz / OUTPUT_RATE))
+        poly = _gain_db(_polyphase, freq_hz)
+        box = _gain_db(_box, freq_hz)
+        print(
+            f"\n[STOPBAND] {freq_hz}Hz -> alias at {alias_hz}Hz: "
+            f"polyphase={poly:.1f}dB box={box:.1f}dB"
+        )
+
+        assert poly < -60.0
+        assert poly < box - 40.0
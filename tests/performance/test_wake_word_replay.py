@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Wake Word Replay Benchmark: Offline Throughput, Latency and FPR
+
+Streams a synthetic corpus through the full WakeWordPipeline (preprocessor
+→ VAD → detector → MultiFrameConfirmer) via a lossless FileReplaySource,
+using the template-matching stub detector so results do not depend on
+OpenWakeWord being installed.
+
+Measured:
+- Throughput (chunks/sec, real-time factor)
+- Per-stage latency against STAGE_TARGETS_MS
+- Detection latency after the wake word ends
+- Recall and false positives per hour
+
+Performance Targets:
+- Replay faster than real time (> 1x; typically > 50x on a desktop)
+- All synthetic wake words detected, no false positives
+
+Configuration (environment variables):
+    OPENDUCK_REPLAY_SECONDS  synthetic corpus length (default: 120)
+
+Run with:
+    pytest tests/performance/test_wake_word_replay.py -v -s
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+replay = pytest.importorskip("src.voice.replay")
+
+
+# =============================================================================
+# BENCHMARK CONFIGURATION
+# =============================================================================
+
+CORPUS_SECONDS = float(os.environ.get("OPENDUCK_REPLAY_SECONDS", "120"))
+
+DAY13_RESULT_KEYS = {
+    "name", "iterations", "mean_ms", "median_ms", "p99_ms", "max_ms",
+    "min_ms", "stdev_ms", "target_ms", "status",
+}
+
+
+@pytest.fixture(scope="module")
+def report():
+    corpus = replay.synthesize_corpus(duration_s=CORPUS_SECONDS, n_events=8, seed=1)
+    result = replay.run_replay(
+        [corpus], detector_factory=replay.TemplateWakeWordDetector, timeout_s=120
+    )
+    replay.print_report(result)
+    return result
+
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+
+class TestReplayThroughput:
+    """Replay runs the whole chain faster than real time."""
+
+    def test_faster_than_realtime(self, report):
+        assert report.realtime_factor > 1.0
+        assert report.iterations == int(CORPUS_SECONDS / 0.08)
+
+    def test_stage_latencies_within_targets(self, report):
+        for result in report.results:
+            assert result.status == "PASS", result
+
+
+class TestReplayAccuracy:
+    """Detections are matched against the synthetic ground truth."""
+
+    def test_all_events_detected_without_false_positives(self, report):
+        assert report.true_positives == report.events == 8
+        assert report.false_positives == 0
+        assert report.fpr_per_hour == 0.0
+        assert report.verdict == "PASS"
+
+    def test_detection_latency_reported(self, report):
+        latency = report.detection_latency
+        assert latency.iterations == 8
+        assert 0.0 <= latency.median_ms < 1500.0
+
+    def test_negative_corpus_counts_false_positives_per_hour(self):
+        corpus = replay.synthesize_corpus(duration_s=60.0, n_events=0, seed=2)
+        result = replay.run_replay([corpus], detector_factory=replay.TemplateWakeWordDetector)
+        assert result.events == 0
+        assert result.fpr_per_hour == result.false_positives / (60.0 / 3600.0)
+
+
+class TestReplayReport:
+    """JSON output is comparable with results_day13.json."""
+
+    def test_json_layout_matches_day13(self, report):
+        data = json.loads(json.dumps(report.to_dict()))
+
+        for key in ("timestamp", "python_version", "platform", "iterations", "results"):
+            assert key in data
+        for result in data["results"]:
+            assert set(result) == DAY13_RESULT_KEYS
+        assert set(data["detection_latency"]) == DAY13_RESULT_KEYS
+
+    def test_match_detections(self):
+        events = [(1.0, 1.6), (10.0, 10.6)]
+        tp, fp, latencies = replay.match_detections([2.0, 5.0, 2.1], events, tolerance_s=1.0)
+        assert (tp, fp) == (1, 2)
+        assert latencies == pytest.approx([400.0])
+
+    def test_stub_detector_rejects_noise(self):
+        detector = replay.TemplateWakeWordDetector()
+        template = replay.wake_word_template()
+        rng = np.random.default_rng(0)
+        noise = (rng.standard_normal(len(template)) * 3000).astype(np.int16)
+        word = (template * 16000).astype(np.int16)
+
+        noise_score = max(detector.predict(chunk)["stub"] for chunk in np.split(noise, 6))
+        detector.reset()
+        word_score = max(detector.predict(chunk)["stub"] for chunk in np.split(word, 6))
+
+        assert noise_score < 0.3
+        assert word_score > 0.9
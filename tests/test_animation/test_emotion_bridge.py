@@ -15,6 +15,7 @@ Test Classes:
     TestStateTransitions: Smooth emotion transition tests
     TestEmotionBridgeExpress: Expression triggering tests
     TestEmotionBridgeMapping: Detailed mapping tests
+    TestExpressionCache: Memoized expression compilation tests
 
 Run with: pytest tests/test_animation/test_emotion_bridge.py -v
 
@@ -799,5 +800,121 @@ class TestEmotionBridgeIntegration:
         # (exact behavior depends on timing)
 
 
+
+# =============================================================================
+# Expression Cache Tests
+# =============================================================================
+
+class TestExpressionCache:
+    """Tests for memoized EmotionExpression compilation."""
+
+    @staticmethod
+    def _bridge(**kwargs):
+        from animation.emotion_bridge import EmotionBridge
+        return EmotionBridge(**kwargs)
+
+    def test_presets_precompiled(self):
+        """
+        Every EMOTION_PRESETS entry is compiled at construction.
+        """
+        from animation.emotion_axes import EMOTION_PRESETS
+        bridge = self._bridge()
+
+        for axes in EMOTION_PRESETS.values():
+            expression = bridge.get_expression_for_emotion(axes)
+            assert expression == bridge._compile_expression(axes)
+            assert bridge.get_expression_for_emotion(axes) is expression
+
+        stats = bridge.get_expression_cache_stats()
+        assert stats["presets"] == len(EMOTION_PRESETS)
+        assert stats["misses"] == 0
+        assert stats["size"] == 0
+
+    def test_quantized_key_shares_entry(self):
+        """
+        Axes equal after rounding share one cached expression.
+        """
+        from animation.emotion_axes import EmotionAxes
+        bridge = self._bridge()
+
+        first = bridge.get_expression_for_emotion(EmotionAxes(0.1234, 0.2, 0.3, 1.0))
+        second = bridge.get_expression_for_emotion(EmotionAxes(0.12341, 0.2, 0.3, 1.0))
+
+        assert second is first
+        assert first == bridge._compile_expression(EmotionAxes(0.123, 0.2, 0.3, 1.0))
+        stats = bridge.get_expression_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_mutated_preset_recompiled(self):
+        """
+        A preset instance changed in place is looked up by its new values.
+        """
+        from animation.emotion_axes import EMOTION_PRESETS
+        bridge = self._bridge()
+        axes = EMOTION_PRESETS["happy"]
+        original = axes.arousal
+
+        try:
+            axes.arousal = -0.9
+            expression = bridge.get_expression_for_emotion(axes)
+            assert expression == bridge._compile_expression(axes)
+        finally:
+            axes.arousal = original
+
+    def test_lru_eviction(self):
+        """
+        Cache holds at most expression_cache_size entries, evicting the oldest.
+        """
+        from animation.emotion_axes import EmotionAxes
+        bridge = self._bridge(expression_cache_size=2)
+        a, b, c = (EmotionAxes(v, 0.0, 0.5, 1.0) for v in (0.11, 0.22, 0.33))
+
+        bridge.get_expression_for_emotion(a)
+        bridge.get_expression_for_emotion(b)
+        bridge.get_expression_for_emotion(a)  # a becomes most recent
+        bridge.get_expression_for_emotion(c)  # evicts b
+
+        stats = bridge.get_expression_cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        bridge.get_expression_for_emotion(a)
+        assert bridge.get_expression_cache_stats()["misses"] == 3
+
+        bridge.clear_expression_cache()
+        assert bridge.get_expression_cache_stats()["size"] == 0
+
+    def test_expression_is_immutable(self):
+        """
+        Cached expressions cannot be modified by callers.
+        """
+        from dataclasses import FrozenInstanceError
+        from animation.emotion_axes import EMOTION_PRESETS
+        expression = self._bridge().get_expression_for_emotion(EMOTION_PRESETS["happy"])
+
+        with pytest.raises(FrozenInstanceError):
+            expression.target_pan = 10.0
+
+    def test_custom_mapper_not_cached(self, mock_axis_to_led_mapper):
+        """
+        Custom/mock mappers are called on every lookup.
+        """
+        from animation.emotion_axes import EMOTION_PRESETS
+        bridge = self._bridge(axis_to_led_mapper=mock_axis_to_led_mapper)
+
+        bridge.get_expression_for_emotion(EMOTION_PRESETS["happy"])
+        bridge.get_expression_for_emotion(EMOTION_PRESETS["happy"])
+
+        assert mock_axis_to_led_mapper.axes_to_led_config.call_count == 2
+        assert bridge.get_expression_cache_stats()["enabled"] is False
+
+    def test_negative_cache_size_rejected(self):
+        """
+        Negative cache size raises ValueError.
+        """
+        with pytest.raises(ValueError, match="expression_cache_size"):
+            self._bridge(expression_cache_size=-1)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
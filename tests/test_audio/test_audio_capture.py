@@ -3,11 +3,12 @@
 Tests cover:
 - AudioRingBuffer write/read/overflow operations
 - VoiceActivityDetector threshold and probability
+- VoiceActivityDetector frame state machine (onset/hangover in audio time)
 - AudioCapturePipeline start/stop/callbacks
 - Latency verification (<50ms budget)
 - AudioCaptureConfig validation
 
-Total: 25 tests
+Total: 30 tests
 """
 
 import pytest
@@ -196,6 +197,76 @@ class TestAudioRingBuffer:
 
         assert ring_buffer.get_available() == 500
 
+    def test_buffer_read_into_across_wrap(self, ring_buffer):
+        """Test read_into fills caller array with newest samples across wrap."""
+        ramp = np.arange(7000, dtype=np.float32)
+        for i in range(0, 7000, 700):
+            ring_buffer.write(ramp[i:i + 700])
+
+        out = np.empty(1000, dtype=np.float32)
+        assert ring_buffer.read_into(out) == 1000
+        np.testing.assert_array_equal(out, ramp[-1000:])
+
+        # Window straddling the physical end of storage is one contiguous view
+        view = ring_buffer.view_latest(4800)
+        np.testing.assert_array_equal(view.reshape(-1), ramp[-4800:])
+
+    def test_buffer_overflow_counted_in_samples(self, ring_buffer):
+        """Test overflow accounting reports dropped samples, not just events."""
+        ring_buffer.write(np.zeros(4000, dtype=np.float32))
+        ring_buffer.write(np.zeros(2000, dtype=np.float32))  # drops 1200
+        ring_buffer.write(np.zeros(6000, dtype=np.float32))  # drops 4800 + 1200
+
+        assert ring_buffer.overflow_count == 2
+        assert ring_buffer.overflow_samples == 1200 + 6000
+        assert ring_buffer.total_written == 4000 + 2000 + 4800
+
+    def test_buffer_consume_skips_overwritten(self, ring_buffer):
+        """Test consumer resumes at oldest surviving sample after overflow."""
+        ramp = np.arange(6000, dtype=np.float32)
+        ring_buffer.write(ramp[:3000])
+        ring_buffer.write(ramp[3000:])
+
+        out = np.empty(100, dtype=np.float32)
+        assert ring_buffer.consume_into(out) == 100
+        np.testing.assert_array_equal(out, ramp[1200:1300])
+        assert ring_buffer.get_available() == 4700
+
+    def test_buffer_stereo_interleaved(self, ring_buffer_stereo):
+        """Test multi-channel frames keep channel order through wrap."""
+        frames = np.stack([np.arange(6000), -np.arange(6000)], axis=1).astype(np.float32)
+        ring_buffer_stereo.write(frames[:4000])
+        ring_buffer_stereo.write(frames[4000:])
+
+        data = ring_buffer_stereo.read(2000)
+        np.testing.assert_array_equal(data, frames[-2000:])
+
+    def test_buffer_concurrent_producer_consumer(self, ring_buffer):
+        """Test SPSC producer/consumer threads see an unbroken sample stream."""
+
+        total = 200 * 320
+        received = []
+        done = threading.Event()
+
+        def producer():
+            for i in range(0, total, 320):
+                while ring_buffer.get_available() > ring_buffer.capacity - 320:
+                    time.sleep(0.0005)
+                ring_buffer.write(np.arange(i, i + 320, dtype=np.float32))
+            done.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        out = np.empty(512, dtype=np.float32)
+        while not (done.is_set() and ring_buffer.get_available() == 0):
+            n = ring_buffer.consume_into(out)
+            received.append(out[:n].copy())
+        thread.join()
+
+        stream = np.concatenate(received)
+        np.testing.assert_array_equal(stream, np.arange(total, dtype=np.float32))
+        assert ring_buffer.overflow_samples == 0
+
 
 # =============================================================================
 # TestVoiceActivityDetector - VAD tests
@@ -284,6 +355,87 @@ class TestVoiceActivityDetector:
             vad.threshold_db = 5.0
 
 
+# =============================================================================
+# TestVADFrameStateMachine - process_frame() onset/hangover in audio time
+# =============================================================================
+
+class TestVADFrameStateMachine:
+    """Test the frame state machine used to gate wake word inference."""
+
+    @staticmethod
+    def _frame(amplitude, n=1280):
+        return np.full(n, amplitude, dtype=np.float32)
+
+    def test_onset_and_hangover_counted_in_audio_time(self):
+        """Speech starts after min_speech_ms and ends after hangover_ms of audio."""
+        from src.drivers.audio.audio_capture import (
+            VADConfig, VADEvent, VADState, VoiceActivityDetector,
+        )
+
+        vad = VoiceActivityDetector.from_config(VADConfig(min_speech_ms=160, hangover_ms=240))
+
+        assert not vad.process_frame(self._frame(0.1)).is_speech  # 80 ms
+        result = vad.process_frame(self._frame(0.1))  # 160 ms
+        assert result.is_speech
+        assert result.event == VADEvent.SPEECH_START
+
+        for _ in range(2):
+            assert vad.process_frame(self._frame(0.0)).state == VADState.HANGOVER
+        result = vad.process_frame(self._frame(0.0))
+        assert result.event == VADEvent.SPEECH_END
+        assert not result.is_speech
+
+    def test_energy_db(self, vad):
+        """Full-scale square wave is 0 dBFS, silence is clamped."""
+        assert vad.get_energy_db(self._frame(1.0)) == pytest.approx(0.0)
+        assert vad.get_energy_db(self._frame(0.01)) == pytest.approx(-40.0)
+        assert vad.get_energy_db(self._frame(0.0)) == pytest.approx(-200.0)
+
+    def test_threshold_and_statistics(self):
+        """Threshold updates apply immediately; reset keeps the threshold."""
+        from src.drivers.audio.audio_capture import VADConfig, VoiceActivityDetector
+
+        vad = VoiceActivityDetector.from_config(VADConfig(min_speech_ms=0))
+        vad.set_threshold_db(-20.0)
+        assert not vad.process_frame(self._frame(0.05)).is_speech
+        assert vad.process_frame(self._frame(0.5)).is_speech
+
+        stats = vad.get_statistics()
+        assert stats['frames'] == 2
+        assert stats['speech_segments'] == 1
+
+        vad.reset()
+        assert vad.get_statistics()['frames'] == 0
+        assert vad.threshold_db == -20.0
+        with pytest.raises(ValueError):
+            vad.set_threshold_db(3.0)
+
+    def test_spectral_flatness_rejects_broadband_noise(self):
+        """Loud noise fails the flatness test; a harmonic tone passes."""
+        from src.drivers.audio.audio_capture import VADConfig, VoiceActivityDetector
+
+        vad = VoiceActivityDetector.from_config(
+            VADConfig(min_speech_ms=0, max_spectral_flatness=0.4))
+        t = np.arange(1280) / 16000
+        tone = (0.2 * np.sin(2 * np.pi * 200 * t)
+                + 0.1 * np.sin(2 * np.pi * 400 * t)).astype(np.float32)
+        noise = (np.random.default_rng(0).standard_normal(1280) * 0.2).astype(np.float32)
+
+        result = vad.process_frame(noise)
+        assert not result.is_speech
+        assert result.spectral_flatness > 0.4
+        assert vad.process_frame(tone).is_speech
+        assert vad.get_statistics()['noise_rejected_frames'] == 1
+
+    def test_voice_vad_is_the_driver_vad(self):
+        """src.voice.vad re-exports the driver detector (single implementation)."""
+        from src.drivers.audio import audio_capture
+        from src.voice import vad as voice_vad
+
+        assert voice_vad.VoiceActivityDetector is audio_capture.VoiceActivityDetector
+        assert voice_vad.VADConfig is audio_capture.VADConfig
+
+
 # =============================================================================
 # TestAudioCapturePipeline - Pipeline tests (mocked sounddevice)
 # =============================================================================
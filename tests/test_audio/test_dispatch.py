@@ -0,0 +1,156 @@
+"""Unit tests for audio callback dispatch.
+
+Tests cover:
+- Synchronous poll() chunking from the ring write position
+- Slow subscribers dropping oldest chunks without delaying others
+- Skipped frames when the ring laps the dispatcher
+- Subscribe/unsubscribe while running
+- Pipeline and INMP441 callbacks delivered off the capture callback
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.drivers.audio.audio_capture import AudioRingBuffer
+from src.drivers.audio.dispatch import AudioDispatcher, AudioSubscription
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestAudioDispatcher:
+    """Tests for AudioDispatcher chunking and fan-out."""
+
+    def test_poll_dispatches_complete_chunks(self):
+        ring = AudioRingBuffer(capacity=1000)
+        chunks = []
+        dispatcher = AudioDispatcher(ring, chunk_frames=100, on_chunk=chunks.append)
+
+        ring.write(np.arange(250, dtype=np.float32))
+        assert dispatcher.poll() == 2
+        ring.write(np.arange(250, 300, dtype=np.float32))
+        assert dispatcher.poll() == 1
+
+        assert [c[0, 0] for c in chunks] == [0.0, 100.0, 200.0]
+        assert all(c.shape == (100, 1) for c in chunks)
+        assert not chunks[0].flags.writeable
+
+    def test_skipped_frames_when_lapped(self):
+        ring = AudioRingBuffer(capacity=200)
+        chunks = []
+        dispatcher = AudioDispatcher(ring, chunk_frames=100, on_chunk=chunks.append)
+
+        for start in range(0, 500, 100):
+            ring.write(np.arange(start, start + 100, dtype=np.float32))
+        dispatcher.poll()
+
+        assert dispatcher.get_statistics()["skipped_frames"] == 300
+        assert [c[0, 0] for c in chunks] == [300.0, 400.0]
+
+    def test_slow_subscriber_drops_without_blocking_fast(self):
+        ring = AudioRingBuffer(capacity=4000)
+        dispatcher = AudioDispatcher(ring, chunk_frames=100)
+        release = threading.Event()
+        fast = []
+
+        dispatcher.subscribe(fast.append, max_queue=64, name="fast")
+        dispatcher.subscribe(lambda chunk: release.wait(2.0), max_queue=2, name="slow")
+        dispatcher.start()
+        try:
+            ring.write(np.zeros(2000, dtype=np.float32))
+            assert _wait_for(lambda: len(fast) == 20)
+        finally:
+            release.set()
+            assert dispatcher.stop()
+
+        subscribers = dispatcher.get_statistics()["subscribers"]
+        assert subscribers["fast"]["dropped"] == 0
+        assert subscribers["slow"]["dropped"] > 0
+        assert subscribers["slow"]["delivered"] + subscribers["slow"]["dropped"] == 20
+
+    def test_hook_errors_are_counted(self):
+        ring = AudioRingBuffer(capacity=1000)
+
+        def bad_hook(chunk):
+            raise RuntimeError("boom")
+
+        dispatcher = AudioDispatcher(ring, chunk_frames=100, on_chunk=bad_hook)
+        ring.write(np.zeros(200, dtype=np.float32))
+        dispatcher.poll()
+
+        stats = dispatcher.get_statistics()
+        assert stats["hook_errors"] == 2
+        assert stats["chunks_dispatched"] == 2
+
+    def test_unsubscribe_stops_delivery(self):
+        ring = AudioRingBuffer(capacity=1000)
+        dispatcher = AudioDispatcher(ring, chunk_frames=100)
+        received = []
+        dispatcher.subscribe(received.append)
+        dispatcher.start()
+        try:
+            ring.write(np.zeros(100, dtype=np.float32))
+            assert _wait_for(lambda: len(received) == 1)
+            assert dispatcher.unsubscribe(received.append)
+            assert not dispatcher.unsubscribe(received.append)
+            ring.write(np.zeros(300, dtype=np.float32))
+            time.sleep(0.05)
+        finally:
+            dispatcher.stop()
+
+        assert len(received) == 1
+
+    def test_invalid_arguments(self):
+        ring = AudioRingBuffer(capacity=100)
+        with pytest.raises(ValueError, match="chunk_frames"):
+            AudioDispatcher(ring, chunk_frames=0)
+        with pytest.raises(ValueError, match="max_queue"):
+            AudioSubscription(print, max_queue=0)
+
+
+class TestDriverIntegration:
+    """Capture callbacks only write the ring; processing runs on dispatch."""
+
+    def test_pipeline_callbacks_via_dispatcher(self, capture_config):
+        from src.drivers.audio.audio_capture import AudioCapturePipeline
+
+        pipeline = AudioCapturePipeline(capture_config)
+        received = []
+        pipeline.add_callback(received.append)
+
+        dispatcher = pipeline._dispatcher
+        dispatcher.start()
+        pipeline._ring_buffer.write(np.full(dispatcher.chunk_frames * 3, 0.1, dtype=np.float32))
+        assert dispatcher.stop()  # Flushes ready chunks and drains subscribers
+
+        assert len(received) == 3
+        assert pipeline.get_level_db() == pytest.approx(-20.0, abs=0.1)
+        assert pipeline.get_statistics()["dispatch"]["chunks_dispatched"] == 3
+
+    def test_inmp441_mock_capture_runs_through_dispatcher(self):
+        from src.drivers.audio.inmp441 import INMP441Driver
+
+        mic = INMP441Driver(mock_mode=True)
+        blocks = []
+        mic.add_callback(blocks.append)
+        mic.start_capture()
+        try:
+            samples = mic.read_samples(1024)
+            assert _wait_for(lambda: len(blocks) >= 2)
+        finally:
+            mic.stop_capture()
+
+        assert samples.dtype == np.int16
+        assert len(samples) == 1024
+        stats = mic.get_statistics()
+        assert stats["dispatch"]["chunks_dispatched"] >= 2
+        assert stats["dispatch"]["subscribers"]["append"]["dropped"] == 0
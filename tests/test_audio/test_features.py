@@ -0,0 +1,127 @@
+"""Unit tests for per-chunk audio feature extraction.
+
+Tests cover:
+- Energy, RMS and zero-crossing rate against direct formulas
+- Band energies consistent with total energy (Parseval)
+- Spectral flatness separating tonal audio from broadband noise
+- Reuse of shared features by the capture VAD
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.drivers.audio.features import (
+    ChunkFeatures,
+    FeatureExtractor,
+    chunk_mean_square,
+    mean_square_to_db,
+)
+
+
+def _harmonic(n=1280, rate=16000):
+    t = np.arange(n) / rate
+    return (0.3 * np.sin(2 * np.pi * 150 * t)
+            + 0.2 * np.sin(2 * np.pi * 300 * t)
+            + 0.1 * np.sin(2 * np.pi * 450 * t)).astype(np.float32)
+
+
+def _noise(n=1280, scale=0.1, seed=0):
+    return (np.random.default_rng(seed).standard_normal(n) * scale).astype(np.float32)
+
+
+class TestEnergyFeatures:
+    """Tests for time-domain features."""
+
+    def test_energy_matches_direct_formula(self):
+        x = _noise(scale=0.2)
+        features = FeatureExtractor(spectral=False).extract(x)
+
+        assert features.mean_square == pytest.approx(float(np.mean(x.astype(np.float64) ** 2)), rel=1e-5)
+        assert features.rms == pytest.approx(np.sqrt(features.mean_square))
+        assert features.energy_db == pytest.approx(10 * np.log10(features.mean_square))
+        assert features.band_energies_db is None
+        assert features.spectral_flatness is None
+
+    def test_multichannel_energy_over_all_samples(self):
+        stereo = np.stack([np.full(320, 0.5), np.zeros(320)], axis=1).astype(np.float32)
+        assert chunk_mean_square(stereo) == pytest.approx(0.125)
+
+    def test_zero_crossing_rate(self):
+        alternating = np.tile([0.5, -0.5], 160).astype(np.float32)
+        features = FeatureExtractor(spectral=False).extract(alternating)
+        assert features.zcr == pytest.approx(1.0)
+
+        tone = np.sin(2 * np.pi * 100 * np.arange(1600) / 16000).astype(np.float32)
+        # 100Hz crosses zero 200 times per second
+        assert FeatureExtractor(spectral=False).extract(tone).zcr == pytest.approx(200 / 16000, abs=1e-3)
+
+    def test_empty_chunk_is_silent(self):
+        features = FeatureExtractor().extract(np.zeros(0, dtype=np.float32))
+        assert features == ChunkFeatures.silent()
+        assert features.energy_db == mean_square_to_db(0.0)
+
+
+class TestSpectralFeatures:
+    """Tests for band energies and spectral flatness."""
+
+    def test_band_energies_sum_to_total(self):
+        x = _noise()
+        features = FeatureExtractor().extract(x)
+
+        band_total = np.sum(10 ** (features.band_energies_db / 10))
+        assert 10 * np.log10(band_total) == pytest.approx(features.energy_db, abs=1.0)
+
+    def test_tone_energy_lands_in_its_band(self):
+        tone = 0.5 * np.sin(2 * np.pi * 2000 * np.arange(1280) / 16000).astype(np.float32)
+        features = FeatureExtractor(band_edges_hz=(0, 1000, 3000, 8000)).extract(tone)
+
+        assert int(np.argmax(features.band_energies_db)) == 1
+        assert features.band_energies_db[1] == pytest.approx(features.energy_db, abs=0.5)
+
+    def test_flatness_separates_tonal_from_noise(self):
+        extractor = FeatureExtractor()
+        tonal = extractor.extract(_harmonic()).spectral_flatness
+        noise = extractor.extract(_noise()).spectral_flatness
+
+        assert tonal < 0.1
+        assert noise > 0.45
+
+    def test_tables_rebuilt_on_length_change(self):
+        extractor = FeatureExtractor()
+        first = extractor.extract(_noise(320)).band_energies_db
+        second = extractor.extract(_noise(1280)).band_energies_db
+        assert first.shape == second.shape == (4,)
+
+    def test_invalid_band_edges(self):
+        with pytest.raises(ValueError, match="band_edges_hz"):
+            FeatureExtractor(band_edges_hz=(1000, 500))
+
+
+class TestCaptureVADReuse:
+    """The capture VAD consumes shared features and adds a spectral test."""
+
+    def test_precomputed_features_are_used(self):
+        from src.drivers.audio.audio_capture import VoiceActivityDetector
+
+        vad = VoiceActivityDetector(threshold_db=-40.0)
+        quiet = np.zeros(320, dtype=np.float32)
+        loud = FeatureExtractor(spectral=False).extract(_noise(320, scale=0.2))
+
+        # Energy comes from the supplied features, not the samples
+        assert vad.update_probability(quiet, loud) > 0.5
+
+    def test_spectral_test_rejects_loud_noise(self):
+        from src.drivers.audio.audio_capture import VoiceActivityDetector
+
+        vad = VoiceActivityDetector(threshold_db=-40.0, min_speech_ms=10,
+                                    spectral_flatness_max=0.4)
+        noise = _noise(320, scale=0.2)
+        voiced = _harmonic(320)
+
+        assert not vad.is_speech(noise)
+        assert vad.update_probability(noise) <= 0.5
+        vad.is_speech(voiced)
+        time.sleep(0.015)  # min_speech_ms is measured in wall-clock time
+        assert vad.is_speech(voiced)
@@ -0,0 +1,107 @@
+"""Unit tests for the streaming polyphase resampler.
+
+Tests cover:
+- Output length and agreement with direct FIR convolution
+- Seamless chunk boundaries (any chunking gives identical output)
+- Rational ratios (44.1kHz -> 16kHz) and upsampling
+- Filter design caching and input validation
+"""
+
+import numpy as np
+import pytest
+
+from src.drivers.audio.resampler import PolyphaseResampler, design_lowpass
+
+
+def _chunked(resampler: PolyphaseResampler, audio: np.ndarray, sizes) -> np.ndarray:
+    parts, i = [], 0
+    for size in sizes:
+        if i >= len(audio):
+            break
+        parts.append(resampler.process(audio[i:i + size]).copy())
+        i += size
+    return np.concatenate(parts)
+
+
+class TestDecimation:
+    """Tests for the integer decimation fast path."""
+
+    def test_matches_direct_convolution(self):
+        x = np.random.default_rng(1).standard_normal(9600).astype(np.float32)
+        resampler = PolyphaseResampler(48000, 16000)
+
+        out = _chunked(resampler, x, [3840] * 3)
+
+        taps = design_lowpass(1, 3).astype(np.float64)
+        expected = np.convolve(x.astype(np.float64), taps)[:len(x)][::3]
+        assert len(out) == 3200
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+
+    def test_chunk_boundaries_are_seamless(self):
+        x = np.random.default_rng(2).standard_normal(48000).astype(np.float32)
+        sizes = np.random.default_rng(3).integers(1, 4096, size=200)
+
+        whole = _chunked(PolyphaseResampler(48000, 16000), x, [3840] * 13)
+        ragged = _chunked(PolyphaseResampler(48000, 16000), x, sizes)
+
+        np.testing.assert_array_equal(ragged, whole[:len(ragged)])
+
+    def test_reset_clears_history(self):
+        resampler = PolyphaseResampler(48000, 16000)
+        resampler.process(np.ones(3840, dtype=np.float32))
+        resampler.reset()
+
+        out = resampler.process(np.zeros(3840, dtype=np.float32))
+        assert not np.any(out)
+
+    def test_rejects_oversized_chunk(self):
+        resampler = PolyphaseResampler(48000, 16000, max_chunk=1024)
+        with pytest.raises(ValueError, match="max_chunk"):
+            resampler.process(np.zeros(2048, dtype=np.float32))
+
+
+class TestRationalRatios:
+    """Tests for non-integer ratios."""
+
+    def test_44k1_to_16k_length_and_gain(self):
+        t = np.arange(44100) / 44100.0
+        tone = (0.5 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+        resampler = PolyphaseResampler(44100, 16000, max_chunk=3528)
+
+        out = _chunked(resampler, tone, [3528] * 13)
+
+        assert resampler.up == 160 and resampler.down == 441
+        assert len(out) == 16000
+        rms = np.sqrt(np.mean(out[1000:] ** 2))
+        assert rms == pytest.approx(0.5 / np.sqrt(2), rel=0.01)
+
+    def test_rational_chunk_boundaries_are_seamless(self):
+        x = np.random.default_rng(4).standard_normal(22050).astype(np.float32)
+        sizes = np.random.default_rng(5).integers(1, 3000, size=200)
+
+        whole = _chunked(PolyphaseResampler(44100, 16000, max_chunk=3528), x, [3528] * 7)
+        ragged = _chunked(PolyphaseResampler(44100, 16000, max_chunk=3528), x, sizes)
+
+        n = min(len(whole), len(ragged))
+        np.testing.assert_allclose(ragged[:n], whole[:n], atol=1e-6)
+
+    def test_upsampling(self):
+        resampler = PolyphaseResampler(16000, 48000, max_chunk=1280)
+        out = _chunked(resampler, np.ones(12800, dtype=np.float32), [1280] * 10)
+
+        assert len(out) == 38400
+        assert out[-1] == pytest.approx(1.0, abs=1e-3)
+
+
+class TestFilterDesign:
+    """Tests for prototype filter design."""
+
+    def test_design_is_cached_and_read_only(self):
+        taps = design_lowpass(1, 3)
+        assert design_lowpass(1, 3) is taps
+        assert not taps.flags.writeable
+        assert taps.sum() == pytest.approx(1.0, rel=1e-5)
+
+    def test_invalid_rates(self):
+        with pytest.raises(ValueError):
+            PolyphaseResampler(0, 16000)
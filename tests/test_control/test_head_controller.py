@@ -341,6 +341,28 @@ class TestHeadControllerInit:
         assert state.tilt == 0.0
         assert state.is_moving is False
 
+    def test_from_config_and_apply_config(self, mock_servo_driver) -> None:
+        """Test animation timings come from RobotConfig and hot reload."""
+        from src.control.head_controller import HeadController
+        from src.utils.config import AnimationSettings, RobotConfig
+
+        config = RobotConfig(animation=AnimationSettings(head_default_speed_ms=250))
+        head = HeadController.from_config(config, mock_servo_driver, pan_channel=4, tilt_channel=5)
+
+        assert head.config.default_speed_ms == 250
+        assert head.config.pan_channel == 4
+
+        head.apply_config(RobotConfig(animation=AnimationSettings(
+            head_default_speed_ms=400, head_easing="linear",
+        )))
+        assert head.config.default_speed_ms == 400
+        assert head.config.easing == "linear"
+        assert head.config.pan_channel == 4  # Channels are not reloaded
+
+        with pytest.raises(ValueError, match="Unknown easing"):
+            head.apply_config(RobotConfig(animation=AnimationSettings(head_easing="wobble")))
+        assert head.config.easing == "linear"
+
 
 # =============================================================================
 # TestLookAt - Direct positioning tests (~5 tests)
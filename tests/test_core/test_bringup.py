@@ -0,0 +1,243 @@
+"""Tests for staged bring-up and startup tracing.
+
+Tests verify:
+- Safety stage runs before any LED/voice/pattern stage
+- Safety failure aborts bring-up
+- LED and background failures are non-fatal
+- Config is loaded in the safety stage and hot reloads reach LED and head
+- Tracer timeline, milestones and report
+"""
+
+import threading
+
+import pytest
+
+from src.core.bringup import BringupConfig, StagedBringup
+from src.utils.config import CONFIG_FILES, ConfigLoader
+from src.utils.startup_profiler import StartupTracer
+
+
+class _FakeLED:
+    """LED controller stand-in recording calls."""
+
+    def __init__(self, events):
+        self.events = events
+        self.color = None
+        self.brightness = None
+        self.target_fps = 50
+
+    def set_brightness(self, brightness):
+        self.brightness = brightness
+        self.events.append("led.brightness")
+
+    def set_color(self, color):
+        self.color = color
+
+    def set_pattern(self, name, speed=1.0):
+        self.events.append(f"led.pattern:{name}")
+
+    def update(self):
+        self.events.append("led.update")
+
+    def clear(self):
+        self.events.append("led.clear")
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Empty config directory (every setting at its default)."""
+    directory = tmp_path / "config"
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def make_bringup(mock_servo_driver, mock_gpio, config_dir, tmp_path):
+    """Build a StagedBringup with recording factories."""
+    from src.core.robot import Robot
+
+    def build(robot_ok=True, led_ok=True, voice_error=None, config=None, head_factory=None):
+        events = []
+        started_background = threading.Event()
+
+        def robot_factory():
+            events.append("robot")
+            robot = Robot(servo_driver=mock_servo_driver, gpio_provider=mock_gpio,
+                          enable_hardware=False, watchdog_timeout_ms=60000)
+            if not robot_ok:
+                robot.start = lambda: False
+            return robot
+
+        def led_factory():
+            events.append("led")
+            if not led_ok:
+                raise RuntimeError("no LED hardware")
+            return _FakeLED(events)
+
+        def voice_factory():
+            started_background.set()
+            if voice_error:
+                raise voice_error
+            return "voice"
+
+        def patterns_factory():
+            return {"confused": object()}
+
+        bringup = StagedBringup(
+            robot_factory=robot_factory,
+            led_factory=led_factory,
+            voice_factory=voice_factory,
+            patterns_factory=patterns_factory,
+            config=config,
+            tracer=StartupTracer(),
+            head_factory=head_factory,
+            config_loader=ConfigLoader(config_dir, cache_dir=tmp_path / "cache"),
+        )
+        return bringup, events
+
+    yield build
+
+
+class TestStagedBringup:
+    """Tests for stage ordering and failure handling."""
+
+    def test_safety_then_boot_frame_then_background(self, make_bringup):
+        bringup, events = make_bringup()
+
+        assert bringup.run()
+        assert bringup.wait(timeout=5.0)
+
+        assert events[:2] == ["robot", "led"]
+        assert "led.update" in events
+        assert bringup.robot.is_operational
+        assert bringup.led.color == BringupConfig().boot_color
+        assert bringup.voice == "voice"
+        assert set(bringup.compound_patterns) == {"confused"}
+        assert bringup.get_status() == {
+            "safety": "ready", "led": "ready", "head": "skipped",
+            "voice": "ready", "compound_patterns": "ready",
+        }
+        bringup.shutdown()
+
+    def test_safety_failure_aborts(self, make_bringup):
+        bringup, events = make_bringup(robot_ok=False)
+
+        assert not bringup.run()
+        assert events == ["robot"]
+        status = bringup.get_status()
+        assert status["safety"] == "failed"
+        assert status["led"] == status["head"] == status["voice"] == "skipped"
+
+    def test_led_and_background_failures_are_non_fatal(self, make_bringup):
+        bringup, _ = make_bringup(led_ok=False, voice_error=ImportError("no openwakeword"))
+
+        assert bringup.run()
+        assert bringup.wait(timeout=5.0)
+
+        report = bringup.get_report()
+        assert report["stages"]["led"] == "failed"
+        assert report["stages"]["voice"] == "failed"
+        assert report["stages"]["compound_patterns"] == "ready"
+        assert "no openwakeword" in report["errors"]["voice"]
+        assert report["first_expression_ms"] is None
+        assert not report["first_expression_met"]
+        bringup.shutdown()
+
+    def test_report_timeline(self, make_bringup):
+        bringup, _ = make_bringup(config=BringupConfig(enable_compound_patterns=False))
+        bringup.run()
+        bringup.wait(timeout=5.0)
+
+        report = bringup.get_report()
+        phases = {p["name"]: p for p in report["phases"]}
+        assert phases["robot"]["thread"] == "MainThread"
+        assert phases["voice"]["thread"] == "Bringup-voice"
+        assert "compound_patterns" not in phases
+        assert report["stages"]["compound_patterns"] == "skipped"
+        assert report["first_expression_ms"] <= phases["voice"]["start_ms"] + phases["voice"]["duration_ms"]
+        assert report["first_expression_met"]
+        assert "background_done" in report["marks_ms"]
+        bringup.shutdown()
+
+    def test_config_loaded_and_hot_reload_applied(self, make_bringup, config_dir, mock_servo_driver):
+        from src.control.head_controller import HeadController
+
+        bringup, _ = make_bringup(
+            config=BringupConfig(enable_head=True, config_watch_interval_s=None),
+            head_factory=lambda robot: HeadController.from_config(
+                bringup.robot_config, robot.servo_driver,
+            ),
+        )
+        assert bringup.run()
+        assert bringup.wait(timeout=5.0)
+        assert bringup.get_status()["head"] == "ready"
+        assert bringup.head.config.default_speed_ms == 300
+        assert bringup.led.brightness == BringupConfig().boot_brightness
+
+        (config_dir / CONFIG_FILES["robot"]).write_text(
+            "led:\n  brightness: 200\n  target_fps: 30\n"
+            "animation:\n  head_default_speed_ms: 450\n"
+        )
+        assert bringup.config_loader.check_for_changes()
+
+        assert bringup.led.brightness == 200
+        assert bringup.led.target_fps == 30
+        assert bringup.head.config.default_speed_ms == 450
+        bringup.shutdown()
+        assert not bringup.config_loader.unregister_callback(bringup._apply_config)
+
+    def test_head_failure_is_non_fatal(self, make_bringup):
+        def head_factory(robot):
+            raise RuntimeError("no head servos")
+
+        bringup, _ = make_bringup(
+            config=BringupConfig(enable_head=True, config_watch_interval_s=None),
+            head_factory=head_factory,
+        )
+        assert bringup.run()
+        assert bringup.wait(timeout=5.0)
+        assert bringup.get_status()["head"] == "failed"
+        assert bringup.head is None
+        assert "no head servos" in bringup.get_report()["errors"]["head"]
+        bringup.shutdown()
+
+    def test_default_compound_patterns_factory(self):
+        bringup = StagedBringup(tracer=StartupTracer())
+        patterns = bringup._create_compound_patterns()
+
+        assert set(patterns) == {"confused", "surprised", "anxious", "frustrated", "proud"}
+        assert any(p["name"] == "src.animation.emotion_patterns" for p in bringup.tracer.to_dict()["phases"])
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="boot_brightness"):
+            BringupConfig(boot_brightness=300)
+        with pytest.raises(ValueError, match="config_watch_interval_s"):
+            BringupConfig(config_watch_interval_s=0)
+
+
+class TestStartupTracer:
+    """Tests for phase and milestone recording."""
+
+    def test_phase_records_error_and_reraises(self):
+        tracer = StartupTracer()
+        with pytest.raises(ValueError):
+            with tracer.phase("broken"):
+                raise ValueError("bad")
+
+        phase = tracer.phases[0]
+        assert phase.name == "broken"
+        assert phase.error == "ValueError: bad"
+
+    def test_mark_first_call_wins(self):
+        tracer = StartupTracer()
+        first = tracer.mark("ready")
+        assert tracer.mark("ready") == first
+        assert tracer.get_mark("missing") is None
+
+    def test_import_module_traced(self):
+        tracer = StartupTracer()
+        module = tracer.import_module("src.core.robot_state")
+
+        assert module.RobotState
+        assert tracer.phases[0].kind == "import"
+        assert "src.core.robot_state" in tracer.format_report()
@@ -104,6 +104,22 @@ class TestLEDController:
         assert led_controller.right_pin == 13
         assert led_controller._brightness == 128
 
+    def test_from_config(self):
+        """Test wiring and refresh rate come from RobotConfig."""
+        from utils.config import HardwareSettings, LEDSettings, RobotConfig
+
+        config = RobotConfig(
+            hardware=HardwareSettings(led_left_pin=10, led_num_pixels=12),
+            led=LEDSettings(brightness=64, target_fps=30),
+        )
+        controller = LEDController.from_config(config, brightness=40)
+
+        assert controller.num_pixels == 12
+        assert controller.left_pin == 10
+        assert controller.right_pin == 13
+        assert controller.target_fps == 30
+        assert controller._brightness == 40  # Keyword override
+
     def test_set_pattern_valid(self, led_controller):
         """Test setting valid pattern."""
         led_controller.set_pattern('breathing', speed=1.0)
@@ -8,6 +8,7 @@ Tests verify:
 - Arm kinematics integration
 """
 
+import math
 import time
 from unittest.mock import Mock
 
@@ -79,6 +80,29 @@ class TestRobotInit:
                 enable_hardware=False,
             )
 
+    def test_from_config(self, mock_servo_driver, mock_gpio):
+        """Verify from_config applies config values and keyword overrides."""
+        from src.utils.config import ArmSettings, ControlSettings, RobotConfig, SafetySettings
+
+        config = RobotConfig(
+            arm=ArmSettings(l1_mm=90.0, l2_mm=50.0),
+            control=ControlSettings(loop_hz=100, imu_sample_hz=None),
+            safety=SafetySettings(estop_gpio_pin=21, max_current_stall_ma=1200.0),
+        )
+        robot = Robot.from_config(
+            config,
+            servo_driver=mock_servo_driver,
+            gpio_provider=mock_gpio,
+            enable_hardware=False,
+            arm_l2_mm=55.0,
+        )
+        assert robot.arm.l1 == 90.0
+        assert robot.arm.l2 == 55.0
+        assert robot.get_timing_stats()["period_ms"] == pytest.approx(10.0)
+        assert robot.imu_sampler is None
+        assert robot._safety.estop_gpio_pin == 21
+        assert robot._safety._current_limiter.profile.stall_ma == 1200.0
+
     def test_init_state_is_init(self, robot):
         """Verify initial state is INIT."""
         assert robot.state == RobotState.INIT
@@ -267,6 +291,202 @@ class TestRobotControlLoop:
             robot.run_control_loop(max_iterations=1)
 
 
+class TestRobotDeadlineScheduling:
+    """Tests for absolute-deadline loop timing and overrun policies."""
+
+    def _robot(self, mock_servo_driver, mock_gpio, **kwargs):
+        robot = Robot(
+            servo_driver=mock_servo_driver,
+            gpio_provider=mock_gpio,
+            enable_hardware=False,
+            watchdog_timeout_ms=60000,
+            imu_sample_hz=None,
+            **kwargs,
+        )
+        robot.start()
+        return robot
+
+    def test_rejects_unknown_policy(self, mock_servo_driver, mock_gpio):
+        """Verify an unknown overrun policy is rejected."""
+        with pytest.raises(ValueError, match="overrun_policy"):
+            Robot(
+                servo_driver=mock_servo_driver,
+                gpio_provider=mock_gpio,
+                enable_hardware=False,
+                overrun_policy="drop",
+            )
+
+    def test_rejects_negative_busy_wait(self, mock_servo_driver, mock_gpio):
+        """Verify negative busy-wait is rejected."""
+        with pytest.raises(ValueError, match="non-negative"):
+            Robot(
+                servo_driver=mock_servo_driver,
+                gpio_provider=mock_gpio,
+                enable_hardware=False,
+                busy_wait_us=-1,
+            )
+
+    def test_no_drift_over_many_steps(self, mock_servo_driver, mock_gpio):
+        """Verify N steps take N periods, not N periods plus step overhead."""
+        robot = self._robot(mock_servo_driver, mock_gpio, control_loop_hz=100)
+        steps = 50
+        start = time.perf_counter()
+        robot.run_control_loop(max_iterations=steps)
+        elapsed = time.perf_counter() - start
+        robot.stop()
+
+        assert elapsed == pytest.approx(steps * 0.01, abs=0.01)
+        assert robot.get_timing_stats()["jitter"]["count"] == steps
+
+    def test_skip_policy_stays_on_phase_grid(self, mock_servo_driver, mock_gpio):
+        """Verify skip drops missed ticks and keeps the original phase."""
+        robot = self._robot(mock_servo_driver, mock_gpio, control_loop_hz=50)
+        robot.step()
+        first_deadline = robot._next_deadline - 0.02
+
+        time.sleep(0.05)  # Miss the next deadline by 1.5 periods
+        robot.step()
+        stats = robot.get_timing_stats()
+        robot.stop()
+
+        assert stats["skipped_ticks"] == 1
+        assert stats["overrun"]["count"] == 1
+        ticks = (robot._next_deadline - first_deadline) / 0.02
+        assert ticks == pytest.approx(round(ticks), abs=1e-6)
+        assert robot._next_deadline > time.perf_counter() - 0.02
+
+    def test_catch_up_policy_replays_missed_ticks(self, mock_servo_driver, mock_gpio):
+        """Verify catch_up runs missed ticks back-to-back."""
+        robot = self._robot(
+            mock_servo_driver, mock_gpio, control_loop_hz=50, overrun_policy="catch_up",
+        )
+        robot.step()
+        time.sleep(0.05)  # Two deadlines now in the past
+
+        start = time.perf_counter()
+        robot.step()  # Late: returns immediately
+        robot.step()  # Also late: returns immediately
+        burst = time.perf_counter() - start
+        stats = robot.get_timing_stats()
+        robot.stop()
+
+        assert burst < 0.015
+        assert stats["skipped_ticks"] == 0
+        assert stats["overrun"]["count"] == 2
+
+    def test_catch_up_bounded(self, mock_servo_driver, mock_gpio):
+        """Verify catch_up falls back to skipping after a long stall."""
+        robot = self._robot(
+            mock_servo_driver, mock_gpio, control_loop_hz=100,
+            overrun_policy="catch_up", max_catch_up_ticks=2,
+        )
+        robot.step()
+        time.sleep(0.1)  # ~9 missed ticks
+        robot.step()
+        stats = robot.get_timing_stats()
+        robot.stop()
+
+        assert stats["skipped_ticks"] >= 5
+
+    def test_reset_starts_new_grid(self, mock_servo_driver, mock_gpio):
+        """Verify reset after an E-stop does not inherit stale deadlines."""
+        robot = self._robot(mock_servo_driver, mock_gpio)
+        robot.step()
+        robot.emergency_stop(source="test")
+        time.sleep(0.05)
+        robot.reset()
+        robot.step()
+        robot.stop()
+
+        assert robot.get_timing_stats()["overrun"]["count"] == 0
+
+    def test_control_loop_starts_new_grid(self, mock_servo_driver, mock_gpio):
+        """Verify the loop does not inherit the grid of earlier manual steps."""
+        robot = self._robot(mock_servo_driver, mock_gpio)
+        robot.step()
+        time.sleep(0.05)
+        robot.run_control_loop(max_iterations=2)
+        stats = robot.get_timing_stats()
+        robot.stop()
+
+        assert stats["overrun"]["count"] == 0
+        assert stats["skipped_ticks"] == 0
+
+
+class TestRobotPhaseTiming:
+    """Tests for per-phase step timing."""
+
+    def test_phases_recorded(self, started_robot):
+        """Verify each step records every step phase once."""
+        started_robot.run_control_loop(iteration_callback=lambda r: None, max_iterations=3)
+        phases = started_robot.get_timing_stats()["phases"]
+
+        for name in ("watchdog", "imu", "arm", "compute", "callback"):
+            assert phases[name]["count"] == 3
+        assert phases["compute"]["max_ms"] >= phases["watchdog"]["max_ms"]
+
+    def test_budget_callback_fires(self, mock_servo_driver, mock_gpio):
+        """Verify a phase over budget is reported to callbacks."""
+        robot = Robot(
+            servo_driver=mock_servo_driver,
+            gpio_provider=mock_gpio,
+            enable_hardware=False,
+            watchdog_timeout_ms=60000,
+            imu_sample_hz=None,
+            phase_budgets_ms={"callback": 1.0},
+        )
+        over = []
+        robot.register_phase_budget_callback(lambda *args: over.append(args))
+        robot.start()
+        robot.run_control_loop(
+            iteration_callback=lambda r: time.sleep(0.003), max_iterations=2,
+        )
+        robot.stop()
+
+        assert [phase for phase, _, _ in over] == ["callback", "callback"]
+        assert all(took > budget == 0.001 for _, took, budget in over)
+        assert robot.get_timing_stats()["phases"]["callback"]["over_budget"] == 2
+
+    def test_set_phase_budget_validates(self, robot):
+        """Verify unknown phases and non-positive budgets are rejected."""
+        with pytest.raises(ValueError, match="Unknown phase"):
+            robot.set_phase_budget("render", 1.0)
+        with pytest.raises(ValueError, match="positive"):
+            robot.set_phase_budget("imu", 0.0)
+        robot.set_phase_budget("imu", 0.5)
+        assert robot.get_timing_stats()["phases"]["imu"]["budget_ms"] == pytest.approx(0.5)
+
+    def test_periodic_log_line(self, mock_servo_driver, mock_gpio, caplog):
+        """Verify the phase summary is logged once per interval."""
+        robot = Robot(
+            servo_driver=mock_servo_driver,
+            gpio_provider=mock_gpio,
+            enable_hardware=False,
+            control_loop_hz=100,
+            watchdog_timeout_ms=60000,
+            imu_sample_hz=None,
+            phase_log_interval_s=0.025,
+        )
+        robot.start()
+        with caplog.at_level("INFO", logger="src.core.robot"):
+            robot.run_control_loop(max_iterations=8)
+        robot.stop()
+
+        lines = [r.getMessage() for r in caplog.records if "phases:" in r.getMessage()]
+        assert 1 <= len(lines) <= 3
+        assert "watchdog.p99_ms=" in lines[0]
+
+    def test_invalid_log_interval(self, mock_servo_driver, mock_gpio):
+        """Verify non-positive log interval is rejected."""
+        with pytest.raises(ValueError, match="phase_log_interval_s"):
+            Robot(
+                servo_driver=mock_servo_driver,
+                gpio_provider=mock_gpio,
+                enable_hardware=False,
+                phase_log_interval_s=0,
+            )
+
+
 # =============================================================================
 # Servo Command Tests
 # =============================================================================
@@ -306,6 +526,46 @@ class TestRobotServoCommands:
         result = started_robot.set_arm_position(200.0, 200.0)
         assert result is False
 
+    def test_set_arm_position_trajectory_streams_per_step(
+        self, started_robot, mock_servo_driver
+    ):
+        """Verify trajectory mode sends one pre-solved frame per step()."""
+        assert started_robot.set_arm_position(100.0, 50.0)
+        mock_servo_driver.set_servo_angle_calls.clear()
+
+        # 0.1s at 50Hz -> 6 waypoints, 5 streamed frames
+        assert started_robot.set_arm_position(60.0, 80.0, duration_s=0.1)
+        assert mock_servo_driver.set_servo_angle_calls == []
+        assert started_robot.get_diagnostics()["arm"]["trajectory_frames_remaining"] == 5
+
+        for _ in range(5):
+            assert started_robot.step()
+        assert not started_robot.arm_trajectory_active
+        assert len(mock_servo_driver.set_servo_angle_calls) == 10
+
+        expected = started_robot.arm.solve_ik(60.0, 80.0)
+        final = dict(mock_servo_driver.set_servo_angle_calls[-2:])
+        assert final[0] == pytest.approx(max(0.0, min(180.0, math.degrees(expected[0]))))
+        assert final[1] == pytest.approx(max(0.0, min(180.0, math.degrees(expected[1]))))
+        assert started_robot.get_diagnostics()["arm"]["position_mm"] == (60.0, 80.0)
+
+    def test_set_arm_position_trajectory_rejects_unreachable_path(self, started_robot):
+        """Verify a path crossing outside the workspace is refused up front."""
+        # Straight line through the origin crosses the inner dead zone
+        result = started_robot.set_arm_position(
+            -100.0, 0.0, duration_s=0.2, start=(100.0, 0.0)
+        )
+        assert result is False
+        assert not started_robot.arm_trajectory_active
+
+    def test_emergency_stop_cancels_trajectory(self, started_robot):
+        """Verify E-stop drops an in-progress trajectory."""
+        started_robot.set_arm_position(60.0, 80.0, duration_s=0.5, start=(100.0, 50.0))
+        assert started_robot.arm_trajectory_active
+
+        started_robot.emergency_stop(source="test")
+        assert not started_robot.arm_trajectory_active
+
 
 # =============================================================================
 # Safety Integration Tests
@@ -337,6 +597,46 @@ class TestRobotSafetyIntegration:
         assert result is True
         assert started_robot.state == RobotState.READY
 
+    def test_step_uses_sampled_imu_snapshot(self, started_robot, mock_imu):
+        """Verify step() takes the sampler snapshot instead of reading I2C."""
+        assert started_robot.imu_sampler.wait_for_sample(timeout=2.0)
+        started_robot.imu_sampler.stop()
+        calls = mock_imu.read_orientation_calls
+
+        assert started_robot.step() is True
+        assert mock_imu.read_orientation_calls == calls
+        assert started_robot.imu_snapshot is started_robot.imu_sampler.latest
+        assert len(started_robot.imu_history) >= 1
+
+        diag = started_robot.get_diagnostics()
+        assert diag["imu"]["sampler"]["samples"] >= 1
+
+    def test_synchronous_imu_when_sampling_disabled(
+        self, mock_servo_driver, mock_gpio, mock_imu
+    ):
+        """Verify imu_sample_hz=None keeps the in-loop IMU read."""
+        robot = Robot(
+            servo_driver=mock_servo_driver,
+            imu=mock_imu,
+            gpio_provider=mock_gpio,
+            enable_hardware=False,
+            watchdog_timeout_ms=60000,
+            imu_sample_hz=None,
+        )
+        robot.start()
+        try:
+            assert robot.imu_sampler is None
+            assert robot.step() is True
+            assert mock_imu.read_orientation_calls == 1
+        finally:
+            robot.stop()
+
+    def test_stop_stops_imu_sampler(self, started_robot):
+        """Verify stop() ends the sampler thread."""
+        assert started_robot.imu_sampler.is_running
+        started_robot.stop()
+        assert not started_robot.imu_sampler.is_running
+
 
 # =============================================================================
 # Diagnostics Tests
@@ -368,6 +668,15 @@ class TestRobotDiagnostics:
         diag = started_robot.get_diagnostics()
         assert "safety" in diag
 
+    def test_get_diagnostics_includes_timing(self, started_robot):
+        """Verify diagnostics include loop jitter and overrun histograms."""
+        started_robot.step()
+        timing = started_robot.get_diagnostics()["timing"]
+        assert timing["period_ms"] == pytest.approx(20.0)
+        assert timing["overrun_policy"] == "skip"
+        assert timing["jitter"]["count"] == 1
+        assert "p99_ms" in timing["overrun"]
+
 
 # =============================================================================
 # Repr Test
@@ -176,6 +176,21 @@ class TestBNO085DataReading:
         assert len(gyro) == 3
         assert all(isinstance(v, (int, float)) for v in gyro)
 
+    def test_read_sample_single_bus_transaction(self, mock_hardware, reset_bus_manager):
+        """Test batched quaternion/accel/gyro read takes the bus once."""
+        from src.drivers.sensor.imu.bno085 import BNO085Driver
+
+        imu = BNO085Driver()
+        client = imu.bus_manager.get_bus_stats()['clients']['bno085@0x4a']
+        before = client['acquisitions']
+        quat, accel, gyro = imu.read_sample()
+
+        client = imu.bus_manager.get_bus_stats()['clients']['bno085@0x4a']
+        assert client['acquisitions'] == before + 1
+        assert (quat.w, quat.x, quat.y, quat.z) == (0.707, 0.0, 0.0, 0.707)
+        assert accel == (0.0, 0.0, 9.81)
+        assert gyro == (0.0, 0.0, 0.0)
+
     def test_quaternion_to_euler_conversion(self, mock_hardware, reset_bus_manager):
         """Test quaternion to Euler angle conversion."""
         from src.drivers.sensor.imu.bno085 import BNO085Driver
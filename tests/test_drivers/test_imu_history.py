@@ -0,0 +1,186 @@
+"""Unit Tests for the IMU history ring.
+
+Tests cover:
+- Ring wraparound and window selection (count / duration)
+- Windows are read-only views, not copies
+- Vectorized statistics against straightforward loop references
+- Batched quaternion -> Euler against the scalar driver conversion
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.drivers.sensor.imu.bno085 import BNO085Driver
+from src.drivers.sensor.imu.history import IMUHistory, accel_tilt, quaternion_to_euler
+from src.drivers.sensor.imu.sampler import IMUSampler
+
+
+def _fill(history, n, dt=0.01, gyro=None, accel=None):
+    """Append n samples at dt spacing with sample index in every field."""
+    for i in range(n):
+        history.append_sample(
+            timestamp=i * dt,
+            quaternion=(1.0, 0.0, 0.0, 0.0),
+            acceleration=accel(i) if accel else (0.0, 0.0, 9.81),
+            gyro=gyro(i) if gyro else (float(i), 0.0, 0.0),
+            euler=(0.0, float(i), 0.0),
+        )
+
+
+class TestIMUHistoryRing:
+    """Tests for append and window selection."""
+
+    def test_wraparound_keeps_newest(self):
+        history = IMUHistory(capacity=8)
+        _fill(history, 20)
+
+        window = history.window()
+        assert len(history) == 8
+        assert history.total_appended == 20
+        assert list(window.gyro[:, 0]) == [float(i) for i in range(12, 20)]
+        assert history.latest_timestamp == pytest.approx(0.19)
+
+    def test_window_by_count_and_duration(self):
+        history = IMUHistory(capacity=64)
+        _fill(history, 50)
+
+        assert len(history.window(count=5)) == 5
+        # last 95ms at 10ms spacing -> samples 40..49
+        recent = history.window(duration_s=0.095)
+        assert len(recent) == 10
+        assert recent.timestamps[0] == pytest.approx(0.40)
+        assert len(history.window(duration_s=1.0, count=3)) == 3
+
+    def test_window_is_read_only_view(self):
+        history = IMUHistory(capacity=16)
+        _fill(history, 20)
+        window = history.window(count=4)
+
+        assert np.shares_memory(window.gyro, history._rows)
+        with pytest.raises(ValueError):
+            window.gyro[0, 0] = 1.0
+        detached = window.copy()
+        assert not np.shares_memory(detached.gyro, history._rows)
+
+    def test_missing_fields_are_nan(self):
+        history = IMUHistory(capacity=4)
+        history.append_sample(timestamp=0.0, euler=(1.0, 2.0, 3.0))
+
+        window = history.window()
+        assert np.isnan(window.quaternion).all()
+        assert list(window.euler[0]) == [1.0, 2.0, 3.0]
+
+    def test_empty_and_clear(self):
+        history = IMUHistory(capacity=4)
+        assert len(history.window(duration_s=0.1)) == 0
+        assert history.latest_timestamp is None
+
+        _fill(history, 3)
+        history.clear()
+        assert len(history) == 0
+        with pytest.raises(ValueError, match="empty"):
+            history.window().mean('gyro')
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="capacity"):
+            IMUHistory(capacity=0)
+
+
+class TestIMUWindowQueries:
+    """Vectorized queries against loop references."""
+
+    def test_mean_and_variance(self):
+        history = IMUHistory(capacity=32)
+        _fill(history, 10)
+        window = history.window()
+
+        assert window.mean('gyro')[0] == pytest.approx(4.5)
+        assert window.variance('gyro')[0] == pytest.approx(np.var(np.arange(10.0)))
+        with pytest.raises(ValueError, match="Unknown field"):
+            window.mean('magnetometer')
+
+    def test_low_pass_matches_recursive_filter(self):
+        history = IMUHistory(capacity=64)
+        rng = np.random.default_rng(3)
+        values = rng.normal(size=(40, 3))
+        for i, v in enumerate(values):
+            history.append_sample(timestamp=i * 0.01, acceleration=tuple(v))
+
+        alpha = 0.2
+        expected = values[0].copy()
+        for v in values[1:]:
+            expected = alpha * v + (1 - alpha) * expected
+
+        result = history.window().low_pass('acceleration', alpha)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_complementary_tilt_matches_recursive_filter(self):
+        history = IMUHistory(capacity=128)
+        rng = np.random.default_rng(5)
+        n = 60
+        gyro = rng.normal(scale=0.5, size=(n, 3))
+        accel = np.column_stack((rng.normal(scale=1.0, size=n),
+                                 rng.normal(scale=1.0, size=n),
+                                 np.full(n, 9.81)))
+        times = np.cumsum(rng.uniform(0.008, 0.012, size=n))
+        for t, g, a in zip(times, gyro, accel):
+            history.append_sample(timestamp=t, gyro=tuple(g), acceleration=tuple(a))
+
+        alpha = 0.98
+        reference = accel_tilt(accel)
+        angle = reference[0].copy()
+        for k in range(1, n):
+            rate = np.degrees(gyro[k, :2])
+            angle = alpha * (angle + rate * (times[k] - times[k - 1])) + (1 - alpha) * reference[k]
+
+        roll, pitch = history.window().complementary_tilt(alpha)
+        assert roll == pytest.approx(angle[0], abs=1e-9)
+        assert pitch == pytest.approx(angle[1], abs=1e-9)
+
+    def test_level_robot_has_zero_tilt(self):
+        history = IMUHistory(capacity=16)
+        _fill(history, 10, gyro=lambda i: (0.0, 0.0, 0.0))
+
+        roll, pitch = history.window().complementary_tilt()
+        assert roll == pytest.approx(0.0)
+        assert pitch == pytest.approx(0.0)
+
+    def test_peak_angular_rate(self):
+        history = IMUHistory(capacity=32)
+        _fill(history, 10, gyro=lambda i: (0.0, 3.0, 4.0) if i == 6 else (0.1, 0.0, 0.0))
+
+        rate, when = history.window().peak_angular_rate()
+        assert rate == pytest.approx(5.0)
+        assert when == pytest.approx(0.06)
+
+    def test_batched_euler_matches_driver(self):
+        rng = np.random.default_rng(7)
+        quats = rng.normal(size=(50, 4))
+        quats /= np.linalg.norm(quats, axis=1, keepdims=True)
+
+        batched = quaternion_to_euler(quats)
+        for q, row in zip(quats, batched):
+            expected = BNO085Driver._quaternion_to_euler(*q)
+            np.testing.assert_allclose(row, expected, atol=1e-9)
+
+
+class TestSamplerFeedsHistory:
+    """IMUSampler appends every snapshot to its history."""
+
+    def test_sampler_appends(self):
+        class _IMU:
+            def read_orientation(self):
+                return type("D", (), {"heading": 1.0, "roll": 2.0, "pitch": 3.0})()
+
+        history = IMUHistory(capacity=8)
+        sampler = IMUSampler(_IMU(), history=history)
+        for _ in range(3):
+            sampler.sample_once()
+
+        window = history.window()
+        assert len(window) == 3
+        assert list(window.euler[-1]) == [1.0, 2.0, 3.0]
+        assert window.timestamps[-1] == sampler.latest.timestamp
+        assert math.isnan(window.gyro[0, 0])
@@ -0,0 +1,152 @@
+"""Unit Tests for the background IMU sampler.
+
+Tests cover:
+- Batched reads published as immutable snapshots
+- Fallback to read_orientation() for IMUs without read_sample()
+- Read failures keep the last snapshot and are counted
+- Overrunning reads skip ticks instead of bursting
+- Start/stop lifecycle
+"""
+
+import dataclasses
+import threading
+import time
+
+import pytest
+
+from src.drivers.sensor.imu.bno085 import IMUData, Quaternion
+from src.drivers.sensor.imu.sampler import IMUSampler
+
+
+class FakeBatchIMU:
+    """IMU stand-in with a batched read_sample()."""
+
+    def __init__(self, read_delay_s: float = 0.0):
+        self.read_delay_s = read_delay_s
+        self.should_fail = False
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def read_sample(self):
+        with self._lock:
+            self.calls += 1
+        if self.read_delay_s:
+            time.sleep(self.read_delay_s)
+        if self.should_fail:
+            raise RuntimeError("I2C NACK")
+        return Quaternion(w=0.707, x=0.0, y=0.0, z=0.707), (0.0, 0.0, 9.81), (0.1, 0.0, 0.0)
+
+
+class FakeOrientationIMU:
+    """IMU stand-in with only read_orientation()."""
+
+    def read_orientation(self):
+        return IMUData(heading=10.0, roll=1.0, pitch=2.0, timestamp=time.time())
+
+
+class TestIMUSnapshot:
+    """Tests for snapshot contents."""
+
+    def test_batched_snapshot(self):
+        sampler = IMUSampler(FakeBatchIMU())
+        snapshot = sampler.sample_once()
+
+        assert sampler.latest is snapshot
+        assert snapshot.sequence == 1
+        assert snapshot.quaternion == (0.707, 0.0, 0.0, 0.707)
+        assert snapshot.acceleration == (0.0, 0.0, 9.81)
+        assert snapshot.gyro == (0.1, 0.0, 0.0)
+        assert 89 <= snapshot.heading <= 91
+        assert 0.0 <= snapshot.age() < 1.0
+
+    def test_snapshot_is_immutable(self):
+        snapshot = IMUSampler(FakeBatchIMU()).sample_once()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.pitch = 0.0
+
+    def test_orientation_fallback(self):
+        sampler = IMUSampler(FakeOrientationIMU())
+        snapshot = sampler.sample_once()
+
+        assert (snapshot.heading, snapshot.roll, snapshot.pitch) == (10.0, 1.0, 2.0)
+        assert snapshot.quaternion is None
+        assert sampler.get_statistics()['batched'] is False
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="rate_hz"):
+            IMUSampler(FakeBatchIMU(), rate_hz=0)
+
+
+class TestIMUSamplerErrors:
+    """Tests for read failures."""
+
+    def test_failure_keeps_last_snapshot(self):
+        imu = FakeBatchIMU()
+        sampler = IMUSampler(imu)
+        good = sampler.sample_once()
+
+        imu.should_fail = True
+        assert sampler.sample_once() is None
+        assert sampler.sample_once() is None
+
+        stats = sampler.get_statistics()
+        assert sampler.latest is good
+        assert stats['read_errors'] == 2
+        assert stats['consecutive_errors'] == 2
+        assert stats['last_error'] == "I2C NACK"
+
+        imu.should_fail = False
+        assert sampler.sample_once().sequence == 2
+        assert sampler.get_statistics()['consecutive_errors'] == 0
+
+    def test_no_snapshot_before_first_read(self):
+        sampler = IMUSampler(FakeBatchIMU())
+
+        assert sampler.latest is None
+        assert sampler.get_sample_age() is None
+        assert sampler.get_statistics()['sample_age_ms'] is None
+
+
+class TestIMUSamplerThread:
+    """Tests for the background thread."""
+
+    def test_samples_in_background(self):
+        sampler = IMUSampler(FakeBatchIMU(), rate_hz=200.0)
+        sampler.start()
+        try:
+            assert sampler.wait_for_sample(timeout=2.0)
+            time.sleep(0.05)
+            stats = sampler.get_statistics()
+            assert stats['running']
+            assert stats['samples'] >= 2
+            assert stats['sample_age_ms'] < 1000.0
+        finally:
+            sampler.stop()
+
+        assert not sampler.is_running
+        assert sampler.latest is not None
+
+    def test_overrun_skips_ticks(self):
+        # 20ms reads at 200Hz (5ms period): ~3 ticks skipped per read
+        imu = FakeBatchIMU(read_delay_s=0.02)
+        sampler = IMUSampler(imu, rate_hz=200.0)
+        sampler.start()
+        time.sleep(0.15)
+        sampler.stop()
+
+        stats = sampler.get_statistics()
+        assert stats['skipped_ticks'] >= stats['samples']
+        assert imu.calls <= 10
+        assert stats['read_time_max_ms'] >= 15.0
+
+    def test_restart(self):
+        sampler = IMUSampler(FakeBatchIMU(), rate_hz=200.0)
+        sampler.start()
+        sampler.start()  # no-op while running
+        sampler.stop()
+        sampler.start()
+        try:
+            assert sampler.is_running
+        finally:
+            sampler.stop()
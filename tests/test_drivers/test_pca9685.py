@@ -163,6 +163,107 @@ class TestPCA9685Driver:
         assert state['angle'] == 120
         assert state['enabled'] is True
 
+    def test_set_servo_angles_single_burst(self, mock_hardware):
+        """Test contiguous channels are written in one auto-increment burst."""
+        import struct
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        device = mock_hardware['pca'].i2c_device
+        device.write.reset_mock()
+
+        driver.set_servo_angles({12: 90, 13: 45})
+
+        device.write.assert_called_once()
+        buffer = bytes(device.write.call_args[0][0])
+        assert buffer[0] == 0x06 + 12 * 4
+        on_pan, off_pan, on_tilt, off_tilt = struct.unpack('<HHHH', buffer[1:])
+        assert (on_pan, on_tilt) == (0, 0)
+        # Same 12-bit value the per-channel duty_cycle path would produce
+        assert off_pan == int((1500 / 20000) * 65535) >> 4
+        assert off_tilt == int((1250 / 20000) * 65535) >> 4
+        assert driver.channels[12] == {'angle': 90, 'enabled': True}
+        assert driver.channels[13] == {'angle': 45, 'enabled': True}
+
+    def test_set_servo_angles_groups_runs(self, mock_hardware):
+        """Test non-contiguous channels are split into one write per run."""
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        device = mock_hardware['pca'].i2c_device
+        device.write.reset_mock()
+
+        driver.set_servo_angles({0: 90, 1: 90, 2: 90, 8: 90})
+
+        writes = [bytes(c[0][0]) for c in device.write.call_args_list]
+        assert [(w[0], len(w)) for w in writes] == [(0x06, 13), (0x06 + 32, 5)]
+
+    def test_set_servo_angles_validates_before_writing(self, mock_hardware):
+        """Test an invalid entry leaves all servos untouched."""
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        device = mock_hardware['pca'].i2c_device
+        device.write.reset_mock()
+
+        with pytest.raises(ValueError):
+            driver.set_servo_angles({0: 90, 1: 200})
+
+        device.write.assert_not_called()
+        assert driver.channels[0]['angle'] is None
+
+    def test_register_cache_skips_redundant_writes(self, mock_hardware):
+        """Test unchanged registers are not rewritten and skips are counted."""
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        device = mock_hardware['pca'].i2c_device
+        device.write.reset_mock()
+
+        driver.set_servo_angles({12: 90, 13: 45})
+        driver.set_servo_angles({12: 90, 13: 45})  # hold: nothing to send
+        driver.set_servo_angles({12: 90, 13: 50})  # only tilt changes
+
+        writes = [bytes(c[0][0]) for c in device.write.call_args_list]
+        assert [(w[0], len(w)) for w in writes] == [(0x06 + 48, 9), (0x06 + 52, 5)]
+
+        stats = driver.get_register_cache_stats()
+        assert stats['skipped'] == 3
+        assert stats['skipped_by_channel'] == {12: 2, 13: 1}
+
+    def test_register_cache_single_channel_path(self, mock_hardware):
+        """Test set_servo_angle skips writes that would not change the register."""
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        channel = Mock(duty_cycle=0)
+        mock_hardware['pca'].channels[3] = channel
+
+        driver.set_servo_angle(3, 120)
+        channel.duty_cycle = -1  # sentinel to detect a rewrite
+        driver.set_servo_angle(3, 120)
+
+        assert channel.duty_cycle == -1
+        assert driver.channels[3]['angle'] == 120
+        assert driver.get_register_cache_stats()['skipped'] == 1
+
+    def test_register_cache_invalidated_by_disable(self, mock_hardware):
+        """Test disable paths are never skipped and invalidate the cache."""
+        from src.drivers.servo.pca9685 import PCA9685Driver
+
+        driver = PCA9685Driver()
+        channel = mock_hardware['pca'].channels[0]
+
+        driver.disable_channel(0)  # already off at init, still written
+        assert driver.get_register_cache_stats()['skipped'] == 0
+
+        driver.set_servo_angle(0, 90)
+        driver.disable_all()
+        channel.duty_cycle = -1
+        driver.set_servo_angle(0, 90)  # same angle, must reach hardware after sleep
+
+        assert channel.duty_cycle == int((1500 / 20000) * 65535)
+
 
 class TestServoController:
     """Test cases for ServoController class."""
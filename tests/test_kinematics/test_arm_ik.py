@@ -523,6 +523,15 @@ class TestWorkspaceBoundary:
             distance = np.linalg.norm(point)
             assert distance < 0.01  # Should be at origin
 
+    def test_workspace_boundary_cached_copy(self, arm: ArmKinematics) -> None:
+        """Test repeated calls reuse the cached boundary but return copies."""
+        first = arm.get_workspace_boundary(num_points=64)
+        first[:] = 0.0
+        second = arm.get_workspace_boundary(num_points=64)
+
+        assert abs(np.linalg.norm(second[0]) - 140.0) < 0.01
+        assert second is not arm.get_workspace_boundary(num_points=64)
+
     def test_workspace_boundary_all_reachable(self, arm: ArmKinematics) -> None:
         """Test all boundary points are reachable."""
         boundary = arm.get_workspace_boundary(num_points=100)
@@ -768,3 +777,73 @@ class TestExtendedEdgeCases:
 
         with pytest.raises(ValueError, match="Angles must be finite"):
             arm.solve_fk(0.0, float("-inf"))
+
+
+class TestBatchKinematics:
+    """Test vectorized solve_ik_batch / solve_fk_batch against scalar solvers."""
+
+    @pytest.mark.parametrize("elbow_up", [True, False])
+    def test_ik_batch_matches_scalar(self, elbow_up: bool) -> None:
+        """Test batch IK agrees with solve_ik point by point."""
+        arm = ArmKinematics(l1=80.0, l2=60.0)
+        rng = np.random.default_rng(11)
+        xs = rng.uniform(-160.0, 160.0, size=500)
+        ys = rng.uniform(-160.0, 160.0, size=500)
+
+        shoulder, elbow, reachable = arm.solve_ik_batch(xs, ys, elbow_up=elbow_up)
+
+        for i in range(len(xs)):
+            expected = arm.solve_ik(float(xs[i]), float(ys[i]), elbow_up=elbow_up)
+            assert reachable[i] == (expected is not None)
+            if expected is None:
+                assert np.isnan(shoulder[i]) and np.isnan(elbow[i])
+            else:
+                assert shoulder[i] == pytest.approx(expected[0], abs=1e-9)
+                assert elbow[i] == pytest.approx(expected[1], abs=1e-9)
+
+    def test_ik_batch_invalid_and_origin(self) -> None:
+        """Test NaN/inf are unreachable and origin follows solve_ik."""
+        arm = ArmKinematics(l1=80.0, l2=60.0)
+        _, _, reachable = arm.solve_ik_batch(
+            np.array([np.nan, np.inf, 0.0]), np.array([50.0, 0.0, 0.0])
+        )
+        assert not reachable.any()
+
+        equal = ArmKinematics(l1=70.0, l2=70.0)
+        shoulder, elbow, reachable = equal.solve_ik_batch(np.array([0.0]), np.array([0.0]))
+        assert reachable[0]
+        assert (shoulder[0], elbow[0]) == equal.solve_ik(0.0, 0.0)
+
+    def test_ik_batch_shape_mismatch(self) -> None:
+        """Test mismatched shapes raise ValueError."""
+        arm = ArmKinematics(l1=80.0, l2=60.0)
+        with pytest.raises(ValueError, match="same shape"):
+            arm.solve_ik_batch(np.zeros(3), np.zeros(4))
+
+    def test_fk_batch_roundtrip(self) -> None:
+        """Test batch FK recovers the batch IK targets."""
+        arm = ArmKinematics(l1=80.0, l2=60.0)
+        xs, ys = arm.plan_cartesian_path((100.0, -30.0), (40.0, 90.0), 50)
+
+        shoulder, elbow, reachable = arm.solve_ik_batch(xs, ys)
+        assert reachable.all()
+        fx, fy = arm.solve_fk_batch(shoulder, elbow)
+        np.testing.assert_allclose(fx, xs, atol=1e-9)
+        np.testing.assert_allclose(fy, ys, atol=1e-9)
+
+    def test_fk_batch_rejects_nan(self) -> None:
+        """Test non-finite angles raise ValueError like solve_fk."""
+        arm = ArmKinematics(l1=80.0, l2=60.0)
+        with pytest.raises(ValueError, match="finite"):
+            arm.solve_fk_batch(np.array([0.0, np.nan]), np.zeros(2))
+
+    def test_cartesian_path_eases_in_and_out(self) -> None:
+        """Test planned path hits both ends with small first/last steps."""
+        xs, ys = ArmKinematics.plan_cartesian_path((0.0, 0.0), (100.0, 0.0), 21)
+
+        assert (xs[0], xs[-1]) == (0.0, 100.0)
+        steps = np.diff(xs)
+        assert steps[0] < steps[10] and steps[-1] < steps[10]
+        assert np.all(ys == 0.0)
+        with pytest.raises(ValueError, match="num_points"):
+            ArmKinematics.plan_cartesian_path((0.0, 0.0), (1.0, 1.0), 1)
@@ -2,8 +2,12 @@
 
 Tests the integrated pipeline components:
 - AudioPreprocessor: resampling, normalization
+- PipeChunkReader: readinto chunk assembly, short-read accounting
+- ChunkRing / capture-inference split: drop-oldest handoff, stage latency
+- Capture sources: file/WAV replay, sounddevice callback assembly
 - NoiseCalibrator: EMA tracking, adaptive thresholds
 - MultiFrameConfirmer: sliding window confirmation
+- WakeWordModelManager: cached loading, warmup, shared sessions
 - PipelineConfig: validation
 
 Created: 26 January 2026
@@ -11,7 +15,10 @@ Created: 26 January 2026
 
 import pytest
 import numpy as np
+import threading
 import time
+import wave
+from types import SimpleNamespace
 
 # Add firmware to path
 import sys
@@ -25,6 +32,15 @@ from src.voice.pipeline import (
     AudioPreprocessor,
     NoiseCalibrator,
     MultiFrameConfirmer,
+    StageLatency,
+    WakeWordPipeline,
+)
+from src.voice.models import WakeWordModelManager
+from src.voice.capture import (
+    ChunkRing,
+    FileReplaySource,
+    PipeChunkReader,
+    SoundDeviceSource,
 )
 
 
@@ -126,14 +142,15 @@ class TestAudioPreprocessor:
         # Need at least 3 sample pairs for 3:1 decimation
         # Let's test with more samples
 
-        max_vals = np.array([2147483647, 0] * 3, dtype=np.int32)
+        # Full-scale DC long enough to fill the FIR history
+        max_vals = np.array([2147483647, 0] * 480, dtype=np.int32)
         raw_bytes = max_vals.tobytes()
 
         result = preprocessor.process(raw_bytes)
 
-        # After averaging, should be close to 1.0
-        assert len(result) == 1
-        assert result[0] > 0.99  # Close to 1.0
+        # After the filter settles, output should be close to 1.0
+        assert len(result) == 160
+        assert result[-1] > 0.99  # Close to 1.0
 
     def test_resample_48k_to_16k(self, preprocessor):
         """Test 48kHz to 16kHz resampling (3:1 ratio)."""
@@ -172,6 +189,74 @@ class TestAudioPreprocessor:
         assert result.dtype == np.int16
         assert len(result) == 2  # 6 / 3 = 2
 
+    def test_fused_matches_float_path(self):
+        """Test fused int32->int16 path agrees with the float round trip."""
+        rng = np.random.default_rng(1)
+        stereo = rng.integers(-2**30, 2**30, size=2 * 3840 * 3, dtype=np.int32)
+        fused = AudioPreprocessor(PipelineConfig(fused_preprocessing=True))
+        legacy = AudioPreprocessor(PipelineConfig(fused_preprocessing=False))
+
+        for i in range(0, len(stereo), 2 * 3840):
+            raw = stereo[i:i + 2 * 3840].tobytes()
+            f_float = fused.process(raw)
+            l_float = legacy.process(raw)
+            np.testing.assert_allclose(f_float, l_float, atol=1e-6)
+            assert np.abs(fused.to_int16(f_float).astype(np.int32)
+                          - legacy.to_int16(l_float).astype(np.int32)).max() <= 1
+
+    @pytest.mark.parametrize("fused", [True, False])
+    def test_mono_input_uses_every_frame(self, fused):
+        """Test channels=1 is honoured by both the fused and float paths."""
+        rng = np.random.default_rng(2)
+        mono = rng.integers(-2**30, 2**30, size=3840, dtype=np.int32)
+        stereo = np.repeat(mono, 2)
+
+        mono_result = AudioPreprocessor(
+            PipelineConfig(channels=1, fused_preprocessing=fused)).process(mono.tobytes())
+        stereo_result = AudioPreprocessor(
+            PipelineConfig(channels=2, fused_preprocessing=fused)).process(stereo.tobytes())
+
+        np.testing.assert_allclose(mono_result, stereo_result, atol=1e-6)
+
+    def test_fused_int16_reuses_buffer_and_clips(self, preprocessor):
+        """Test int16 output is a reused buffer and full scale does not wrap."""
+        full_scale = np.array([2147483647, 0] * 3840, dtype=np.int32).tobytes()
+
+        first = preprocessor.process_int16(full_scale)
+        second = preprocessor.process_int16(full_scale)
+
+        assert np.shares_memory(first, second)
+        assert second.min() > 32000  # FIR overshoot clipped, not wrapped
+
+    def test_resampler_rejects_aliases(self, preprocessor):
+        """Test 12kHz tone is not aliased onto 4kHz (box averaging passes -9.5dB)."""
+        t = np.arange(48000) / 48000.0
+        tone = (0.5 * np.sin(2 * np.pi * 12000 * t) * 2147483647).astype(np.int32)
+        stereo = np.repeat(tone, 2)
+
+        result = np.concatenate([
+            preprocessor.process(stereo[i:i + 7680].tobytes()).copy()
+            for i in range(0, len(stereo), 7680)
+        ])
+
+        rms = np.sqrt(np.mean(result[200:] ** 2))
+        assert 20 * np.log10(rms / (0.5 / np.sqrt(2))) < -60.0
+
+    def test_chunking_is_seamless(self):
+        """Test output does not depend on how the stream is chunked."""
+        config = PipelineConfig()
+        rng = np.random.default_rng(0)
+        stereo = rng.integers(-2**30, 2**30, size=2 * 7680, dtype=np.int32)
+
+        whole = AudioPreprocessor(config).process(stereo.tobytes()).copy()
+        chunked = AudioPreprocessor(config)
+        parts = [
+            chunked.process(stereo[i:i + 2 * 960].tobytes()).copy()
+            for i in range(0, len(stereo), 2 * 960)
+        ]
+
+        np.testing.assert_allclose(np.concatenate(parts), whole, atol=1e-6)
+
 
 # =============================================================================
 # NoiseCalibrator Tests
@@ -412,6 +497,463 @@ class TestDetectionResult:
         assert result.confirm_count == 4
 
 
+# =============================================================================
+# PipeChunkReader Tests
+# =============================================================================
+
+class _TricklePipe:
+    """Fake unbuffered pipe returning at most ``max_read`` bytes per call."""
+
+    def __init__(self, data: bytes, max_read: int):
+        self._data = memoryview(data)
+        self._pos = 0
+        self._max_read = max_read
+
+    def readinto(self, buffer) -> int:
+        n = min(len(buffer), self._max_read, len(self._data) - self._pos)
+        buffer[:n] = self._data[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+
+class TestPipeChunkReader:
+    """Tests for zero-copy chunk assembly."""
+
+    def test_short_reads_accumulated_without_loss(self):
+        """Partial reads are stitched into whole chunks, in order."""
+        data = np.arange(1000, dtype=np.int32).tobytes()
+        reader = PipeChunkReader(chunk_bytes=400)
+        reader.attach(_TricklePipe(data, max_read=150))
+
+        chunks = []
+        while True:
+            chunk = reader.read_chunk()
+            if chunk is None:
+                break
+            chunks.append(np.frombuffer(chunk, dtype=np.int32).copy())
+
+        joined = np.concatenate(chunks)
+        assert len(chunks) == 10
+        np.testing.assert_array_equal(joined, np.arange(1000, dtype=np.int32))
+        assert reader.short_reads > 0
+        assert reader.dropped_bytes == 0
+        assert reader.eof
+
+    def test_partial_chunk_at_eof_counted_as_dropped(self):
+        """Trailing bytes that never complete a chunk are reported."""
+        reader = PipeChunkReader(chunk_bytes=400)
+        reader.attach(_TricklePipe(bytes(1000), max_read=400))
+
+        assert reader.read_chunk() is not None
+        assert reader.read_chunk() is not None
+        assert reader.read_chunk() is None
+
+        stats = reader.get_statistics()
+        assert stats['chunks'] == 2
+        assert stats['bytes_read'] == 1000
+        assert stats['dropped_bytes'] == 200
+
+    def test_chunk_buffer_reused_and_viewed_without_copy(self):
+        """Every chunk lands in the same buffer; frombuffer wraps it."""
+        reader = PipeChunkReader(chunk_bytes=64)
+        reader.attach(_TricklePipe(bytes(128), max_read=64))
+
+        first = np.frombuffer(reader.read_chunk(), dtype=np.int32)
+        second = np.frombuffer(reader.read_chunk(), dtype=np.int32)
+
+        assert np.shares_memory(first, second)
+
+    def test_preprocessor_accepts_chunk_view(self):
+        """AudioPreprocessor consumes the reader's memoryview directly."""
+        config = PipelineConfig()
+        samples = np.zeros(config.input_chunk_samples * config.channels, dtype=np.int32)
+        reader = PipeChunkReader(chunk_bytes=samples.nbytes)
+        reader.attach(_TricklePipe(samples.tobytes(), max_read=1000))
+
+        audio_16k = AudioPreprocessor(config).process(reader.read_chunk())
+
+        assert len(audio_16k) == config.output_chunk_samples
+
+    def test_invalid_chunk_size_rejected(self):
+        with pytest.raises(ValueError):
+            PipeChunkReader(chunk_bytes=0)
+
+
+# =============================================================================
+# Capture/Inference Handoff Tests
+# =============================================================================
+
+class TestChunkRing:
+    """Tests for the bounded drop-oldest chunk ring."""
+
+    def test_fifo_with_timestamps_and_sequence(self):
+        ring = ChunkRing(num_slots=4, chunk_bytes=8)
+        for i in range(3):
+            slot = ring.acquire_write()
+            ring.slot(slot)[:] = bytes([i]) * 8
+            ring.commit(slot, capture_time=100.0 + i)
+
+        for i in range(3):
+            chunk = ring.get(timeout=0)
+            assert chunk.sequence == i
+            assert chunk.capture_time == 100.0 + i
+            assert bytes(chunk.data) == bytes([i]) * 8
+            ring.release(chunk)
+
+        assert ring.get(timeout=0) is None
+
+    def test_full_ring_drops_oldest_without_blocking(self):
+        ring = ChunkRing(num_slots=3, chunk_bytes=8)
+        for i in range(5):
+            ring.commit(ring.acquire_write(), capture_time=float(i))
+
+        stats = ring.get_statistics()
+        assert stats['dropped_chunks'] == 2
+        assert stats['max_depth'] == 3
+        assert [ring.get(timeout=0).sequence for _ in range(3)] == [2, 3, 4]
+
+    def test_slot_held_by_consumer_is_never_reused(self):
+        ring = ChunkRing(num_slots=3, chunk_bytes=8)
+        ring.commit(ring.acquire_write(), capture_time=0.0)
+        held = ring.get(timeout=0)
+
+        for _ in range(10):
+            slot = ring.acquire_write()
+            assert slot != held.slot
+            ring.commit(slot, capture_time=0.0)
+
+        ring.release(held)
+        assert ring.get_statistics()['dropped_chunks'] == 8
+
+    def test_close_wakes_consumer(self):
+        ring = ChunkRing(num_slots=3, chunk_bytes=8)
+        threading.Timer(0.05, ring.close).start()
+
+        start = time.monotonic()
+        assert ring.get(timeout=5.0) is None
+        assert time.monotonic() - start < 1.0
+        assert ring.closed
+
+    def test_too_few_slots_rejected(self):
+        with pytest.raises(ValueError):
+            ChunkRing(num_slots=2, chunk_bytes=8)
+        with pytest.raises(ValueError):
+            PipelineConfig(queue_chunks=2)
+
+
+class TestStageLatency:
+    """Tests for rolling stage latency windows."""
+
+    def test_summary_percentiles(self):
+        latency = StageLatency(window=100)
+        for ms in range(1, 101):
+            latency.record(ms / 1000.0)
+
+        summary = latency.summary()
+        assert summary['count'] == 100
+        assert summary['p50_ms'] == pytest.approx(50.5, abs=0.5)
+        assert summary['max_ms'] == pytest.approx(100.0)
+
+    def test_empty_summary(self):
+        assert StageLatency().summary()['count'] == 0
+
+    def test_detection_latency_from_capture_timestamp(self):
+        result = DetectionResult(
+            detected=True, wake_word="hey openduck", raw_score=0.9,
+            smoothed_score=0.9, confirm_count=3, noise_floor=-60.0,
+            vad_active=True, timestamp=10.25, capture_timestamp=10.0,
+        )
+        assert result.latency_ms == pytest.approx(250.0)
+        assert DetectionResult.not_detected().latency_ms is None
+
+
+class _SlowVAD:
+    """VAD stand-in that takes ``delay`` seconds per frame."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def process_frame(self, audio, features=None):
+        time.sleep(self.delay)
+        return SimpleNamespace(energy_db=-60.0, is_speech=False, state=None)
+
+    def get_statistics(self):
+        return {}
+
+
+def _run_replay(n_chunks: int, lossless: bool, delay: float):
+    """Replay silent chunks through a pipeline with a slow VAD.
+
+    Returns:
+        Tuple of (pipeline, seconds spent in the capture loop)
+    """
+    config = PipelineConfig(queue_chunks=3, calibration_seconds=60.0)
+    frames = config.input_chunk_samples * n_chunks
+    source = FileReplaySource(
+        np.zeros((frames, config.channels), dtype=np.int32),
+        sample_rate=config.input_sample_rate,
+        channels=config.channels,
+        chunk_frames=config.input_chunk_samples,
+        lossless=lossless,
+    )
+    pipeline = WakeWordPipeline(config, source=source)
+    pipeline._vad = _SlowVAD(delay=delay)
+
+    source.open()
+    pipeline._running = True
+    inference = threading.Thread(target=pipeline._audio_loop, daemon=True)
+    inference.start()
+
+    start = time.monotonic()
+    pipeline._capture_loop()
+    capture_time = time.monotonic() - start
+    pipeline._running = False
+    inference.join(timeout=5.0)
+    return pipeline, capture_time
+
+
+class TestCaptureInferenceSplit:
+    """Capture keeps draining the source while inference is slow."""
+
+    def test_capture_never_blocks_on_inference(self):
+        n_chunks = 20
+        pipeline, capture_time = _run_replay(n_chunks, lossless=False, delay=0.05)
+
+        # Serial processing would take n_chunks * 50ms = 1s
+        stats = pipeline.get_statistics()
+        assert capture_time < 0.5
+        assert stats['queue']['committed'] == n_chunks
+        assert stats['queue']['dropped_chunks'] > 0
+        assert stats['frames_processed'] + stats['queue']['dropped_chunks'] == n_chunks
+        assert stats['sequence_gaps'] > 0
+        assert stats['latency']['vad']['p50_ms'] >= 40.0
+        assert stats['latency']['queue_wait']['count'] == stats['frames_processed']
+
+    def test_lossless_replay_processes_every_chunk(self):
+        pipeline, _ = _run_replay(10, lossless=True, delay=0.005)
+
+        stats = pipeline.get_statistics()
+        assert stats['frames_processed'] == 10
+        assert stats['queue']['dropped_chunks'] == 0
+        assert stats['sequence_gaps'] == 0
+        assert stats['capture']['source'] == 'file'
+
+
+class TestCaptureSources:
+    """Tests for pluggable capture sources."""
+
+    def test_wav_converted_to_capture_format(self, tmp_path):
+        """16kHz mono int16 WAV is resampled and widened to 48kHz stereo S32."""
+        path = tmp_path / "tone.wav"
+        t = np.arange(16000) / 16000
+        tone = (0.5 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(tone.tobytes())
+
+        source = FileReplaySource(path, sample_rate=48000, channels=2, chunk_frames=3840)
+
+        assert source.duration_s == pytest.approx(1.0, abs=0.01)
+        assert source.total_chunks == 12
+        frames = np.frombuffer(source._data, dtype="<i4").reshape(-1, 2)
+        np.testing.assert_array_equal(frames[:, 0], frames[:, 1])
+        peak = np.abs(frames[4800:, 0]).max() / 2**31
+        assert peak == pytest.approx(0.5, abs=0.02)
+
+    def test_replay_feeds_ring_in_order(self):
+        audio = np.arange(3840 * 3 * 2, dtype=np.int32).reshape(-1, 2)
+        source = FileReplaySource(audio, sample_rate=48000, channels=2, chunk_frames=3840)
+        ring = ChunkRing(num_slots=4, chunk_bytes=source.chunk_bytes)
+
+        source.open()
+        source.run(ring)
+
+        for i in range(3):
+            chunk = ring.get(timeout=0)
+            samples = np.frombuffer(chunk.data, dtype=np.int32)
+            assert chunk.sequence == i
+            # Integer input at full scale maps to the same int32 values
+            assert samples[0] == audio.ravel()[i * 3840 * 2]
+            ring.release(chunk)
+
+    def test_sounddevice_callback_assembles_chunks(self):
+        """Blocks smaller than a chunk are stitched into whole ring slots."""
+        source = SoundDeviceSource(None, sample_rate=48000, channels=2, chunk_frames=4)
+        ring = ChunkRing(num_slots=4, chunk_bytes=source.chunk_bytes)
+        source._active = True
+
+        data = np.arange(24, dtype=np.int32)
+        for block in np.split(data, 4):  # 3 frames per callback
+            source._callback(block.tobytes(), 3, None, None)
+
+        assert source._drain(ring) == 3
+        chunks = [ring.get(timeout=0) for _ in range(3)]
+        assert ring.get(timeout=0) is None
+        joined = np.concatenate([np.frombuffer(c.data, dtype=np.int32) for c in chunks])
+        np.testing.assert_array_equal(joined, data)
+
+    def test_sounddevice_callback_never_takes_ring_lock(self):
+        """The callback completes while another thread holds the ring lock."""
+        source = SoundDeviceSource(None, sample_rate=48000, channels=2, chunk_frames=4)
+        ring = ChunkRing(num_slots=4, chunk_bytes=source.chunk_bytes)
+        source._active = True
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_ring_lock():
+            with ring._cond:
+                held.set()
+                release.wait(2.0)
+
+        holder = threading.Thread(target=hold_ring_lock)
+        holder.start()
+        try:
+            assert held.wait(1.0)
+            start = time.monotonic()
+            for _ in range(4):
+                source._callback(np.zeros(8, dtype=np.int32).tobytes(), 4, None, None)
+            assert time.monotonic() - start < 0.5
+        finally:
+            release.set()
+            holder.join()
+
+        assert source._drain(ring) == 4
+        assert ring.depth == 4
+
+    def test_sounddevice_overrun_counts_dropped_bytes(self):
+        """Frames overwritten before the capture thread drains are reported."""
+        source = SoundDeviceSource(None, sample_rate=48000, channels=2, chunk_frames=4)
+        source._active = True
+        blocks = source.BUFFER_CHUNKS + 1
+        for _ in range(blocks):
+            source._callback(np.zeros(8, dtype=np.int32).tobytes(), 4, None, None)
+
+        assert source.get_statistics()['dropped_bytes'] == source.chunk_bytes
+        source.reset_statistics()
+        assert source.get_statistics()['dropped_bytes'] == 0
+
+    def test_source_format_must_match_config(self):
+        source = FileReplaySource(
+            np.zeros(1000, dtype=np.int16), sample_rate=16000, channels=1, chunk_frames=1280
+        )
+        with pytest.raises(ValueError):
+            WakeWordPipeline(PipelineConfig(), source=source)
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            PipelineConfig(capture_backend="pulse")
+
+
+# =============================================================================
+# Model Manager Tests
+# =============================================================================
+
+class _CountingModel:
+    """OpenWakeWord stand-in recording predict/reset calls."""
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.predictions = 0
+        self.resets = 0
+
+    def predict(self, audio):
+        self.predictions += 1
+        return {"hey_jarvis": 0.0}
+
+    def reset(self):
+        self.resets += 1
+
+
+class _CountingManager(WakeWordModelManager):
+    """Manager with fake resolver/loader counting scans and loads."""
+
+    def __init__(self):
+        self.scans = 0
+        self.models = []
+
+        def resolver(names):
+            self.scans += 1
+            return {name: f"/models/{name}.onnx" for name in names}
+
+        def loader(paths, framework):
+            self.models.append(_CountingModel(paths))
+            return self.models[-1]
+
+        super().__init__(resolver=resolver, loader=loader)
+
+
+@pytest.fixture
+def model_manager():
+    """Install a fake process-wide model manager."""
+    manager = _CountingManager()
+    WakeWordModelManager._instance = manager
+    yield manager
+    WakeWordModelManager.reset()
+
+
+class TestWakeWordModelManager:
+    """Tests for cached model loading and session sharing."""
+
+    def test_session_loaded_once_and_warmed(self):
+        manager = _CountingManager()
+
+        first = manager.acquire(["hey_jarvis"], warmup=True)
+        second = manager.acquire(["hey_jarvis"], warmup=True)
+
+        assert len(manager.models) == 1
+        assert manager.scans == 1
+        assert first.model is second.model
+        assert first.model.predictions == 1  # Single silent warmup chunk
+        metrics = manager.get_metrics()["hey_jarvis"]
+        assert metrics["acquisitions"] == 2
+        assert metrics["model_paths"] == ["/models/hey_jarvis.onnx"]
+        assert metrics["cold_start_ms"] >= metrics["load_ms"] >= 0.0
+
+    def test_handles_reset_buffers_when_taking_turns(self):
+        manager = _CountingManager()
+        a = manager.acquire(warmup=False)
+        b = manager.acquire(warmup=False)
+        model = a.model
+
+        a.predict(np.zeros(1280, dtype=np.int16))
+        a.predict(np.zeros(1280, dtype=np.int16))
+        assert model.resets == 1
+        b.predict(np.zeros(1280, dtype=np.int16))
+        assert model.resets == 2
+
+    def test_unresolved_model_raises(self):
+        manager = WakeWordModelManager(resolver=lambda names: {}, loader=None)
+        with pytest.raises(RuntimeError, match="Could not find"):
+            manager.acquire(["missing"])
+
+    def test_pipeline_restart_reuses_session(self, model_manager):
+        config = PipelineConfig(calibration_seconds=60.0)
+
+        def make_pipeline():
+            source = FileReplaySource(
+                np.zeros((config.input_chunk_samples * 2, config.channels), dtype=np.int32),
+                sample_rate=config.input_sample_rate,
+                channels=config.channels,
+                chunk_frames=config.input_chunk_samples,
+            )
+            return WakeWordPipeline(config, source=source)
+
+        first = make_pipeline()
+        first.start()
+        first.stop()
+        first.start()
+        first.stop()
+        second = make_pipeline()
+        second.start()
+        second.stop()
+
+        assert len(model_manager.models) == 1
+        assert model_manager.get_metrics()["hey_jarvis"]["acquisitions"] == 2
+        assert first.get_statistics()["model"]["model_paths"] == ["/models/hey_jarvis.onnx"]
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -733,6 +733,22 @@ class TestServoCurrentProfile:
         with pytest.raises(ValueError, match="thermal_time_constant_s must be positive"):
             ServoCurrentProfile(thermal_time_constant_s=-10.0)
 
+    def test_from_config(self):
+        """Test profile and limiter take currents from the safety config."""
+        from src.utils.config import RobotConfig, SafetySettings
+
+        config = RobotConfig(safety=SafetySettings(
+            max_current_no_load_ma=300.0, max_current_stall_ma=1200.0,
+        ))
+        profile = ServoCurrentProfile.from_config(config)
+        assert profile.no_load_ma == 300.0
+        assert profile.stall_ma == 1200.0
+        assert profile.idle_ma == 15.0  # Not configurable
+
+        limiter = CurrentLimiter.from_config(config, num_channels=4)
+        assert limiter.profile == profile
+        assert limiter.num_channels == 4
+
 
 # =============================================================================
 # SECTION 8: Integration-like Tests
@@ -0,0 +1,195 @@
+"""Tests for the cached YAML configuration loader."""
+
+import os
+import threading
+
+import pytest
+
+from src.utils.config import (
+    CONFIG_FILES,
+    ConfigLoader,
+    LEDSettings,
+    RobotConfig,
+    compile_config,
+    default_config_dir,
+)
+
+
+ROBOT_YAML = """
+control:
+  loop_hz: 100
+kinematics:
+  arm_2dof:
+    l1: 90.0
+    l2: 50.0
+animation:
+  head_default_speed_ms: 250
+"""
+
+SAFETY_YAML = """
+servos:
+  max_current_stall_ma: 850
+emergency_stop:
+  gpio_pin: 26
+  debounce_ms: 30
+"""
+
+HARDWARE_YAML = """
+gpio:
+  neopixel:
+    ring_1:
+      data_pin: 10
+      brightness: 0.25
+    ring_2:
+      data_pin: 13
+"""
+
+
+def _write(directory, name, text, bump_ns=0):
+    """Write a config file, optionally pushing its mtime forward."""
+    path = directory / CONFIG_FILES[name]
+    path.write_text(text)
+    if bump_ns:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+    return path
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Config directory with all three files."""
+    directory = tmp_path / "config"
+    directory.mkdir()
+    _write(directory, "robot", ROBOT_YAML)
+    _write(directory, "safety", SAFETY_YAML)
+    _write(directory, "hardware", HARDWARE_YAML)
+    return directory
+
+
+@pytest.fixture
+def loader(config_dir, tmp_path):
+    """Loader with a private cache directory."""
+    return ConfigLoader(config_dir, cache_dir=tmp_path / "cache")
+
+
+class TestCompile:
+    """YAML -> dataclass compilation."""
+
+    def test_values_and_defaults(self, loader):
+        config = loader.load()
+
+        assert config.control.loop_hz == 100
+        assert config.control.watchdog_timeout_ms == 500  # Default
+        assert config.arm.l1_mm == 90.0
+        assert config.safety.max_current_stall_ma == 850
+        assert config.safety.max_current_no_load_ma == 220.0  # Default
+        assert config.safety.estop_debounce_ms == 30
+        assert config.hardware.led_left_pin == 10
+        assert config.led.brightness == 64  # 0.25 * 255
+        assert config.animation.head_default_speed_ms == 250
+        assert len(config.sources) == 3
+
+    def test_frozen(self, loader):
+        config = loader.load()
+        with pytest.raises(Exception):
+            config.led.brightness = 10
+
+    def test_empty_config_equals_defaults(self):
+        assert compile_config({}) == RobotConfig()
+
+    def test_invalid_value_rejected(self):
+        with pytest.raises(ValueError, match="brightness"):
+            compile_config({"robot": {"led": {"brightness": 300}}})
+
+    def test_invalid_yaml_rejected(self, config_dir, loader):
+        _write(config_dir, "robot", "control: [unclosed")
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            loader.load()
+
+    def test_repo_config_loads(self, tmp_path):
+        config = ConfigLoader(default_config_dir(), cache_dir=tmp_path).load()
+        assert config.arm.l1_mm == 80.0
+        assert config.safety.estop_gpio_pin == 26
+
+    def test_head_config(self, loader):
+        head = loader.load().head_config()
+        assert head.default_speed_ms == 250
+
+
+class TestCache:
+    """mtime-keyed parsed cache."""
+
+    def test_second_load_hits_cache(self, config_dir, loader, tmp_path):
+        first = loader.load()
+        again = ConfigLoader(config_dir, cache_dir=tmp_path / "cache")
+        assert again.load() == first
+        assert again.get_statistics()["cache_hits"] == 1
+        assert loader.cache_path().exists()
+
+    def test_modified_file_invalidates_cache(self, config_dir, loader, tmp_path):
+        loader.load()
+        _write(config_dir, "safety", SAFETY_YAML.replace("850", "800"), bump_ns=10**9)
+
+        again = ConfigLoader(config_dir, cache_dir=tmp_path / "cache")
+        assert again.load().safety.max_current_stall_ma == 800
+        assert again.get_statistics()["cache_hits"] == 0
+
+    def test_corrupt_cache_is_ignored(self, loader):
+        loader.load()
+        loader.cache_path().write_bytes(b"\x00garbage")
+        assert loader.load().control.loop_hz == 100
+
+    def test_cache_disabled(self, config_dir):
+        loader = ConfigLoader(config_dir, use_cache=False)
+        assert loader.cache_path() is None
+        assert loader.load().control.loop_hz == 100
+
+
+class TestHotReload:
+    """Polling reload of non-safety sections."""
+
+    def test_no_change(self, loader):
+        loader.load()
+        assert loader.check_for_changes() is False
+
+    def test_reloadable_change_applied(self, config_dir, loader):
+        old = loader.load()
+        seen = []
+        loader.register_callback(lambda o, n: seen.append((o, n)))
+
+        _write(config_dir, "hardware", HARDWARE_YAML.replace("0.25", "1.0"), bump_ns=10**9)
+        assert loader.check_for_changes() is True
+
+        assert loader.config.led == LEDSettings(brightness=255)
+        assert seen == [(old, loader.config)]
+
+    def test_safety_change_not_applied(self, config_dir, loader, caplog):
+        loader.load()
+        _write(config_dir, "safety", SAFETY_YAML.replace("30", "5"), bump_ns=10**9)
+        _write(config_dir, "robot", ROBOT_YAML.replace("250", "400"), bump_ns=10**9)
+
+        assert loader.check_for_changes() is True
+        assert loader.config.safety.estop_debounce_ms == 30
+        assert loader.config.animation.head_default_speed_ms == 400
+        assert "need a restart" in caplog.text
+
+    def test_invalid_reload_keeps_config(self, config_dir, loader):
+        config = loader.load()
+        _write(config_dir, "hardware", HARDWARE_YAML.replace("0.25", "7.0"), bump_ns=10**9)
+
+        assert loader.check_for_changes() is False
+        assert loader.config is config
+        assert loader.get_statistics()["reload_errors"] == 1
+        assert loader.check_for_changes() is False  # Not retried until next edit
+
+    def test_watcher_thread(self, config_dir, loader):
+        loader.load()
+        changed = threading.Event()
+        loader.register_callback(lambda o, n: changed.set())
+        loader.start_watching(interval_s=0.01)
+        try:
+            _write(config_dir, "robot", ROBOT_YAML.replace("250", "350"), bump_ns=10**9)
+            assert changed.wait(timeout=2.0)
+        finally:
+            loader.stop_watching()
+        assert loader.config.animation.head_default_speed_ms == 350
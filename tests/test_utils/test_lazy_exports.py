@@ -0,0 +1,66 @@
+"""Tests for lazy package exports.
+
+Tests cover:
+- Exports resolve on first access and are cached in the package globals
+- Unknown names raise AttributeError
+- __dir__ lists exports before they are loaded
+- The lazy packages (src.core, src.animation, src.voice) use the helper
+"""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from src.utils.lazy_exports import make_lazy
+
+
+@pytest.fixture
+def lazy_package():
+    """Register a throwaway package exporting names from the stdlib."""
+    name = "_openduck_lazy_test_pkg"
+    package = types.ModuleType(name)
+    exports = {"dedent": "textwrap", "sqrt": "math"}
+    package.__all__ = list(exports)
+    package.__getattr__, package.__dir__ = make_lazy(name, exports, package.__all__)
+    sys.modules[name] = package
+    yield package
+    del sys.modules[name]
+
+
+class TestMakeLazy:
+    """Tests for make_lazy()."""
+
+    def test_resolves_and_caches(self, lazy_package):
+        import textwrap
+
+        assert "dedent" not in vars(lazy_package)
+        assert lazy_package.dedent is textwrap.dedent
+        assert vars(lazy_package)["dedent"] is textwrap.dedent
+
+    def test_unknown_name_raises_attribute_error(self, lazy_package):
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            lazy_package.missing
+
+    def test_dir_lists_unloaded_exports(self, lazy_package):
+        names = dir(lazy_package)
+        assert "dedent" in names
+        assert "sqrt" in names
+
+    @pytest.mark.parametrize("package, name, submodule", [
+        ("src.core", "RobotState", "src.core.robot_state"),
+        ("src.animation", "EmotionAxes", "src.animation.emotion_axes"),
+        ("src.voice", "PipelineConfig", "src.voice.pipeline"),
+    ])
+    def test_packages_load_submodule_on_first_access(self, package, name, submodule):
+        # Fresh interpreter: the test session may already have these loaded
+        code = (
+            "import importlib, sys\n"
+            f"pkg = importlib.import_module({package!r})\n"
+            f"assert {submodule!r} not in sys.modules\n"
+            f"assert {name!r} in dir(pkg)\n"
+            f"getattr(pkg, {name!r})\n"
+            f"assert {submodule!r} in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,210 @@
+"""Tests for opt-in lock contention profiling.
+
+Tests cover:
+- Factory returns plain locks when profiling is disabled (zero overhead)
+- Reentrancy and hold-time accounting on the outermost acquire/release
+- Release ownership checks and locked() state
+- Contention detection, wait time and call-site attribution
+- Non-blocking/timed-out acquires
+- Wiring into the safety stack and Robot diagnostics
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.utils import lock_profiler
+from src.utils.lock_profiler import (
+    InstrumentedLock,
+    create_lock,
+    disable_lock_profiling,
+    enable_lock_profiling,
+    format_lock_report,
+    get_lock_report,
+    reset_lock_stats,
+)
+
+
+@pytest.fixture
+def profiling():
+    """Enable profiling for the test and restore the previous state."""
+    was_enabled = lock_profiler.is_lock_profiling_enabled()
+    enable_lock_profiling()
+    reset_lock_stats()
+    yield
+    if not was_enabled:
+        disable_lock_profiling()
+
+
+class TestCreateLock:
+    """Tests for the create_lock factory."""
+
+    def test_plain_locks_when_disabled(self):
+        was_enabled = lock_profiler.is_lock_profiling_enabled()
+        disable_lock_profiling()
+        try:
+            assert isinstance(create_lock("t.plain"), type(threading.RLock()))
+            assert isinstance(
+                create_lock("t.plain", reentrant=False), type(threading.Lock())
+            )
+        finally:
+            if was_enabled:
+                enable_lock_profiling()
+
+    def test_instrumented_when_enabled(self, profiling):
+        lock = create_lock("t.instrumented")
+        assert isinstance(lock, InstrumentedLock)
+
+
+class TestInstrumentedLock:
+    """Tests for InstrumentedLock accounting."""
+
+    def test_reentrant_counts_outermost_only(self, profiling):
+        lock = create_lock("t.reentrant")
+        with lock:
+            with lock:
+                time.sleep(0.005)
+            assert lock.locked()
+        assert not lock.locked()
+
+        stats = get_lock_report()["t.reentrant"]
+        assert stats["acquisitions"] == 1
+        assert stats["contentions"] == 0
+        assert stats["hold_max_ms"] >= 4.0
+        assert stats["holder"] is None
+
+    def test_release_by_non_owner_raises(self, profiling):
+        lock = create_lock("t.non_owner")
+        errors = []
+
+        def intruder():
+            try:
+                lock.release()
+            except RuntimeError as e:
+                errors.append(e)
+
+        with lock:
+            t = threading.Thread(target=intruder)
+            t.start()
+            t.join()
+            assert lock.locked()
+        assert len(errors) == 1
+        assert not lock.locked()
+        assert get_lock_report()["t.non_owner"]["acquisitions"] == 1
+
+        with pytest.raises(RuntimeError):
+            lock.release()
+
+    def test_locked_seen_from_other_thread(self, profiling):
+        for reentrant in (True, False):
+            lock = create_lock("t.locked", reentrant=reentrant)
+            seen = []
+
+            def check():
+                seen.append(lock.locked())
+
+            with lock:
+                t = threading.Thread(target=check)
+                t.start()
+                t.join()
+            check()
+            assert seen == [True, False]
+
+    def test_contention_records_wait_and_site(self, profiling):
+        lock = create_lock("t.contended")
+        held = threading.Event()
+        release = threading.Event()
+
+        def holder():
+            with lock:
+                held.set()
+                release.wait(1.0)
+
+        t = threading.Thread(target=holder)
+        t.start()
+        held.wait(1.0)
+        assert "holder" in get_lock_report()["t.contended"]["holder"]
+
+        threading.Timer(0.02, release.set).start()
+        with lock:
+            pass
+        t.join()
+
+        stats = get_lock_report()["t.contended"]
+        assert stats["acquisitions"] == 2
+        assert stats["contentions"] == 1
+        assert stats["wait_max_ms"] >= 10.0
+        sites = [s["site"] for s in stats["sites"]]
+        assert any("test_contention_records_wait_and_site" in s for s in sites)
+
+    def test_failed_nonblocking_acquire(self, profiling):
+        lock = create_lock("t.failed", reentrant=False)
+        lock.acquire()
+        result = []
+        t = threading.Thread(target=lambda: result.append(lock.acquire(timeout=0.01)))
+        t.start()
+        t.join()
+        lock.release()
+
+        assert result == [False]
+        stats = get_lock_report()["t.failed"]
+        assert stats["failed_acquires"] == 1
+        assert stats["acquisitions"] == 1
+
+    def test_same_name_is_aggregated(self, profiling):
+        a = create_lock("t.shared")
+        b = create_lock("t.shared")
+        with a:
+            pass
+        with b:
+            pass
+        assert get_lock_report()["t.shared"]["acquisitions"] == 2
+
+
+class TestSafetyStackWiring:
+    """Tests that safety-critical locks report when profiling is on."""
+
+    def test_safety_locks_report(self, profiling):
+        from unittest.mock import MagicMock
+
+        from src.safety.emergency_stop import EmergencyStop
+        from src.safety.watchdog import ServoWatchdog
+        from src.core.safety_coordinator import SafetyCoordinator
+
+        estop = EmergencyStop(servo_driver=MagicMock())
+        watchdog = ServoWatchdog(estop, timeout_ms=1000)
+        watchdog.feed()
+        estop.trigger("lock profiling test")
+
+        coordinator = SafetyCoordinator(servo_driver=MagicMock())
+        coordinator.get_diagnostics()
+
+        report = get_lock_report()
+        assert report["safety.emergency_stop"]["acquisitions"] >= 1
+        assert report["safety.watchdog"]["acquisitions"] >= 1
+        assert report["core.safety_coordinator"]["acquisitions"] >= 1
+        assert "safety.emergency_stop" in format_lock_report()
+
+    def test_robot_diagnostics_include_locks(self, profiling):
+        from src.core.robot import Robot
+
+        diag = Robot().get_diagnostics()
+        assert "locks" in diag
+
+    def test_i2c_bus_lock_instrumented_after_runtime_enable(self, profiling):
+        from unittest.mock import patch
+
+        from src.drivers.i2c_bus_manager import I2CBusManager
+
+        with patch('src.drivers.i2c_bus_manager.board'), \
+             patch('src.drivers.i2c_bus_manager.busio'):
+            I2CBusManager.reset()
+            try:
+                manager = I2CBusManager.get_instance()
+                with manager.acquire_bus(client="test"):
+                    pass
+                assert isinstance(I2CBusManager._bus_lock, InstrumentedLock)
+                assert get_lock_report()["drivers.i2c_bus"]["acquisitions"] == 1
+            finally:
+                I2CBusManager.reset()
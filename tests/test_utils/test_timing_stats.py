@@ -0,0 +1,137 @@
+"""Tests for rolling latency histograms."""
+
+import pytest
+
+from src.utils.timing_stats import LatencyHistogram, PhaseTimer
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty(self):
+        hist = LatencyHistogram(window=10)
+        assert hist.count == 0
+        assert hist.mean() == 0.0
+        assert hist.max() == 0.0
+        assert hist.percentile(99) == 0.0
+
+    def test_mean_max_and_buckets(self):
+        hist = LatencyHistogram(window=10, edges_s=(0.001, 0.002, 0.005))
+        for value in (0.0005, 0.0015, 0.0015, 0.004, 0.010):
+            hist.add(value)
+
+        assert hist.count == 5
+        assert hist.mean() == pytest.approx(0.0035)
+        assert hist.max() == pytest.approx(0.010)
+        summary = hist.to_dict()
+        assert summary["buckets"] == {"<=1ms": 1, "<=2ms": 2, "<=5ms": 1, ">5ms": 1}
+        assert summary["max_ms"] == pytest.approx(10.0)
+
+    def test_rolling_window_evicts_oldest(self):
+        hist = LatencyHistogram(window=4, edges_s=(0.001, 0.01))
+        for _ in range(4):
+            hist.add(0.005)
+        for _ in range(4):
+            hist.add(0.0001)
+
+        assert hist.count == 4
+        assert hist.total == 8
+        assert hist.mean() == pytest.approx(0.0001)
+        assert hist.to_dict()["buckets"]["<=10ms"] == 0
+
+    def test_percentile_within_bucket(self):
+        hist = LatencyHistogram(window=100, edges_s=(0.001, 0.002))
+        for _ in range(50):
+            hist.add(0.0005)
+        for _ in range(50):
+            hist.add(0.0015)
+
+        assert hist.percentile(50) == pytest.approx(0.001)
+        assert 0.001 < hist.percentile(90) <= 0.002
+        assert hist.percentile(100) == pytest.approx(0.0015)  # Capped at max
+
+    def test_overflow_reports_largest_edge(self):
+        hist = LatencyHistogram(window=10, edges_s=(0.001,))
+        hist.add(1.0)
+        assert hist.percentile(99) == pytest.approx(0.001)
+
+    def test_reset(self):
+        hist = LatencyHistogram(window=4)
+        hist.add(0.001)
+        hist.reset()
+        assert hist.count == 0
+        assert hist.total == 0
+        assert sum(hist.to_dict()["buckets"].values()) == 0
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError, match="window"):
+            LatencyHistogram(window=0)
+        with pytest.raises(ValueError, match="ascending"):
+            LatencyHistogram(edges_s=(0.002, 0.001))
+
+
+class TestPhaseTimer:
+    """Tests for PhaseTimer."""
+
+    def test_record_and_report(self):
+        timer = PhaseTimer(("read", "write"), budgets_s={"read": 0.002})
+        timer.record("read", 0.001)
+        timer.record("write", 0.003)
+
+        report = timer.to_dict()
+        assert list(report) == ["read", "write"]
+        assert report["read"]["count"] == 1
+        assert report["read"]["budget_ms"] == pytest.approx(2.0)
+        assert report["write"]["budget_ms"] is None
+        assert "buckets" not in report["read"]
+        assert timer.histogram("write").max() == pytest.approx(0.003)
+
+    def test_over_budget_fires_callbacks(self):
+        timer = PhaseTimer(("read",), budgets_s={"read": 0.002})
+        calls = []
+        timer.register_callback(lambda *args: calls.append(args))
+
+        timer.record("read", 0.001)
+        timer.record("read", 0.005)
+
+        assert calls == [("read", 0.005, 0.002)]
+        assert timer.to_dict()["read"]["over_budget"] == 1
+
+    def test_callback_errors_are_contained(self):
+        timer = PhaseTimer(("read",), budgets_s={"read": 0.001})
+        calls = []
+
+        def bad(*args):
+            raise RuntimeError("boom")
+
+        timer.register_callback(bad)
+        timer.register_callback(lambda *args: calls.append(args))
+        timer.record("read", 0.01)
+
+        assert len(calls) == 1
+        assert timer.unregister_callback(bad) is True
+        assert timer.unregister_callback(bad) is False
+
+    def test_format_line(self):
+        timer = PhaseTimer(("read", "write"))
+        timer.record("read", 0.0015)
+        line = timer.format_line()
+        assert "read.max_ms=1.500" in line
+        assert "write.over_budget=0" in line
+
+    def test_reset_keeps_budgets(self):
+        timer = PhaseTimer(("read",), budgets_s={"read": 0.001})
+        timer.record("read", 0.01)
+        timer.reset()
+        report = timer.to_dict()["read"]
+        assert report["count"] == 0
+        assert report["over_budget"] == 0
+        assert report["budget_ms"] == pytest.approx(1.0)
+
+    def test_invalid_budgets(self):
+        with pytest.raises(ValueError, match="Unknown phase"):
+            PhaseTimer(("read",), budgets_s={"draw": 0.001})
+        with pytest.raises(ValueError, match="positive"):
+            PhaseTimer(("read",), budgets_s={"read": 0.0})
+        with pytest.raises(ValueError, match="empty"):
+            PhaseTimer(())